@@ -0,0 +1,163 @@
+"""
+Benchmark de arranque del sistema de gestión de clínica.
+
+Mide el tiempo de importación de main.py y de lote.py con `python -X
+importtime`, el tiempo real hasta que el menú interactivo pide la primera
+opción y el tiempo total de un `main.py --script` corto, como los de los
+trabajos por lotes. Termina con código 1 si alguna mediana supera su
+presupuesto, para usarlo como control de regresiones.
+
+Uso:
+    python -m benchmarks.bench_arranque [--repeticiones N] [--presupuesto-ms MS]
+                                        [--presupuesto-script-ms MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT = "Seleccione una opción"
+
+# Script corto de un trabajo por lotes
+SCRIPT = (
+    'agregar_paciente "Ana Díaz" 12345678 01/01/1990\n'
+    'agregar_medico "Dr. García" M1\n'
+    'ver_pacientes\n'
+)
+
+
+def medir_importtime(modulo="main"):
+    """
+    Importa un módulo en un proceso nuevo con `-X importtime`.
+
+    Args:
+        modulo (str): Módulo a importar
+
+    Returns:
+        list[tuple[str, int]]: Pares (módulo, microsegundos acumulados), de mayor a menor
+    """
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+
+    tiempos = []
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        tiempos.append((nombre.strip(), int(acumulado)))
+
+    return sorted(tiempos, key=lambda t: t[1], reverse=True)
+
+
+def medir_primer_prompt():
+    """
+    Inicia main.py y mide el tiempo hasta que muestra el pedido de opción.
+
+    Returns:
+        float: Segundos desde el lanzamiento hasta el primer prompt
+    """
+    entorno = dict(os.environ, PYTHONUNBUFFERED="1")
+    inicio = time.perf_counter()
+    proceso = subprocess.Popen(
+        [sys.executable, "main.py"], cwd=RAIZ, env=entorno,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+
+    leido = b""
+    objetivo = PROMPT.encode("utf-8")
+    while objetivo not in leido:
+        bloque = proceso.stdout.read1(4096)
+        if not bloque:
+            break
+        leido += bloque
+    transcurrido = time.perf_counter() - inicio
+
+    proceso.communicate(b"0\n", timeout=10)
+    if objetivo not in leido:
+        raise RuntimeError("main.py terminó sin mostrar el menú")
+    return transcurrido
+
+
+def medir_script():
+    """
+    Ejecuta `main.py --script -` con un script corto y mide cuánto tarda en terminar.
+
+    Returns:
+        float: Segundos desde el lanzamiento hasta que termina el proceso
+
+    Raises:
+        RuntimeError: Si el script termina con error
+    """
+    inicio = time.perf_counter()
+    proceso = subprocess.run(
+        [sys.executable, "main.py", "--script", "-"], cwd=RAIZ, input=SCRIPT,
+        capture_output=True, text=True,
+    )
+    transcurrido = time.perf_counter() - inicio
+    if proceso.returncode != 0:
+        raise RuntimeError(f"main.py --script terminó con error: {proceso.stderr}")
+    return transcurrido
+
+
+def informar(titulo, tiempos, presupuesto_ms):
+    """
+    Imprime la mediana de una medición y la compara con su presupuesto.
+
+    Args:
+        titulo (str): Qué se midió
+        tiempos (list[float]): Milisegundos de cada repetición
+        presupuesto_ms (float): Mediana máxima aceptable
+
+    Returns:
+        bool: True si se respeta el presupuesto
+    """
+    mediana = statistics.median(tiempos)
+    print(f"{titulo}: mediana {mediana:.1f} ms, "
+          f"mínimo {min(tiempos):.1f} ms, máximo {max(tiempos):.1f} ms "
+          f"({len(tiempos)} repeticiones)")
+    if mediana > presupuesto_ms:
+        print(f"FALLA: se superó el presupuesto de {presupuesto_ms:.0f} ms")
+        return False
+    print(f"OK: dentro del presupuesto de {presupuesto_ms:.0f} ms")
+    return True
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark y compara las medianas con sus presupuestos.
+
+    Args:
+        argv (list[str]): Argumentos de la línea de comandos
+
+    Returns:
+        int: 0 si se respetan los presupuestos, 1 si se supera alguno
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--presupuesto-ms", type=float, default=150.0,
+                        help="tiempo máximo aceptable hasta el primer prompt (mediana)")
+    parser.add_argument("--presupuesto-script-ms", type=float, default=100.0,
+                        help="tiempo máximo aceptable de un main.py --script corto (mediana)")
+    parser.add_argument("--top", type=int, default=10, help="módulos a mostrar de -X importtime")
+    argumentos = parser.parse_args(argv)
+
+    for modulo in ("main", "lote"):
+        print(f"Importaciones más costosas de 'import {modulo}' (acumulado):")
+        for nombre, microsegundos in medir_importtime(modulo)[:argumentos.top]:
+            print(f"  {microsegundos / 1000:8.2f} ms  {nombre}")
+
+    prompt = [medir_primer_prompt() * 1000 for _ in range(argumentos.repeticiones)]
+    script = [medir_script() * 1000 for _ in range(argumentos.repeticiones)]
+    correcto = informar("Tiempo hasta el primer prompt", prompt, argumentos.presupuesto_ms)
+    correcto = informar("Tiempo de un main.py --script corto", script, argumentos.presupuesto_script_ms) and correcto
+    return 0 if correcto else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
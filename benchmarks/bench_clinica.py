@@ -0,0 +1,258 @@
+"""
+Benchmark de escalabilidad de las operaciones principales de Clinica.
+
+Para cada tamaño (cantidad de pacientes, turnos y recetas) mide agregar
+pacientes, agendar turnos, validar duplicados, emitir recetas, obtener
+historias clínicas y los listados completos. Informa operaciones por segundo,
+percentiles de latencia y memoria pico, y puede guardar los resultados en
+JSON para compararlos con una corrida anterior.
+
+Uso:
+    python -m benchmarks.bench_clinica [--tamanios 1000 10000 100000 1000000]
+                                       [--salida resultados.json]
+                                       [--comparar anterior.json]
+                                       [--sin-memoria]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+
+TAMANIOS = (1_000, 10_000, 100_000)
+
+# Cantidad máxima de consultas individuales medidas por operación
+MUESTRAS_CONSULTAS = 100_000
+
+# Repeticiones de cada listado completo
+REPETICIONES_LISTADOS = 5
+
+
+class Escenario:
+    """
+    Datos sintéticos de un tamaño dado: n pacientes, un médico cada 100
+    pacientes (al menos 10) que atiende todos los días, y un turno por
+    paciente a partir de mañana, cada 30 minutos por médico.
+
+    Atributos:
+        tamanio (int): Cantidad de pacientes, turnos y recetas
+        pacientes (list[Paciente]): Pacientes a registrar
+        medicos (list[Medico]): Médicos a registrar
+        turnos (list[tuple]): Argumentos (dni, matricula, especialidad, fecha_hora) de cada turno
+    """
+
+    def __init__(self, tamanio):
+        self.tamanio = tamanio
+        cantidad_medicos = max(10, tamanio // 100)
+        inicio = (datetime.now() + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
+
+        self.pacientes = [
+            Paciente(f"Paciente {i}", str(10_000_000 + i), "01/01/1980") for i in range(tamanio)
+        ]
+        self.medicos = []
+        for i in range(cantidad_medicos):
+            medico = Medico(f"Médico {i}", f"M{i}")
+            medico.agregar_especialidad(Especialidad("Clínica", Especialidad.DIAS_VALIDOS))
+            self.medicos.append(medico)
+
+        self.turnos = [
+            (str(10_000_000 + i), f"M{i % cantidad_medicos}", "Clínica",
+             inicio + timedelta(minutes=30 * (i // cantidad_medicos)))
+            for i in range(tamanio)
+        ]
+
+
+def medir(operacion, argumentos):
+    """
+    Ejecuta una operación una vez por cada juego de argumentos, midiendo la
+    latencia de cada llamada.
+
+    Args:
+        operacion (callable): Operación a medir
+        argumentos (iterable[tuple]): Argumentos de cada llamada
+
+    Returns:
+        dict: Operaciones por segundo, percentiles de latencia en microsegundos y cantidad
+    """
+    latencias = []
+    reloj = time.perf_counter_ns
+    gc.disable()
+    try:
+        for args in argumentos:
+            inicio = reloj()
+            operacion(*args)
+            latencias.append(reloj() - inicio)
+    finally:
+        gc.enable()
+    return resumir(latencias)
+
+
+def resumir(latencias):
+    """
+    Calcula las métricas de una lista de latencias.
+
+    Args:
+        latencias (list[int]): Latencias en nanosegundos
+
+    Returns:
+        dict: Métricas de la operación
+    """
+    latencias.sort()
+    total = sum(latencias)
+
+    def percentil(p):
+        return latencias[min(len(latencias) - 1, int(len(latencias) * p))] / 1000
+
+    return {
+        "operaciones": len(latencias),
+        "ops_por_segundo": len(latencias) / (total / 1e9) if total else float("inf"),
+        "p50_us": percentil(0.50),
+        "p95_us": percentil(0.95),
+        "p99_us": percentil(0.99),
+        "max_us": latencias[-1] / 1000,
+    }
+
+
+def cargar(clinica, escenario):
+    """
+    Registra todos los datos de un escenario en una clínica, sin medir.
+
+    Args:
+        clinica (Clinica): Clínica destino
+        escenario (Escenario): Datos a cargar
+    """
+    for paciente in escenario.pacientes:
+        clinica.agregar_paciente(paciente)
+    for medico in escenario.medicos:
+        clinica.agregar_medico(medico)
+    for args in escenario.turnos:
+        clinica.agendar_turno(*args)
+    for dni, matricula, _, _ in escenario.turnos:
+        clinica.emitir_receta(dni, matricula, ["Ibuprofeno"])
+
+
+def ejecutar_tamanio(tamanio, medir_memoria=True, semilla=42):
+    """
+    Mide todas las operaciones para un tamaño.
+
+    Args:
+        tamanio (int): Cantidad de pacientes, turnos y recetas
+        medir_memoria (bool): Si se repite la carga con tracemalloc para medir memoria pico
+        semilla (int): Semilla para elegir las consultas al azar
+
+    Returns:
+        dict: Métricas por operación y memoria pico en MB (o None)
+    """
+    azar = random.Random(semilla)
+    escenario = Escenario(tamanio)
+    clinica = Clinica()
+    resultados = {}
+
+    resultados["agregar_paciente"] = medir(clinica.agregar_paciente, ((p,) for p in escenario.pacientes))
+    for medico in escenario.medicos:
+        clinica.agregar_medico(medico)
+    resultados["agendar_turno"] = medir(clinica.agendar_turno, escenario.turnos)
+
+    muestras = min(tamanio, MUESTRAS_CONSULTAS)
+    ocupados = azar.sample(escenario.turnos, muestras)
+    libres = [(matricula, fecha + timedelta(minutes=15)) for _, matricula, _, fecha in ocupados]
+    resultados["validar_turno_no_duplicado"] = medir(clinica.validar_turno_no_duplicado, libres)
+
+    resultados["emitir_receta"] = medir(
+        clinica.emitir_receta, ((dni, matricula, ["Ibuprofeno"]) for dni, matricula, _, _ in escenario.turnos)
+    )
+    resultados["obtener_historia_clinica"] = medir(
+        clinica.obtener_historia_clinica, ((dni,) for dni, _, _, _ in ocupados)
+    )
+
+    for listado in ("obtener_turnos", "obtener_pacientes", "obtener_medicos"):
+        resultados[listado] = medir(getattr(clinica, listado), [()] * REPETICIONES_LISTADOS)
+
+    memoria_pico_mb = None
+    if medir_memoria:
+        del clinica
+        gc.collect()
+        tracemalloc.start()
+        clinica = Clinica()
+        cargar(clinica, escenario)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memoria_pico_mb = pico / 2**20
+
+    return {"operaciones": resultados, "memoria_pico_mb": memoria_pico_mb}
+
+
+def imprimir(tamanio, resultado, anterior=None):
+    """
+    Imprime la tabla de resultados de un tamaño.
+
+    Args:
+        tamanio (int): Tamaño medido
+        resultado (dict): Resultado de ejecutar_tamanio
+        anterior (dict): Resultado del mismo tamaño en una corrida anterior, o None
+    """
+    memoria = resultado["memoria_pico_mb"]
+    print(f"\n=== {tamanio:,} registros" + (f" - memoria pico {memoria:.1f} MB" if memoria is not None else "") + " ===")
+    print(f"{'operación':<28}{'ops/s':>14}{'p50 µs':>10}{'p95 µs':>10}{'p99 µs':>10}{'máx µs':>12}"
+          + ("  vs. anterior" if anterior else ""))
+
+    for nombre, m in resultado["operaciones"].items():
+        linea = (f"{nombre:<28}{m['ops_por_segundo']:>14,.0f}{m['p50_us']:>10.1f}"
+                 f"{m['p95_us']:>10.1f}{m['p99_us']:>10.1f}{m['max_us']:>12.1f}")
+        previo = (anterior or {}).get("operaciones", {}).get(nombre)
+        if previo:
+            linea += f"  x{m['ops_por_segundo'] / previo['ops_por_segundo']:.2f}"
+        print(linea)
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark para todos los tamaños pedidos.
+
+    Args:
+        argv (list[str]): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanios", type=int, nargs="+", default=list(TAMANIOS))
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="archivo JSON de una corrida anterior")
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir memoria pico (más rápido)")
+    argumentos = parser.parse_args(argv)
+
+    anterior = {}
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as archivo:
+            anterior = json.load(archivo)["resultados"]
+
+    resultados = {}
+    for tamanio in argumentos.tamanios:
+        resultados[str(tamanio)] = ejecutar_tamanio(tamanio, not argumentos.sin_memoria)
+        imprimir(tamanio, resultados[str(tamanio)], anterior.get(str(tamanio)))
+
+    if argumentos.salida:
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "fecha": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "resultados": resultados,
+            }, archivo, indent=2)
+        print(f"\nResultados guardados en {argumentos.salida}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Benchmark de memoria del archivo comprimido de historias clínicas.
+
+Carga en una clínica datos realistas del generador (pacientes frecuentes con
+muchos turnos, recetas en una parte de los turnos) con fechas pasadas, muestra
+una vez todas las historias para que cada turno y receta guarde su texto, y
+mide con tracemalloc la memoria de la clínica antes y después de archivar con
+Clinica.archivar_historias las entradas anteriores a una fecha de corte. Se
+mide la clínica entera y no solo las historias: archivar solo comprime el
+texto de las historias, y los turnos, los índices, las estadísticas y el
+índice de recetas de la clínica siguen guardando los objetos archivados.
+También mide cuánto tarda mostrar todas las historias completas en cada caso,
+ya que lo archivado se descomprime.
+
+Uso:
+    python -m benchmarks.bench_historias [--pacientes N] [--turnos N]
+                                         [--proporcion P] [--semilla S]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from benchmarks.generador import GeneradorDatos
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.turno import Turno
+from modelo.receta import Receta
+
+# Días hacia atrás en los que empiezan los turnos generados; alcanza para que
+# los turnos de la configuración por defecto sean todos pasados
+DIAS_DE_HISTORIA = 5 * 365
+
+
+def crear_clinica(generador, cantidad_pacientes):
+    """
+    Crea una clínica con los médicos y pacientes generados, sin turnos.
+
+    Args:
+        generador (GeneradorDatos): Generador de datos
+        cantidad_pacientes (int): Cantidad de pacientes
+
+    Returns:
+        Clinica: La clínica creada
+    """
+    clinica = Clinica()
+    for nombre, matricula, especialidades in generador.medicos():
+        medico = Medico(nombre, matricula)
+        for especialidad, dias in especialidades:
+            medico.agregar_especialidad(Especialidad(especialidad, dias))
+        clinica.agregar_medico(medico)
+    for nombre, dni, fecha in generador.pacientes(cantidad_pacientes):
+        clinica.agregar_paciente(Paciente(nombre, dni, fecha))
+    return clinica
+
+
+def cargar_historia(clinica, generador, cantidad_pacientes, cantidad_turnos):
+    """
+    Restaura en la clínica los turnos y recetas generados, que ya pasaron.
+
+    Args:
+        clinica (Clinica): Clínica con los médicos y pacientes del generador
+        generador (GeneradorDatos): Generador de datos
+        cantidad_pacientes (int): Cantidad de pacientes
+        cantidad_turnos (int): Cantidad de turnos
+
+    Returns:
+        list[datetime]: Fechas de los turnos
+    """
+    pacientes = {paciente.obtener_dni(): paciente for paciente in clinica.obtener_pacientes()}
+    medicos = {medico.obtener_matricula(): medico for medico in clinica.obtener_medicos()}
+    fechas = []
+
+    for turno, receta in generador.turnos_con_recetas(cantidad_turnos, cantidad_pacientes):
+        dni, matricula, especialidad, fecha_hora, _ = turno
+        clinica.restaurar_turno(Turno.restaurar(pacientes[dni], medicos[matricula], fecha_hora, especialidad))
+        fechas.append(fecha_hora)
+        if receta is not None:
+            clinica.restaurar_receta(Receta.restaurar(pacientes[dni], medicos[matricula], receta[2], receta[3]))
+
+    return fechas
+
+
+def medir_lectura(clinica):
+    """
+    Mide cuánto tarda mostrar todas las historias completas.
+
+    Args:
+        clinica (Clinica): Clínica cuyas historias se muestran
+
+    Returns:
+        tuple[float, int]: Segundos y caracteres generados
+    """
+    inicio = time.perf_counter()
+    caracteres = sum(len(str(clinica.obtener_historia_clinica(paciente.obtener_dni())))
+                     for paciente in clinica.obtener_pacientes())
+    return time.perf_counter() - inicio, caracteres
+
+
+def memoria_actual():
+    """
+    Devuelve la memoria rastreada por tracemalloc después de recolectar basura.
+
+    Returns:
+        int: Bytes reservados
+    """
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def ejecutar(cantidad_pacientes, cantidad_turnos, proporcion, semilla=0):
+    """
+    Ejecuta el benchmark.
+
+    Args:
+        cantidad_pacientes (int): Cantidad de pacientes
+        cantidad_turnos (int): Cantidad de turnos
+        proporcion (float): Proporción de turnos (los más antiguos) a archivar
+        semilla (int): Semilla del generador
+
+    Returns:
+        dict: Memoria, tiempos de lectura y cantidad de entradas archivadas
+    """
+    generador = GeneradorDatos(semilla, inicio=datetime.now() - timedelta(days=DIAS_DE_HISTORIA))
+
+    # Se mide todo lo que la clínica guarda por sus turnos y recetas
+    tracemalloc.start()
+    try:
+        clinica = crear_clinica(generador, cantidad_pacientes)
+        base = memoria_actual()
+        fechas = cargar_historia(clinica, generador, cantidad_pacientes, cantidad_turnos)
+        lectura_antes, caracteres_antes = medir_lectura(clinica)
+        memoria_antes = memoria_actual() - base
+
+        # Solo se puede archivar el pasado
+        fechas.sort()
+        corte = min(fechas[min(len(fechas) - 1, int(len(fechas) * proporcion))], datetime.now())
+        del fechas
+        inicio = time.perf_counter()
+        archivadas = clinica.archivar_historias(corte)
+        segundos_archivo = time.perf_counter() - inicio
+        memoria_despues = memoria_actual() - base
+
+        lectura_despues, caracteres_despues = medir_lectura(clinica)
+    finally:
+        tracemalloc.stop()
+
+    if caracteres_antes != caracteres_despues:
+        raise RuntimeError("Las historias archivadas no muestran el mismo texto")
+
+    return {
+        "archivadas": archivadas,
+        "memoria_antes": memoria_antes,
+        "memoria_despues": memoria_despues,
+        "segundos_archivo": segundos_archivo,
+        "lectura_antes": lectura_antes,
+        "lectura_despues": lectura_despues,
+    }
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime los resultados.
+
+    Args:
+        argv (list[str]): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de memoria del archivo de historias clínicas")
+    parser.add_argument("--pacientes", type=int, default=20_000)
+    parser.add_argument("--turnos", type=int, default=200_000)
+    parser.add_argument("--proporcion", type=float, default=0.8,
+                        help="proporción de turnos, los más antiguos, que se archivan")
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args(argv)
+
+    resultado = ejecutar(argumentos.pacientes, argumentos.turnos, argumentos.proporcion, argumentos.semilla)
+    antes = resultado["memoria_antes"] / 2**20
+    despues = resultado["memoria_despues"] / 2**20
+    print(f"Entradas archivadas: {resultado['archivadas']} en {resultado['segundos_archivo']:.2f} s")
+    print(f"Memoria de la clínica: {antes:.1f} MiB -> {despues:.1f} MiB "
+          f"({despues / antes - 1:+.0%})")
+    print(f"Mostrar todas las historias: {resultado['lectura_antes']:.2f} s -> "
+          f"{resultado['lectura_despues']:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
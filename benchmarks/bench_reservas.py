@@ -0,0 +1,208 @@
+"""
+Benchmark del canal de reservas bajo una ráfaga.
+
+Varios hilos productores envían todas sus reservas a la vez. Se compara:
+
+    - Una por una: cada reserva toma el candado de la clínica, agenda el
+      turno y escribe y vacía el diario por su cuenta.
+    - Canal: las reservas pasan por CanalReservas, que las agenda por lotes
+      con una sola toma del candado y un solo vaciado del diario por lote.
+
+En ambos casos el diario se sincroniza con el disco (fsync) salvo que se
+indique --sin-fsync. Las reservas no se superponen entre sí, así que las
+dos variantes agendan los mismos turnos.
+
+Uso:
+    python -m benchmarks.bench_reservas [--reservas N] [--hilos N] [--medicos N]
+                                        [--tamanio-lote N] [--sin-fsync]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from reservas import CanalReservas, registro_diario
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+
+
+def crear_clinica(cantidad_medicos, cantidad_pacientes):
+    """
+    Crea una clínica con médicos que atienden todos los días.
+
+    Args:
+        cantidad_medicos (int): Cantidad de médicos
+        cantidad_pacientes (int): Cantidad de pacientes
+
+    Returns:
+        Clinica: La clínica creada
+    """
+    clinica = Clinica()
+    for numero in range(cantidad_medicos):
+        medico = Medico(f"Médico {numero}", f"M{numero}")
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS))
+        clinica.agregar_medico(medico)
+    for numero in range(cantidad_pacientes):
+        clinica.agregar_paciente(Paciente(f"Paciente {numero}", str(numero), "01/01/1990"))
+    return clinica
+
+
+def generar_reservas(cantidad, cantidad_medicos, cantidad_pacientes):
+    """
+    Genera reservas válidas y sin superposiciones.
+
+    La reserva k es con el médico k % médicos en el horario k // médicos, y
+    para el paciente k % pacientes; con al menos tantos pacientes como
+    médicos, un paciente nunca tiene dos reservas en el mismo horario.
+
+    Args:
+        cantidad (int): Cantidad de reservas
+        cantidad_medicos (int): Cantidad de médicos
+        cantidad_pacientes (int): Cantidad de pacientes (al menos la de médicos)
+
+    Returns:
+        list[tuple[str, str, str, datetime]]: DNI, matrícula, especialidad y fecha y hora
+    """
+    inicio = (datetime.now() + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
+    por_dia = (Clinica.HORA_CIERRE - Clinica.HORA_APERTURA) * 2
+    reservas = []
+    for numero in range(cantidad):
+        horario = numero // cantidad_medicos
+        fecha_hora = inicio + timedelta(days=horario // por_dia) + Clinica.DURACION_TURNO * (horario % por_dia)
+        reservas.append((str(numero % cantidad_pacientes), f"M{numero % cantidad_medicos}", "Clínica", fecha_hora))
+    return reservas
+
+
+def en_hilos(reservas, cantidad_hilos, funcion):
+    """
+    Reparte las reservas entre hilos que las envían todos a la vez.
+
+    Args:
+        reservas (list[tuple]): Reservas
+        cantidad_hilos (int): Cantidad de hilos productores
+        funcion (callable): Recibe la parte de cada hilo
+
+    Returns:
+        float: Segundos desde la largada hasta que terminan todos los hilos
+    """
+    largada = threading.Barrier(cantidad_hilos + 1)
+
+    def producir(parte):
+        largada.wait()
+        funcion(parte)
+
+    hilos = [threading.Thread(target=producir, args=(reservas[i::cantidad_hilos],)) for i in range(cantidad_hilos)]
+    for hilo in hilos:
+        hilo.start()
+    largada.wait()
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.join()
+    return time.perf_counter() - inicio
+
+
+def medir_una_por_una(clinica, reservas, cantidad_hilos, ruta_diario, sincronizar):
+    """
+    Agenda cada reserva por separado, con su propio vaciado del diario.
+
+    Args:
+        clinica (Clinica): Clínica donde se agenda
+        reservas (list[tuple]): Reservas
+        cantidad_hilos (int): Cantidad de hilos productores
+        ruta_diario (str): Ruta del diario
+        sincronizar (bool): Sincronizar el diario con el disco en cada reserva
+
+    Returns:
+        float: Segundos
+    """
+    candado = threading.Lock()
+    with open(ruta_diario, "a", encoding="utf-8") as diario:
+        def reservar(parte):
+            for dni, matricula, especialidad, fecha_hora in parte:
+                with candado:
+                    turno = clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
+                    diario.write(json.dumps(registro_diario(turno), ensure_ascii=False) + "\n")
+                    diario.flush()
+                    if sincronizar:
+                        os.fsync(diario.fileno())
+
+        return en_hilos(reservas, cantidad_hilos, reservar)
+
+
+def medir_canal(clinica, reservas, cantidad_hilos, ruta_diario, sincronizar, tamanio_lote):
+    """
+    Agenda las reservas a través de CanalReservas.
+
+    Args:
+        clinica (Clinica): Clínica donde se agenda
+        reservas (list[tuple]): Reservas
+        cantidad_hilos (int): Cantidad de hilos productores
+        ruta_diario (str): Ruta del diario
+        sincronizar (bool): Sincronizar el diario con el disco en cada lote
+        tamanio_lote (int): Cantidad máxima de reservas por lote
+
+    Returns:
+        tuple[float, dict]: Segundos y estadísticas del canal
+    """
+    canal = CanalReservas(clinica, ruta_diario, tamanio_lote=tamanio_lote, sincronizar=sincronizar)
+
+    def reservar(parte):
+        futuros = [canal.solicitar(*reserva) for reserva in parte]
+        for futuro in futuros:
+            futuro.result()
+
+    try:
+        segundos = en_hilos(reservas, cantidad_hilos, reservar)
+    finally:
+        canal.cerrar()
+    return segundos, canal.obtener_estadisticas()
+
+
+def main(argv=None):
+    """
+    Ejecuta el benchmark e imprime los resultados.
+
+    Args:
+        argv (list[str]): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description="Benchmark del canal de reservas bajo una ráfaga")
+    parser.add_argument("--reservas", type=int, default=20_000)
+    parser.add_argument("--hilos", type=int, default=8)
+    parser.add_argument("--medicos", type=int, default=50)
+    parser.add_argument("--tamanio-lote", type=int, default=256)
+    parser.add_argument("--sin-fsync", action="store_true", help="no sincronizar el diario con el disco")
+    argumentos = parser.parse_args(argv)
+
+    pacientes = max(argumentos.medicos, 1_000)
+    reservas = generar_reservas(argumentos.reservas, argumentos.medicos, pacientes)
+    sincronizar = not argumentos.sin_fsync
+
+    with tempfile.TemporaryDirectory() as directorio:
+        una_por_una = medir_una_por_una(crear_clinica(argumentos.medicos, pacientes), reservas, argumentos.hilos,
+                                        os.path.join(directorio, "una_por_una.jsonl"), sincronizar)
+        canal, estadisticas = medir_canal(crear_clinica(argumentos.medicos, pacientes), reservas, argumentos.hilos,
+                                          os.path.join(directorio, "canal.jsonl"), sincronizar,
+                                          argumentos.tamanio_lote)
+
+    cantidad = len(reservas)
+    print(f"{cantidad} reservas desde {argumentos.hilos} hilos (fsync: {'sí' if sincronizar else 'no'})")
+    print(f"Una por una: {cantidad / una_por_una:10.0f} reservas/s ({una_por_una:.2f} s)")
+    print(f"Canal:       {cantidad / canal:10.0f} reservas/s ({canal:.2f} s), "
+          f"{estadisticas['lotes']} lotes, el mayor de {estadisticas['mayor_lote']}")
+    print(f"Mejora: {una_por_una / canal:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+"""
+Generador determinístico de datos sintéticos para pruebas de carga.
+
+Produce médicos con especialidades y días de atención, pacientes, turnos y
+recetas válidos para el modelo: los años de nacimiento no superan 2024 y los
+turnos son siempre futuros. Los datos salen como flujos de tuplas, de modo que
+se pueden volcar directamente en una Clinica o en archivos CSV sin tenerlos
+todos en memoria.
+
+Distribuciones:
+    - La demanda de especialidades es sesgada (Clínica y Pediatría concentran
+      la mayoría de los turnos) y la cantidad de médicos de cada una es
+      proporcional a su demanda.
+    - Cada médico atiende de lunes a sábado, con cada especialidad en días
+      fijos; los turnos son cada 30 minutos de 8 a 18, más llenos a la mañana.
+    - Los pacientes frecuentes (crónicos) concentran más turnos.
+    - Cada turno tiene una fecha de solicitud con anticipación exponencial
+      (unos 10 días de media).
+
+Uso:
+    python -m benchmarks.generador DIRECTORIO --pacientes N --turnos N [--semilla S]
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+
+# Especialidad -> peso relativo de su demanda
+ESPECIALIDADES = {
+    "Clínica": 30, "Pediatría": 20, "Ginecología": 10, "Traumatología": 9,
+    "Cardiología": 8, "Dermatología": 7, "Oftalmología": 6, "Otorrinolaringología": 4,
+    "Neurología": 3, "Endocrinología": 3,
+}
+
+NOMBRES = [
+    "Juan", "María", "José", "Ana", "Luis", "Lucía", "Carlos", "Sofía", "Jorge", "Valentina",
+    "Pedro", "Laura", "Diego", "Camila", "Miguel", "Martina", "Pablo", "Julieta", "Ramón", "Inés",
+]
+
+APELLIDOS = [
+    "González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez",
+    "García", "Sánchez", "Romero", "Sosa", "Álvarez", "Torres", "Ruiz", "Ramírez", "Flores",
+    "Acosta", "Benítez", "Medina",
+]
+
+# Medicamento -> peso relativo de prescripción
+MEDICAMENTOS = {
+    "Ibuprofeno": 25, "Paracetamol": 22, "Amoxicilina": 12, "Omeprazol": 10, "Enalapril": 8,
+    "Metformina": 7, "Atorvastatina": 6, "Levotiroxina": 5, "Loratadina": 4, "Salbutamol": 3,
+}
+
+DIAS_LABORABLES = Especialidad.DIAS_VALIDOS[:6]
+
+HORA_APERTURA = 8
+TURNOS_POR_DIA = 20  # De 8:00 a 17:30, cada 30 minutos
+
+# Probabilidad relativa de que se ocupe cada horario (más demanda a la mañana)
+PESOS_HORARIOS = [3 if i < 8 else 2 if i < 14 else 1 for i in range(TURNOS_POR_DIA)]
+
+
+class GeneradorDatos:
+    """
+    Genera datos sintéticos reproducibles a partir de una semilla.
+
+    Cada tipo de dato usa su propio generador de números aleatorios, así que
+    cambiar la cantidad de pacientes no altera los médicos, por ejemplo.
+
+    Atributos:
+        semilla (int): Semilla de los generadores
+        cantidad_medicos (int): Cantidad de médicos a generar
+        inicio (datetime): Primer día con turnos (por defecto, mañana)
+        probabilidad_receta (float): Proporción de turnos que generan una receta
+    """
+
+    def __init__(self, semilla=0, cantidad_medicos=40, inicio=None, probabilidad_receta=0.4):
+        """
+        Inicializa el generador.
+
+        Args:
+            semilla (int): Semilla de los generadores
+            cantidad_medicos (int): Cantidad de médicos a generar
+            inicio (datetime): Primer día con turnos (por defecto, mañana);
+                debe ser futuro para que los turnos sean válidos
+            probabilidad_receta (float): Proporción de turnos que generan una receta
+        """
+        if inicio is None:
+            inicio = datetime.now() + timedelta(days=1)
+
+        self.semilla = semilla
+        self.cantidad_medicos = cantidad_medicos
+        self.inicio = inicio.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.probabilidad_receta = probabilidad_receta
+        self.__medicos = None
+
+    def _azar(self, flujo):
+        """
+        Devuelve un generador aleatorio propio de un flujo de datos.
+
+        Args:
+            flujo (str): Nombre del flujo ("medicos", "pacientes", ...)
+
+        Returns:
+            random.Random: Generador inicializado con la semilla y el flujo
+        """
+        return random.Random(f"{self.semilla}-{flujo}")
+
+    def medicos(self):
+        """
+        Genera los médicos con sus especialidades y días de atención.
+
+        Cada médico tiene una especialidad principal (elegida según la
+        demanda) y, a veces, una secundaria, en días distintos.
+
+        Returns:
+            list[tuple]: (nombre, matricula, [(especialidad, [días])]) por médico
+        """
+        if self.__medicos is not None:
+            return self.__medicos
+
+        azar = self._azar("medicos")
+        nombres = list(ESPECIALIDADES)
+        pesos = list(accumulate(ESPECIALIDADES.values()))
+
+        medicos = []
+        for i in range(self.cantidad_medicos):
+            # Los primeros médicos cubren todas las especialidades al menos una vez
+            principal = nombres[i] if i < len(nombres) else azar.choices(nombres, cum_weights=pesos)[0]
+            dias = azar.sample(DIAS_LABORABLES, len(DIAS_LABORABLES))
+            cantidad_principal = azar.randint(2, 4)
+            especialidades = [(principal, sorted(dias[:cantidad_principal], key=DIAS_LABORABLES.index))]
+
+            secundaria = azar.choices(nombres, cum_weights=pesos)[0]
+            if secundaria != principal and azar.random() < 0.3:
+                especialidades.append((secundaria, sorted(dias[cantidad_principal:], key=DIAS_LABORABLES.index)))
+
+            nombre = f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)}"
+            medicos.append((nombre, f"M{i + 1:05d}", especialidades))
+
+        self.__medicos = medicos
+        return medicos
+
+    def pacientes(self, cantidad):
+        """
+        Genera pacientes con DNI únicos y fechas de nacimiento entre 1930 y 2024.
+
+        Args:
+            cantidad (int): Cantidad de pacientes
+
+        Yields:
+            tuple: (nombre, dni, fecha_nacimiento en formato dd/mm/aaaa)
+        """
+        azar = self._azar("pacientes")
+        for i in range(cantidad):
+            nombre = f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)} {azar.choice(APELLIDOS)}"
+            anio = int(azar.triangular(1930, 2024.99, 1985))
+            fecha = f"{azar.randint(1, 28):02d}/{azar.randint(1, 12):02d}/{anio}"
+            yield nombre, self.dni(i), fecha
+
+    @staticmethod
+    def dni(indice):
+        """
+        Devuelve el DNI del paciente número `indice`.
+
+        Args:
+            indice (int): Posición del paciente, desde 0
+
+        Returns:
+            str: DNI del paciente
+        """
+        return str(20_000_000 + indice)
+
+    def turnos(self, cantidad, cantidad_pacientes):
+        """
+        Genera turnos en orden cronológico, día por día, sin horarios
+        repetidos para un médico ni para un paciente.
+
+        Solo guarda en memoria los datos del día que está generando.
+
+        Args:
+            cantidad (int): Cantidad de turnos
+            cantidad_pacientes (int): Cantidad de pacientes generados con `pacientes`
+
+        Yields:
+            tuple: (dni, matricula, especialidad, fecha_hora, fecha_solicitud)
+
+        Raises:
+            ValueError: Si no hay pacientes
+        """
+        if cantidad_pacientes <= 0:
+            raise ValueError("Se necesita al menos un paciente para generar turnos")
+
+        azar = self._azar("turnos")
+        agenda = self._agenda_semanal()
+        total_pesos = sum(PESOS_HORARIOS)
+        generados = 0
+        dia = self.inicio
+
+        while generados < cantidad:
+            pacientes_ocupados = set()
+            for matricula, especialidad, ocupacion in agenda[dia.weekday()]:
+                for horario, peso in enumerate(PESOS_HORARIOS):
+                    if azar.random() >= ocupacion * peso * TURNOS_POR_DIA / total_pesos:
+                        continue
+
+                    # Los pacientes con índice bajo son los frecuentes
+                    indice = int(cantidad_pacientes * azar.random() ** 2)
+                    if (indice, horario) in pacientes_ocupados:
+                        continue
+                    pacientes_ocupados.add((indice, horario))
+
+                    fecha_hora = dia + timedelta(hours=HORA_APERTURA, minutes=30 * horario)
+                    anticipacion = timedelta(days=min(60.0, azar.expovariate(0.1)))
+                    yield self.dni(indice), matricula, especialidad, fecha_hora, fecha_hora - anticipacion
+
+                    generados += 1
+                    if generados >= cantidad:
+                        return
+            dia += timedelta(days=1)
+
+    def receta(self, turno, azar):
+        """
+        Decide si un turno genera una receta y, en ese caso, la genera.
+
+        Args:
+            turno (tuple): Turno generado por `turnos`
+            azar (random.Random): Generador aleatorio de recetas
+
+        Returns:
+            tuple | None: (dni, matricula, [medicamentos], fecha) o None
+        """
+        if azar.random() >= self.probabilidad_receta:
+            return None
+
+        cantidad = 1 + int(azar.random() ** 3 * 3)
+        medicamentos = set(azar.choices(list(MEDICAMENTOS), weights=list(MEDICAMENTOS.values()), k=cantidad))
+        dni, matricula, _, fecha_hora, _ = turno
+        return dni, matricula, sorted(medicamentos), fecha_hora
+
+    def turnos_con_recetas(self, cantidad, cantidad_pacientes):
+        """
+        Genera los turnos de `turnos` junto con la receta que genera cada uno.
+
+        Args:
+            cantidad (int): Cantidad de turnos
+            cantidad_pacientes (int): Cantidad de pacientes generados con `pacientes`
+
+        Yields:
+            tuple: (turno, receta), con los formatos de `turnos` y de `receta`
+                (la receta es None si el turno no genera una)
+        """
+        azar = self._azar("recetas")
+        for turno in self.turnos(cantidad, cantidad_pacientes):
+            yield turno, self.receta(turno, azar)
+
+    def _agenda_semanal(self):
+        """
+        Arma, para cada día de la semana, qué médicos atienden qué especialidad
+        y con qué ocupación esperada.
+
+        La ocupación de cada especialidad es proporcional a su demanda por
+        médico disponible, con un máximo del 95%.
+
+        Returns:
+            list[list[tuple]]: Por día (0 = lunes), tuplas (matricula, especialidad, ocupación)
+        """
+        oferta = {}
+        for _, matricula, especialidades in self.medicos():
+            for especialidad, dias in especialidades:
+                oferta[especialidad] = oferta.get(especialidad, 0) + len(dias)
+
+        demanda_total = sum(ESPECIALIDADES.values())
+        oferta_total = sum(oferta.values())
+
+        agenda = [[] for _ in range(7)]
+        for _, matricula, especialidades in self.medicos():
+            for especialidad, dias in especialidades:
+                relativa = (ESPECIALIDADES[especialidad] / demanda_total) / (oferta[especialidad] / oferta_total)
+                ocupacion = min(0.95, 0.7 * relativa)
+                for dia in dias:
+                    agenda[Especialidad.DIAS_VALIDOS.index(dia)].append((matricula, especialidad, ocupacion))
+        return agenda
+
+
+def poblar_clinica(clinica, generador, cantidad_pacientes, cantidad_turnos):
+    """
+    Carga en una clínica los médicos, pacientes, turnos y recetas generados.
+
+    Args:
+        clinica (Clinica): Clínica destino (sin datos previos con los mismos DNI o matrículas)
+        generador (GeneradorDatos): Generador de datos
+        cantidad_pacientes (int): Cantidad de pacientes
+        cantidad_turnos (int): Cantidad de turnos
+
+    Returns:
+        dict: Cantidad de registros cargados por tipo y turnos rechazados
+    """
+    for nombre, matricula, especialidades in generador.medicos():
+        medico = Medico(nombre, matricula)
+        for especialidad, dias in especialidades:
+            medico.agregar_especialidad(Especialidad(especialidad, dias))
+        clinica.agregar_medico(medico)
+
+    for nombre, dni, fecha in generador.pacientes(cantidad_pacientes):
+        clinica.agregar_paciente(Paciente(nombre, dni, fecha))
+
+    azar_recetas = generador._azar("recetas")
+    turnos = recetas = rechazados = 0
+    for turno in generador.turnos(cantidad_turnos, cantidad_pacientes):
+        dni, matricula, especialidad, fecha_hora, _ = turno
+        try:
+            clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
+        except Exception:
+            rechazados += 1
+            continue
+        turnos += 1
+
+        receta = generador.receta(turno, azar_recetas)
+        if receta is not None:
+            clinica.emitir_receta(receta[0], receta[1], receta[2])
+            recetas += 1
+
+    return {
+        "medicos": len(generador.medicos()),
+        "pacientes": cantidad_pacientes,
+        "turnos": turnos,
+        "recetas": recetas,
+        "rechazados": rechazados,
+    }
+
+
+def escribir_archivos(directorio, generador, cantidad_pacientes, cantidad_turnos):
+    """
+    Escribe los datos generados en archivos CSV, fila por fila.
+
+    Crea medicos.csv, especialidades.csv, pacientes.csv, turnos.csv y
+    recetas.csv (los medicamentos de una receta van separados por '|').
+
+    Args:
+        directorio (str): Directorio destino (se crea si no existe)
+        generador (GeneradorDatos): Generador de datos
+        cantidad_pacientes (int): Cantidad de pacientes
+        cantidad_turnos (int): Cantidad de turnos
+
+    Returns:
+        dict: Cantidad de filas escritas por archivo
+    """
+    os.makedirs(directorio, exist_ok=True)
+
+    def abrir(nombre, encabezado):
+        archivo = open(os.path.join(directorio, nombre), "w", newline="", encoding="utf-8")
+        escritor = csv.writer(archivo)
+        escritor.writerow(encabezado)
+        return archivo, escritor
+
+    conteos = {}
+
+    archivo_medicos, medicos = abrir("medicos.csv", ["matricula", "nombre"])
+    archivo_especialidades, especialidades = abrir("especialidades.csv", ["matricula", "especialidad", "dias"])
+    with archivo_medicos, archivo_especialidades:
+        for nombre, matricula, lista in generador.medicos():
+            medicos.writerow([matricula, nombre])
+            for especialidad, dias in lista:
+                especialidades.writerow([matricula, especialidad, ",".join(dias)])
+    conteos["medicos"] = len(generador.medicos())
+
+    archivo, pacientes = abrir("pacientes.csv", ["dni", "nombre", "fecha_nacimiento"])
+    with archivo:
+        pacientes.writerows((dni, nombre, fecha) for nombre, dni, fecha in generador.pacientes(cantidad_pacientes))
+    conteos["pacientes"] = cantidad_pacientes
+
+    azar_recetas = generador._azar("recetas")
+    archivo_turnos, turnos = abrir("turnos.csv", ["dni", "matricula", "especialidad", "fecha_hora", "fecha_solicitud"])
+    archivo_recetas, recetas = abrir("recetas.csv", ["dni", "matricula", "medicamentos", "fecha"])
+    conteos["turnos"] = conteos["recetas"] = 0
+    with archivo_turnos, archivo_recetas:
+        for turno in generador.turnos(cantidad_turnos, cantidad_pacientes):
+            dni, matricula, especialidad, fecha_hora, solicitud = turno
+            turnos.writerow([dni, matricula, especialidad,
+                             fecha_hora.strftime("%d/%m/%Y %H:%M"), solicitud.strftime("%d/%m/%Y %H:%M")])
+            conteos["turnos"] += 1
+
+            receta = generador.receta(turno, azar_recetas)
+            if receta is not None:
+                recetas.writerow([dni, matricula, "|".join(receta[2]), fecha_hora.strftime("%d/%m/%Y %H:%M")])
+                conteos["recetas"] += 1
+
+    return conteos
+
+
+def main(argv=None):
+    """
+    Genera un conjunto de datos en archivos CSV.
+
+    Args:
+        argv (list[str]): Argumentos de la línea de comandos
+
+    Returns:
+        int: Código de salida
+    """
+    parser = argparse.ArgumentParser(description="Genera datos sintéticos de la clínica en CSV")
+    parser.add_argument("directorio")
+    parser.add_argument("--pacientes", type=int, default=10_000)
+    parser.add_argument("--turnos", type=int, default=100_000)
+    parser.add_argument("--medicos", type=int, default=40)
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args(argv)
+
+    generador = GeneradorDatos(argumentos.semilla, argumentos.medicos)
+    inicio = time.perf_counter()
+    conteos = escribir_archivos(argumentos.directorio, generador, argumentos.pacientes, argumentos.turnos)
+    segundos = time.perf_counter() - inicio
+
+    filas = sum(conteos.values())
+    print(", ".join(f"{cantidad} {nombre}" for nombre, cantidad in conteos.items()))
+    print(f"{filas} filas en {segundos:.2f} s ({filas / segundos:,.0f} filas/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,10 @@
+import sys
 from datetime import datetime
-from modelo.clinica import Clinica
-from modelo.paciente import Paciente
-from modelo.medico import Medico
-from modelo.especialidad import Especialidad
 from modelo.excepciones import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    PacienteOcupadoException,
     RecetaInvalidaException
 )
 
@@ -17,9 +15,23 @@ class CLI:
     
     def __init__(self):
         """
-        Inicializa la CLI con una nueva instancia de clínica.
+        Inicializa la CLI. La clínica se crea recién cuando se usa por primera
+        vez, para mostrar el menú sin esperar a que se cargue el modelo.
         """
-        self.clinica = Clinica()
+        self.__clinica = None
+    
+    @property
+    def clinica(self):
+        """
+        Devuelve la clínica, creándola en el primer acceso.
+        
+        Returns:
+            Clinica: La clínica administrada por la CLI
+        """
+        if self.__clinica is None:
+            from modelo.clinica import Clinica
+            self.__clinica = Clinica()
+        return self.__clinica
     
     def mostrar_menu(self):
         """
@@ -114,6 +126,7 @@ class CLI:
                 print(" Formato de fecha inválido. Use dd/mm/aaaa")
                 return
             
+            from modelo.paciente import Paciente
             paciente = Paciente(nombre, dni, fecha_nacimiento)
             self.clinica.agregar_paciente(paciente)
             
@@ -142,6 +155,7 @@ class CLI:
                 print(" La matrícula no puede estar vacía.")
                 return
             
+            from modelo.medico import Medico
             medico = Medico(nombre, matricula)
             
             # Solicitar especialidades
@@ -190,6 +204,7 @@ class CLI:
                 continue
             
             try:
+                from modelo.especialidad import Especialidad
                 especialidad = Especialidad(especialidad_nombre, dias)
                 medico.agregar_especialidad(especialidad)
                 print(f"Especialidad {especialidad_nombre} agregada!")
@@ -234,8 +249,9 @@ class CLI:
                 print(f"Días inválidos: {', '.join(dias_invalidos)}")
                 return
             
+            from modelo.especialidad import Especialidad
             especialidad = Especialidad(especialidad_nombre, dias)
-            medico.agregar_especialidad(especialidad)
+            self.clinica.agregar_especialidad_a_medico(matricula, especialidad)
             
             print(f"Especialidad {especialidad_nombre} agregada al médico {medico.obtener_matricula()}!")
             
@@ -287,7 +303,7 @@ class CLI:
             print("Turno agendado exitosamente!")
             
         except (PacienteNoEncontradoException, MedicoNoDisponibleException, 
-                TurnoOcupadoException) as e:
+                TurnoOcupadoException, PacienteOcupadoException) as e:
             print(f"{e}")
         except ValueError as e:
             print(f"Error: {e}")
@@ -351,57 +367,94 @@ class CLI:
                 return
             
             historia = self.clinica.obtener_historia_clinica(dni)
-            print("\n" + str(historia))
+            print()
+            historia.escribir(sys.stdout)
             
         except PacienteNoEncontradoException as e:
             print(f"{e}")
         except Exception as e:
             print(f"Error inesperado: {e}")
     
-    def ver_todos_los_turnos(self):
+    def ver_todos_los_turnos(self, desde=None, medico=None, especialidad=None,
+                             formato="texto", pagina=1, por_pagina=None, destino=None):
         """
-        Muestra todos los turnos agendados.
-        """
-        print("TODOS LOS TURNOS")
-        print("-" * 25)
-        
-        turnos = self.clinica.obtener_turnos()
+        Muestra los turnos agendados, opcionalmente filtrados y paginados.
         
-        if not turnos:
-            print("No hay turnos agendados.")
-            return
+        Args:
+            desde (datetime): Si se indica, solo turnos desde esa fecha y hora
+            medico (str): Si se indica, solo turnos del médico con esa matrícula
+            especialidad (str): Si se indica, solo turnos de esa especialidad
+            formato (str): "texto", "tsv" o "jsonl"
+            pagina (int): Número de página, comenzando en 1
+            por_pagina (int): Filas por página (None muestra todas)
+            destino: Flujo de salida (por defecto, sys.stdout)
+        """
+        from listados import seleccionar_turnos, fila_turno
         
-        for i, turno in enumerate(turnos, 1):
-            print(f"{i}. {turno}")
+        turnos = seleccionar_turnos(self.clinica, desde, medico, especialidad)
+        self.__mostrar_listado("TODOS LOS TURNOS", "-" * 25, "No hay turnos agendados.",
+                               turnos, fila_turno, formato, pagina, por_pagina, destino)
     
-    def ver_todos_los_pacientes(self):
+    def ver_todos_los_pacientes(self, formato="texto", pagina=1, por_pagina=None, destino=None):
         """
-        Muestra todos los pacientes registrados.
+        Muestra todos los pacientes registrados, opcionalmente paginados.
+        
+        Args:
+            formato (str): "texto", "tsv" o "jsonl"
+            pagina (int): Número de página, comenzando en 1
+            por_pagina (int): Filas por página (None muestra todas)
+            destino: Flujo de salida (por defecto, sys.stdout)
         """
-        print("TODOS LOS PACIENTES")
-        print("-" * 30)
+        from listados import fila_paciente
         
         pacientes = self.clinica.obtener_pacientes()
+        self.__mostrar_listado("TODOS LOS PACIENTES", "-" * 30, "No hay pacientes registrados.",
+                               pacientes, fila_paciente, formato, pagina, por_pagina, destino)
+    
+    def ver_todos_los_medicos(self, especialidad=None, formato="texto", pagina=1,
+                              por_pagina=None, destino=None):
+        """
+        Muestra los médicos registrados, opcionalmente filtrados y paginados.
         
-        if not pacientes:
-            print("No hay pacientes registrados.")
-            return
+        Args:
+            especialidad (str): Si se indica, solo médicos con esa especialidad
+            formato (str): "texto", "tsv" o "jsonl"
+            pagina (int): Número de página, comenzando en 1
+            por_pagina (int): Filas por página (None muestra todas)
+            destino: Flujo de salida (por defecto, sys.stdout)
+        """
+        from listados import seleccionar_medicos, fila_medico
         
-        for i, paciente in enumerate(pacientes, 1):
-            print(f"{i}. {paciente}")
+        medicos = seleccionar_medicos(self.clinica, especialidad)
+        self.__mostrar_listado("TODOS LOS MÉDICOS", "-" * 25, "No hay médicos registrados.",
+                               medicos, fila_medico, formato, pagina, por_pagina, destino)
     
-    def ver_todos_los_medicos(self):
+    def __mostrar_listado(self, titulo, separador, mensaje_vacio, objetos, a_fila,
+                          formato, pagina, por_pagina, destino):
         """
-        Muestra todos los médicos registrados.
+        Escribe un listado con su título. En formato TSV o JSONL solo se
+        escriben las filas, para que la salida se pueda procesar con otras
+        herramientas.
+        
+        Args:
+            titulo (str): Título del listado
+            separador (str): Línea bajo el título
+            mensaje_vacio (str): Texto a mostrar si no hay filas
+            objetos (list): Objetos a listar
+            a_fila (callable): Convierte un objeto en un dict de campos
+            formato (str): "texto", "tsv" o "jsonl"
+            pagina (int): Número de página
+            por_pagina (int): Filas por página, o None
+            destino: Flujo de salida, o None para sys.stdout
         """
-        print("TODOS LOS MÉDICOS")
-        print("-" * 25)
+        from listados import escribir_listado
         
-        medicos = self.clinica.obtener_medicos()
+        destino = destino if destino is not None else sys.stdout
         
-        if not medicos:
-            print("No hay médicos registrados.")
-            return
+        if formato == "texto":
+            destino.write(f"{titulo}\n{separador}\n")
+            if not objetos:
+                destino.write(mensaje_vacio + "\n")
+                return
         
-        for i, medico in enumerate(medicos, 1):
-            print(f"{i}. {medico}")
\ No newline at end of file
+        escribir_listado(destino, objetos, a_fila, formato, pagina, por_pagina)
@@ -0,0 +1,385 @@
+"""
+Detección de pacientes duplicados para el sistema de gestión de clínica.
+
+Un mismo paciente puede quedar registrado dos veces con un DNI o un nombre mal
+tipeado. Comparar todos los pares de pacientes es cuadrático, así que primero
+se agrupan en bloques por claves baratas (código fonético del nombre y año o
+fecha de nacimiento) y solo se comparan los pacientes de un mismo bloque. Los
+bloques se reparten entre varios procesos y los pares sospechosos se reúnen
+en un reporte de candidatos a fusionar.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from modelo.indice_pacientes import normalizar_texto
+
+# Puntaje mínimo (entre 0 y 1) para reportar un par como posible duplicado
+UMBRAL_DUPLICADO = 0.75
+
+# Bloques más grandes que esto no se comparan par a par: cada paciente se
+# compara solo con los VENTANA_BLOQUE siguientes en orden alfabético
+MAXIMO_BLOQUE = 500
+VENTANA_BLOQUE = 20
+
+# Con menos comparaciones que esto no conviene lanzar procesos
+COMPARACIONES_PARALELO = 200_000
+
+# Comparaciones aproximadas que recibe cada proceso por vez
+COMPARACIONES_POR_LOTE = 50_000
+
+# Peso de cada criterio en el puntaje (suman 1)
+PESO_NOMBRE = 0.6
+PESO_FECHA = 0.25
+PESO_DNI = 0.15
+
+# Reemplazos fonéticos del español, aplicados en orden sobre texto normalizado
+_REEMPLAZOS = (
+    ("ch", "x"), ("ll", "y"), ("qu", "k"), ("gue", "ge"), ("gui", "gi"),
+    ("ce", "se"), ("ci", "si"), ("ge", "je"), ("gi", "ji"),
+    ("h", ""), ("v", "b"), ("w", "b"), ("z", "s"), ("c", "k"), ("q", "k"),
+)
+_VOCALES = set("aeiouy")
+
+
+def codigo_fonetico(palabra):
+    """
+    Calcula un código fonético simplificado para el español: las letras que
+    suenan igual (b/v, c/k/q, s/z, g/j, ll/y) comparten código, la h muda se
+    ignora, y solo se conservan las consonantes sin repetir.
+
+    Args:
+        palabra (str): Palabra a codificar
+
+    Returns:
+        str: Código fonético ("" si la palabra no tiene consonantes)
+    """
+    texto = "".join(c for c in normalizar_texto(palabra) if c.isalpha())
+    for original, reemplazo in _REEMPLAZOS:
+        texto = texto.replace(original, reemplazo)
+
+    codigo = []
+    for letra in texto:
+        if letra not in _VOCALES and (not codigo or codigo[-1] != letra):
+            codigo.append(letra)
+    return "".join(codigo)
+
+
+def claves_bloque(fila):
+    """
+    Devuelve las claves de los bloques a los que pertenece un paciente.
+
+    Dos pacientes comparten bloque si coinciden en el código fonético del
+    primer y último nombre (en cualquier orden) y en el año de nacimiento, o
+    en la fecha de nacimiento completa y el código de alguno de esos nombres.
+    Así un error de tipeo en el DNI, en una palabra del nombre o en el día de
+    nacimiento no impide encontrar el duplicado.
+
+    Args:
+        fila (tuple[str, str, str]): DNI, nombre y fecha de nacimiento (dd/mm/aaaa)
+
+    Returns:
+        set[tuple]: Claves de bloque
+    """
+    _, nombre, fecha_nacimiento = fila
+    palabras = normalizar_texto(nombre).split()
+    primero, ultimo = codigo_fonetico(palabras[0]), codigo_fonetico(palabras[-1])
+    anio = fecha_nacimiento[-4:]
+    return {
+        ("anio", anio) + tuple(sorted((primero, ultimo))),
+        ("fecha", fecha_nacimiento, primero),
+        ("fecha", fecha_nacimiento, ultimo),
+    }
+
+
+def comparar(fila_a, fila_b, minimo=0.0):
+    """
+    Calcula qué tan probable es que dos pacientes sean la misma persona.
+
+    La fecha y el DNI se comparan primero porque son baratos; la similitud
+    de los nombres, que es lo más costoso, solo se calcula si con ella el
+    par todavía puede alcanzar `minimo`.
+
+    Args:
+        fila_a (tuple[str, str, str]): DNI, nombre y fecha de nacimiento
+        fila_b (tuple[str, str, str]): DNI, nombre y fecha de nacimiento
+        minimo (float): Puntaje por debajo del cual no interesa el resultado
+
+    Returns:
+        tuple[float, list[str]] | None: Puntaje entre 0 y 1 y motivos de la
+            coincidencia, o None si el puntaje no alcanza `minimo`
+    """
+    dni_a, nombre_a, fecha_a = fila_a
+    dni_b, nombre_b, fecha_b = fila_b
+    puntaje = 0.0
+    motivos = []
+
+    if fecha_a == fecha_b:
+        puntaje += PESO_FECHA
+        motivos.append("misma fecha de nacimiento")
+
+    if dni_a == dni_b:
+        puntaje += PESO_DNI
+        motivos.append("mismo DNI")
+    elif _dni_parecido(dni_a, dni_b):
+        puntaje += PESO_DNI
+        motivos.append("DNI casi igual")
+
+    if puntaje + PESO_NOMBRE < minimo:
+        return None
+
+    palabras_a = normalizar_texto(nombre_a).split()
+    palabras_b = normalizar_texto(nombre_b).split()
+    similitud = 0.0
+    for texto_a, texto_b in ((palabras_a, palabras_b), (sorted(palabras_a), sorted(palabras_b))):
+        comparador = SequenceMatcher(None, " ".join(texto_a), " ".join(texto_b))
+        # quick_ratio es una cota superior de ratio y mucho más barata
+        if puntaje + PESO_NOMBRE * comparador.quick_ratio() >= minimo:
+            similitud = max(similitud, comparador.ratio())
+
+    puntaje += PESO_NOMBRE * similitud
+    if puntaje < minimo:
+        return None
+    motivos.insert(0, "mismo nombre" if similitud == 1 else f"nombre similar ({similitud:.0%})")
+    return puntaje, motivos
+
+
+def _dni_parecido(dni_a, dni_b):
+    """
+    Indica si dos DNIs difieren en un solo error de tipeo: un dígito
+    cambiado, dos dígitos vecinos invertidos, o un dígito de más o de menos.
+
+    Args:
+        dni_a (str): Primer DNI
+        dni_b (str): Segundo DNI
+
+    Returns:
+        bool: True si difieren en un solo error de tipeo
+    """
+    if len(dni_a) == len(dni_b):
+        diferencias = [i for i, (a, b) in enumerate(zip(dni_a, dni_b)) if a != b]
+        if len(diferencias) == 1:
+            return True
+        if len(diferencias) == 2:
+            i, j = diferencias
+            return j == i + 1 and dni_a[i] == dni_b[j] and dni_a[j] == dni_b[i]
+        return False
+
+    if abs(len(dni_a) - len(dni_b)) != 1:
+        return False
+    corto, largo = sorted((dni_a, dni_b), key=len)
+    return any(largo[:i] + largo[i + 1:] == corto for i in range(len(largo)))
+
+
+def _pares_bloque(filas):
+    """
+    Recorre los pares de un bloque que hay que comparar.
+
+    Args:
+        filas (list[tuple[int, tuple]]): Posición y datos de cada paciente del bloque
+
+    Yields:
+        tuple[tuple, tuple]: Par de pacientes
+    """
+    if len(filas) <= MAXIMO_BLOQUE:
+        for i, fila_a in enumerate(filas):
+            for fila_b in filas[i + 1:]:
+                yield fila_a, fila_b
+        return
+
+    ordenadas = sorted(filas, key=lambda fila: normalizar_texto(fila[1][1]))
+    for i, fila_a in enumerate(ordenadas):
+        for fila_b in ordenadas[i + 1:i + 1 + VENTANA_BLOQUE]:
+            yield fila_a, fila_b
+
+
+def _comparaciones(filas):
+    """
+    Calcula cuántas comparaciones requiere un bloque.
+
+    Args:
+        filas (list[tuple[int, tuple]]): Posición y datos de cada paciente del bloque
+
+    Returns:
+        int: Cantidad de pares a comparar
+    """
+    n = len(filas)
+    if n <= MAXIMO_BLOQUE:
+        return n * (n - 1) // 2
+    return n * VENTANA_BLOQUE
+
+
+def _comparar_bloques(bloques):
+    """
+    Compara los pacientes de cada bloque. Corre en los procesos de trabajo.
+
+    Args:
+        bloques (list[list[tuple[int, tuple]]]): Bloques de pacientes
+
+    Returns:
+        list[tuple[int, int, float, list[str]]]: Posiciones, puntaje y motivos
+            de cada par que supera UMBRAL_DUPLICADO
+    """
+    candidatos = []
+    for filas in bloques:
+        for (i, fila_a), (j, fila_b) in _pares_bloque(filas):
+            resultado = comparar(fila_a, fila_b, UMBRAL_DUPLICADO)
+            if resultado is not None:
+                candidatos.append((min(i, j), max(i, j)) + resultado)
+    return candidatos
+
+
+def _agrupar_lotes(bloques):
+    """
+    Agrupa los bloques en lotes de aproximadamente COMPARACIONES_POR_LOTE
+    comparaciones, para repartirlos entre los procesos.
+
+    Args:
+        bloques (list[list[tuple[int, tuple]]]): Bloques de pacientes
+
+    Yields:
+        list[list[tuple[int, tuple]]]: Lote de bloques
+    """
+    lote = []
+    comparaciones = 0
+    for filas in bloques:
+        lote.append(filas)
+        comparaciones += _comparaciones(filas)
+        if comparaciones >= COMPARACIONES_POR_LOTE:
+            yield lote
+            lote = []
+            comparaciones = 0
+    if lote:
+        yield lote
+
+
+class CandidatoDuplicado:
+    """
+    Par de pacientes que probablemente son la misma persona.
+
+    Atributos:
+        __paciente_a (Paciente): Primer paciente
+        __paciente_b (Paciente): Segundo paciente
+        __puntaje (float): Probabilidad estimada, entre 0 y 1
+        __motivos (list[str]): Coincidencias encontradas
+    """
+
+    def __init__(self, paciente_a, paciente_b, puntaje, motivos):
+        """
+        Inicializa el candidato.
+
+        Args:
+            paciente_a (Paciente): Primer paciente
+            paciente_b (Paciente): Segundo paciente
+            puntaje (float): Probabilidad estimada, entre 0 y 1
+            motivos (list[str]): Coincidencias encontradas
+        """
+        self.__paciente_a = paciente_a
+        self.__paciente_b = paciente_b
+        self.__puntaje = puntaje
+        self.__motivos = list(motivos)
+
+    def obtener_pacientes(self):
+        """
+        Devuelve los dos pacientes del par.
+
+        Returns:
+            tuple[Paciente, Paciente]: Pacientes, en el orden en que se revisaron
+        """
+        return self.__paciente_a, self.__paciente_b
+
+    def obtener_puntaje(self):
+        """
+        Devuelve la probabilidad estimada de que sean la misma persona.
+
+        Returns:
+            float: Puntaje entre 0 y 1
+        """
+        return self.__puntaje
+
+    def obtener_motivos(self):
+        """
+        Devuelve las coincidencias encontradas.
+
+        Returns:
+            list[str]: Motivos del puntaje
+        """
+        return self.__motivos.copy()
+
+    def __str__(self):
+        """
+        Devuelve una representación legible del candidato.
+
+        Returns:
+            str: Pacientes, puntaje y motivos
+        """
+        return (f"{self.__paciente_a.obtener_nombre()} (DNI: {self.__paciente_a.obtener_dni()}) y "
+                f"{self.__paciente_b.obtener_nombre()} (DNI: {self.__paciente_b.obtener_dni()}) - "
+                f"{self.__puntaje:.0%}: {', '.join(self.__motivos)}")
+
+
+def fila_candidato(candidato):
+    """
+    Convierte un candidato en una fila con sus campos, para los listados.
+
+    Args:
+        candidato (CandidatoDuplicado): Candidato a convertir
+
+    Returns:
+        dict: Campos del candidato
+    """
+    paciente_a, paciente_b = candidato.obtener_pacientes()
+    return {
+        "dni_a": paciente_a.obtener_dni(),
+        "nombre_a": paciente_a.obtener_nombre(),
+        "dni_b": paciente_b.obtener_dni(),
+        "nombre_b": paciente_b.obtener_nombre(),
+        "puntaje": round(candidato.obtener_puntaje(), 3),
+        "motivos": ", ".join(candidato.obtener_motivos()),
+    }
+
+
+def buscar_duplicados(pacientes, procesos=None):
+    """
+    Busca pares de pacientes que probablemente son la misma persona.
+
+    Los pacientes se agrupan en bloques con claves_bloque y solo se comparan
+    dentro de cada bloque. Si hay suficientes comparaciones, los bloques se
+    reparten entre varios procesos.
+
+    Args:
+        pacientes (iterable[Paciente]): Pacientes a revisar
+        procesos (int): Cantidad de procesos (None usa uno por CPU; 1 compara
+            en el proceso actual)
+
+    Returns:
+        list[CandidatoDuplicado]: Candidatos de mayor a menor puntaje
+    """
+    pacientes = list(pacientes)
+    bloques = {}
+    for posicion, paciente in enumerate(pacientes):
+        fila = (paciente.obtener_dni(), paciente.obtener_nombre(), paciente.obtener_fecha_nacimiento())
+        for clave in claves_bloque(fila):
+            bloques.setdefault(clave, []).append((posicion, fila))
+
+    a_comparar = [filas for filas in bloques.values() if len(filas) > 1]
+    del bloques
+
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if procesos > 1 and sum(_comparaciones(filas) for filas in a_comparar) >= COMPARACIONES_PARALELO:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            resultados = list(ejecutor.map(_comparar_bloques, _agrupar_lotes(a_comparar)))
+    else:
+        resultados = [_comparar_bloques(a_comparar)]
+
+    # Un mismo par puede aparecer en más de un bloque
+    pares = {}
+    for candidatos in resultados:
+        for i, j, puntaje, motivos in candidatos:
+            pares[i, j] = (puntaje, motivos)
+
+    return [
+        CandidatoDuplicado(pacientes[i], pacientes[j], puntaje, motivos)
+        for (i, j), (puntaje, motivos) in sorted(pares.items(), key=lambda par: (-par[1][0], par[0]))
+    ]
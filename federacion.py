@@ -0,0 +1,360 @@
+"""
+Federación de varias sedes del sistema de gestión de clínica.
+
+Cada sede es una Clinica independiente. La federación busca el primer turno
+libre de una especialidad en todas las sedes a la vez: cada sede se consulta
+en su propio hilo, los horarios de todas llegan a una misma cola y se
+combinan con un heap, de modo que los resultados se entregan en orden
+cronológico a medida que llegan, sin esperar a que cada sede termine de
+responder. Una sede que tarda más que el tiempo máximo en dar su próximo
+horario se omite. También mantiene un directorio en caché de qué sede
+atiende a cada paciente.
+"""
+
+import heapq
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturoTimeoutError
+from itertools import islice
+from modelo.excepciones import PacienteNoEncontradoException
+
+# Horarios libres que cada sede puede adelantar antes de que se consuman
+CANDIDATOS_POR_SEDE = 16
+
+# Cada cuánto (en segundos) revisa un hilo de sede si la búsqueda se abandonó
+ESPERA_HILO = 0.05
+
+# Segundos que se espera el próximo horario de una sede antes de omitirla
+TIEMPO_MAXIMO_SEDE = 5.0
+
+
+class SedeSimulada:
+    """
+    Reemplazo local de una sede remota: delega en una Clinica y agrega una
+    demora fija a cada respuesta, para probar la federación sin red.
+
+    Atributos:
+        clinica (Clinica): Clínica de la sede
+        __latencia (float): Demora en segundos de cada respuesta
+    """
+
+    def __init__(self, clinica, latencia=0.0):
+        """
+        Inicializa la sede simulada.
+
+        Args:
+            clinica (Clinica): Clínica de la sede
+            latencia (float): Demora en segundos de cada respuesta
+        """
+        self.clinica = clinica
+        self.__latencia = latencia
+
+    def obtener_turnos_libres(self, especialidad, desde=None, hasta=None):
+        """
+        Recorre los horarios libres de la sede, con la demora de la primera respuesta.
+
+        Args:
+            especialidad (str): Especialidad buscada
+            desde (datetime): Fecha y hora inicial, incluida
+            hasta (datetime): Fecha y hora final, excluida
+
+        Yields:
+            tuple[datetime, str]: Fecha y hora libre y matrícula del médico
+        """
+        time.sleep(self.__latencia)
+        yield from self.clinica.obtener_turnos_libres(especialidad, desde, hasta)
+
+    def validar_existencia_paciente(self, dni):
+        """
+        Verifica si un paciente está registrado en la sede.
+
+        Args:
+            dni (str): DNI del paciente
+
+        Raises:
+            PacienteNoEncontradoException: Si el paciente no está en la sede
+        """
+        time.sleep(self.__latencia)
+        self.clinica.validar_existencia_paciente(dni)
+
+
+class Federacion:
+    """
+    Conjunto de sedes consultadas en paralelo.
+
+    Cada sede solo se consulta desde un hilo por vez, pero las sedes no se
+    bloquean entre sí: las búsquedas no deben correr mientras otro hilo
+    modifica la misma Clinica.
+
+    Atributos:
+        __sedes (dict[str, Clinica | SedeSimulada]): Nombre -> sede
+        __tiempo_maximo (float): Segundos de espera por respuesta de una sede
+        __directorio (dict[str, str]): DNI -> nombre de la sede del paciente
+        __errores (dict[str, Exception]): Nombre -> error de la última consulta fallida
+    """
+
+    def __init__(self, sedes, tiempo_maximo=TIEMPO_MAXIMO_SEDE):
+        """
+        Inicializa la federación.
+
+        Args:
+            sedes (dict[str, Clinica | SedeSimulada]): Nombre -> sede; cada sede debe
+                ofrecer obtener_turnos_libres y validar_existencia_paciente
+            tiempo_maximo (float): Segundos que se espera cada respuesta de una
+                sede antes de omitirla en la consulta
+
+        Raises:
+            ValueError: Si no hay sedes o el tiempo máximo no es positivo
+        """
+        if not sedes:
+            raise ValueError("La federación debe tener al menos una sede")
+        if tiempo_maximo <= 0:
+            raise ValueError("El tiempo máximo de espera debe ser positivo")
+
+        self.__sedes = dict(sedes)
+        self.__tiempo_maximo = tiempo_maximo
+        self.__directorio = {}
+        self.__errores = {}
+
+    def obtener_sedes(self):
+        """
+        Devuelve los nombres de las sedes.
+
+        Returns:
+            list[str]: Nombres de las sedes
+        """
+        return list(self.__sedes)
+
+    def obtener_errores(self):
+        """
+        Devuelve los errores de las sedes que fallaron en la última consulta.
+
+        Returns:
+            dict[str, Exception]: Nombre de la sede -> error
+        """
+        return dict(self.__errores)
+
+    def turnos_libres(self, especialidad, desde=None, hasta=None):
+        """
+        Recorre los horarios libres de una especialidad en todas las sedes, en
+        orden cronológico.
+
+        Cada sede produce sus horarios en un hilo propio y todas los ponen en
+        una misma cola, que se atiende en el orden de llegada. Un horario se
+        entrega en cuanto es seguro que ninguna sede tiene uno anterior. Las
+        sedes que fallan, o que tardan más que el tiempo máximo en dar su
+        próximo horario, se omiten desde ese momento y su error queda en
+        obtener_errores().
+
+        Args:
+            especialidad (str): Especialidad buscada
+            desde (datetime): Fecha y hora inicial, incluida
+            hasta (datetime): Fecha y hora final, excluida
+
+        Yields:
+            tuple[datetime, str, str]: Fecha y hora libre, nombre de la sede y matrícula del médico
+        """
+        self.__errores = {}
+        abandonada = threading.Event()
+        llegadas = queue.Queue()
+        lugares = {}
+
+        for nombre, sede in self.__sedes.items():
+            lugares[nombre] = threading.Semaphore(CANDIDATOS_POR_SEDE)
+            threading.Thread(
+                target=self.__producir,
+                args=(nombre, sede, llegadas, lugares[nombre], abandonada, especialidad, desde, hasta),
+                daemon=True,
+            ).start()
+
+        try:
+            heap = []
+            en_heap = dict.fromkeys(self.__sedes, 0)
+            # Sedes sin horarios en el heap -> momento desde el que se espera su próximo horario
+            esperadas = dict.fromkeys(self.__sedes, time.monotonic())
+            activas = set(self.__sedes)
+
+            while activas:
+                while esperadas:
+                    limite = min(esperadas.values()) + self.__tiempo_maximo
+                    try:
+                        nombre, elemento = llegadas.get(timeout=max(0.0, limite - time.monotonic()))
+                    except queue.Empty:
+                        self.__omitir_demoradas(esperadas, activas, limite)
+                        continue
+                    if nombre not in activas:
+                        continue
+                    esperadas.pop(nombre, None)
+                    if elemento is None:
+                        activas.discard(nombre)
+                    else:
+                        heapq.heappush(heap, elemento)
+                        en_heap[nombre] += 1
+
+                if not heap:
+                    break
+                fecha_hora, nombre, matricula = heapq.heappop(heap)
+                en_heap[nombre] -= 1
+                lugares[nombre].release()
+                yield fecha_hora, nombre, matricula
+                if nombre in activas and not en_heap[nombre]:
+                    esperadas[nombre] = time.monotonic()
+        finally:
+            abandonada.set()
+
+    def primeros_turnos(self, especialidad, cantidad=1, desde=None, hasta=None):
+        """
+        Devuelve los primeros horarios libres de una especialidad en todas las sedes.
+
+        Args:
+            especialidad (str): Especialidad buscada
+            cantidad (int): Cantidad máxima de horarios
+            desde (datetime): Fecha y hora inicial, incluida
+            hasta (datetime): Fecha y hora final, excluida
+
+        Returns:
+            list[tuple[datetime, str, str]]: (fecha y hora, sede, matrícula) en orden cronológico
+        """
+        turnos = self.turnos_libres(especialidad, desde, hasta)
+        try:
+            return list(islice(turnos, cantidad))
+        finally:
+            turnos.close()
+
+    def sede_de_paciente(self, dni):
+        """
+        Devuelve la sede en la que está registrado un paciente.
+
+        La primera búsqueda consulta todas las sedes en paralelo y termina en
+        cuanto una lo encuentra; el resultado queda en el directorio para las
+        siguientes. Las sedes que fallan o no responden en el tiempo máximo se
+        omiten y su error queda en obtener_errores().
+
+        Args:
+            dni (str): DNI del paciente
+
+        Returns:
+            str: Nombre de la sede
+
+        Raises:
+            PacienteNoEncontradoException: Si el paciente no está en ninguna sede
+        """
+        nombre = self.__directorio.get(dni)
+        if nombre is not None:
+            return nombre
+
+        self.__errores = {}
+
+        def esta_en(nombre_sede):
+            try:
+                self.__sedes[nombre_sede].validar_existencia_paciente(dni)
+                return True
+            except PacienteNoEncontradoException:
+                return False
+            except Exception as e:
+                self.__errores[nombre_sede] = e
+                return False
+
+        # Sin esperar a los hilos al salir: una sede colgada no debe demorar la respuesta
+        ejecutor = ThreadPoolExecutor(max_workers=len(self.__sedes))
+        try:
+            futuros = {ejecutor.submit(esta_en, nombre): nombre for nombre in self.__sedes}
+            try:
+                for futuro in as_completed(futuros, timeout=self.__tiempo_maximo):
+                    if futuro.result():
+                        nombre = futuros[futuro]
+                        self.__directorio[dni] = nombre
+                        return nombre
+            except FuturoTimeoutError:
+                for futuro, nombre in futuros.items():
+                    if not futuro.done():
+                        self.__errores[nombre] = TimeoutError(f"La sede {nombre} no respondió a tiempo")
+        finally:
+            ejecutor.shutdown(wait=False)
+
+        raise PacienteNoEncontradoException(dni)
+
+    def registrar_paciente(self, nombre_sede, paciente):
+        """
+        Registra un paciente en una sede y lo anota en el directorio.
+
+        Args:
+            nombre_sede (str): Nombre de la sede
+            paciente (Paciente): Paciente a registrar
+
+        Raises:
+            KeyError: Si la sede no existe
+            ValueError: Si el paciente ya está registrado en esa sede
+        """
+        sede = self.__sedes[nombre_sede]
+        getattr(sede, "clinica", sede).agregar_paciente(paciente)
+        self.__directorio[paciente.obtener_dni()] = nombre_sede
+
+    def olvidar_paciente(self, dni):
+        """
+        Quita un paciente del directorio, para volver a buscarlo en las sedes.
+
+        Args:
+            dni (str): DNI del paciente
+        """
+        self.__directorio.pop(dni, None)
+
+    def __producir(self, nombre, sede, llegadas, lugares, abandonada, especialidad, desde, hasta):
+        """
+        Pone en la cola compartida los horarios libres de una sede hasta
+        agotarlos o hasta que se abandone la búsqueda. Al final pone None.
+
+        Cada horario ocupa uno de los lugares de la sede hasta que se entrega,
+        para que una sede rápida no adelante más de CANDIDATOS_POR_SEDE.
+
+        Args:
+            nombre (str): Nombre de la sede
+            sede (Clinica | SedeSimulada): Sede a consultar
+            llegadas (queue.Queue): Cola de (nombre de la sede, horario o None)
+            lugares (threading.Semaphore): Horarios que la sede puede adelantar
+            abandonada (threading.Event): Se activa cuando ya no se piden más horarios
+            especialidad (str): Especialidad buscada
+            desde (datetime): Fecha y hora inicial
+            hasta (datetime): Fecha y hora final
+        """
+        try:
+            for fecha_hora, matricula in sede.obtener_turnos_libres(especialidad, desde, hasta):
+                if not self.__esperar_lugar(lugares, abandonada):
+                    return
+                llegadas.put((nombre, (fecha_hora, nombre, matricula)))
+        except Exception as e:
+            self.__errores[nombre] = e
+        llegadas.put((nombre, None))
+
+    @staticmethod
+    def __esperar_lugar(lugares, abandonada):
+        """
+        Espera un lugar libre de la sede, salvo que se abandone la búsqueda.
+
+        Args:
+            lugares (threading.Semaphore): Horarios que la sede puede adelantar
+            abandonada (threading.Event): Se activa cuando ya no se piden más horarios
+
+        Returns:
+            bool: True si se obtuvo el lugar
+        """
+        while not abandonada.is_set():
+            if lugares.acquire(timeout=ESPERA_HILO):
+                return True
+        return False
+
+    def __omitir_demoradas(self, esperadas, activas, limite):
+        """
+        Omite las sedes cuyo próximo horario no llegó antes del límite.
+
+        Args:
+            esperadas (dict[str, float]): Sede -> momento desde el que se espera su próximo horario
+            activas (set[str]): Sedes que todavía participan de la búsqueda
+            limite (float): Momento (time.monotonic) hasta el que se esperó
+        """
+        for nombre, desde in list(esperadas.items()):
+            if desde + self.__tiempo_maximo <= limite:
+                del esperadas[nombre]
+                activas.discard(nombre)
+                self.__errores[nombre] = TimeoutError(f"La sede {nombre} no respondió a tiempo")
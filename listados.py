@@ -0,0 +1,174 @@
+"""
+Listados de turnos, pacientes y médicos para la CLI y el modo por lotes.
+
+Las filas se escriben en bloques a través de un único flujo de salida, en
+formato de texto legible, TSV o JSONL (un objeto JSON por línea).
+"""
+
+import json
+from itertools import islice
+
+FORMATOS = ("texto", "tsv", "jsonl")
+
+# Cantidad de filas que se acumulan antes de cada escritura
+TAMANIO_BLOQUE = 500
+
+
+def fila_turno(turno):
+    """
+    Convierte un turno en una fila con sus campos.
+
+    Args:
+        turno (Turno): Turno a convertir
+
+    Returns:
+        dict: Campos del turno
+    """
+    paciente = turno.obtener_paciente()
+    medico = turno.obtener_medico()
+    return {
+        "fecha_hora": turno.obtener_fecha_hora().strftime("%d/%m/%Y %H:%M"),
+        "dni": paciente.obtener_dni(),
+        "paciente": paciente.obtener_nombre(),
+        "matricula": medico.obtener_matricula(),
+        "medico": medico.obtener_nombre(),
+        "especialidad": turno.obtener_especialidad(),
+    }
+
+
+def fila_paciente(paciente):
+    """
+    Convierte un paciente en una fila con sus campos.
+
+    Args:
+        paciente (Paciente): Paciente a convertir
+
+    Returns:
+        dict: Campos del paciente
+    """
+    return {
+        "dni": paciente.obtener_dni(),
+        "nombre": paciente.obtener_nombre(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento(),
+    }
+
+
+def fila_medico(medico):
+    """
+    Convierte un médico en una fila con sus campos.
+
+    Args:
+        medico (Medico): Médico a convertir
+
+    Returns:
+        dict: Campos del médico; las especialidades como "Tipo: día, día; Tipo: día"
+    """
+    especialidades = "; ".join(
+        f"{esp.obtener_especialidad()}: {', '.join(esp.obtener_dias())}"
+        for esp in medico.obtener_especialidades()
+    )
+    return {
+        "matricula": medico.obtener_matricula(),
+        "nombre": medico.obtener_nombre(),
+        "especialidades": especialidades,
+    }
+
+
+def seleccionar_turnos(clinica, desde=None, matricula=None, especialidad=None):
+    """
+    Devuelve los turnos que cumplen los filtros.
+
+    Sin filtros se devuelven en orden de alta; con algún filtro, en orden
+    cronológico usando los índices por fecha de la clínica.
+
+    Args:
+        clinica (Clinica): Clínica a consultar
+        desde (datetime): Si se indica, solo turnos desde esa fecha y hora
+        matricula (str): Si se indica, solo turnos de ese médico
+        especialidad (str): Si se indica, solo turnos de esa especialidad
+
+    Returns:
+        list[Turno]: Turnos seleccionados
+    """
+    if desde is None and matricula is None and especialidad is None:
+        return clinica.obtener_turnos()
+    return clinica.obtener_turnos_entre(desde, None, especialidad=especialidad, matricula=matricula)
+
+
+def seleccionar_medicos(clinica, especialidad=None):
+    """
+    Devuelve los médicos, opcionalmente solo los de una especialidad.
+
+    Args:
+        clinica (Clinica): Clínica a consultar
+        especialidad (str): Si se indica, solo médicos con esa especialidad
+
+    Returns:
+        list[Medico]: Médicos seleccionados
+    """
+    medicos = clinica.obtener_medicos()
+    if especialidad is None:
+        return medicos
+    return [medico for medico in medicos if medico.tiene_especialidad(especialidad)]
+
+
+def escribir_listado(destino, objetos, a_fila, formato="texto", pagina=1, por_pagina=None):
+    """
+    Escribe una página de un listado en bloques de TAMANIO_BLOQUE filas.
+
+    Args:
+        destino: Objeto con método write
+        objetos (iterable): Objetos a listar
+        a_fila (callable): Convierte un objeto en un dict de campos (para TSV y JSONL)
+        formato (str): "texto" (numerado, con str de cada objeto), "tsv" o "jsonl"
+        pagina (int): Número de página, comenzando en 1
+        por_pagina (int): Filas por página (None escribe todas)
+
+    Returns:
+        int: Cantidad de filas escritas
+
+    Raises:
+        ValueError: Si el formato o la paginación no son válidos
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato}. Debe ser uno de: {', '.join(FORMATOS)}")
+    if pagina < 1 or (por_pagina is not None and por_pagina < 1):
+        raise ValueError("La página y la cantidad por página deben ser números positivos")
+
+    inicio = 0 if por_pagina is None else (pagina - 1) * por_pagina
+    fin = None if por_pagina is None else inicio + por_pagina
+
+    bloque = []
+    escritas = 0
+    for numero, objeto in enumerate(islice(objetos, inicio, fin), inicio + 1):
+        if formato == "texto":
+            bloque.append(f"{numero}. {objeto}\n")
+        elif formato == "jsonl":
+            bloque.append(json.dumps(a_fila(objeto), ensure_ascii=False) + "\n")
+        else:
+            fila = a_fila(objeto)
+            if not escritas and not bloque:
+                bloque.append("\t".join(fila) + "\n")
+            bloque.append("\t".join(_limpiar_tsv(valor) for valor in fila.values()) + "\n")
+
+        escritas += 1
+        if len(bloque) >= TAMANIO_BLOQUE:
+            destino.write("".join(bloque))
+            bloque.clear()
+
+    if bloque:
+        destino.write("".join(bloque))
+    return escritas
+
+
+def _limpiar_tsv(valor):
+    """
+    Reemplaza tabulaciones y saltos de línea para no romper el formato TSV.
+
+    Args:
+        valor: Valor del campo
+
+    Returns:
+        str: Valor como texto de una sola línea
+    """
+    return str(valor).replace("\t", " ").replace("\n", " ")
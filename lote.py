@@ -0,0 +1,363 @@
+"""
+Modo por lotes del sistema de gestión de clínica.
+
+Ejecuta comandos leídos de un archivo o de la entrada estándar, sin menús ni
+pausas, para automatizar cargas y medir el rendimiento del sistema.
+
+Formato: un comando por línea, con los argumentos separados por espacios
+(los que contienen espacios van entre comillas). Las líneas vacías y las que
+comienzan con '#' se ignoran.
+
+    agregar_paciente "Juan Pérez" 12345678 01/01/1990
+    agregar_medico "Dra. Gómez" M111
+    agregar_especialidad M111 Pediatría lunes,miércoles
+    agendar_turno 12345678 M111 Pediatría 15/06/2026 10:00
+    agendar_serie 12345678 M111 Pediatría 17/06/2026 10:00 semanal 26
+    agendar_o_esperar 12345678 M111 Pediatría 15/06/2026 10:00 [urgencia]
+    solicitar_turno 12345678 Pediatría 15/06/2026 19/06/2026 [prioridad]
+    asignar_solicitudes
+    cancelar_turno M111 15/06/2026 10:00
+    emitir_receta 12345678 M111 Ibuprofeno Paracetamol
+    buscar_pacientes "pérez" 10
+    ver_historia 12345678
+    ver_turnos [--desde dd/mm/aaaa] [--medico MAT] [--especialidad ESP]
+    ver_pacientes
+    ver_medicos [--especialidad ESP]
+    buscar_duplicados [--procesos N]
+
+Las solicitudes de solicitar_turno (cualquier médico de la especialidad entre
+las dos fechas, ambas incluidas) se acumulan y se asignan todas juntas con
+asignar_solicitudes.
+
+Los listados (ver_turnos, ver_pacientes, ver_medicos, buscar_duplicados)
+aceptan además --formato texto|tsv|jsonl, --pagina N y --por-pagina N.
+"""
+
+import argparse
+import inspect
+import shlex
+import time
+from datetime import datetime, timedelta
+from listados import (
+    escribir_listado, seleccionar_turnos, seleccionar_medicos,
+    fila_turno, fila_paciente, fila_medico, FORMATOS
+)
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.lista_espera import SolicitudEspera
+from modelo.asignacion import SolicitudAsignacion
+
+
+class _ParserOpciones(argparse.ArgumentParser):
+    """
+    Parser de opciones de un comando que informa los errores con ValueError
+    en lugar de terminar el programa.
+    """
+
+    def error(self, message):
+        raise ValueError(f"{self.prog}: {message}")
+
+
+def _parser_listado(nombre, filtros=()):
+    """
+    Crea el parser de opciones de un comando de listado.
+
+    Args:
+        nombre (str): Nombre del comando
+        filtros (tuple[str]): Filtros que acepta, entre "desde", "medico" y "especialidad"
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    parser = _ParserOpciones(prog=nombre, add_help=False)
+    for filtro in filtros:
+        parser.add_argument(f"--{filtro}")
+    parser.add_argument("--formato", choices=FORMATOS, default="texto")
+    parser.add_argument("--pagina", type=int, default=1)
+    parser.add_argument("--por-pagina", type=int)
+    return parser
+
+
+class EjecutorLote:
+    """
+    Ejecuta comandos de texto sobre una clínica y acumula la salida en un
+    buffer que se escribe en bloques.
+
+    Atributos:
+        clinica (Clinica): Clínica sobre la que se ejecutan los comandos
+        __salida: Flujo de texto donde se escriben los resultados
+        __buffer (list[str]): Líneas pendientes de escribir
+        __solicitudes (list[SolicitudAsignacion]): Solicitudes pendientes de asignar
+    """
+
+    # Cantidad de líneas acumuladas antes de escribir en la salida
+    TAMANIO_BUFFER = 1000
+
+    def __init__(self, salida, clinica=None):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            salida: Objeto con método write donde se escriben los resultados
+            clinica (Clinica): Clínica a usar (por defecto, una nueva y vacía)
+        """
+        self.clinica = clinica if clinica is not None else Clinica()
+        self.__salida = salida
+        self.__buffer = []
+        self.__solicitudes = []
+        self.__comandos = {
+            "agregar_paciente": self._agregar_paciente,
+            "agregar_medico": self._agregar_medico,
+            "agregar_especialidad": self._agregar_especialidad,
+            "agendar_turno": self._agendar_turno,
+            "agendar_serie": self._agendar_serie,
+            "agendar_o_esperar": self._agendar_o_esperar,
+            "solicitar_turno": self._solicitar_turno,
+            "asignar_solicitudes": self._asignar_solicitudes,
+            "cancelar_turno": self._cancelar_turno,
+            "emitir_receta": self._emitir_receta,
+            "buscar_pacientes": self._buscar_pacientes,
+            "ver_historia": self._ver_historia,
+            "ver_turnos": self._ver_turnos,
+            "ver_pacientes": self._ver_pacientes,
+            "ver_medicos": self._ver_medicos,
+            "buscar_duplicados": self._buscar_duplicados,
+        }
+        self.clinica.suscribir_promociones(self._turno_promovido)
+        self.__firmas = {nombre: inspect.signature(comando) for nombre, comando in self.__comandos.items()}
+        self.__parsers = {
+            "ver_turnos": _parser_listado("ver_turnos", ("desde", "medico", "especialidad")),
+            "ver_pacientes": _parser_listado("ver_pacientes"),
+            "ver_medicos": _parser_listado("ver_medicos", ("especialidad",)),
+            "buscar_duplicados": _parser_listado("buscar_duplicados", ("procesos",)),
+        }
+
+    def ejecutar(self, lineas):
+        """
+        Ejecuta todos los comandos y escribe un resumen al final.
+
+        Un comando que falla se informa con su número de línea y no detiene
+        la ejecución de los siguientes.
+
+        Args:
+            lineas (iterable[str]): Líneas con comandos
+
+        Returns:
+            dict: Resumen con las claves 'exitosos', 'fallidos' y 'segundos'
+        """
+        exitosos = 0
+        fallidos = 0
+        inicio = time.perf_counter()
+
+        for numero, linea in enumerate(lineas, 1):
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+
+            try:
+                self.ejecutar_comando(linea)
+                exitosos += 1
+            except Exception as e:
+                fallidos += 1
+                self.escribir(f"Línea {numero}: {type(e).__name__}: {e}")
+
+        segundos = time.perf_counter() - inicio
+        total = exitosos + fallidos
+        velocidad = total / segundos if segundos > 0 else 0.0
+        self.escribir(f"Resumen: {total} comandos, {exitosos} exitosos, {fallidos} fallidos "
+                      f"en {segundos:.3f} s ({velocidad:.0f} comandos/s)")
+        self.vaciar_buffer()
+
+        return {"exitosos": exitosos, "fallidos": fallidos, "segundos": segundos}
+
+    def ejecutar_comando(self, linea):
+        """
+        Ejecuta un único comando.
+
+        Args:
+            linea (str): Comando con sus argumentos
+
+        Raises:
+            ValueError: Si el comando no existe o sus argumentos son incorrectos
+            Exception: Cualquier excepción del modelo que produzca el comando
+        """
+        partes = shlex.split(linea)
+        nombre, argumentos = partes[0], partes[1:]
+
+        comando = self.__comandos.get(nombre)
+        if comando is None:
+            raise ValueError(f"Comando desconocido: {nombre}")
+
+        comando(*self._argumentos(nombre, argumentos))
+
+    def escribir(self, texto):
+        """
+        Agrega una línea a la salida, escribiéndola cuando se llena el buffer.
+
+        Args:
+            texto (str): Línea a escribir (sin salto de línea final)
+        """
+        self.__buffer.append(texto + "\n")
+        if len(self.__buffer) >= self.TAMANIO_BUFFER:
+            self.vaciar_buffer()
+
+    def write(self, texto):
+        """
+        Agrega texto ya formateado al buffer, para usar el ejecutor como flujo
+        de salida de los listados.
+
+        Args:
+            texto (str): Texto a escribir
+        """
+        self.__buffer.append(texto)
+        if len(self.__buffer) >= self.TAMANIO_BUFFER:
+            self.vaciar_buffer()
+
+    def vaciar_buffer(self):
+        """
+        Escribe en la salida todas las líneas pendientes.
+        """
+        if self.__buffer:
+            self.__salida.write("".join(self.__buffer))
+            self.__buffer.clear()
+
+    # === COMANDOS ===
+
+    def _agregar_paciente(self, nombre, dni, fecha_nacimiento):
+        """Registra un paciente."""
+        self.clinica.agregar_paciente(Paciente(nombre, dni, fecha_nacimiento))
+
+    def _agregar_medico(self, nombre, matricula):
+        """Registra un médico sin especialidades."""
+        self.clinica.agregar_medico(Medico(nombre, matricula))
+
+    def _agregar_especialidad(self, matricula, especialidad, dias):
+        """Agrega una especialidad, con sus días separados por comas, a un médico."""
+        self.clinica.agregar_especialidad_a_medico(matricula, Especialidad(especialidad, dias.split(",")))
+
+    def _agendar_turno(self, dni, matricula, especialidad, fecha, hora):
+        """Agenda un turno."""
+        self.clinica.agendar_turno(dni, matricula, especialidad, self._fecha_hora(fecha, hora))
+
+    def _agendar_serie(self, dni, matricula, especialidad, fecha, hora, regla, cantidad):
+        """Agenda una serie de turnos recurrentes ("semanal" o "quincenal")."""
+        self.clinica.agendar_serie(dni, matricula, especialidad, self._fecha_hora(fecha, hora), regla, int(cantidad))
+
+    def _agendar_o_esperar(self, dni, matricula, especialidad, fecha, hora, urgencia="0"):
+        """Agenda un turno o, si el horario está ocupado, anota al paciente en lista de espera."""
+        resultado = self.clinica.agendar_o_esperar(dni, matricula, especialidad,
+                                                   self._fecha_hora(fecha, hora), int(urgencia))
+        if isinstance(resultado, SolicitudEspera):
+            self.escribir(f"En lista de espera: {resultado}")
+
+    def _solicitar_turno(self, dni, especialidad, desde, hasta, prioridad="0"):
+        """Anota un pedido de turno con cualquier médico de la especialidad entre dos fechas."""
+        inicio = self._fecha_hora(desde, "00:00")
+        fin = self._fecha_hora(hasta, "00:00") + timedelta(days=1)
+        self.__solicitudes.append(SolicitudAsignacion(dni, especialidad, inicio, fin, int(prioridad)))
+
+    def _asignar_solicitudes(self):
+        """Asigna turnos a todas las solicitudes anotadas."""
+        asignados, sin_turno = self.clinica.asignar_solicitudes(self.__solicitudes)
+        self.__solicitudes = []
+        for _, turno in asignados:
+            self.escribir(f"Asignado: {turno}")
+        for solicitud in sin_turno:
+            self.escribir(f"Sin turno: {solicitud}")
+
+    def _turno_promovido(self, solicitud, turno):
+        """Informa que una solicitud en espera obtuvo turno."""
+        self.escribir(f"Asignado desde lista de espera: {turno}")
+
+    def _cancelar_turno(self, matricula, fecha, hora):
+        """Cancela un turno."""
+        self.clinica.cancelar_turno(matricula, self._fecha_hora(fecha, hora))
+
+    def _emitir_receta(self, dni, matricula, *medicamentos):
+        """Emite una receta con uno o más medicamentos."""
+        self.clinica.emitir_receta(dni, matricula, list(medicamentos))
+
+    def _buscar_pacientes(self, texto, limite="10"):
+        """Muestra los pacientes cuyo nombre coincide con el texto."""
+        for paciente in self.clinica.buscar_pacientes(texto, int(limite)):
+            self.escribir(str(paciente))
+
+    def _ver_historia(self, dni):
+        """Muestra la historia clínica de un paciente."""
+        for linea in self.clinica.obtener_historia_clinica(dni).iterar_lineas():
+            self.escribir(linea.rstrip("\n"))
+
+    def _ver_turnos(self, *opciones):
+        """Lista los turnos, con filtros opcionales por fecha, médico y especialidad."""
+        opciones = self.__parsers["ver_turnos"].parse_args(opciones)
+        desde = None if opciones.desde is None else self._fecha_hora(opciones.desde, "00:00")
+        turnos = seleccionar_turnos(self.clinica, desde, opciones.medico, opciones.especialidad)
+        escribir_listado(self, turnos, fila_turno, opciones.formato, opciones.pagina, opciones.por_pagina)
+
+    def _ver_pacientes(self, *opciones):
+        """Lista los pacientes."""
+        opciones = self.__parsers["ver_pacientes"].parse_args(opciones)
+        escribir_listado(self, self.clinica.obtener_pacientes(), fila_paciente,
+                         opciones.formato, opciones.pagina, opciones.por_pagina)
+
+    def _ver_medicos(self, *opciones):
+        """Lista los médicos, con filtro opcional por especialidad."""
+        opciones = self.__parsers["ver_medicos"].parse_args(opciones)
+        medicos = seleccionar_medicos(self.clinica, opciones.especialidad)
+        escribir_listado(self, medicos, fila_medico, opciones.formato, opciones.pagina, opciones.por_pagina)
+
+    def _buscar_duplicados(self, *opciones):
+        """Lista los pares de pacientes que probablemente son la misma persona."""
+        # duplicados carga multiprocessing: solo se importa si se usa el comando
+        from duplicados import buscar_duplicados, fila_candidato
+
+        opciones = self.__parsers["buscar_duplicados"].parse_args(opciones)
+        procesos = None if opciones.procesos is None else int(opciones.procesos)
+        candidatos = buscar_duplicados(self.clinica.obtener_pacientes(), procesos)
+        escribir_listado(self, candidatos, fila_candidato, opciones.formato, opciones.pagina, opciones.por_pagina)
+
+    # === MÉTODOS AUXILIARES ===
+
+    def _argumentos(self, nombre, argumentos):
+        """
+        Verifica la cantidad de argumentos de un comando.
+
+        Args:
+            nombre (str): Nombre del comando
+            argumentos (list[str]): Argumentos recibidos
+
+        Returns:
+            list[str]: Los mismos argumentos
+
+        Raises:
+            ValueError: Si la cantidad de argumentos no es válida
+        """
+        firma = self.__firmas[nombre]
+        try:
+            firma.bind(*argumentos)
+        except TypeError:
+            parametros = " ".join(p.upper() for p in firma.parameters)
+            raise ValueError(f"Uso: {nombre} {parametros}".rstrip())
+
+        return argumentos
+
+    def _fecha_hora(self, fecha, hora):
+        """
+        Convierte fecha y hora de texto a datetime.
+
+        Args:
+            fecha (str): Fecha en formato dd/mm/aaaa
+            hora (str): Hora en formato HH:MM
+
+        Returns:
+            datetime: Fecha y hora combinadas
+
+        Raises:
+            ValueError: Si el formato es inválido
+        """
+        try:
+            return datetime.strptime(f"{fecha} {hora}", "%d/%m/%Y %H:%M")
+        except ValueError:
+            raise ValueError("Formato de fecha/hora inválido. Use dd/mm/aaaa y HH:MM")
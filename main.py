@@ -5,27 +5,153 @@ Sistema de Gestión para una Clínica
 Este es el punto de entrada principal para el sistema de gestión de clínica.
 Ejecute este archivo para iniciar la interfaz de línea de comandos.
 
+Para ejecutar comandos por lotes desde un archivo (o desde la entrada
+estándar con '-'), sin menú interactivo:
+
+    python main.py --script comandos.txt
+    python main.py --script - < comandos.txt
+
+Con --metricas ARCHIVO se miden las operaciones de la clínica y, al salir, se
+escriben en ARCHIVO en formato de texto de Prometheus.
+
+Con --profile y --profile-memory la sesión se ejecuta bajo cProfile y
+tracemalloc, y al salir se escriben los reportes de tiempo y de memoria:
+
+    python main.py --script comandos.txt --profile --profile-memory
+
 Autor: Agustin Vera
 Fecha: 12/06/2025
 Materia: Computacion I
 """
 
-from cli import CLI
+import sys
+
+# Los subsistemas (CLI, modo por lotes y modelo) se importan recién cuando se
+# usan, para que el programa arranque rápido.
 
-def main():
+def crear_parser():
+    """
+    Crea el parser de argumentos de la línea de comandos.
+    
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Sistema de gestión de clínica")
+    parser.add_argument(
+        "--script",
+        metavar="ARCHIVO",
+        help="ejecuta los comandos del archivo sin menú interactivo ('-' lee la entrada estándar)",
+    )
+    parser.add_argument(
+        "--metricas",
+        metavar="ARCHIVO",
+        help="mide las operaciones y las escribe al salir en ARCHIVO (formato Prometheus)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="perfil_cpu.txt",
+        metavar="ARCHIVO",
+        help="perfila la sesión con cProfile y escribe las funciones más costosas "
+             "(por defecto en perfil_cpu.txt)",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        nargs="?",
+        const="perfil_memoria.txt",
+        metavar="ARCHIVO",
+        help="rastrea la memoria con tracemalloc y escribe los lugares que más reservan, "
+             "agrupados por módulo del modelo (por defecto en perfil_memoria.txt)",
+    )
+    return parser
+
+def iniciar_sesion(script=None, ruta_metricas=None):
+    """
+    Ejecuta una sesión interactiva o por lotes.
+    
+    Args:
+        script (str): Archivo de comandos ('-' para la entrada estándar), o
+            None para el menú interactivo
+        ruta_metricas (str): Si se indica, archivo donde exportar las métricas al salir
+        
+    Returns:
+        int: Código de salida de la sesión
+    """
+    if script:
+        from lote import EjecutorLote
+        sesion = EjecutorLote(sys.stdout)
+    else:
+        from cli import CLI
+        sesion = CLI()
+    
+    if ruta_metricas:
+        sesion.clinica.habilitar_metricas()
+    
+    try:
+        if script:
+            return ejecutar_script(script, sesion)
+        sesion.ejecutar()
+        return 0
+    finally:
+        if ruta_metricas:
+            sesion.clinica.exportar_metricas(ruta_metricas)
+
+def ejecutar_script(ruta, ejecutor):
+    """
+    Ejecuta un archivo de comandos en modo por lotes.
+    
+    Args:
+        ruta (str): Ruta del archivo, o '-' para la entrada estándar
+        ejecutor (EjecutorLote): Ejecutor de los comandos
+        
+    Returns:
+        int: 0 si todos los comandos fueron exitosos, 1 en caso contrario
+    """
+    if ruta == "-":
+        resumen = ejecutor.ejecutar(sys.stdin)
+    else:
+        with open(ruta, encoding="utf-8") as archivo:
+            resumen = ejecutor.ejecutar(archivo)
+    
+    return 1 if resumen["fallidos"] else 0
+
+def main(argv=None):
     """
     Función principal que inicia el sistema de gestión de clínica.
+    
+    Args:
+        argv (list[str]): Argumentos de la línea de comandos (por defecto, sys.argv)
+        
+    Returns:
+        int: Código de salida del proceso
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Sin argumentos se inicia el menú interactivo sin cargar argparse
+    argumentos = crear_parser().parse_args(argv) if argv else None
+    
     try:
-        # Crear e iniciar la interfaz de línea de comandos
-        cli = CLI()
-        cli.ejecutar()
+        if argumentos is None:
+            return iniciar_sesion()
+        
+        if argumentos.profile or argumentos.profile_memory:
+            from perfilado import sesion_perfilada
+            with sesion_perfilada(argumentos.profile, argumentos.profile_memory):
+                return iniciar_sesion(argumentos.script, argumentos.metricas)
+        
+        return iniciar_sesion(argumentos.script, argumentos.metricas)
         
     except KeyboardInterrupt:
         print(" Sistema interrumpido por el usuario. ¡Hasta luego!")
     except Exception as e:
         print(f" Error crítico del sistema: {e}")
         print("Por favor, contacte al administrador del sistema.")
+        return 1
+    
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
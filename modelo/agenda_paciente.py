@@ -0,0 +1,159 @@
+"""
+Clase AgendaPaciente para el sistema de gestión de clínica.
+
+Mantiene los turnos futuros de un paciente ordenados por fecha y hora.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+
+
+class AgendaPaciente:
+    """
+    Turnos próximos de un paciente, ordenados cronológicamente.
+
+    Permite obtener el próximo turno y verificar superposiciones con búsqueda
+    binaria. Los turnos que ya pasaron se descartan de la agenda recién al
+    consultarla; siguen disponibles en la historia clínica del paciente.
+
+    Las series de turnos se guardan aparte, sin expandir, y se combinan con
+    los turnos sueltos al consultar.
+
+    Atributos:
+        __fechas (list[datetime]): Fechas de los turnos, ordenadas
+        __turnos (list[Turno]): Turnos en el mismo orden que __fechas
+        __series (list[SerieTurnos]): Series con ocurrencias pendientes
+    """
+
+    def __init__(self):
+        """
+        Inicializa una agenda vacía.
+        """
+        self.__fechas = []
+        self.__turnos = []
+        self.__series = []
+
+    def agregar(self, turno):
+        """
+        Agrega un turno manteniendo el orden cronológico.
+
+        Args:
+            turno (Turno): Turno a agregar
+        """
+        fecha_hora = turno.obtener_fecha_hora()
+        posicion = bisect_right(self.__fechas, fecha_hora)
+        self.__fechas.insert(posicion, fecha_hora)
+        self.__turnos.insert(posicion, turno)
+
+    def quitar(self, turno):
+        """
+        Quita un turno de la agenda, si está.
+
+        Args:
+            turno (Turno): Turno a quitar
+        """
+        fecha_hora = turno.obtener_fecha_hora()
+        posicion = bisect_left(self.__fechas, fecha_hora)
+        while posicion < len(self.__fechas) and self.__fechas[posicion] == fecha_hora:
+            if self.__turnos[posicion] is turno:
+                del self.__fechas[posicion]
+                del self.__turnos[posicion]
+                return
+            posicion += 1
+
+    def agregar_serie(self, serie):
+        """
+        Agrega una serie de turnos sin expandir sus ocurrencias.
+
+        Args:
+            serie (SerieTurnos): Serie a agregar
+        """
+        self.__series.append(serie)
+
+    def quitar_serie(self, serie):
+        """
+        Quita una serie de la agenda, si está.
+
+        Args:
+            serie (SerieTurnos): Serie a quitar
+        """
+        self.__series = [s for s in self.__series if s is not serie]
+
+    def tiene_superposicion(self, fecha_hora, duracion) -> bool:
+        """
+        Verifica si algún turno de la agenda se superpone con un horario.
+
+        Args:
+            fecha_hora (datetime): Inicio del horario a verificar
+            duracion (timedelta): Duración de cada turno
+
+        Returns:
+            bool: True si hay un turno que comienza a menos de `duracion` del horario
+        """
+        posicion = bisect_right(self.__fechas, fecha_hora - duracion)
+        if posicion < len(self.__fechas) and self.__fechas[posicion] < fecha_hora + duracion:
+            return True
+        return any(serie.tiene_superposicion(fecha_hora, duracion) for serie in self.__series)
+
+    def obtener_proximo(self, ahora=None):
+        """
+        Devuelve el próximo turno del paciente.
+
+        Args:
+            ahora (datetime): Momento de referencia (por defecto, el actual)
+
+        Returns:
+            Turno | None: El próximo turno, o None si no tiene turnos pendientes
+        """
+        proximos = self.obtener_proximos(1, ahora)
+        return proximos[0] if proximos else None
+
+    def obtener_proximos(self, limite=None, ahora=None):
+        """
+        Devuelve los turnos pendientes en orden cronológico.
+
+        Args:
+            limite (int): Cantidad máxima de turnos (None devuelve todos)
+            ahora (datetime): Momento de referencia (por defecto, el actual)
+
+        Returns:
+            list[Turno]: Turnos pendientes
+        """
+        if ahora is None:
+            ahora = datetime.now()
+        self._descartar_pasados(ahora)
+        if not self.__series:
+            return self.__turnos[:limite]
+
+        turnos = merge(self.__turnos, *(serie.turnos(desde=ahora) for serie in self.__series),
+                       key=lambda turno: turno.obtener_fecha_hora())
+        return list(islice(turnos, limite))
+
+    def __len__(self) -> int:
+        """
+        Devuelve la cantidad de turnos en la agenda, incluidos los ya pasados
+        que todavía no se descartaron y las ocurrencias vigentes de las series.
+
+        Returns:
+            int: Cantidad de turnos
+        """
+        return len(self.__turnos) + sum(len(serie) for serie in self.__series)
+
+    def _descartar_pasados(self, ahora=None):
+        """
+        Quita de la agenda los turnos anteriores al momento indicado.
+
+        Args:
+            ahora (datetime): Momento de referencia (por defecto, el actual)
+        """
+        if ahora is None:
+            ahora = datetime.now()
+
+        posicion = bisect_left(self.__fechas, ahora)
+        if posicion:
+            del self.__fechas[:posicion]
+            del self.__turnos[:posicion]
+        if any(serie.obtener_fin() < ahora for serie in self.__series):
+            self.__series = [serie for serie in self.__series if serie.obtener_fin() >= ahora]
@@ -0,0 +1,174 @@
+"""
+Almacenamiento comprimido de entradas antiguas de las historias clínicas.
+
+Las entradas viejas de una historia clínica casi nunca se leen. En lugar de
+conservarlas como objetos Turno y Receta, se guardan en segmentos de solo
+agregado: cada segmento es un bloque comprimido con zlib con la fecha y el
+texto de cada entrada, y se descomprime únicamente cuando se pide la parte de
+la historia que lo contiene.
+"""
+
+import json
+import zlib
+from datetime import datetime
+
+# Nivel de compresión de zlib (1 es el más rápido, 9 el más compacto)
+NIVEL_COMPRESION = 9
+
+
+class EntradaArchivada:
+    """
+    Entrada de una historia clínica recuperada de un segmento archivado.
+
+    Ofrece la fecha con los mismos métodos que Turno y Receta (y el final,
+    como SerieTurnos), y su texto original como representación.
+
+    Atributos:
+        __fecha (datetime): Fecha del turno o de la receta
+        __fin (datetime): Última ocurrencia si la entrada es una serie; si no, la fecha
+        __texto (str): Texto de la entrada al momento de archivarla
+    """
+
+    __slots__ = ("__fecha", "__fin", "__texto")
+
+    def __init__(self, fecha, texto, fin=None):
+        """
+        Inicializa la entrada.
+
+        Args:
+            fecha (datetime): Fecha del turno o de la receta
+            texto (str): Texto de la entrada
+            fin (datetime): Última ocurrencia de una serie (por defecto, la fecha)
+        """
+        self.__fecha = fecha
+        self.__fin = fin if fin is not None else fecha
+        self.__texto = texto
+
+    def obtener_fecha(self):
+        """
+        Devuelve la fecha de la entrada.
+
+        Returns:
+            datetime: Fecha del turno o de la receta
+        """
+        return self.__fecha
+
+    def obtener_fecha_hora(self):
+        """
+        Devuelve la fecha de la entrada (igual que obtener_fecha, como en Turno).
+
+        Returns:
+            datetime: Fecha del turno o de la receta
+        """
+        return self.__fecha
+
+    def obtener_fin(self):
+        """
+        Devuelve la fecha en que termina la entrada (como en SerieTurnos).
+
+        Returns:
+            datetime: Última ocurrencia de una serie, o la fecha de la entrada
+        """
+        return self.__fin
+
+    def __str__(self):
+        """
+        Devuelve el texto de la entrada.
+
+        Returns:
+            str: Texto de la entrada al momento de archivarla
+        """
+        return self.__texto
+
+
+class SegmentoArchivado:
+    """
+    Bloque comprimido e inmutable de entradas de una historia clínica.
+
+    Guarda aparte la cantidad de entradas y el rango de fechas, para contar
+    entradas y descartar segmentos fuera de un filtro sin descomprimirlos.
+
+    Atributos:
+        __datos (bytes): Entradas comprimidas
+        __cantidad (int): Cantidad de entradas
+        __primera_fecha (datetime): Fecha más antigua
+        __ultima_fecha (datetime): Fecha más reciente, contando el final de las series
+    """
+
+    __slots__ = ("__datos", "__cantidad", "__primera_fecha", "__ultima_fecha")
+
+    def __init__(self, entradas):
+        """
+        Comprime un grupo de entradas.
+
+        Args:
+            entradas (list[tuple]): (fecha, texto) de cada entrada, o (fecha, texto, fin)
+                si es una serie, en el orden en que deben mostrarse
+
+        Raises:
+            ValueError: Si no hay entradas
+        """
+        if not entradas:
+            raise ValueError("Un segmento archivado debe tener al menos una entrada")
+
+        registros = []
+        self.__primera_fecha = self.__ultima_fecha = entradas[0][0]
+        for fecha, texto, *resto in entradas:
+            fin = resto[0] if resto else fecha
+            # El final solo se guarda si difiere de la fecha
+            registros.append([fecha.isoformat(), texto] if fin == fecha else
+                             [fecha.isoformat(), texto, fin.isoformat()])
+            self.__primera_fecha = min(self.__primera_fecha, fecha)
+            self.__ultima_fecha = max(self.__ultima_fecha, fin)
+
+        self.__datos = zlib.compress(json.dumps(registros, ensure_ascii=False).encode("utf-8"),
+                                     NIVEL_COMPRESION)
+        self.__cantidad = len(entradas)
+
+    def obtener_cantidad(self):
+        """
+        Devuelve la cantidad de entradas del segmento.
+
+        Returns:
+            int: Cantidad de entradas
+        """
+        return self.__cantidad
+
+    def obtener_primera_fecha(self):
+        """
+        Devuelve la fecha más antigua del segmento.
+
+        Returns:
+            datetime: Fecha más antigua
+        """
+        return self.__primera_fecha
+
+    def obtener_ultima_fecha(self):
+        """
+        Devuelve la fecha más reciente del segmento.
+
+        Returns:
+            datetime: Fecha más reciente
+        """
+        return self.__ultima_fecha
+
+    def obtener_tamanio(self):
+        """
+        Devuelve el tamaño de los datos comprimidos.
+
+        Returns:
+            int: Bytes comprimidos
+        """
+        return len(self.__datos)
+
+    def entradas(self):
+        """
+        Descomprime las entradas del segmento.
+
+        Returns:
+            list[EntradaArchivada]: Entradas en el orden en que se archivaron
+        """
+        registros = json.loads(zlib.decompress(self.__datos).decode("utf-8"))
+        return [EntradaArchivada(datetime.fromisoformat(fecha), texto,
+                                 datetime.fromisoformat(fin[0]) if fin else None)
+                for fecha, texto, *fin in registros]
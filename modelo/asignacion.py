@@ -0,0 +1,353 @@
+"""
+Asignación de turnos por lotes para el sistema de gestión de clínica.
+
+Las solicitudes del tipo "cualquier médico de la especialidad X entre tal y
+tal fecha" se resuelven todas juntas: se busca la asignación que cubre la
+mayor cantidad de solicitudes, dando preferencia a las de mayor prioridad,
+en lugar de asignarlas una por una en orden de llegada.
+"""
+
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+
+
+class SolicitudAsignacion:
+    """
+    Pedido de un turno con cualquier médico de una especialidad dentro de un
+    período.
+
+    Atributos:
+        __dni (str): DNI del paciente
+        __especialidad (str): Especialidad solicitada
+        __desde (datetime): Comienzo del período, incluido
+        __hasta (datetime): Fin del período, excluido
+        __prioridad (int): Cuanto mayor, antes se asigna
+    """
+
+    def __init__(self, dni, especialidad, desde, hasta, prioridad=0):
+        """
+        Inicializa una solicitud.
+
+        Args:
+            dni (str): DNI del paciente
+            especialidad (str): Especialidad solicitada
+            desde (datetime): Comienzo del período, incluido
+            hasta (datetime): Fin del período, excluido
+            prioridad (int): Cuanto mayor, antes se asigna
+
+        Raises:
+            ValueError: Si el período está vacío o la prioridad no es un entero no negativo
+        """
+        if not isinstance(desde, datetime) or not isinstance(hasta, datetime) or desde >= hasta:
+            raise ValueError("El período de la solicitud debe comenzar antes de terminar")
+        if not isinstance(prioridad, int) or prioridad < 0:
+            raise ValueError("La prioridad debe ser un número entero no negativo")
+
+        self.__dni = dni
+        self.__especialidad = especialidad.strip()
+        self.__desde = desde
+        self.__hasta = hasta
+        self.__prioridad = prioridad
+
+    def obtener_dni(self):
+        """
+        Devuelve el DNI del paciente.
+
+        Returns:
+            str: DNI del paciente
+        """
+        return self.__dni
+
+    def obtener_especialidad(self):
+        """
+        Devuelve la especialidad solicitada.
+
+        Returns:
+            str: Especialidad solicitada
+        """
+        return self.__especialidad
+
+    def obtener_desde(self):
+        """
+        Devuelve el comienzo del período.
+
+        Returns:
+            datetime: Comienzo del período, incluido
+        """
+        return self.__desde
+
+    def obtener_hasta(self):
+        """
+        Devuelve el fin del período.
+
+        Returns:
+            datetime: Fin del período, excluido
+        """
+        return self.__hasta
+
+    def obtener_prioridad(self):
+        """
+        Devuelve la prioridad de la solicitud.
+
+        Returns:
+            int: Prioridad (mayor se asigna antes)
+        """
+        return self.__prioridad
+
+    def __str__(self):
+        """
+        Devuelve una representación legible de la solicitud.
+
+        Returns:
+            str: Información de la solicitud
+        """
+        return (f"Solicitud: DNI {self.__dni} - {self.__especialidad} - "
+                f"entre {self.__desde.strftime('%d/%m/%Y %H:%M')} y {self.__hasta.strftime('%d/%m/%Y %H:%M')} - "
+                f"prioridad {self.__prioridad}")
+
+
+class AsignadorTurnos:
+    """
+    Asigna horarios libres a un lote de solicitudes maximizando la cantidad
+    de solicitudes cubiertas.
+
+    Es un emparejamiento bipartito entre solicitudes y horarios (matrícula,
+    fecha y hora). Las solicitudes se procesan de mayor a menor prioridad:
+    cada una toma el primer horario libre de su período y, si no queda
+    ninguno, se busca un camino de aumento que corra a otras solicitudes ya
+    asignadas a otros horarios de sus propios períodos. Una solicitud
+    asignada nunca pierde su turno, así que entre las asignaciones de máxima
+    cantidad se obtiene la que favorece a las de mayor prioridad.
+
+    Los horarios libres de cada especialidad se recorren con una estructura
+    de "siguiente libre" (union-find), y las búsquedas fallidas conservan los
+    horarios visitados hasta el próximo aumento exitoso, de modo que el costo
+    total queda acotado aunque el lote pida más turnos de los que hay.
+
+    Un paciente no puede recibir dos turnos superpuestos. Esa restricción no
+    es bipartita: si un camino de aumento movería dos solicitudes del mismo
+    paciente, se descarta.
+
+    Atributos:
+        __solicitudes (list[SolicitudAsignacion]): Solicitudes del lote
+        __fechas (dict[str, list[datetime]]): Especialidad -> fechas de sus horarios, ordenadas
+        __horarios (dict[str, list[tuple[str, datetime]]]): Especialidad -> horarios en el mismo orden
+        __siguientes (dict[str, list[int]]): Especialidad -> estructura de siguiente horario libre
+        __titulares (dict[tuple[str, datetime], int]): Horario -> solicitud que lo tiene
+        __asignados (list[tuple[str, datetime] | None]): Horario de cada solicitud
+        __fechas_paciente (dict[str, list[datetime]]): DNI -> fechas asignadas en el lote
+        __paciente_ocupado (callable): (dni, fecha_hora) -> True si el paciente ya tiene un turno superpuesto
+        __duracion (timedelta): Duración de cada turno
+    """
+
+    def __init__(self, solicitudes, horarios_libres, paciente_ocupado, duracion):
+        """
+        Inicializa el asignador.
+
+        Args:
+            solicitudes (list[SolicitudAsignacion]): Solicitudes del lote
+            horarios_libres (dict[str, list[tuple[datetime, str]]]): Especialidad en
+                minúsculas -> (fecha y hora, matrícula) libres, en orden cronológico; un
+                horario de un médico con varias especialidades puede aparecer en varias
+            paciente_ocupado (callable): Recibe (dni, fecha_hora) y devuelve True si el
+                paciente ya tiene un turno superpuesto fuera del lote
+            duracion (timedelta): Duración de cada turno
+        """
+        self.__solicitudes = list(solicitudes)
+        self.__fechas = {}
+        self.__horarios = {}
+        self.__siguientes = {}
+        for especialidad, libres in horarios_libres.items():
+            self.__fechas[especialidad] = [fecha_hora for fecha_hora, _ in libres]
+            self.__horarios[especialidad] = [(matricula, fecha_hora) for fecha_hora, matricula in libres]
+            self.__siguientes[especialidad] = list(range(len(libres)))
+        self.__titulares = {}
+        self.__asignados = [None] * len(self.__solicitudes)
+        self.__fechas_paciente = {}
+        self.__paciente_ocupado = paciente_ocupado
+        self.__duracion = duracion
+
+    def resolver(self):
+        """
+        Calcula la asignación.
+
+        Returns:
+            list[tuple[str, datetime] | None]: (matrícula, fecha y hora) asignados a
+                cada solicitud, en el orden del lote; None si quedó sin turno
+        """
+        orden = sorted(
+            range(len(self.__solicitudes)),
+            key=lambda i: (-self.__solicitudes[i].obtener_prioridad(), self.__solicitudes[i].obtener_hasta(), i),
+        )
+        visitados = set()
+        for indice in orden:
+            if self.__asignar_libre(indice):
+                continue
+            if self.__aumentar(indice, visitados):
+                visitados.clear()
+        return list(self.__asignados)
+
+    def __rango(self, indice):
+        """
+        Devuelve la especialidad y las posiciones de los horarios del período
+        de una solicitud.
+
+        Args:
+            indice (int): Posición de la solicitud
+
+        Returns:
+            tuple[str, int, int]: Especialidad, primera posición y posición final (excluida)
+        """
+        solicitud = self.__solicitudes[indice]
+        especialidad = solicitud.obtener_especialidad().lower()
+        fechas = self.__fechas.get(especialidad, [])
+        return (especialidad, bisect_left(fechas, solicitud.obtener_desde()),
+                bisect_left(fechas, solicitud.obtener_hasta()))
+
+    def __primer_libre(self, especialidad, posicion):
+        """
+        Devuelve la posición del primer horario libre desde una posición.
+
+        Los horarios solo pasan de libres a ocupados, así que los ocupados se
+        saltean para siempre comprimiendo los saltos.
+
+        Args:
+            especialidad (str): Especialidad en minúsculas
+            posicion (int): Posición inicial
+
+        Returns:
+            int: Posición del horario libre (la cantidad de horarios si no hay)
+        """
+        siguientes = self.__siguientes[especialidad]
+        horarios = self.__horarios[especialidad]
+        raiz = posicion
+        while raiz < len(horarios) and (siguientes[raiz] != raiz or horarios[raiz] in self.__titulares):
+            if siguientes[raiz] == raiz:
+                siguientes[raiz] = raiz + 1
+            raiz = siguientes[raiz]
+
+        while posicion < len(horarios) and posicion != raiz:
+            siguientes[posicion], posicion = raiz, siguientes[posicion]
+        return raiz
+
+    def __admite(self, indice, fecha_hora):
+        """
+        Indica si el paciente de una solicitud puede tomar un horario.
+
+        Args:
+            indice (int): Posición de la solicitud
+            fecha_hora (datetime): Horario a tomar
+
+        Returns:
+            bool: True si el paciente no tiene otro turno superpuesto
+        """
+        dni = self.__solicitudes[indice].obtener_dni()
+        propio = self.__asignados[indice]
+        for otra in self.__fechas_paciente.get(dni, ()):
+            if abs(otra - fecha_hora) < self.__duracion and (propio is None or propio[1] != otra):
+                return False
+        return not self.__paciente_ocupado(dni, fecha_hora)
+
+    def __asignar_libre(self, indice):
+        """
+        Asigna a una solicitud el primer horario libre de su período.
+
+        Args:
+            indice (int): Posición de la solicitud
+
+        Returns:
+            bool: True si se asignó un horario
+        """
+        especialidad, inicio, fin = self.__rango(indice)
+        if especialidad not in self.__horarios:
+            return False
+
+        posicion = self.__primer_libre(especialidad, inicio)
+        while posicion < fin:
+            horario = self.__horarios[especialidad][posicion]
+            if self.__admite(indice, horario[1]):
+                self.__mover(indice, horario)
+                return True
+            posicion = self.__primer_libre(especialidad, posicion + 1)
+        return False
+
+    def __aumentar(self, origen, visitados):
+        """
+        Busca en anchura un camino de aumento desde una solicitud sin turno:
+        una cadena de solicitudes asignadas que pueden correrse a otro
+        horario de su período hasta liberar uno para la solicitud original.
+
+        Args:
+            origen (int): Posición de la solicitud sin turno
+            visitados (set): Horarios ya explorados sin éxito; se actualiza
+
+        Returns:
+            bool: True si se encontró y aplicó un camino
+        """
+        pedida_por = {origen: None}  # Solicitud -> solicitud que quiere su horario
+        pendientes = deque([origen])
+
+        while pendientes:
+            indice = pendientes.popleft()
+            especialidad, inicio, fin = self.__rango(indice)
+            horarios = self.__horarios.get(especialidad, ())
+            for posicion in range(inicio, fin):
+                horario = horarios[posicion]
+                if horario in visitados or not self.__admite(indice, horario[1]):
+                    continue
+                visitados.add(horario)
+
+                titular = self.__titulares.get(horario)
+                if titular is None:
+                    return self.__aplicar_camino(indice, horario, pedida_por)
+                if titular not in pedida_por:
+                    pedida_por[titular] = indice
+                    pendientes.append(titular)
+        return False
+
+    def __aplicar_camino(self, indice, horario, pedida_por):
+        """
+        Corre cada solicitud del camino al horario que libera la siguiente.
+
+        Args:
+            indice (int): Última solicitud del camino, que toma un horario libre
+            horario (tuple[str, datetime]): Horario libre
+            pedida_por (dict[int, int]): Solicitud -> solicitud que quiere su horario
+
+        Returns:
+            bool: True si se aplicó; False si el camino movía dos solicitudes del mismo paciente
+        """
+        movimientos = []
+        while indice is not None:
+            movimientos.append((indice, horario))
+            horario = self.__asignados[indice]
+            indice = pedida_por[indice]
+
+        dnis = [self.__solicitudes[i].obtener_dni() for i, _ in movimientos]
+        if len(set(dnis)) != len(dnis):
+            return False
+
+        for indice, horario in movimientos:
+            self.__mover(indice, horario)
+        return True
+
+    def __mover(self, indice, horario):
+        """
+        Asigna un horario a una solicitud, liberando el que tenía.
+
+        Args:
+            indice (int): Posición de la solicitud
+            horario (tuple[str, datetime]): Horario a asignar
+        """
+        dni = self.__solicitudes[indice].obtener_dni()
+        fechas = self.__fechas_paciente.setdefault(dni, [])
+        anterior = self.__asignados[indice]
+        if anterior is not None:
+            fechas.remove(anterior[1])
+            if self.__titulares.get(anterior) == indice:
+                del self.__titulares[anterior]
+
+        self.__titulares[horario] = indice
+        self.__asignados[indice] = horario
+        fechas.append(horario[1])
@@ -1,15 +1,30 @@
-from datetime import datetime
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from heapq import merge
+from itertools import count
 from .paciente import Paciente
 from .medico import Medico
 from .turno import Turno
+from .serie_turnos import SerieTurnos
 from .receta import Receta
 from .historia_clinica import HistoriaClinica
 from .especialidad import Especialidad
+from .indice_pacientes import IndicePacientes
+from .estadisticas import EstadisticasOcupacion
+from .agenda_paciente import AgendaPaciente
+from .indice_recetas import IndiceRecetas
+from .indice_turnos import IndiceTurnos
+from .lista_espera import ListaEspera, SolicitudEspera
+from .asignacion import AsignadorTurnos
+from .eventos import Evento, FeedCambios
 from .excepciones import (
     PacienteNoEncontradoException,
     MedicoNoDisponibleException, 
     TurnoOcupadoException,
-    RecetaInvalidaException
+    PacienteOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    DatosInvalidosException
 )
 
 class Clinica:
@@ -17,14 +32,46 @@ class Clinica:
     Clase principal que representa el sistema de gestión de la clínica.
     """
     
+    # Duración de cada turno, usada para detectar superposiciones de un paciente
+    DURACION_TURNO = timedelta(minutes=30)
+    
+    # Horario de atención (de HORA_APERTURA a HORA_CIERRE, en turnos de DURACION_TURNO)
+    HORA_APERTURA = 8
+    HORA_CIERRE = 18
+    
+    # Período en el que se buscan turnos libres si no se indica el final
+    HORIZONTE_TURNOS_LIBRES = timedelta(days=60)
+    
+    # Operaciones que se miden cuando se habilitan las métricas
+    OPERACIONES_INSTRUMENTADAS = (
+        "agregar_paciente", "agregar_medico", "agendar_turno", "agendar_serie", "asignar_solicitudes",
+        "cancelar_turno",
+        "emitir_receta", "obtener_historia_clinica", "buscar_pacientes",
+        "obtener_turnos_entre",
+    )
+    
     def __init__(self):
         """
         Inicializa una nueva clínica vacía.
         """
         self.__pacientes = {}  # DNI -> Paciente
         self.__medicos = {}    # Matrícula -> Medico
-        self.__turnos = []     # Lista de todos los turnos
+        self.__turnos = {}     # (Matrícula, fecha_hora) -> Turno o SerieTurnos, en orden de alta
         self.__historias_clinicas = {}  # DNI -> HistoriaClinica
+        self.__agendas = {}    # DNI -> AgendaPaciente con sus turnos próximos
+        self.__indice_pacientes = IndicePacientes()  # Búsqueda por nombre
+        self.__estadisticas = EstadisticasOcupacion()  # Contadores de ocupación
+        self.__indice_recetas = IndiceRecetas()  # Recetas por médico, medicamento y mes
+        self.__turnos_por_fecha = IndiceTurnos()  # Todos los turnos, por fecha y hora
+        self.__turnos_por_medico = {}        # Matrícula -> IndiceTurnos
+        self.__turnos_por_especialidad = {}  # Especialidad (minúsculas) -> IndiceTurnos
+        self.__series_por_medico = {}  # Matrícula -> list[SerieTurnos] con ocurrencias vigentes
+        self.__series_por_fin = []     # (fin, número, SerieTurnos) ordenadas por la última ocurrencia
+        self.__numero_serie = count()  # Desempata series que terminan en la misma fecha y hora
+        self.__cortes_archivo = []     # Fechas de corte de cada archivar_historias que archivó algo
+        self.__lista_espera = ListaEspera()  # Solicitudes sin turno, por médico y especialidad
+        self.__feed = FeedCambios()  # Eventos de cada modificación, para consumidores incrementales
+        self.__metricas = None  # Metricas, o None si la instrumentación está deshabilitada
     
     # === MÉTODOS PARA PACIENTES ===
     
@@ -45,6 +92,9 @@ class Clinica:
         
         self.__pacientes[dni] = paciente
         self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+        self.__agendas[dni] = AgendaPaciente()
+        self.__indice_pacientes.agregar(paciente)
+        self.__feed.publicar(Evento.PACIENTE_AGREGADO, paciente=paciente)
     
     def obtener_pacientes(self):
         """
@@ -55,6 +105,26 @@ class Clinica:
         """
         return list(self.__pacientes.values())
     
+    def buscar_pacientes(self, texto, limite=10):
+        """
+        Busca pacientes por nombre completo o parcial.
+        
+        La búsqueda no distingue mayúsculas ni tildes. Primero aparecen los
+        pacientes con palabras que comienzan con el texto buscado y luego los
+        que lo contienen en cualquier parte del nombre.
+        
+        Args:
+            texto (str): Nombre o parte del nombre a buscar
+            limite (int): Cantidad máxima de resultados
+            
+        Returns:
+            list[Paciente]: Pacientes encontrados
+            
+        Raises:
+            ValueError: Si el límite no es un número positivo
+        """
+        return self.__indice_pacientes.buscar(texto, limite)
+    
     def validar_existencia_paciente(self, dni):
         """
         Verifica si un paciente está registrado.
@@ -86,6 +156,23 @@ class Clinica:
             raise ValueError(f"El médico con matrícula {matricula} ya está registrado")
         
         self.__medicos[matricula] = medico
+        self.__feed.publicar(Evento.MEDICO_AGREGADO, medico=medico)
+    
+    def agregar_especialidad_a_medico(self, matricula, especialidad):
+        """
+        Agrega una especialidad a un médico registrado.
+        
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (Especialidad): Especialidad con sus días de atención
+            
+        Raises:
+            ValueError: Si el médico no existe
+            EspecialidadDuplicadaException: Si el médico ya tiene esa especialidad
+        """
+        medico = self.obtener_medico_por_matricula(matricula)
+        medico.agregar_especialidad(especialidad)
+        self.__feed.publicar(Evento.ESPECIALIDAD_AGREGADA, medico=medico, especialidad=especialidad)
     
     def obtener_medicos(self):
         """
@@ -139,11 +226,15 @@ class Clinica:
             especialidad (str): Especialidad solicitada
             fecha_hora (datetime): Fecha y hora del turno
             
+        Returns:
+            Turno: El turno agendado
+            
         Raises:
             PacienteNoEncontradoException: Si el paciente no existe
             ValueError: Si el médico no existe
             MedicoNoDisponibleException: Si el médico no atiende esa especialidad ese día
             TurnoOcupadoException: Si ya hay un turno para ese médico en esa fecha/hora
+            PacienteOcupadoException: Si el paciente ya tiene un turno superpuesto
         """
         # 1. Validar que el paciente existe
         self.validar_existencia_paciente(dni)
@@ -162,21 +253,322 @@ class Clinica:
         # 5. Validar que no hay turno duplicado
         self.validar_turno_no_duplicado(matricula, fecha_hora)
         
-        # 6. Crear y agregar el turno
+        # 6. Validar que el paciente no tiene otro turno a esa hora
+        self.validar_paciente_disponible(dni, fecha_hora)
+        
+        # 7. Crear y registrar el turno
         turno = Turno(paciente, medico, fecha_hora, especialidad)
-        self.__turnos.append(turno)
+        self.__registrar_turno(turno)
+        return turno
+    
+    def cancelar_turno(self, matricula, fecha_hora):
+        """
+        Cancela un turno agendado y libera el horario del médico.
         
-        # 7. Agregar el turno a la historia clínica del paciente
-        self.__historias_clinicas[dni].agregar_turno(turno)
+        Si el turno es una ocurrencia de una serie, se cancela solo esa
+        ocurrencia; la serie se quita cuando no le quedan ocurrencias. Si hay
+        solicitudes en lista de espera para ese médico y especialidad, el
+        horario liberado se asigna a la más prioritaria. Los turnos pasados
+        (incluidos los archivados) no se pueden cancelar.
+        
+        Args:
+            matricula (str): Matrícula del médico
+            fecha_hora (datetime): Fecha y hora del turno
+            
+        Returns:
+            Turno: El turno cancelado
+            
+        Raises:
+            DatosInvalidosException: Si el turno ya pasó
+            TurnoNoEncontradoException: Si no hay un turno para ese médico en esa fecha/hora
+        """
+        if fecha_hora < datetime.now():
+            raise DatosInvalidosException("No se pueden cancelar turnos pasados")
+        
+        return self.__cancelar_turno(matricula, fecha_hora)
+    
+    def deshacer_turno(self, matricula, fecha_hora):
+        """
+        Quita un turno recién agendado, por ejemplo al revertir un lote que no
+        se pudo registrar.
+        
+        A diferencia de cancelar_turno, el horario liberado no se asigna a la
+        lista de espera: el turno nunca llegó a confirmarse, así que otro
+        paciente no debe ocupar su lugar ni perder su solicitud. Tampoco se
+        valida la fecha.
+        
+        Args:
+            matricula (str): Matrícula del médico
+            fecha_hora (datetime): Fecha y hora del turno
+            
+        Returns:
+            Turno: El turno quitado
+            
+        Raises:
+            TurnoNoEncontradoException: Si no hay un turno para ese médico en esa fecha/hora
+        """
+        return self.__cancelar_turno(matricula, fecha_hora, promover=False)
+    
+    def agendar_o_esperar(self, dni, matricula, especialidad, fecha_hora, urgencia=0):
+        """
+        Agenda un turno o, si el horario está ocupado, anota al paciente en la
+        lista de espera del médico y especialidad.
+        
+        Args:
+            dni (str): DNI del paciente
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad solicitada
+            fecha_hora (datetime): Fecha y hora pedida
+            urgencia (int): Prioridad en la lista de espera; cuanto mayor, antes se atiende
+            
+        Returns:
+            Turno | SolicitudEspera: El turno agendado, o la solicitud anotada en espera
+            
+        Raises:
+            Las mismas excepciones que agendar_turno, salvo TurnoOcupadoException
+        """
+        try:
+            return self.agendar_turno(dni, matricula, especialidad, fecha_hora)
+        except TurnoOcupadoException:
+            solicitud = SolicitudEspera(dni, matricula, especialidad, fecha_hora, urgencia)
+            self.__lista_espera.agregar(solicitud)
+            self.__feed.publicar(Evento.ESPERA_AGREGADA, solicitud=solicitud)
+            return solicitud
+    
+    def obtener_lista_espera(self, matricula, especialidad):
+        """
+        Devuelve las solicitudes en espera de un médico y especialidad.
+        
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad
+            
+        Returns:
+            list[SolicitudEspera]: Solicitudes en orden de prioridad
+        """
+        return self.__lista_espera.obtener_solicitudes(matricula, especialidad)
+    
+    def retirar_de_espera(self, solicitud):
+        """
+        Retira una solicitud de la lista de espera.
+        
+        Args:
+            solicitud (SolicitudEspera): Solicitud a retirar
+            
+        Returns:
+            bool: True si la solicitud estaba esperando
+        """
+        return self.__lista_espera.retirar(solicitud)
+    
+    def suscribir_promociones(self, oyente):
+        """
+        Registra una función que se llama cada vez que una solicitud en espera
+        obtiene turno.
+        
+        Args:
+            oyente (callable): Recibe la solicitud y el turno agendado
+            
+        Returns:
+            Suscripcion: Suscripción al feed de cambios, para cancelarla
+        """
+        def filtrar(evento):
+            if evento.obtener_tipo() == Evento.ESPERA_PROMOVIDA:
+                oyente(evento.obtener("solicitud"), evento.obtener("turno"))
+        
+        return self.__feed.suscribir(filtrar)
+    
+    def agendar_serie(self, dni, matricula, especialidad, inicio, regla, cantidad):
+        """
+        Agenda una serie de turnos recurrentes (por ejemplo, todos los martes
+        a las 9:00 durante seis meses).
+        
+        Todas las ocurrencias se validan antes de agendar ninguna: si alguna
+        no es posible, no se agenda la serie. Las ocurrencias no se crean como
+        turnos individuales sino que se calculan al consultarlas.
+        
+        Args:
+            dni (str): DNI del paciente
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad solicitada
+            inicio (datetime): Fecha y hora de la primera ocurrencia
+            regla (str | timedelta): "semanal", "quincenal" o intervalo de al menos un día
+            cantidad (int): Cantidad de ocurrencias
+            
+        Returns:
+            SerieTurnos: La serie agendada
+            
+        Raises:
+            PacienteNoEncontradoException: Si el paciente no existe
+            ValueError: Si el médico no existe
+            DatosInvalidosException: Si la regla, la cantidad o el inicio no son válidos
+            MedicoNoDisponibleException: Si el médico no atiende esa especialidad el día de alguna ocurrencia
+            TurnoOcupadoException: Si el médico ya tiene un turno en alguna ocurrencia
+            PacienteOcupadoException: Si el paciente ya tiene un turno superpuesto con alguna ocurrencia
+        """
+        # 1. Validar que el paciente y el médico existen
+        self.validar_existencia_paciente(dni)
+        self.validar_existencia_medico(matricula)
+        medico = self.__medicos[matricula]
+        
+        # 2. Crear la serie (valida la regla, la cantidad y el inicio)
+        serie = SerieTurnos(self.__pacientes[dni], medico, especialidad, inicio, regla, cantidad)
+        
+        # 3. Validar todas las ocurrencias en una sola pasada; cada día de la
+        #    semana distinto se valida contra la agenda del médico una sola vez
+        dias_validados = set()
+        for fecha_hora in serie.fechas():
+            dia_semana = fecha_hora.weekday()
+            if dia_semana not in dias_validados:
+                self.validar_especialidad_en_dia(medico, especialidad, self.obtener_dia_semana_en_espanol(fecha_hora))
+                dias_validados.add(dia_semana)
+            self.validar_turno_no_duplicado(matricula, fecha_hora)
+            self.validar_paciente_disponible(dni, fecha_hora)
+        
+        # 4. Ocupar los horarios y registrar la serie
+        self.__registrar_serie(serie)
+        return serie
+    
+    def asignar_solicitudes(self, solicitudes):
+        """
+        Asigna turnos a un lote de solicitudes del tipo "cualquier médico de
+        esta especialidad en este período".
+        
+        El lote se resuelve completo con AsignadorTurnos, que maximiza la
+        cantidad de solicitudes cubiertas dando preferencia a las de mayor
+        prioridad; cada solicitud recibe el primer horario que esa asignación
+        le permite. Los turnos se registran todos juntos: si algún dato es
+        inválido no se agenda ninguno.
+        
+        Args:
+            solicitudes (list[SolicitudAsignacion]): Solicitudes del lote
+            
+        Returns:
+            tuple[list[tuple[SolicitudAsignacion, Turno]], list[SolicitudAsignacion]]:
+                Solicitudes con el turno asignado y solicitudes que quedaron sin turno
+            
+        Raises:
+            PacienteNoEncontradoException: Si algún paciente no existe
+        """
+        solicitudes = list(solicitudes)
+        for solicitud in solicitudes:
+            self.validar_existencia_paciente(solicitud.obtener_dni())
+        
+        # 1. Horarios libres de cada especialidad en el período que cubren sus solicitudes
+        ahora = datetime.now()
+        periodos = {}
+        for solicitud in solicitudes:
+            especialidad = solicitud.obtener_especialidad().lower()
+            desde, hasta = periodos.get(especialidad, (solicitud.obtener_desde(), solicitud.obtener_hasta()))
+            periodos[especialidad] = (min(desde, solicitud.obtener_desde()), max(hasta, solicitud.obtener_hasta()))
+        horarios = {
+            especialidad: list(self.obtener_turnos_libres(especialidad, max(desde, ahora), hasta))
+            for especialidad, (desde, hasta) in periodos.items()
+        }
+        
+        # 2. Calcular la asignación sin modificar la clínica
+        def paciente_ocupado(dni, fecha_hora):
+            return self.__agendas[dni].tiene_superposicion(fecha_hora, self.DURACION_TURNO)
+        
+        asignados = AsignadorTurnos(solicitudes, horarios, paciente_ocupado, self.DURACION_TURNO).resolver()
+        
+        # 3. Crear todos los turnos antes de registrar ninguno
+        resultado = []
+        sin_turno = []
+        for solicitud, horario in zip(solicitudes, asignados):
+            if horario is None:
+                sin_turno.append(solicitud)
+                continue
+            matricula, fecha_hora = horario
+            turno = Turno(self.__pacientes[solicitud.obtener_dni()], self.__medicos[matricula],
+                          fecha_hora, solicitud.obtener_especialidad())
+            resultado.append((solicitud, turno))
+        
+        # 4. Registrar los turnos
+        for _, turno in resultado:
+            self.__registrar_turno(turno)
+        return resultado, sin_turno
     
     def obtener_turnos(self):
         """
         Devuelve todos los turnos agendados.
         
+        Las ocurrencias de las series se devuelven como turnos individuales.
+        
         Returns:
             list[Turno]: Lista de todos los turnos
         """
-        return self.__turnos.copy()
+        return [
+            turno if isinstance(turno, Turno) else turno.obtener_turno(fecha_hora)
+            for (_, fecha_hora), turno in self.__turnos.items()
+        ]
+    
+    def obtener_series(self):
+        """
+        Devuelve las series con ocurrencias vigentes.
+        
+        Returns:
+            list[SerieTurnos]: Series agendadas, por médico
+        """
+        return self.__series_de()
+    
+    def obtener_turnos_entre(self, desde=None, hasta=None, especialidad=None, matricula=None):
+        """
+        Devuelve los turnos de un rango de fechas en orden cronológico.
+        
+        Usa el índice más específico disponible: el del médico si se indica
+        la matrícula, el de la especialidad si se indica la especialidad, o el
+        de todos los turnos.
+        
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+            especialidad (str): Si se indica, solo turnos de esa especialidad
+            matricula (str): Si se indica, solo turnos de ese médico
+            
+        Returns:
+            list[Turno]: Turnos del rango que cumplen los filtros
+        """
+        if matricula is not None:
+            indice = self.__turnos_por_medico.get(matricula)
+        elif especialidad is not None:
+            indice = self.__turnos_por_especialidad.get(especialidad.strip().lower())
+        else:
+            indice = self.__turnos_por_fecha
+        
+        turnos = indice.entre(desde, hasta) if indice is not None else ()
+        series = self.__series_de(matricula, especialidad, desde, hasta)
+        if series:
+            turnos = merge(turnos, *(serie.turnos(desde, hasta) for serie in series),
+                           key=Turno.obtener_fecha_hora)
+        
+        if matricula is not None and especialidad is not None:
+            especialidad = especialidad.strip().lower()
+            return [t for t in turnos if t.obtener_especialidad().lower() == especialidad]
+        return list(turnos)
+    
+    def obtener_turnos_libres(self, especialidad, desde=None, hasta=None):
+        """
+        Recorre los horarios libres de una especialidad en orden cronológico.
+        
+        Los horarios se calculan a medida que se piden: cada médico que
+        atiende la especialidad aporta los turnos de DURACION_TURNO entre
+        HORA_APERTURA y HORA_CIERRE de los días en que la atiende.
+        
+        Args:
+            especialidad (str): Especialidad buscada
+            desde (datetime): Fecha y hora inicial, incluida (por defecto, la actual)
+            hasta (datetime): Fecha y hora final, excluida (por defecto, desde + HORIZONTE_TURNOS_LIBRES)
+            
+        Yields:
+            tuple[datetime, str]: Fecha y hora libre y matrícula del médico
+        """
+        if desde is None:
+            desde = datetime.now()
+        if hasta is None:
+            hasta = desde + self.HORIZONTE_TURNOS_LIBRES
+        
+        medicos = [medico for medico in self.__medicos.values() if medico.tiene_especialidad(especialidad)]
+        return merge(*(self.__turnos_libres_de(medico, especialidad, desde, hasta) for medico in medicos))
     
     def validar_turno_no_duplicado(self, matricula, fecha_hora):
         """
@@ -189,13 +581,317 @@ class Clinica:
         Raises:
             TurnoOcupadoException: Si ya existe un turno para ese médico en esa fecha/hora
         """
-        for turno in self.__turnos:
-            if (turno.obtener_medico().obtener_matricula() == matricula and 
-                turno.obtener_fecha_hora() == fecha_hora):
-                raise TurnoOcupadoException(matricula, fecha_hora)
-                (f"Ya existe un turno para el médico {matricula} "
-                    f"en la fecha {fecha_hora.strftime('%d/%m/%Y %H:%M')}"
-                )
+        if (matricula, fecha_hora) in self.__turnos:
+            raise TurnoOcupadoException(matricula, fecha_hora)
+    
+    def validar_paciente_disponible(self, dni, fecha_hora):
+        """
+        Verifica que el paciente no tenga otro turno que se superponga.
+        
+        Args:
+            dni (str): DNI del paciente
+            fecha_hora (datetime): Fecha y hora a verificar
+            
+        Raises:
+            PacienteOcupadoException: Si el paciente tiene un turno a menos de
+                DURACION_TURNO de esa fecha/hora
+        """
+        if self.__agendas[dni].tiene_superposicion(fecha_hora, self.DURACION_TURNO):
+            raise PacienteOcupadoException(dni, fecha_hora)
+    
+    def obtener_proximo_turno(self, dni):
+        """
+        Devuelve el próximo turno de un paciente.
+        
+        Args:
+            dni (str): DNI del paciente
+            
+        Returns:
+            Turno | None: El próximo turno, o None si no tiene turnos pendientes
+            
+        Raises:
+            PacienteNoEncontradoException: Si el paciente no existe
+        """
+        self.validar_existencia_paciente(dni)
+        return self.__agendas[dni].obtener_proximo()
+    
+    def obtener_proximos_turnos(self, dni, limite=None):
+        """
+        Devuelve los turnos pendientes de un paciente en orden cronológico.
+        
+        Args:
+            dni (str): DNI del paciente
+            limite (int): Cantidad máxima de turnos (None devuelve todos)
+            
+        Returns:
+            list[Turno]: Turnos pendientes del paciente
+            
+        Raises:
+            PacienteNoEncontradoException: Si el paciente no existe
+        """
+        self.validar_existencia_paciente(dni)
+        return self.__agendas[dni].obtener_proximos(limite)
+    
+    def __turnos_libres_de(self, medico, especialidad, desde, hasta):
+        """
+        Recorre los horarios libres de un médico para una especialidad.
+        
+        Args:
+            medico (Medico): El médico
+            especialidad (str): Especialidad buscada
+            desde (datetime): Fecha y hora inicial, incluida
+            hasta (datetime): Fecha y hora final, excluida
+            
+        Yields:
+            tuple[datetime, str]: Fecha y hora libre y matrícula del médico
+        """
+        matricula = medico.obtener_matricula()
+        dia = desde.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        while dia < hasta:
+            if medico.atiende_especialidad_en_dia(especialidad, self.obtener_dia_semana_en_espanol(dia)):
+                fecha_hora = dia.replace(hour=self.HORA_APERTURA)
+                cierre = dia.replace(hour=self.HORA_CIERRE)
+                while fecha_hora < cierre and fecha_hora < hasta:
+                    if fecha_hora >= desde and (matricula, fecha_hora) not in self.__turnos:
+                        yield fecha_hora, matricula
+                    fecha_hora += self.DURACION_TURNO
+            dia += timedelta(days=1)
+    
+    def __registrar_turno(self, turno):
+        """
+        Ocupa el horario de un turno ya validado y lo agrega a la historia
+        clínica, a la agenda del paciente, a los índices y a las estadísticas.
+        
+        Args:
+            turno (Turno): Turno a registrar
+        """
+        matricula = turno.obtener_medico().obtener_matricula()
+        dni = turno.obtener_paciente().obtener_dni()
+        self.__turnos[(matricula, turno.obtener_fecha_hora())] = turno
+        
+        self.__historias_clinicas[dni].agregar_turno(turno)
+        self.__agendas[dni].agregar(turno)
+        
+        self.__indexar_turno(turno)
+        self.__estadisticas.registrar_turno(turno)
+        
+        self.__feed.publicar(Evento.TURNO_AGENDADO, turno=turno)
+    
+    def __registrar_serie(self, serie):
+        """
+        Ocupa los horarios de las ocurrencias vigentes de una serie ya validada
+        y la agrega a la historia clínica, a la agenda del paciente, al índice
+        de series y a las estadísticas.
+        
+        Args:
+            serie (SerieTurnos): Serie a registrar
+        """
+        matricula = serie.obtener_medico().obtener_matricula()
+        dni = serie.obtener_paciente().obtener_dni()
+        for fecha_hora in serie.fechas():
+            self.__turnos[(matricula, fecha_hora)] = serie
+            self.__estadisticas.registrar(matricula, serie.obtener_especialidad(), fecha_hora)
+        
+        self.__historias_clinicas[dni].agregar_serie(serie)
+        self.__agendas[dni].agregar_serie(serie)
+        self.__series_por_medico.setdefault(matricula, []).append(serie)
+        insort(self.__series_por_fin, (serie.obtener_fin(), next(self.__numero_serie), serie))
+        
+        self.__feed.publicar(Evento.SERIE_AGENDADA, serie=serie)
+    
+    def __indexar_turno(self, turno):
+        """
+        Agrega un turno a los índices por fecha, por médico y por especialidad.
+        
+        Args:
+            turno (Turno): Turno agendado
+        """
+        matricula = turno.obtener_medico().obtener_matricula()
+        especialidad = turno.obtener_especialidad().lower()
+        
+        self.__turnos_por_fecha.agregar(turno)
+        self.__turnos_por_medico.setdefault(matricula, IndiceTurnos()).agregar(turno)
+        self.__turnos_por_especialidad.setdefault(especialidad, IndiceTurnos()).agregar(turno)
+    
+    def __promover_espera(self, matricula, especialidad, fecha_hora):
+        """
+        Asigna un horario liberado a la solicitud en espera más prioritaria.
+        
+        Las solicitudes que no pueden usar el horario (por ejemplo, porque el
+        paciente tiene otro turno a esa hora) vuelven a la lista con su misma
+        prioridad y se prueba con la siguiente.
+        
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad del turno liberado
+            fecha_hora (datetime): Horario liberado
+            
+        Returns:
+            Turno | None: El turno agendado, o None si ninguna solicitud pudo usarlo
+        """
+        if fecha_hora < datetime.now():
+            return None
+        
+        descartadas = []
+        turno = None
+        while turno is None:
+            solicitud = self.__lista_espera.siguiente(matricula, especialidad)
+            if solicitud is None:
+                break
+            try:
+                turno = self.agendar_turno(solicitud.obtener_dni(), matricula, especialidad, fecha_hora)
+            except (PacienteNoEncontradoException, PacienteOcupadoException,
+                    MedicoNoDisponibleException, DatosInvalidosException):
+                descartadas.append(solicitud)
+        
+        for descartada in descartadas:
+            self.__lista_espera.agregar(descartada)
+        
+        if turno is not None:
+            self.__feed.publicar(Evento.ESPERA_PROMOVIDA, solicitud=solicitud, turno=turno)
+        return turno
+    
+    def __series_de(self, matricula=None, especialidad=None, desde=None, hasta=None):
+        """
+        Devuelve las series vigentes de un médico o de una especialidad.
+        
+        Con `desde` o `hasta`, solo las series con alguna ocurrencia en ese
+        rango de fechas. Sin matrícula, las series que terminaron antes de
+        `desde` se saltean con una búsqueda binaria, así que no se recorren
+        todas las series que alguna vez se agendaron.
+        
+        Args:
+            matricula (str): Si se indica, solo series de ese médico
+            especialidad (str): Si se indica, solo series de esa especialidad
+            desde (datetime): Fecha y hora inicial del rango, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final del rango, excluida (None: sin límite)
+            
+        Returns:
+            list[SerieTurnos]: Series que cumplen los filtros
+        """
+        if matricula is not None:
+            series = self.__series_por_medico.get(matricula, [])
+            if desde is not None:
+                series = [serie for serie in series if serie.obtener_fin() >= desde]
+        elif desde is not None:
+            primera = bisect_left(self.__series_por_fin, (desde,))
+            series = [serie for _, _, serie in self.__series_por_fin[primera:]]
+        else:
+            series = [serie for lista in self.__series_por_medico.values() for serie in lista]
+        
+        if hasta is not None:
+            series = [serie for serie in series if serie.obtener_fecha_hora() < hasta]
+        if especialidad is not None:
+            especialidad = especialidad.strip().lower()
+            series = [serie for serie in series if serie.obtener_especialidad().lower() == especialidad]
+        return series
+    
+    def __cancelar_ocurrencia(self, serie, fecha_hora):
+        """
+        Cancela una ocurrencia de una serie cuyo horario ya se liberó.
+        
+        Args:
+            serie (SerieTurnos): Serie de la ocurrencia
+            fecha_hora (datetime): Fecha y hora de la ocurrencia
+            
+        Returns:
+            Turno: La ocurrencia cancelada
+        """
+        turno = serie.cancelar(fecha_hora)
+        matricula = serie.obtener_medico().obtener_matricula()
+        historia = self.__historias_clinicas[serie.obtener_paciente().obtener_dni()]
+        self.__estadisticas.quitar(matricula, serie.obtener_especialidad(), fecha_hora)
+        
+        if not len(serie):
+            historia.quitar_turno(serie)
+            self.__agendas[serie.obtener_paciente().obtener_dni()].quitar_serie(serie)
+            self.__series_por_medico[matricula].remove(serie)
+            posicion = bisect_left(self.__series_por_fin, (serie.obtener_fin(),))
+            while self.__series_por_fin[posicion][2] is not serie:
+                posicion += 1
+            del self.__series_por_fin[posicion]
+        
+        return turno
+    
+    def __cancelar_turno(self, matricula, fecha_hora, promover=True):
+        """
+        Cancela un turno o una ocurrencia de una serie, sin validar la fecha.
+        
+        Args:
+            matricula (str): Matrícula del médico
+            fecha_hora (datetime): Fecha y hora del turno
+            promover (bool): Si se asigna el horario liberado a la lista de espera
+            
+        Returns:
+            Turno: El turno cancelado
+            
+        Raises:
+            TurnoNoEncontradoException: Si no hay un turno para ese médico en esa fecha/hora
+        """
+        turno = self.__turnos.pop((matricula, fecha_hora), None)
+        
+        if turno is None:
+            raise TurnoNoEncontradoException(matricula, fecha_hora)
+        
+        if isinstance(turno, SerieTurnos):
+            turno = self.__cancelar_ocurrencia(turno, fecha_hora)
+        else:
+            dni = turno.obtener_paciente().obtener_dni()
+            self.__historias_clinicas[dni].quitar_turno(turno)
+            self.__agendas[dni].quitar(turno)
+            self.__desindexar_turno(turno)
+            self.__estadisticas.quitar_turno(turno)
+        
+        self.__feed.publicar(Evento.TURNO_CANCELADO, turno=turno)
+        if promover:
+            self.__promover_espera(matricula, turno.obtener_especialidad(), fecha_hora)
+        
+        return turno
+    
+    def __desindexar_turno(self, turno):
+        """
+        Quita un turno de los índices por fecha, por médico y por especialidad.
+        
+        Args:
+            turno (Turno): Turno cancelado
+        """
+        matricula = turno.obtener_medico().obtener_matricula()
+        especialidad = turno.obtener_especialidad().lower()
+        
+        self.__turnos_por_fecha.quitar(turno)
+        self.__turnos_por_medico[matricula].quitar(turno)
+        self.__turnos_por_especialidad[especialidad].quitar(turno)
+    
+    # === MÉTODOS PARA ESTADÍSTICAS ===
+    
+    def obtener_estadisticas(self):
+        """
+        Devuelve los contadores de ocupación de turnos.
+        
+        Returns:
+            EstadisticasOcupacion: Ocupación por médico, especialidad, fecha, día y hora
+        """
+        return self.__estadisticas
+    
+    def verificar_estadisticas(self):
+        """
+        Recalcula la ocupación desde cero y la compara con los contadores.
+        
+        Returns:
+            bool: True si los contadores coinciden con los turnos agendados
+        """
+        return EstadisticasOcupacion.reconstruir(self.obtener_turnos()) == self.__estadisticas
+    
+    def reconstruir_estadisticas(self):
+        """
+        Reemplaza los contadores de ocupación por unos recalculados desde cero.
+        
+        Returns:
+            EstadisticasOcupacion: Los contadores recalculados
+        """
+        self.__estadisticas = EstadisticasOcupacion.reconstruir(self.obtener_turnos())
+        return self.__estadisticas
     
     # === MÉTODOS PARA RECETAS ===
     
@@ -208,6 +904,9 @@ class Clinica:
             matricula (str): Matrícula del médico
             medicamentos (list[str]): Lista de medicamentos
             
+        Returns:
+            Receta: La receta emitida
+            
         Raises:
             PacienteNoEncontradoException: Si el paciente no existe
             ValueError: Si el médico no existe
@@ -230,11 +929,31 @@ class Clinica:
             if not medicamento or medicamento.strip() == "":
                 raise RecetaInvalidaException("Los medicamentos no pueden estar vacíos")
         
-        # 5. Crear y agregar la receta
+        # 5. Crear y registrar la receta
         receta = Receta(paciente, medico, medicamentos)
+        self.__registrar_receta(receta)
+        return receta
+    
+    def __registrar_receta(self, receta):
+        """
+        Agrega una receta ya validada a la historia clínica del paciente y al
+        índice de recetas.
+        
+        Args:
+            receta (Receta): Receta a registrar
+        """
+        self.__historias_clinicas[receta.obtener_paciente().obtener_dni()].agregar_receta(receta)
+        self.__indice_recetas.agregar(receta)
+        self.__feed.publicar(Evento.RECETA_EMITIDA, receta=receta)
+    
+    def obtener_indice_recetas(self):
+        """
+        Devuelve el índice de todas las recetas emitidas por la clínica.
         
-        # 6. Agregar la receta a la historia clínica del paciente
-        self.__historias_clinicas[dni].agregar_receta(receta)
+        Returns:
+            IndiceRecetas: Recetas por médico, medicamento y mes, con rankings
+        """
+        return self.__indice_recetas
     
     # === MÉTODOS PARA HISTORIA CLÍNICA ===
     
@@ -254,6 +973,229 @@ class Clinica:
         self.validar_existencia_paciente(dni)
         return self.__historias_clinicas[dni]
     
+    def archivar_historias(self, antes_de):
+        """
+        Comprime las entradas antiguas de todas las historias clínicas.
+        
+        Solo cambia la forma en que las historias guardan su texto: los
+        turnos, los índices, las estadísticas de ocupación y el índice de
+        recetas no se modifican, así que las consultas y los reportes siguen
+        contando las entradas archivadas. Solo se archiva el pasado.
+        
+        Args:
+            antes_de (datetime): Se archivan las entradas anteriores a esta fecha
+            
+        Returns:
+            int: Cantidad de entradas archivadas
+            
+        Raises:
+            ValueError: Si la fecha es futura
+        """
+        if antes_de > datetime.now():
+            raise ValueError("Solo se pueden archivar entradas pasadas")
+        
+        cantidad = sum(historia.archivar(antes_de) for historia in self.__historias_clinicas.values())
+        if cantidad:
+            self.__cortes_archivo.append(antes_de)
+            self.__feed.publicar(Evento.HISTORIAS_ARCHIVADAS, antes_de=antes_de)
+        return cantidad
+    
+    def obtener_cortes_archivo(self):
+        """
+        Devuelve las fechas de corte con las que se archivaron las historias.
+        
+        Repetir archivar_historias con estas fechas, en orden, sobre los mismos
+        turnos y recetas arma los mismos segmentos archivados.
+        
+        Returns:
+            list[datetime]: Fechas de corte, en el orden en que se archivó
+        """
+        return self.__cortes_archivo.copy()
+    
+    # === MÉTODOS PARA EL FEED DE CAMBIOS ===
+    
+    def suscribir_cambios(self, oyente=None, tamanio_cola=None, desde=None):
+        """
+        Suscribe un consumidor a los eventos de cada modificación de la clínica.
+        
+        Con `oyente`, cada evento se entrega al publicarse; sin él, los eventos
+        se acumulan en una cola de hasta `tamanio_cola` eventos; si la cola se
+        desborda, Suscripcion.obtener lanza EventosNoDisponiblesException al
+        vaciarla, para que el consumidor se ponga al día. Con `desde`,
+        primero se reciben los eventos conservados posteriores a esa secuencia,
+        para reanudar después de una interrupción.
+        
+        Args:
+            oyente (callable): Función que recibe cada Evento
+            tamanio_cola (int): Capacidad de la cola (None: sin límite)
+            desde (int): Secuencia del último evento ya procesado
+            
+        Returns:
+            Suscripcion: La suscripción creada
+            
+        Raises:
+            EventosNoDisponiblesException: Si los eventos posteriores a `desde` ya no se conservan
+        """
+        return self.__feed.suscribir(oyente, tamanio_cola, desde)
+    
+    def obtener_cambios_desde(self, secuencia):
+        """
+        Devuelve los eventos conservados posteriores a una secuencia.
+        
+        Args:
+            secuencia (int): Secuencia del último evento ya procesado
+            
+        Returns:
+            list[Evento]: Eventos posteriores, en orden
+            
+        Raises:
+            EventosNoDisponiblesException: Si alguno de esos eventos ya no se conserva
+        """
+        return self.__feed.eventos_desde(secuencia)
+    
+    def obtener_ultima_secuencia(self):
+        """
+        Devuelve la secuencia del último evento publicado.
+        
+        Returns:
+            int: Secuencia (0 si la clínica no tuvo modificaciones)
+        """
+        return self.__feed.obtener_ultima_secuencia()
+    
+    # === MÉTODOS PARA RESPALDOS ===
+    
+    def restaurar_turno(self, turno):
+        """
+        Registra un turno recuperado de un respaldo sin volver a validarlo.
+        
+        El paciente y el médico del turno deben estar registrados en la clínica.
+        
+        Args:
+            turno (Turno): Turno reconstruido con Turno.restaurar
+        """
+        self.__registrar_turno(turno)
+    
+    def restaurar_serie(self, serie):
+        """
+        Registra una serie recuperada de un respaldo sin volver a validarla.
+        
+        El paciente y el médico de la serie deben estar registrados en la clínica.
+        
+        Args:
+            serie (SerieTurnos): Serie reconstruida con SerieTurnos.restaurar
+        """
+        self.__registrar_serie(serie)
+    
+    def restaurar_cancelacion(self, matricula, fecha_hora):
+        """
+        Aplica una cancelación recuperada de un respaldo, aunque el turno ya
+        haya pasado.
+        
+        Args:
+            matricula (str): Matrícula del médico
+            fecha_hora (datetime): Fecha y hora del turno cancelado
+            
+        Returns:
+            Turno: El turno cancelado
+            
+        Raises:
+            TurnoNoEncontradoException: Si no hay un turno para ese médico en esa fecha/hora
+        """
+        return self.__cancelar_turno(matricula, fecha_hora)
+    
+    def restaurar_receta(self, receta):
+        """
+        Registra una receta recuperada de un respaldo sin volver a validarla.
+        
+        El paciente y el médico de la receta deben estar registrados en la clínica.
+        
+        Args:
+            receta (Receta): Receta reconstruida con Receta.restaurar
+        """
+        self.__registrar_receta(receta)
+    
+    # === MÉTODOS PARA MÉTRICAS ===
+    
+    def habilitar_metricas(self, metricas=None):
+        """
+        Comienza a medir las operaciones de OPERACIONES_INSTRUMENTADAS.
+        
+        Cada operación se reemplaza, solo en esta instancia, por una versión
+        que registra su duración y sus excepciones. Mientras las métricas
+        están deshabilitadas no hay ningún costo adicional.
+        
+        Args:
+            metricas (Metricas): Métricas donde registrar (por defecto, unas nuevas)
+            
+        Returns:
+            Metricas: Las métricas en uso
+        """
+        if metricas is None:
+            from .metricas import Metricas
+            metricas = Metricas()
+        
+        self.deshabilitar_metricas()
+        for operacion in self.OPERACIONES_INSTRUMENTADAS:
+            setattr(self, operacion, metricas.instrumentar(operacion, getattr(self, operacion)))
+        
+        self.__metricas = metricas
+        return metricas
+    
+    def deshabilitar_metricas(self):
+        """
+        Deja de medir las operaciones y restaura los métodos originales.
+        """
+        for operacion in self.OPERACIONES_INSTRUMENTADAS:
+            self.__dict__.pop(operacion, None)
+        self.__metricas = None
+    
+    def obtener_tamanios(self):
+        """
+        Devuelve la cantidad de registros de cada colección.
+        
+        Returns:
+            dict[str, int]: Colección -> cantidad de registros
+        """
+        return {
+            "pacientes": len(self.__pacientes),
+            "medicos": len(self.__medicos),
+            "turnos": len(self.__turnos),
+            "recetas": len(self.__indice_recetas),
+        }
+    
+    def metricas(self):
+        """
+        Devuelve una foto de las métricas de operaciones y de los tamaños de
+        las colecciones.
+        
+        Returns:
+            dict: {'habilitadas', 'operaciones' (ver Metricas.obtener_resumen), 'tamanios'}
+        """
+        return {
+            "habilitadas": self.__metricas is not None,
+            "operaciones": self.__metricas.obtener_resumen() if self.__metricas is not None else {},
+            "tamanios": self.obtener_tamanios(),
+        }
+    
+    def exportar_metricas(self, ruta):
+        """
+        Escribe las métricas en formato de texto de Prometheus.
+        
+        El archivo se reemplaza de una sola vez, para que un recolector nunca
+        lea un archivo a medio escribir.
+        
+        Args:
+            ruta (str): Ruta del archivo .prom
+        """
+        import os
+        from .metricas import Metricas
+        
+        metricas = self.__metricas if self.__metricas is not None else Metricas()
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(metricas.a_prometheus(self.obtener_tamanios()))
+        os.replace(temporal, ruta)
+    
     # === MÉTODOS AUXILIARES ===
     
     def obtener_dia_semana_en_espanol(self, fecha_hora):
@@ -14,6 +14,7 @@ class Especialidad:
     Atributos:
         __tipo (str): Nombre de la especialidad (ej: "Pediatría", "Cardiología")
         __dias (list[str]): Lista de días en los que se atiende esta especialidad, en minúsculas
+        __texto (str): Representación ya formateada, o None hasta el primer str()
     """
     
     # Días válidos de la semana
@@ -59,6 +60,7 @@ class Especialidad:
         # Asignar atributos privados
         self.__tipo = tipo.strip().title()  # Capitalizar primera letra
         self.__dias = sorted(dias_normalizados)  # Ordenar días alfabéticamente
+        self.__texto = None
     
     def obtener_especialidad(self) -> str:
         """
@@ -102,11 +104,13 @@ class Especialidad:
         Returns:
             str: Especialidad con sus días de atención
         """
-        # Capitalizar primera letra de cada día para mostrar
-        dias_mostrar = [dia.capitalize() for dia in self.__dias]
-        dias_texto = ', '.join(dias_mostrar)
-        
-        return f"{self.__tipo} (Días: {dias_texto})"
+        if self.__texto is None:
+            # Capitalizar primera letra de cada día para mostrar
+            dias_mostrar = [dia.capitalize() for dia in self.__dias]
+            dias_texto = ', '.join(dias_mostrar)
+            
+            self.__texto = f"{self.__tipo} (Días: {dias_texto})"
+        return self.__texto
     
     def __eq__(self, other) -> bool:
         """
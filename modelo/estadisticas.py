@@ -0,0 +1,194 @@
+"""
+Clase EstadisticasOcupacion para el sistema de gestión de clínica.
+
+Mantiene contadores de turnos ocupados que se actualizan al agendar y al
+cancelar, para no tener que recorrer todos los turnos en cada reporte.
+"""
+
+from collections import Counter
+from .especialidad import Especialidad
+
+
+class EstadisticasOcupacion:
+    """
+    Contadores incrementales de ocupación de turnos.
+
+    Cada turno suma uno en todas las celdas que lo contienen: por médico, por
+    especialidad, por ambos o por ninguno, combinados con un período (una
+    fecha, un día de la semana, una hora del día o ningún período). Así,
+    cualquier celda se consulta en O(1).
+
+    Atributos:
+        __celdas (Counter): (matrícula, especialidad, período) -> cantidad de turnos
+    """
+
+    def __init__(self):
+        """
+        Inicializa las estadísticas sin turnos.
+        """
+        self.__celdas = Counter()
+
+    @classmethod
+    def reconstruir(cls, turnos):
+        """
+        Calcula las estadísticas desde cero a partir de una lista de turnos.
+
+        Args:
+            turnos (iterable[Turno]): Turnos a contabilizar
+
+        Returns:
+            EstadisticasOcupacion: Estadísticas recalculadas
+        """
+        estadisticas = cls()
+        for turno in turnos:
+            estadisticas.registrar_turno(turno)
+        return estadisticas
+
+    def registrar_turno(self, turno):
+        """
+        Suma un turno agendado a los contadores.
+
+        Args:
+            turno (Turno): Turno agendado
+        """
+        self.registrar(turno.obtener_medico().obtener_matricula(),
+                       turno.obtener_especialidad(), turno.obtener_fecha_hora())
+
+    def quitar_turno(self, turno):
+        """
+        Resta un turno cancelado de los contadores.
+
+        Args:
+            turno (Turno): Turno cancelado
+        """
+        self.quitar(turno.obtener_medico().obtener_matricula(),
+                    turno.obtener_especialidad(), turno.obtener_fecha_hora())
+
+    def registrar(self, matricula, especialidad, fecha_hora):
+        """
+        Suma una ocupación a los contadores.
+
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad del turno
+            fecha_hora (datetime): Fecha y hora del turno
+        """
+        for clave in self._claves(matricula, especialidad, fecha_hora):
+            self.__celdas[clave] += 1
+
+    def quitar(self, matricula, especialidad, fecha_hora):
+        """
+        Resta una ocupación de los contadores.
+
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad del turno
+            fecha_hora (datetime): Fecha y hora del turno
+        """
+        for clave in self._claves(matricula, especialidad, fecha_hora):
+            self.__celdas[clave] -= 1
+            if self.__celdas[clave] <= 0:
+                del self.__celdas[clave]
+
+    def ocupacion(self, matricula=None, especialidad=None, fecha=None,
+                  dia_semana=None, hora=None) -> int:
+        """
+        Devuelve la cantidad de turnos de una celda.
+
+        Los filtros omitidos no restringen la consulta. Se puede indicar a lo
+        sumo uno de `fecha`, `dia_semana` u `hora`.
+
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad (no distingue mayúsculas)
+            fecha (date): Fecha de los turnos
+            dia_semana (str): Día de la semana en español
+            hora (int): Hora del día (0 a 23)
+
+        Returns:
+            int: Cantidad de turnos en la celda
+
+        Raises:
+            ValueError: Si se indica más de un período
+        """
+        periodos = [p for p in (
+            ("fecha", fecha) if fecha is not None else None,
+            ("dia", dia_semana.strip().lower()) if dia_semana is not None else None,
+            ("hora", hora) if hora is not None else None,
+        ) if p is not None]
+
+        if len(periodos) > 1:
+            raise ValueError("Solo se puede consultar un período a la vez: fecha, día de la semana u hora")
+
+        periodo = periodos[0] if periodos else None
+        if especialidad is not None:
+            especialidad = especialidad.strip().lower()
+
+        return self.__celdas.get((matricula, especialidad, periodo), 0)
+
+    def utilizacion(self, matricula, fecha, capacidad_diaria) -> float:
+        """
+        Devuelve la proporción de turnos ocupados de un médico en una fecha.
+
+        Args:
+            matricula (str): Matrícula del médico
+            fecha (date): Fecha a consultar
+            capacidad_diaria (int): Cantidad de turnos que atiende por día
+
+        Returns:
+            float: Turnos ocupados sobre la capacidad (entre 0 y 1 si no hay sobreturnos)
+
+        Raises:
+            ValueError: Si la capacidad no es positiva
+        """
+        if capacidad_diaria <= 0:
+            raise ValueError("La capacidad diaria debe ser un número positivo")
+
+        return self.ocupacion(matricula=matricula, fecha=fecha) / capacidad_diaria
+
+    def total(self) -> int:
+        """
+        Devuelve la cantidad total de turnos contabilizados.
+
+        Returns:
+            int: Cantidad de turnos
+        """
+        return self.__celdas.get((None, None, None), 0)
+
+    def _claves(self, matricula, especialidad, fecha_hora):
+        """
+        Genera todas las celdas a las que pertenece un turno.
+
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad del turno
+            fecha_hora (datetime): Fecha y hora del turno
+
+        Yields:
+            tuple: Clave de cada celda
+        """
+        especialidad = especialidad.strip().lower()
+        periodos = (
+            None,
+            ("fecha", fecha_hora.date()),
+            ("dia", Especialidad.DIAS_VALIDOS[fecha_hora.weekday()]),
+            ("hora", fecha_hora.hour),
+        )
+        for mat in (None, matricula):
+            for esp in (None, especialidad):
+                for periodo in periodos:
+                    yield (mat, esp, periodo)
+
+    def __eq__(self, other) -> bool:
+        """
+        Compara dos estadísticas por el valor de todas sus celdas.
+
+        Args:
+            other: Otras estadísticas a comparar
+
+        Returns:
+            bool: True si todas las celdas coinciden, False en caso contrario
+        """
+        if isinstance(other, EstadisticasOcupacion):
+            return self.__celdas == other.__celdas
+        return False
@@ -0,0 +1,452 @@
+"""
+Feed de cambios del sistema de gestión de clínica.
+
+La clínica publica un evento por cada modificación (paciente agregado, turno
+agendado, receta emitida, etc.) con un número de secuencia creciente. Los
+consumidores se suscriben con una función o con una cola acotada, y pueden
+reanudar desde la última secuencia que procesaron para ponerse al día sin
+volver a recorrer todos los datos.
+"""
+
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from .excepciones import EventosNoDisponiblesException
+
+# Cantidad de eventos que se conservan para reanudar suscripciones
+RETENCION_EVENTOS = 10_000
+
+
+class Evento:
+    """
+    Modificación de la clínica.
+
+    Atributos:
+        __secuencia (int): Número de secuencia, creciente y sin huecos desde 1
+        __tipo (str): Uno de los tipos definidos en la clase
+        __fecha (datetime): Momento en que se publicó
+        __datos (dict): Objetos afectados, por nombre ('paciente', 'turno', ...)
+    """
+
+    PACIENTE_AGREGADO = "paciente_agregado"
+    MEDICO_AGREGADO = "medico_agregado"
+    ESPECIALIDAD_AGREGADA = "especialidad_agregada"
+    TURNO_AGENDADO = "turno_agendado"
+    TURNO_CANCELADO = "turno_cancelado"
+    SERIE_AGENDADA = "serie_agendada"
+    ESPERA_AGREGADA = "espera_agregada"
+    ESPERA_PROMOVIDA = "espera_promovida"
+    RECETA_EMITIDA = "receta_emitida"
+    HISTORIAS_ARCHIVADAS = "historias_archivadas"
+
+    def __init__(self, secuencia, tipo, datos, fecha=None):
+        """
+        Inicializa un evento.
+
+        Args:
+            secuencia (int): Número de secuencia
+            tipo (str): Tipo de evento
+            datos (dict): Objetos afectados, por nombre
+            fecha (datetime): Momento de publicación (por defecto, el actual)
+        """
+        self.__secuencia = secuencia
+        self.__tipo = tipo
+        self.__datos = datos
+        self.__fecha = fecha if fecha is not None else datetime.now()
+
+    def obtener_secuencia(self):
+        """
+        Devuelve el número de secuencia del evento.
+
+        Returns:
+            int: Número de secuencia
+        """
+        return self.__secuencia
+
+    def obtener_tipo(self):
+        """
+        Devuelve el tipo del evento.
+
+        Returns:
+            str: Tipo de evento
+        """
+        return self.__tipo
+
+    def obtener_fecha(self):
+        """
+        Devuelve el momento en que se publicó el evento.
+
+        Returns:
+            datetime: Momento de publicación
+        """
+        return self.__fecha
+
+    def obtener_datos(self):
+        """
+        Devuelve una copia de los objetos afectados.
+
+        Returns:
+            dict: Objetos afectados, por nombre
+        """
+        return dict(self.__datos)
+
+    def obtener(self, nombre):
+        """
+        Devuelve uno de los objetos afectados.
+
+        Args:
+            nombre (str): Nombre del dato ('paciente', 'turno', 'receta', ...)
+
+        Returns:
+            El objeto, o None si el evento no lo incluye
+        """
+        return self.__datos.get(nombre)
+
+    def __str__(self):
+        """
+        Devuelve una representación legible del evento.
+
+        Returns:
+            str: Secuencia, tipo y objetos afectados
+        """
+        datos = ", ".join(f"{nombre}={valor}" for nombre, valor in self.__datos.items())
+        return f"#{self.__secuencia} {self.__tipo}: {datos}"
+
+
+class Suscripcion:
+    """
+    Consumidor del feed de cambios.
+
+    Con una función, cada evento se entrega en el momento en que se publica;
+    con una cola acotada, se acumula hasta que el consumidor lo pida. Si la
+    cola se llena, la suscripción queda atrasada y descarta eventos hasta
+    que el consumidor los recupera del feed con obtener_eventos(). Un
+    consumidor que usa obtener() se entera al vaciar la cola: en lugar de
+    esperar eventos que ya no van a llegar, obtener() lanza
+    EventosNoDisponiblesException con la secuencia del último evento
+    entregado, desde la que se reanuda.
+
+    Atributos:
+        __feed (FeedCambios): Feed al que está suscripta
+        __oyente (callable): Función que recibe cada evento, o None
+        __cola (queue.Queue): Cola de eventos pendientes, o None
+        __ultima (int): Secuencia del último evento entregado
+        __atrasada (bool): True si se descartaron eventos por cola llena
+        __error (Exception): Último error del oyente, o None
+    """
+
+    def __init__(self, feed, oyente=None, tamanio_cola=None, desde=0):
+        """
+        Inicializa la suscripción.
+
+        Args:
+            feed (FeedCambios): Feed al que se suscribe
+            oyente (callable): Función que recibe cada evento
+            tamanio_cola (int): Capacidad de la cola (si no hay oyente)
+            desde (int): Secuencia del último evento ya procesado
+        """
+        self.__feed = feed
+        self.__oyente = oyente
+        self.__cola = None if oyente is not None else queue.Queue(maxsize=tamanio_cola or 0)
+        self.__ultima = desde
+        self.__atrasada = False
+        self.__error = None
+
+    def entregar(self, evento):
+        """
+        Entrega un evento publicado a la suscripción.
+
+        Args:
+            evento (Evento): Evento a entregar
+        """
+        if self.__oyente is not None:
+            try:
+                self.__oyente(evento)
+            except Exception as e:
+                self.__error = e
+            self.__ultima = evento.obtener_secuencia()
+            return
+
+        if self.__atrasada:
+            return
+        try:
+            self.__cola.put_nowait(evento)
+            self.__ultima = evento.obtener_secuencia()
+        except queue.Full:
+            self.__atrasada = True
+
+    def obtener(self, timeout=None):
+        """
+        Espera y devuelve el próximo evento de la cola.
+
+        Si la suscripción está atrasada, primero se devuelven los eventos que
+        quedaron en la cola; después, en lugar de esperar, se lanza
+        EventosNoDisponiblesException hasta que el consumidor se pone al día
+        con obtener_eventos() (o reanuda desde la secuencia de la excepción
+        con FeedCambios.eventos_desde).
+
+        Args:
+            timeout (float): Segundos máximos de espera (None espera indefinidamente)
+
+        Returns:
+            Evento | None: El evento, o None si no llegó ninguno a tiempo
+
+        Raises:
+            EventosNoDisponiblesException: Si la cola está vacía y se descartaron eventos
+        """
+        if self.__cola is None:
+            raise ValueError("La suscripción entrega los eventos a una función, no tiene cola")
+        try:
+            return self.__cola.get_nowait()
+        except queue.Empty:
+            pass
+        # Si se atrasa durante la espera es porque la cola se llenó, y get devuelve un evento
+        if self.__atrasada:
+            raise EventosNoDisponiblesException(self.__ultima)
+        try:
+            return self.__cola.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def obtener_eventos(self):
+        """
+        Devuelve todos los eventos pendientes sin esperar.
+
+        Si la suscripción estaba atrasada, después de la cola se recuperan del
+        feed los eventos descartados y la suscripción vuelve a recibir eventos.
+
+        Returns:
+            list[Evento]: Eventos pendientes en orden de secuencia
+
+        Raises:
+            EventosNoDisponiblesException: Si los eventos descartados ya no se conservan
+        """
+        if self.__cola is None:
+            raise ValueError("La suscripción entrega los eventos a una función, no tiene cola")
+
+        eventos = []
+        while True:
+            try:
+                eventos.append(self.__cola.get_nowait())
+            except queue.Empty:
+                break
+
+        if self.__atrasada:
+            eventos.extend(self.__feed.ponerse_al_dia(self))
+        return eventos
+
+    def esta_atrasada(self):
+        """
+        Indica si se descartaron eventos por tener la cola llena.
+
+        Returns:
+            bool: True si hay eventos para recuperar con obtener_eventos()
+        """
+        return self.__atrasada
+
+    def obtener_ultima_secuencia(self):
+        """
+        Devuelve la secuencia del último evento entregado.
+
+        Returns:
+            int: Secuencia, o la inicial si todavía no se entregó ninguno
+        """
+        return self.__ultima
+
+    def obtener_error(self):
+        """
+        Devuelve el último error lanzado por el oyente.
+
+        Returns:
+            Exception | None: El error, o None si nunca falló
+        """
+        return self.__error
+
+    def cancelar(self):
+        """
+        Deja de recibir eventos.
+        """
+        self.__feed.cancelar(self)
+
+    def _recuperar(self, eventos):
+        """
+        Marca como entregados los eventos recuperados del feed.
+
+        Args:
+            eventos (list[Evento]): Eventos recuperados, en orden
+        """
+        if eventos:
+            self.__ultima = eventos[-1].obtener_secuencia()
+        self.__atrasada = False
+
+
+class FeedCambios:
+    """
+    Secuencia de eventos de la clínica con sus suscripciones.
+
+    Conserva los últimos eventos para que una suscripción nueva o atrasada
+    pueda reanudar desde una secuencia dada. Publicar y suscribirse son
+    operaciones seguras entre hilos, y cada suscripción recibe los eventos en
+    orden de secuencia. Un oyente puede modificar la clínica: los eventos que
+    eso genera se encolan y se entregan, en orden, cuando todas las
+    suscripciones recibieron el evento en curso, antes de que termine la
+    publicación que lo originó.
+
+    Atributos:
+        __eventos (deque[Evento]): Últimos eventos publicados
+        __secuencia (int): Secuencia del último evento publicado
+        __suscripciones (list[Suscripcion]): Suscripciones activas
+        __por_entregar (deque[Evento]): Eventos publicados por un oyente durante una entrega
+        __entregando (bool): True mientras una publicación reparte eventos
+        __candado (threading.RLock): Protege la publicación y las suscripciones
+    """
+
+    def __init__(self, retencion=RETENCION_EVENTOS):
+        """
+        Inicializa un feed vacío.
+
+        Args:
+            retencion (int): Cantidad de eventos que se conservan
+        """
+        self.__eventos = deque(maxlen=retencion)
+        self.__secuencia = 0
+        self.__suscripciones = []
+        self.__por_entregar = deque()
+        self.__entregando = False
+        self.__candado = threading.RLock()
+
+    def publicar(self, tipo, **datos):
+        """
+        Publica un evento y lo entrega a todas las suscripciones.
+
+        Si se llama desde un oyente, el evento queda encolado y lo entrega la
+        publicación en curso cuando termina de repartir el evento actual.
+
+        Args:
+            tipo (str): Tipo de evento (ver las constantes de Evento)
+            **datos: Objetos afectados, por nombre
+
+        Returns:
+            Evento: El evento publicado
+        """
+        with self.__candado:
+            self.__secuencia += 1
+            evento = Evento(self.__secuencia, tipo, datos)
+            self.__eventos.append(evento)
+            self.__por_entregar.append(evento)
+            if self.__entregando:
+                return evento
+
+            self.__entregando = True
+            try:
+                while self.__por_entregar:
+                    pendiente = self.__por_entregar.popleft()
+                    for suscripcion in self.__suscripciones:
+                        suscripcion.entregar(pendiente)
+            finally:
+                self.__entregando = False
+        return evento
+
+    def suscribir(self, oyente=None, tamanio_cola=None, desde=None):
+        """
+        Crea una suscripción.
+
+        Args:
+            oyente (callable): Función que recibe cada evento; si no se indica,
+                los eventos se acumulan en una cola
+            tamanio_cola (int): Capacidad de la cola (None: sin límite)
+            desde (int): Si se indica, primero se entregan los eventos
+                conservados posteriores a esa secuencia
+
+        Returns:
+            Suscripcion: La suscripción creada
+
+        Raises:
+            EventosNoDisponiblesException: Si los eventos posteriores a `desde` ya no se conservan
+        """
+        with self.__candado:
+            pendientes = self.__eventos_desde(desde) if desde is not None else []
+            suscripcion = Suscripcion(self, oyente, tamanio_cola, self.__secuencia if desde is None else desde)
+            for evento in pendientes:
+                suscripcion.entregar(evento)
+            self.__suscripciones = self.__suscripciones + [suscripcion]
+        return suscripcion
+
+    def cancelar(self, suscripcion):
+        """
+        Quita una suscripción.
+
+        Args:
+            suscripcion (Suscripcion): Suscripción a quitar
+        """
+        with self.__candado:
+            self.__suscripciones = [s for s in self.__suscripciones if s is not suscripcion]
+
+    def eventos_desde(self, secuencia):
+        """
+        Devuelve los eventos conservados posteriores a una secuencia.
+
+        Args:
+            secuencia (int): Secuencia del último evento ya procesado
+
+        Returns:
+            list[Evento]: Eventos posteriores, en orden
+
+        Raises:
+            EventosNoDisponiblesException: Si alguno de esos eventos ya no se conserva
+        """
+        with self.__candado:
+            return self.__eventos_desde(secuencia)
+
+    def ponerse_al_dia(self, suscripcion):
+        """
+        Recupera los eventos que una suscripción atrasada descartó y la vuelve
+        a habilitar.
+
+        Args:
+            suscripcion (Suscripcion): Suscripción atrasada
+
+        Returns:
+            list[Evento]: Eventos descartados, en orden
+
+        Raises:
+            EventosNoDisponiblesException: Si alguno de esos eventos ya no se conserva
+        """
+        with self.__candado:
+            eventos = self.__eventos_desde(suscripcion.obtener_ultima_secuencia())
+            suscripcion._recuperar(eventos)
+        return eventos
+
+    def obtener_ultima_secuencia(self):
+        """
+        Devuelve la secuencia del último evento publicado.
+
+        Returns:
+            int: Secuencia (0 si no se publicó ninguno)
+        """
+        return self.__secuencia
+
+    def __eventos_desde(self, secuencia):
+        """
+        Devuelve los eventos conservados posteriores a una secuencia, sin tomar el candado.
+
+        Args:
+            secuencia (int): Secuencia del último evento ya procesado
+
+        Returns:
+            list[Evento]: Eventos posteriores, en orden
+
+        Raises:
+            EventosNoDisponiblesException: Si alguno de esos eventos ya no se conserva
+        """
+        if secuencia >= self.__secuencia:
+            return []
+
+        primera = self.__eventos[0].obtener_secuencia() if self.__eventos else self.__secuencia + 1
+        if secuencia + 1 < primera:
+            raise EventosNoDisponiblesException(secuencia, primera)
+
+        # Las secuencias son consecutivas: el evento s está en la posición s - primera
+        return list(islice(self.__eventos, secuencia + 1 - primera, None))
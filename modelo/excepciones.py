@@ -34,6 +34,22 @@ class TurnoOcupadoException(Exception):
         super().__init__(f"El médico con matrícula {matricula} ya tiene un turno agendado el {fecha_hora}")
 
 
+class PacienteOcupadoException(Exception):
+    """Excepción lanzada cuando el paciente ya tiene un turno que se superpone con el horario pedido."""
+    def __init__(self, dni, fecha_hora):
+        self.dni = dni
+        self.fecha_hora = fecha_hora
+        super().__init__(f"El paciente con DNI {dni} ya tiene un turno que se superpone con el {fecha_hora}")
+
+
+class TurnoNoEncontradoException(Exception):
+    """Excepción lanzada cuando no existe un turno para un médico en una fecha/hora."""
+    def __init__(self, matricula, fecha_hora):
+        self.matricula = matricula
+        self.fecha_hora = fecha_hora
+        super().__init__(f"No se encontró un turno del médico con matrícula {matricula} el {fecha_hora}")
+
+
 class RecetaInvalidaException(Exception):
     """Excepción lanzada cuando se intenta crear una receta inválida."""
     def __init__(self, mensaje):
@@ -65,4 +81,18 @@ class EspecialidadDuplicadaException(Exception):
 class DatosInvalidosException(Exception):
     """Excepción lanzada cuando se proporcionan datos inválidos."""
     def __init__(self, mensaje):
-        super().__init__(mensaje)
\ No newline at end of file
+        super().__init__(mensaje)
+
+
+class EventosNoDisponiblesException(Exception):
+    """Excepción lanzada cuando se pide reanudar el feed de cambios desde eventos que ya no se conservan,
+    o cuando una suscripción con cola descartó eventos por atrasarse (sin primera_disponible)."""
+    def __init__(self, secuencia, primera_disponible=None):
+        self.secuencia = secuencia
+        self.primera_disponible = primera_disponible
+        if primera_disponible is None:
+            super().__init__(f"La suscripción descartó los eventos posteriores a la secuencia {secuencia}; "
+                             f"deben recuperarse del feed")
+        else:
+            super().__init__(f"No se conservan los eventos posteriores a la secuencia {secuencia}; "
+                             f"el primero disponible es el {primera_disponible}")
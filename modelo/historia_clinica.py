@@ -1,6 +1,13 @@
+from .archivo_historia import SegmentoArchivado, EntradaArchivada
+from .serie_turnos import SerieTurnos
+
 class HistoriaClinica:
     """
     Clase que almacena la información médica de un paciente: turnos y recetas.
+    
+    Las entradas antiguas pueden archivarse en segmentos comprimidos con
+    archivar(); se descomprimen solo cuando se muestra la parte de la
+    historia que las contiene, y aparecen antes que las entradas en memoria.
     """
     
     def __init__(self, paciente):
@@ -13,6 +20,8 @@ class HistoriaClinica:
         self.__paciente = paciente
         self.__turnos = []  # Lista vacía de turnos
         self.__recetas = []  # Lista vacía de recetas
+        self.__turnos_archivados = []   # list[SegmentoArchivado], en orden de archivo
+        self.__recetas_archivadas = []  # list[SegmentoArchivado], en orden de archivo
     
     def agregar_turno(self, turno):
         """
@@ -23,6 +32,25 @@ class HistoriaClinica:
         """
         self.__turnos.append(turno)
     
+    def quitar_turno(self, turno):
+        """
+        Quita un turno cancelado de la historia clínica.
+        
+        Args:
+            turno (Turno): El turno a quitar
+        """
+        if turno in self.__turnos:
+            self.__turnos.remove(turno)
+    
+    def agregar_serie(self, serie):
+        """
+        Agrega una serie de turnos como una sola entrada de la historia clínica.
+        
+        Args:
+            serie (SerieTurnos): La serie a agregar
+        """
+        self.__turnos.append(serie)
+    
     def agregar_receta(self, receta):
         """
         Agrega una receta médica a la historia clínica.
@@ -34,45 +62,238 @@ class HistoriaClinica:
     
     def obtener_turnos(self):
         """
-        Devuelve una copia de la lista de turnos del paciente.
+        Devuelve una copia de la lista de turnos del paciente en memoria.
+        
+        Las series de turnos aparecen como una sola entrada. Los turnos
+        archivados no se incluyen (ver obtener_turnos_archivados).
         
         Returns:
-            list[Turno]: Copia de la lista de turnos
+            list[Turno | SerieTurnos]: Copia de la lista de turnos
         """
         return self.__turnos.copy()
     
     def obtener_recetas(self):
         """
-        Devuelve una copia de la lista de recetas del paciente.
+        Devuelve una copia de la lista de recetas del paciente en memoria.
+        
+        Las recetas archivadas no se incluyen (ver obtener_recetas_archivadas).
         
         Returns:
             list[Receta]: Copia de la lista de recetas
         """
         return self.__recetas.copy()
     
-    def __str__(self):
+    def obtener_turnos_archivados(self):
         """
-        Devuelve una representación textual de la historia clínica.
+        Descomprime y devuelve los turnos archivados, en orden de archivo.
         
         Returns:
-            str: Representación de la historia clínica con turnos y recetas
+            list[EntradaArchivada]: Fecha y texto de cada turno archivado
+        """
+        return [entrada for segmento in self.__turnos_archivados for entrada in segmento.entradas()]
+    
+    def obtener_recetas_archivadas(self):
         """
-        resultado = f"=== Historia Clínica - Paciente: {self.__paciente} ===\n"
+        Descomprime y devuelve las recetas archivadas, en orden de archivo.
         
-        # Mostrar turnos
-        resultado += f"\n--- TURNOS ({len(self.__turnos)}) ---\n"
-        if self.__turnos:
-            for i, turno in enumerate(self.__turnos, 1):
-                resultado += f"{i}. {turno}\n"
-        else:
-            resultado += "No hay turnos registrados.\n"
+        Returns:
+            list[EntradaArchivada]: Fecha y texto de cada receta archivada
+        """
+        return [entrada for segmento in self.__recetas_archivadas for entrada in segmento.entradas()]
+    
+    def archivar(self, antes_de):
+        """
+        Pasa a un segmento comprimido los turnos y recetas anteriores a una fecha.
+        
+        Cada llamada agrega como máximo un segmento de turnos y uno de
+        recetas; los segmentos no se modifican después. Una serie de turnos
+        se archiva cuando terminó su última ocurrencia.
+        
+        Args:
+            antes_de (datetime): Se archivan las entradas con fecha anterior a esta
+            
+        Returns:
+            int: Cantidad de entradas archivadas
+        """
+        def fecha_final(turno):
+            return self._periodo_turno(turno)[1]
+        
+        viejos = [turno for turno in self.__turnos if fecha_final(turno) < antes_de]
+        viejas = [receta for receta in self.__recetas if receta.obtener_fecha() < antes_de]
+        
+        if viejos:
+            self.__turnos_archivados.append(
+                SegmentoArchivado([(turno.obtener_fecha_hora(), str(turno), fecha_final(turno))
+                                   for turno in viejos])
+            )
+            self.__turnos = [turno for turno in self.__turnos if fecha_final(turno) >= antes_de]
+        if viejas:
+            self.__recetas_archivadas.append(
+                SegmentoArchivado([(receta.obtener_fecha(), str(receta)) for receta in viejas])
+            )
+            self.__recetas = [receta for receta in self.__recetas if receta.obtener_fecha() >= antes_de]
+        
+        return len(viejos) + len(viejas)
+    
+    def obtener_cantidad_archivada(self):
+        """
+        Devuelve la cantidad de entradas archivadas, sin descomprimirlas.
+        
+        Returns:
+            int: Turnos y recetas archivados
+        """
+        return sum(segmento.obtener_cantidad()
+                   for segmento in self.__turnos_archivados + self.__recetas_archivadas)
+    
+    def iterar_lineas(self, desde=None, hasta=None, pagina=1, por_pagina=None):
+        """
+        Genera la representación textual de la historia clínica línea por línea.
         
-        # Mostrar recetas
-        resultado += f"\n--- RECETAS ({len(self.__recetas)}) ---\n"
-        if self.__recetas:
-            for i, receta in enumerate(self.__recetas, 1):
-                resultado += f"{i}. {receta}\n"
+        Los filtros y la paginación se aplican por separado a turnos y recetas.
+        Turnos y recetas guardan su propio texto, así que cada uno se formatea
+        una sola vez. De los segmentos archivados se descomprimen solo los
+        que caen en la página y en el rango de fechas pedidos. Una serie de
+        turnos se muestra si alguna parte del período entre su primera y su
+        última ocurrencia cae en el rango.
+        
+        Args:
+            desde (datetime): Si se indica, omite entradas anteriores a esta fecha
+            hasta (datetime): Si se indica, omite entradas posteriores a esta fecha
+            pagina (int): Número de página a mostrar, comenzando en 1
+            por_pagina (int): Cantidad de entradas por página (None muestra todas)
+            
+        Yields:
+            str: Cada línea de la historia clínica, terminada en salto de línea
+            
+        Raises:
+            ValueError: Si la página o la cantidad por página no son positivas
+        """
+        if pagina < 1:
+            raise ValueError("La página debe ser un número positivo")
+        if por_pagina is not None and por_pagina < 1:
+            raise ValueError("La cantidad por página debe ser un número positivo")
+        
+        yield f"=== Historia Clínica - Paciente: {self.__paciente} ===\n"
+        
+        yield from self._lineas_seccion(
+            "TURNOS", self.__turnos_archivados, self.__turnos, self._periodo_turno,
+            "No hay turnos registrados.", desde, hasta, pagina, por_pagina
+        )
+        yield from self._lineas_seccion(
+            "RECETAS", self.__recetas_archivadas, self.__recetas,
+            lambda receta: (receta.obtener_fecha(), receta.obtener_fecha()),
+            "No hay recetas registradas.", desde, hasta, pagina, por_pagina
+        )
+    
+    def escribir(self, destino, desde=None, hasta=None, pagina=1, por_pagina=None):
+        """
+        Escribe la historia clínica en un archivo o flujo de texto.
+        
+        Args:
+            destino: Objeto con método write (archivo, sys.stdout, StringIO)
+            desde (datetime): Si se indica, omite entradas anteriores a esta fecha
+            hasta (datetime): Si se indica, omite entradas posteriores a esta fecha
+            pagina (int): Número de página a mostrar, comenzando en 1
+            por_pagina (int): Cantidad de entradas por página (None muestra todas)
+        """
+        destino.writelines(self.iterar_lineas(desde, hasta, pagina, por_pagina))
+    
+    def _lineas_seccion(self, titulo, segmentos, entradas, obtener_periodo, mensaje_vacio,
+                        desde, hasta, pagina, por_pagina):
+        """
+        Genera las líneas de una sección (turnos o recetas).
+        
+        Args:
+            titulo (str): Título de la sección
+            segmentos (list[SegmentoArchivado]): Entradas archivadas de la sección
+            entradas (list): Turnos o recetas en memoria de la sección
+            obtener_periodo (callable): Devuelve la primera y la última fecha de una
+                entrada; una entrada pasa el filtro si su período se cruza con él
+            mensaje_vacio (str): Texto a mostrar si no hay entradas
+            desde (datetime): Fecha mínima, o None
+            hasta (datetime): Fecha máxima, o None
+            pagina (int): Número de página
+            por_pagina (int): Entradas por página, o None
+            
+        Yields:
+            str: Líneas de la sección
+        """
+        if desde is not None or hasta is not None:
+            def en_rango(entrada):
+                inicio, fin = obtener_periodo(entrada)
+                return (desde is None or fin >= desde) and (hasta is None or inicio <= hasta)
+            
+            archivadas = [
+                entrada for segmento in segmentos
+                if (desde is None or segmento.obtener_ultima_fecha() >= desde)
+                and (hasta is None or segmento.obtener_primera_fecha() <= hasta)
+                for entrada in segmento.entradas()
+            ]
+            entradas = [entrada for entrada in archivadas + entradas if en_rango(entrada)]
+            segmentos = []
+        
+        total = sum(segmento.obtener_cantidad() for segmento in segmentos) + len(entradas)
+        if por_pagina is None:
+            inicio = 0
+            yield f"\n--- {titulo} ({total}) ---\n"
         else:
-            resultado += "No hay recetas registradas.\n"
+            inicio = (pagina - 1) * por_pagina
+            paginas = max(1, -(-total // por_pagina))
+            yield f"\n--- {titulo} ({total}) - página {pagina} de {paginas} ---\n"
+        
+        if not total:
+            yield mensaje_vacio + "\n"
+            return
         
-        return resultado
\ No newline at end of file
+        fin = total if por_pagina is None else inicio + por_pagina
+        for i, entrada in enumerate(self._entradas_entre(segmentos, entradas, inicio, fin), inicio + 1):
+            yield f"{i}. {entrada}\n"
+    
+    def _entradas_entre(self, segmentos, entradas, inicio, fin):
+        """
+        Recorre las entradas de una sección entre dos posiciones,
+        descomprimiendo solo los segmentos que las contienen.
+        
+        Args:
+            segmentos (list[SegmentoArchivado]): Entradas archivadas, que van primero
+            entradas (list): Entradas en memoria, que van a continuación
+            inicio (int): Primera posición, incluida
+            fin (int): Última posición, excluida
+            
+        Yields:
+            Entradas de la sección, en orden
+        """
+        posicion = 0
+        for segmento in segmentos:
+            cantidad = segmento.obtener_cantidad()
+            if posicion + cantidad > inicio and posicion < fin:
+                desde_segmento = max(0, inicio - posicion)
+                yield from segmento.entradas()[desde_segmento:fin - posicion]
+            posicion += cantidad
+        
+        yield from entradas[max(0, inicio - posicion):max(0, fin - posicion)]
+    
+    @staticmethod
+    def _periodo_turno(turno):
+        """
+        Devuelve la primera y la última fecha de un turno. Una serie (o una
+        serie archivada) va de su primera a su última ocurrencia.
+        
+        Args:
+            turno (Turno | SerieTurnos | EntradaArchivada): Entrada de la sección de turnos
+            
+        Returns:
+            tuple[datetime, datetime]: Primera y última fecha
+        """
+        if isinstance(turno, (SerieTurnos, EntradaArchivada)):
+            return turno.obtener_fecha_hora(), turno.obtener_fin()
+        return turno.obtener_fecha_hora(), turno.obtener_fecha_hora()
+    
+    def __str__(self):
+        """
+        Devuelve una representación textual de la historia clínica.
+        
+        Returns:
+            str: Representación de la historia clínica con turnos y recetas
+        """
+        return "".join(self.iterar_lineas())
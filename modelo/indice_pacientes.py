@@ -0,0 +1,193 @@
+"""
+Clase IndicePacientes para el sistema de gestión de clínica.
+
+Permite buscar pacientes por nombre (o parte del nombre) sin recorrer
+todos los pacientes registrados.
+"""
+
+import unicodedata
+
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Normaliza un texto para comparaciones: sin tildes, en minúsculas y con
+    espacios simples.
+
+    Args:
+        texto (str): Texto a normalizar
+
+    Returns:
+        str: Texto normalizado
+    """
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_tildes.lower().split())
+
+
+class IndicePacientes:
+    """
+    Índice incremental de pacientes por nombre.
+
+    Combina un árbol de prefijos (trie) sobre cada palabra del nombre, para
+    búsquedas de autocompletado, con un índice de trigramas para encontrar
+    coincidencias en cualquier parte del nombre.
+
+    Atributos:
+        __raiz (dict): Nodo raíz del trie (carácter -> nodo)
+        __trigramas (dict[str, set[str]]): Trigrama -> DNIs que lo contienen
+        __pacientes (dict[str, Paciente]): DNI -> Paciente indexado
+        __nombres (dict[str, str]): DNI -> nombre normalizado
+    """
+
+    # Clave reservada del nodo del trie donde se guardan los DNIs que terminan allí
+    _FIN = ""
+
+    def __init__(self):
+        """
+        Inicializa un índice vacío.
+        """
+        self.__raiz = {}
+        self.__trigramas = {}
+        self.__pacientes = {}
+        self.__nombres = {}
+
+    def agregar(self, paciente):
+        """
+        Agrega un paciente al índice.
+
+        Args:
+            paciente (Paciente): Paciente a indexar
+        """
+        dni = paciente.obtener_dni()
+        nombre = normalizar_texto(paciente.obtener_nombre())
+
+        self.__pacientes[dni] = paciente
+        self.__nombres[dni] = nombre
+
+        for palabra in set(nombre.split()):
+            nodo = self.__raiz
+            for caracter in palabra:
+                nodo = nodo.setdefault(caracter, {})
+            nodo.setdefault(self._FIN, []).append(dni)
+
+        for trigrama in self._trigramas_de(nombre):
+            self.__trigramas.setdefault(trigrama, set()).add(dni)
+
+    def buscar(self, texto: str, limite: int = 10) -> list:
+        """
+        Busca pacientes cuyo nombre coincida con el texto.
+
+        Primero se devuelven los pacientes en los que cada palabra buscada es
+        el comienzo de alguna palabra del nombre; luego, si no se alcanzó el
+        límite, aquellos cuyo nombre contiene el texto en cualquier posición.
+
+        Args:
+            texto (str): Texto a buscar (no distingue mayúsculas ni tildes)
+            limite (int): Cantidad máxima de resultados
+
+        Returns:
+            list[Paciente]: Pacientes encontrados, como máximo `limite`
+
+        Raises:
+            ValueError: Si el límite no es un entero positivo
+        """
+        if limite <= 0:
+            raise ValueError("El límite debe ser un número positivo")
+
+        consulta = normalizar_texto(texto or "")
+        if not consulta:
+            return []
+
+        encontrados = []
+        vistos = set()
+
+        palabras = consulta.split()
+        for dni in self._por_prefijo(palabras[0]):
+            if dni in vistos:
+                continue
+            palabras_nombre = self.__nombres[dni].split()
+            if all(any(p.startswith(q) for p in palabras_nombre) for q in palabras[1:]):
+                vistos.add(dni)
+                encontrados.append(dni)
+                if len(encontrados) >= limite:
+                    break
+
+        if len(encontrados) < limite and len(consulta) >= 3:
+            for dni in self._por_subcadena(consulta):
+                if dni not in vistos:
+                    vistos.add(dni)
+                    encontrados.append(dni)
+                    if len(encontrados) >= limite:
+                        break
+
+        return [self.__pacientes[dni] for dni in encontrados]
+
+    def __len__(self) -> int:
+        """
+        Devuelve la cantidad de pacientes indexados.
+
+        Returns:
+            int: Cantidad de pacientes
+        """
+        return len(self.__pacientes)
+
+    def _por_prefijo(self, prefijo: str):
+        """
+        Recorre los DNIs con alguna palabra que comience con el prefijo, en
+        orden alfabético de palabra.
+
+        Args:
+            prefijo (str): Prefijo normalizado
+
+        Yields:
+            str: DNI de cada coincidencia (puede repetirse)
+        """
+        nodo = self.__raiz
+        for caracter in prefijo:
+            nodo = nodo.get(caracter)
+            if nodo is None:
+                return
+
+        pendientes = [nodo]
+        while pendientes:
+            actual = pendientes.pop()
+            yield from actual.get(self._FIN, ())
+            hijos = sorted(c for c in actual if c != self._FIN)
+            pendientes.extend(actual[c] for c in reversed(hijos))
+
+    def _por_subcadena(self, consulta: str):
+        """
+        Recorre los DNIs cuyo nombre contiene la consulta, usando la
+        intersección de los trigramas de la consulta como filtro previo.
+
+        Args:
+            consulta (str): Texto normalizado de al menos 3 caracteres
+
+        Yields:
+            str: DNI de cada coincidencia
+        """
+        conjuntos = []
+        for trigrama in self._trigramas_de(consulta):
+            conjunto = self.__trigramas.get(trigrama)
+            if not conjunto:
+                return
+            conjuntos.append(conjunto)
+
+        conjuntos.sort(key=len)
+        menor, resto = conjuntos[0], conjuntos[1:]
+        for dni in menor:
+            if all(dni in conjunto for conjunto in resto) and consulta in self.__nombres[dni]:
+                yield dni
+
+    @staticmethod
+    def _trigramas_de(texto: str) -> set[str]:
+        """
+        Calcula los trigramas de un texto.
+
+        Args:
+            texto (str): Texto normalizado
+
+        Returns:
+            set[str]: Trigramas del texto
+        """
+        return {texto[i:i + 3] for i in range(len(texto) - 2)}
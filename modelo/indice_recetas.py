@@ -0,0 +1,149 @@
+"""
+Clase IndiceRecetas para el sistema de gestión de clínica.
+
+Indexa todas las recetas emitidas por la clínica para consultarlas por
+médico, por medicamento o por mes sin recorrer las historias clínicas.
+"""
+
+from collections import Counter
+from .indice_pacientes import normalizar_texto
+
+
+class IndiceRecetas:
+    """
+    Índices y contadores de recetas de toda la clínica, actualizados al emitir
+    cada receta.
+
+    Atributos:
+        __por_medico (dict[str, list[Receta]]): Matrícula -> recetas emitidas
+        __por_medicamento (dict[str, list[Receta]]): Medicamento normalizado -> recetas que lo incluyen
+        __por_mes (dict[tuple[int, int], list[Receta]]): (año, mes) -> recetas emitidas
+        __conteo_total (Counter): Medicamento normalizado -> cantidad de recetas
+        __conteo_por_mes (dict[tuple[int, int], Counter]): (año, mes) -> conteo de medicamentos
+        __nombres (dict[str, str]): Medicamento normalizado -> nombre tal como se recetó por primera vez
+        __cantidad (int): Cantidad de recetas indexadas
+    """
+
+    def __init__(self):
+        """
+        Inicializa un índice vacío.
+        """
+        self.__por_medico = {}
+        self.__por_medicamento = {}
+        self.__por_mes = {}
+        self.__conteo_total = Counter()
+        self.__conteo_por_mes = {}
+        self.__nombres = {}
+        self.__cantidad = 0
+
+    def agregar(self, receta):
+        """
+        Agrega una receta a los índices y contadores.
+
+        Args:
+            receta (Receta): Receta emitida
+        """
+        fecha = receta.obtener_fecha()
+        mes = (fecha.year, fecha.month)
+        matricula = receta.obtener_medico().obtener_matricula()
+
+        self.__por_medico.setdefault(matricula, []).append(receta)
+        self.__por_mes.setdefault(mes, []).append(receta)
+        conteo_mes = self.__conteo_por_mes.setdefault(mes, Counter())
+
+        # Un medicamento repetido en la misma receta cuenta una sola vez
+        vistos = set()
+        for medicamento in receta.obtener_medicamentos():
+            clave = normalizar_texto(medicamento)
+            if clave in vistos:
+                continue
+            vistos.add(clave)
+            self.__nombres.setdefault(clave, medicamento.strip())
+            self.__por_medicamento.setdefault(clave, []).append(receta)
+            self.__conteo_total[clave] += 1
+            conteo_mes[clave] += 1
+
+        self.__cantidad += 1
+
+    def obtener_por_medico(self, matricula):
+        """
+        Devuelve las recetas emitidas por un médico.
+
+        Args:
+            matricula (str): Matrícula del médico
+
+        Returns:
+            list[Receta]: Recetas del médico, en orden de emisión
+        """
+        return self.__por_medico.get(matricula, []).copy()
+
+    def cantidad_por_medico(self, matricula) -> int:
+        """
+        Devuelve la cantidad de recetas emitidas por un médico.
+
+        Args:
+            matricula (str): Matrícula del médico
+
+        Returns:
+            int: Cantidad de recetas
+        """
+        return len(self.__por_medico.get(matricula, ()))
+
+    def obtener_por_medicamento(self, medicamento):
+        """
+        Devuelve las recetas que incluyen un medicamento.
+
+        Args:
+            medicamento (str): Nombre del medicamento (no distingue mayúsculas ni tildes)
+
+        Returns:
+            list[Receta]: Recetas que lo incluyen, en orden de emisión
+        """
+        return self.__por_medicamento.get(normalizar_texto(medicamento), []).copy()
+
+    def obtener_por_mes(self, anio, mes):
+        """
+        Devuelve las recetas emitidas en un mes.
+
+        Args:
+            anio (int): Año
+            mes (int): Mes (1 a 12)
+
+        Returns:
+            list[Receta]: Recetas del mes, en orden de emisión
+        """
+        return self.__por_mes.get((anio, mes), []).copy()
+
+    def medicamentos_mas_recetados(self, cantidad=10, anio=None, mes=None):
+        """
+        Devuelve los medicamentos incluidos en más recetas.
+
+        Args:
+            cantidad (int): Cantidad de medicamentos a devolver
+            anio (int): Si se indica junto con `mes`, limita el ranking a ese mes
+            mes (int): Mes (1 a 12)
+
+        Returns:
+            list[tuple[str, int]]: Pares (medicamento, cantidad de recetas), de mayor a menor
+
+        Raises:
+            ValueError: Si se indica solo uno de `anio` y `mes`
+        """
+        if (anio is None) != (mes is None):
+            raise ValueError("Para filtrar por mes se deben indicar el año y el mes")
+
+        if anio is None:
+            conteo = self.__conteo_total
+        else:
+            conteo = self.__conteo_por_mes.get((anio, mes), Counter())
+
+        return [(self.__nombres[clave], veces) for clave, veces in conteo.most_common(cantidad)]
+
+    def __len__(self) -> int:
+        """
+        Devuelve la cantidad de recetas indexadas.
+
+        Returns:
+            int: Cantidad de recetas
+        """
+        return self.__cantidad
@@ -0,0 +1,140 @@
+"""
+Clase IndiceTurnos para el sistema de gestión de clínica.
+
+Mantiene turnos ordenados por fecha y hora para responder consultas por
+rango sin recorrer todos los turnos.
+"""
+
+from bisect import bisect_left, insort
+from itertools import count
+
+
+class IndiceTurnos:
+    """
+    Lista ordenada de turnos dividida en bloques, al estilo de un árbol B de
+    un solo nivel.
+
+    Cada bloque es una lista ordenada de entradas (fecha_hora, secuencia, turno)
+    y se guarda aparte la última clave de cada bloque. Ubicar una fecha cuesta
+    O(log n) y agregar o quitar un turno solo mueve elementos dentro de un
+    bloque, así que una consulta por rango cuesta O(log n + k).
+
+    Atributos:
+        __bloques (list[list[tuple]]): Bloques de entradas ordenadas
+        __maximos (list[tuple]): Última clave (fecha_hora, secuencia) de cada bloque
+        __secuencia (count): Desempata turnos con la misma fecha y hora
+        __cantidad (int): Cantidad total de turnos indexados
+    """
+
+    # Cantidad de entradas a partir de la cual un bloque se divide en dos
+    TAMANIO_MAXIMO_BLOQUE = 1024
+
+    def __init__(self):
+        """
+        Inicializa un índice vacío.
+        """
+        self.__bloques = []
+        self.__maximos = []
+        self.__secuencia = count()
+        self.__cantidad = 0
+
+    def agregar(self, turno):
+        """
+        Agrega un turno al índice.
+
+        Args:
+            turno (Turno): Turno a indexar
+        """
+        entrada = (turno.obtener_fecha_hora(), next(self.__secuencia), turno)
+        self.__cantidad += 1
+
+        if not self.__bloques:
+            self.__bloques.append([entrada])
+            self.__maximos.append(entrada[:2])
+            return
+
+        posicion = bisect_left(self.__maximos, entrada[:2])
+        if posicion == len(self.__bloques):
+            posicion -= 1
+
+        bloque = self.__bloques[posicion]
+        insort(bloque, entrada)
+        self.__maximos[posicion] = bloque[-1][:2]
+
+        if len(bloque) > self.TAMANIO_MAXIMO_BLOQUE:
+            mitad = len(bloque) // 2
+            primera, segunda = bloque[:mitad], bloque[mitad:]
+            self.__bloques[posicion:posicion + 1] = [primera, segunda]
+            self.__maximos[posicion:posicion + 1] = [primera[-1][:2], segunda[-1][:2]]
+
+    def quitar(self, turno) -> bool:
+        """
+        Quita un turno del índice.
+
+        Args:
+            turno (Turno): Turno a quitar
+
+        Returns:
+            bool: True si el turno estaba en el índice, False en caso contrario
+        """
+        fecha_hora = turno.obtener_fecha_hora()
+        posicion = bisect_left(self.__maximos, (fecha_hora,))
+
+        while posicion < len(self.__bloques):
+            bloque = self.__bloques[posicion]
+            i = bisect_left(bloque, (fecha_hora,))
+            while i < len(bloque) and bloque[i][0] == fecha_hora:
+                if bloque[i][2] is turno:
+                    del bloque[i]
+                    self.__cantidad -= 1
+                    if bloque:
+                        self.__maximos[posicion] = bloque[-1][:2]
+                    else:
+                        del self.__bloques[posicion]
+                        del self.__maximos[posicion]
+                    return True
+                i += 1
+            if i < len(bloque):
+                return False
+            posicion += 1
+
+        return False
+
+    def entre(self, desde=None, hasta=None):
+        """
+        Recorre en orden cronológico los turnos de un rango de fechas.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+
+        Yields:
+            Turno: Turnos con desde <= fecha_hora < hasta
+        """
+        if desde is None:
+            posicion, i = 0, 0
+        else:
+            posicion = bisect_left(self.__maximos, (desde,))
+            if posicion == len(self.__bloques):
+                return
+            i = bisect_left(self.__bloques[posicion], (desde,))
+
+        while posicion < len(self.__bloques):
+            bloque = self.__bloques[posicion]
+            while i < len(bloque):
+                entrada = bloque[i]
+                if hasta is not None and entrada[0] >= hasta:
+                    return
+                yield entrada[2]
+                i += 1
+            posicion += 1
+            i = 0
+
+    def __len__(self) -> int:
+        """
+        Devuelve la cantidad de turnos indexados.
+
+        Returns:
+            int: Cantidad de turnos
+        """
+        return self.__cantidad
@@ -0,0 +1,262 @@
+"""
+Lista de espera por médico y especialidad para el sistema de gestión de clínica.
+
+Las solicitudes que no consiguen turno esperan ordenadas por urgencia y, a
+igual urgencia, por orden de llegada. Cuando se libera un horario se ofrece
+a la mejor solicitud en O(log n).
+"""
+
+import heapq
+from datetime import datetime
+from itertools import count
+
+
+class SolicitudEspera:
+    """
+    Pedido de turno de un paciente que espera que se libere un horario.
+
+    Atributos:
+        __dni (str): DNI del paciente
+        __matricula (str): Matrícula del médico
+        __especialidad (str): Especialidad solicitada
+        __fecha_hora (datetime): Horario pedido originalmente
+        __urgencia (int): Prioridad; cuanto mayor, antes se atiende
+        __fecha_solicitud (datetime): Momento en que se anotó en la lista
+        __activa (bool): False si se retiró o ya obtuvo turno
+    """
+
+    def __init__(self, dni, matricula, especialidad, fecha_hora, urgencia=0, fecha_solicitud=None):
+        """
+        Inicializa una solicitud de espera.
+
+        Args:
+            dni (str): DNI del paciente
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad solicitada
+            fecha_hora (datetime): Horario pedido originalmente
+            urgencia (int): Prioridad; cuanto mayor, antes se atiende
+            fecha_solicitud (datetime): Momento de la solicitud (por defecto, el actual)
+
+        Raises:
+            ValueError: Si la urgencia no es un entero no negativo
+        """
+        if not isinstance(urgencia, int) or urgencia < 0:
+            raise ValueError("La urgencia debe ser un número entero no negativo")
+
+        self.__dni = dni
+        self.__matricula = matricula
+        self.__especialidad = especialidad.strip()
+        self.__fecha_hora = fecha_hora
+        self.__urgencia = urgencia
+        self.__fecha_solicitud = fecha_solicitud if fecha_solicitud is not None else datetime.now()
+        self.__activa = True
+
+    def obtener_dni(self):
+        """
+        Devuelve el DNI del paciente.
+
+        Returns:
+            str: DNI del paciente
+        """
+        return self.__dni
+
+    def obtener_matricula(self):
+        """
+        Devuelve la matrícula del médico.
+
+        Returns:
+            str: Matrícula del médico
+        """
+        return self.__matricula
+
+    def obtener_especialidad(self):
+        """
+        Devuelve la especialidad solicitada.
+
+        Returns:
+            str: Especialidad solicitada
+        """
+        return self.__especialidad
+
+    def obtener_fecha_hora(self):
+        """
+        Devuelve el horario pedido originalmente.
+
+        Returns:
+            datetime: Horario pedido
+        """
+        return self.__fecha_hora
+
+    def obtener_urgencia(self):
+        """
+        Devuelve la urgencia de la solicitud.
+
+        Returns:
+            int: Urgencia (mayor es más urgente)
+        """
+        return self.__urgencia
+
+    def obtener_fecha_solicitud(self):
+        """
+        Devuelve el momento en que se anotó en la lista.
+
+        Returns:
+            datetime: Momento de la solicitud
+        """
+        return self.__fecha_solicitud
+
+    def esta_activa(self):
+        """
+        Indica si la solicitud sigue esperando.
+
+        Returns:
+            bool: True si no se retiró ni obtuvo turno
+        """
+        return self.__activa
+
+    def desactivar(self):
+        """
+        Marca la solicitud como retirada o atendida.
+        """
+        self.__activa = False
+
+    def reactivar(self):
+        """
+        Vuelve a marcar la solicitud como en espera.
+        """
+        self.__activa = True
+
+    def __str__(self):
+        """
+        Devuelve una representación legible de la solicitud.
+
+        Returns:
+            str: Información de la solicitud
+        """
+        return (f"Espera: DNI {self.__dni} - Mat: {self.__matricula} - {self.__especialidad} - "
+                f"pedido para {self.__fecha_hora.strftime('%d/%m/%Y %H:%M')} - urgencia {self.__urgencia}")
+
+
+class ListaEspera:
+    """
+    Solicitudes de espera de todos los médicos, con un heap por médico y
+    especialidad.
+
+    Cada vez que se anota una solicitud se agrega una entrada nueva al heap
+    con su propio número de secuencia, y la lista recuerda cuál es la entrada
+    vigente de cada solicitud. Al retirarla, su entrada deja de ser vigente y
+    se descarta recién cuando llega al tope del heap; si la solicitud vuelve a
+    anotarse, la entrada vieja sigue sin ser vigente y no la duplica.
+
+    Atributos:
+        __heaps (dict[tuple[str, str], list]): (matrícula, especialidad en minúsculas) ->
+            heap de (-urgencia, fecha_solicitud, secuencia, solicitud)
+        __secuencia (itertools.count): Desempata solicitudes del mismo momento
+            e identifica cada entrada
+        __vigentes (dict[SolicitudEspera, int]): Solicitud esperando -> secuencia de su entrada
+    """
+
+    def __init__(self):
+        """
+        Inicializa una lista de espera vacía.
+        """
+        self.__heaps = {}
+        self.__secuencia = count()
+        self.__vigentes = {}
+
+    def agregar(self, solicitud):
+        """
+        Anota una solicitud en la lista.
+
+        Una solicitud que se sacó con `siguiente` o se retiró puede volver a
+        anotarse: conserva su urgencia y su fecha de solicitud. Anotar una
+        solicitud que ya está esperando no tiene efecto.
+
+        Args:
+            solicitud (SolicitudEspera): Solicitud a anotar
+        """
+        if solicitud in self.__vigentes:
+            return
+
+        solicitud.reactivar()
+        clave = (solicitud.obtener_matricula(), solicitud.obtener_especialidad().lower())
+        secuencia = next(self.__secuencia)
+        entrada = (-solicitud.obtener_urgencia(), solicitud.obtener_fecha_solicitud(), secuencia, solicitud)
+        heapq.heappush(self.__heaps.setdefault(clave, []), entrada)
+        self.__vigentes[solicitud] = secuencia
+
+    def siguiente(self, matricula, especialidad):
+        """
+        Saca de la lista la solicitud más prioritaria de un médico y especialidad
+        y la marca como atendida.
+
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad
+
+        Returns:
+            SolicitudEspera | None: La solicitud, o None si no hay ninguna esperando
+        """
+        clave = (matricula, especialidad.strip().lower())
+        heap = self.__heaps.get(clave)
+        while heap:
+            entrada = heapq.heappop(heap)
+            if self.__es_vigente(entrada):
+                solicitud = entrada[3]
+                del self.__vigentes[solicitud]
+                solicitud.desactivar()
+                if not heap:
+                    del self.__heaps[clave]
+                return solicitud
+        self.__heaps.pop(clave, None)
+        return None
+
+    def retirar(self, solicitud):
+        """
+        Retira una solicitud de la lista.
+
+        Args:
+            solicitud (SolicitudEspera): Solicitud a retirar
+
+        Returns:
+            bool: True si la solicitud estaba esperando
+        """
+        if self.__vigentes.pop(solicitud, None) is None:
+            return False
+        solicitud.desactivar()
+        return True
+
+    def obtener_solicitudes(self, matricula, especialidad):
+        """
+        Devuelve las solicitudes que esperan para un médico y especialidad.
+
+        Args:
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad
+
+        Returns:
+            list[SolicitudEspera]: Solicitudes en orden de prioridad
+        """
+        heap = self.__heaps.get((matricula, especialidad.strip().lower()), [])
+        return [entrada[3] for entrada in sorted(heap) if self.__es_vigente(entrada)]
+
+    def __es_vigente(self, entrada):
+        """
+        Indica si una entrada del heap es la entrada actual de su solicitud.
+
+        Args:
+            entrada (tuple): (-urgencia, fecha_solicitud, secuencia, solicitud)
+
+        Returns:
+            bool: False si la solicitud se retiró, se atendió o se volvió a anotar
+        """
+        return self.__vigentes.get(entrada[3]) == entrada[2]
+
+    def __len__(self):
+        """
+        Devuelve la cantidad de solicitudes esperando.
+
+        Returns:
+            int: Solicitudes activas
+        """
+        return len(self.__vigentes)
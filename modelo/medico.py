@@ -16,6 +16,7 @@ class Medico:
         __nombre (str): Nombre completo del médico
         __matricula (str): Matrícula profesional del médico (clave única)
         __especialidades (list[Especialidad]): Lista de especialidades con sus días de atención
+        __texto (str): Representación ya formateada, o None si hay que rehacerla
     """
     
     def __init__(self, nombre: str, matricula: str):
@@ -40,6 +41,7 @@ class Medico:
         self.__nombre = nombre.strip()
         self.__matricula = matricula.strip()
         self.__especialidades = []
+        self.__texto = None
     
     def agregar_especialidad(self, especialidad: Especialidad):
         """
@@ -64,6 +66,7 @@ class Medico:
                 )
         
         self.__especialidades.append(especialidad)
+        self.__texto = None  # La representación cambió
     
     def obtener_matricula(self) -> str:
         """
@@ -166,15 +169,19 @@ class Medico:
         Returns:
             str: Información completa del médico
         """
+        if self.__texto is not None:
+            return self.__texto
+        
         especialidades_str = []
         for esp in self.__especialidades:
             especialidades_str.append(str(esp))
         
         if especialidades_str:
             esp_texto = "\n  - ".join(especialidades_str)
-            return f"Dr./Dra. {self.__nombre} (Matrícula: {self.__matricula})\nEspecialidades:\n  - {esp_texto}"
+            self.__texto = f"Dr./Dra. {self.__nombre} (Matrícula: {self.__matricula})\nEspecialidades:\n  - {esp_texto}"
         else:
-            return f"Dr./Dra. {self.__nombre} (Matrícula: {self.__matricula})\nEspecialidades: Ninguna registrada"
+            self.__texto = f"Dr./Dra. {self.__nombre} (Matrícula: {self.__matricula})\nEspecialidades: Ninguna registrada"
+        return self.__texto
     
     def __eq__(self, other) -> bool:
         """
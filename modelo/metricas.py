@@ -0,0 +1,163 @@
+"""
+Clase Metricas para el sistema de gestión de clínica.
+
+Cuenta las llamadas y excepciones de cada operación y mide su latencia en
+un histograma de intervalos fijos. Se exporta como diccionario o en el
+formato de texto de Prometheus.
+"""
+
+import time
+from bisect import bisect_left
+from functools import wraps
+
+# Límites superiores (en segundos) de los intervalos del histograma de latencia
+LIMITES_LATENCIA = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+class Metricas:
+    """
+    Métricas de operaciones: llamadas, excepciones por tipo e histograma de
+    latencias.
+
+    Atributos:
+        __limites (tuple[float]): Límites de los intervalos del histograma
+        __llamadas (dict[str, int]): Operación -> cantidad de llamadas
+        __errores (dict[tuple[str, str], int]): (operación, excepción) -> cantidad
+        __intervalos (dict[str, list[int]]): Operación -> llamadas por intervalo (el último es +Inf)
+        __sumas (dict[str, float]): Operación -> suma de latencias en segundos
+    """
+
+    def __init__(self, limites=LIMITES_LATENCIA):
+        """
+        Inicializa las métricas vacías.
+
+        Args:
+            limites (tuple[float]): Límites crecientes de los intervalos, en segundos
+        """
+        self.__limites = tuple(limites)
+        self.__llamadas = {}
+        self.__errores = {}
+        self.__intervalos = {}
+        self.__sumas = {}
+
+    def registrar(self, operacion, segundos, excepcion=None):
+        """
+        Registra una llamada a una operación.
+
+        Args:
+            operacion (str): Nombre de la operación
+            segundos (float): Duración de la llamada
+            excepcion (str): Nombre de la excepción lanzada, o None si terminó bien
+        """
+        intervalos = self.__intervalos.get(operacion)
+        if intervalos is None:
+            intervalos = self.__intervalos[operacion] = [0] * (len(self.__limites) + 1)
+            self.__llamadas[operacion] = 0
+            self.__sumas[operacion] = 0.0
+
+        self.__llamadas[operacion] += 1
+        self.__sumas[operacion] += segundos
+        intervalos[bisect_left(self.__limites, segundos)] += 1
+
+        if excepcion is not None:
+            clave = (operacion, excepcion)
+            self.__errores[clave] = self.__errores.get(clave, 0) + 1
+
+    def instrumentar(self, operacion, funcion):
+        """
+        Envuelve una función para registrar cada llamada.
+
+        Args:
+            operacion (str): Nombre con el que se registran las llamadas
+            funcion (callable): Función a medir
+
+        Returns:
+            callable: Función que mide y delega en la original
+        """
+        reloj = time.perf_counter
+        registrar = self.registrar
+
+        @wraps(funcion)
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = funcion(*args, **kwargs)
+            except Exception as e:
+                registrar(operacion, reloj() - inicio, type(e).__name__)
+                raise
+            registrar(operacion, reloj() - inicio)
+            return resultado
+
+        return medida
+
+    def obtener_resumen(self):
+        """
+        Devuelve una copia de todas las métricas.
+
+        Returns:
+            dict: Operación -> {'llamadas', 'errores' (excepción -> cantidad),
+                'latencia_segundos' ({'suma', 'intervalos' (límite -> cantidad acumulada)})}
+        """
+        resumen = {}
+        for operacion, llamadas in self.__llamadas.items():
+            acumulado = 0
+            intervalos = {}
+            for limite, cantidad in zip(self.__limites + (float("inf"),), self.__intervalos[operacion]):
+                acumulado += cantidad
+                intervalos[limite] = acumulado
+
+            resumen[operacion] = {
+                "llamadas": llamadas,
+                "errores": {exc: n for (op, exc), n in self.__errores.items() if op == operacion},
+                "latencia_segundos": {"suma": self.__sumas[operacion], "intervalos": intervalos},
+            }
+        return resumen
+
+    def a_prometheus(self, tamanios=None, prefijo="clinica"):
+        """
+        Exporta las métricas en el formato de texto de Prometheus.
+
+        Args:
+            tamanios (dict[str, int]): Colección -> cantidad de registros, exportadas como gauge
+            prefijo (str): Prefijo de los nombres de las métricas
+
+        Returns:
+            str: Texto listo para escribir en un archivo .prom
+        """
+        lineas = [
+            f"# HELP {prefijo}_operaciones_total Cantidad de llamadas por operación.",
+            f"# TYPE {prefijo}_operaciones_total counter",
+        ]
+        for operacion, llamadas in self.__llamadas.items():
+            lineas.append(f'{prefijo}_operaciones_total{{operacion="{operacion}"}} {llamadas}')
+
+        lineas += [
+            f"# HELP {prefijo}_errores_total Cantidad de excepciones por operación y tipo.",
+            f"# TYPE {prefijo}_errores_total counter",
+        ]
+        for (operacion, excepcion), cantidad in self.__errores.items():
+            lineas.append(f'{prefijo}_errores_total{{operacion="{operacion}",excepcion="{excepcion}"}} {cantidad}')
+
+        lineas += [
+            f"# HELP {prefijo}_latencia_segundos Duración de cada operación.",
+            f"# TYPE {prefijo}_latencia_segundos histogram",
+        ]
+        for operacion, datos in self.obtener_resumen().items():
+            for limite, acumulado in datos["latencia_segundos"]["intervalos"].items():
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                lineas.append(f'{prefijo}_latencia_segundos_bucket{{operacion="{operacion}",le="{le}"}} {acumulado}')
+            lineas.append(f'{prefijo}_latencia_segundos_sum{{operacion="{operacion}"}} {datos["latencia_segundos"]["suma"]!r}')
+            lineas.append(f'{prefijo}_latencia_segundos_count{{operacion="{operacion}"}} {datos["llamadas"]}')
+
+        if tamanios:
+            lineas += [
+                f"# HELP {prefijo}_registros Cantidad de registros por colección.",
+                f"# TYPE {prefijo}_registros gauge",
+            ]
+            for coleccion, cantidad in tamanios.items():
+                lineas.append(f'{prefijo}_registros{{coleccion="{coleccion}"}} {cantidad}')
+
+        return "\n".join(lineas) + "\n"
@@ -18,6 +18,61 @@ class Receta:
         self.__medico = medico
         self.__medicamentos = medicamentos.copy()  # Hacemos una copia para evitar modificaciones externas
         self.__fecha = datetime.now()  # Se asigna automáticamente la fecha actual
+        self.__texto = None  # Representación ya formateada, se arma en el primer str()
+    
+    @classmethod
+    def restaurar(cls, paciente, medico, medicamentos, fecha):
+        """
+        Reconstruye una receta ya emitida con su fecha de emisión original.
+        
+        Args:
+            paciente (Paciente): El paciente que recibió la receta
+            medico (Medico): El médico que emitió la receta
+            medicamentos (list[str]): Lista de medicamentos recetados
+            fecha (datetime): Fecha y hora de emisión
+            
+        Returns:
+            Receta: La receta reconstruida
+        """
+        receta = cls(paciente, medico, medicamentos)
+        receta.__fecha = fecha
+        return receta
+    
+    def obtener_paciente(self):
+        """
+        Devuelve el paciente que recibe la receta.
+        
+        Returns:
+            Paciente: Paciente de la receta
+        """
+        return self.__paciente
+    
+    def obtener_medico(self):
+        """
+        Devuelve el médico que emite la receta.
+        
+        Returns:
+            Medico: Médico de la receta
+        """
+        return self.__medico
+    
+    def obtener_medicamentos(self):
+        """
+        Devuelve una copia de la lista de medicamentos recetados.
+        
+        Returns:
+            list[str]: Medicamentos de la receta
+        """
+        return self.__medicamentos.copy()
+    
+    def obtener_fecha(self):
+        """
+        Devuelve la fecha de emisión de la receta.
+        
+        Returns:
+            datetime: Fecha y hora de emisión
+        """
+        return self.__fecha
     
     def __str__(self):
         """
@@ -26,10 +81,14 @@ class Receta:
         Returns:
             str: Representación legible de la receta
         """
+        if self.__texto is not None:
+            return self.__texto
+        
         medicamentos_str = ", ".join(self.__medicamentos)
         fecha_str = self.__fecha.strftime("%d/%m/%Y %H:%M")
         
-        return (f"Receta - Paciente: {self.__paciente.obtener_dni()}, "
-                f"Médico: {self.__medico.obtener_matricula()}, "
-                f"Medicamentos: {medicamentos_str}, "
-                f"Fecha: {fecha_str}")
\ No newline at end of file
+        self.__texto = (f"Receta - Paciente: {self.__paciente.obtener_dni()}, "
+                        f"Médico: {self.__medico.obtener_matricula()}, "
+                        f"Medicamentos: {medicamentos_str}, "
+                        f"Fecha: {fecha_str}")
+        return self.__texto
\ No newline at end of file
@@ -0,0 +1,364 @@
+"""
+Clase SerieTurnos para el sistema de gestión de clínica.
+
+Representa turnos recurrentes (por ejemplo, todos los martes a las 9:00)
+sin crear un objeto Turno por cada ocurrencia.
+"""
+
+from datetime import datetime, timedelta
+from .excepciones import DatosInvalidosException
+from .paciente import Paciente
+from .medico import Medico
+from .turno import Turno
+
+
+class SerieTurnos:
+    """
+    Serie de turnos de un paciente con un médico, a intervalos regulares.
+
+    Solo se guardan el inicio, el intervalo, la cantidad y las ocurrencias
+    canceladas. Cada Turno se crea recién cuando se consulta y no se
+    conserva: la serie ocupa lo mismo sin importar cuántas ocurrencias se
+    hayan consultado. Dos consultas de la misma ocurrencia devuelven turnos
+    iguales (mismo médico y fecha y hora), no el mismo objeto.
+
+    Atributos:
+        __paciente (Paciente): Paciente que asiste a los turnos
+        __medico (Medico): Médico asignado
+        __especialidad (str): Especialidad médica de los turnos
+        __inicio (datetime): Fecha y hora de la primera ocurrencia
+        __intervalo (timedelta): Tiempo entre ocurrencias
+        __cantidad (int): Cantidad de ocurrencias agendadas
+        __canceladas (set[int]): Índices de las ocurrencias canceladas
+        __texto (str): Representación ya formateada, o None si hay que rehacerla
+    """
+
+    # Reglas de repetición por nombre
+    REGLAS = {
+        "semanal": timedelta(weeks=1),
+        "quincenal": timedelta(weeks=2),
+    }
+
+    def __init__(self, paciente: Paciente, medico: Medico, especialidad: str,
+                 inicio: datetime, regla, cantidad: int):
+        """
+        Inicializa una nueva serie de turnos.
+
+        Args:
+            paciente (Paciente): Paciente que asiste a los turnos
+            medico (Medico): Médico asignado
+            especialidad (str): Especialidad médica de los turnos
+            inicio (datetime): Fecha y hora de la primera ocurrencia
+            regla (str | timedelta): Nombre de una regla de REGLAS o intervalo de al menos un día
+            cantidad (int): Cantidad de ocurrencias
+
+        Raises:
+            DatosInvalidosException: Si algún parámetro es inválido
+        """
+        if not isinstance(paciente, Paciente):
+            raise DatosInvalidosException("El paciente debe ser una instancia de la clase Paciente")
+
+        if not isinstance(medico, Medico):
+            raise DatosInvalidosException("El médico debe ser una instancia de la clase Medico")
+
+        if not isinstance(inicio, datetime):
+            raise DatosInvalidosException("La fecha y hora de inicio debe ser una instancia de datetime")
+
+        if not especialidad or not especialidad.strip():
+            raise DatosInvalidosException("La especialidad no puede estar vacía")
+
+        if inicio < datetime.now():
+            raise DatosInvalidosException("No se pueden agendar turnos en el pasado")
+
+        if isinstance(regla, str):
+            if regla.strip().lower() not in self.REGLAS:
+                raise DatosInvalidosException(
+                    f"Regla de repetición inválida: {regla}. Debe ser una de: {', '.join(self.REGLAS)}"
+                )
+            intervalo = self.REGLAS[regla.strip().lower()]
+        elif isinstance(regla, timedelta) and regla >= timedelta(days=1):
+            intervalo = regla
+        else:
+            raise DatosInvalidosException("El intervalo de la serie debe ser de al menos un día")
+
+        if not isinstance(cantidad, int) or cantidad < 1:
+            raise DatosInvalidosException("La cantidad de turnos de la serie debe ser un número positivo")
+
+        self.__paciente = paciente
+        self.__medico = medico
+        self.__especialidad = especialidad.strip()
+        self.__inicio = inicio
+        self.__intervalo = intervalo
+        self.__cantidad = cantidad
+        self.__canceladas = set()
+        self.__texto = None
+
+    @classmethod
+    def restaurar(cls, paciente: Paciente, medico: Medico, especialidad: str, inicio: datetime,
+                  intervalo: timedelta, cantidad: int, canceladas=()) -> "SerieTurnos":
+        """
+        Reconstruye una serie ya agendada, aunque su inicio haya pasado.
+
+        Los datos no se vuelven a validar: deben provenir de una serie que ya
+        pasó las validaciones al agendarse.
+
+        Args:
+            paciente (Paciente): Paciente que asiste a los turnos
+            medico (Medico): Médico asignado
+            especialidad (str): Especialidad médica de los turnos
+            inicio (datetime): Fecha y hora de la primera ocurrencia
+            intervalo (timedelta): Tiempo entre ocurrencias
+            cantidad (int): Cantidad de ocurrencias
+            canceladas (iterable[datetime]): Fechas y horas de las ocurrencias canceladas
+
+        Returns:
+            SerieTurnos: La serie reconstruida
+        """
+        serie = cls.__new__(cls)
+        serie.__paciente = paciente
+        serie.__medico = medico
+        serie.__especialidad = especialidad.strip()
+        serie.__inicio = inicio
+        serie.__intervalo = intervalo
+        serie.__cantidad = cantidad
+        serie.__canceladas = {(fecha_hora - inicio) // intervalo for fecha_hora in canceladas}
+        serie.__texto = None
+        return serie
+
+    def obtener_paciente(self) -> Paciente:
+        """
+        Devuelve el paciente de la serie.
+
+        Returns:
+            Paciente: Paciente de la serie
+        """
+        return self.__paciente
+
+    def obtener_medico(self) -> Medico:
+        """
+        Devuelve el médico de la serie.
+
+        Returns:
+            Medico: Médico de la serie
+        """
+        return self.__medico
+
+    def obtener_especialidad(self) -> str:
+        """
+        Devuelve la especialidad de la serie.
+
+        Returns:
+            str: Especialidad médica de los turnos
+        """
+        return self.__especialidad
+
+    def obtener_fecha_hora(self) -> datetime:
+        """
+        Devuelve la fecha y hora de la primera ocurrencia.
+
+        Returns:
+            datetime: Inicio de la serie
+        """
+        return self.__inicio
+
+    def obtener_intervalo(self) -> timedelta:
+        """
+        Devuelve el tiempo entre ocurrencias.
+
+        Returns:
+            timedelta: Intervalo de la serie
+        """
+        return self.__intervalo
+
+    def obtener_fin(self) -> datetime:
+        """
+        Devuelve la fecha y hora de la última ocurrencia agendada.
+
+        Returns:
+            datetime: Última ocurrencia, aunque esté cancelada
+        """
+        return self.__inicio + self.__intervalo * (self.__cantidad - 1)
+
+    def obtener_cantidad(self) -> int:
+        """
+        Devuelve la cantidad de ocurrencias agendadas, incluidas las canceladas.
+
+        Returns:
+            int: Cantidad de ocurrencias de la serie
+        """
+        return self.__cantidad
+
+    def obtener_canceladas(self) -> list[datetime]:
+        """
+        Devuelve las fechas de las ocurrencias canceladas.
+
+        Returns:
+            list[datetime]: Fechas y horas canceladas, en orden cronológico
+        """
+        return [self.__inicio + self.__intervalo * indice for indice in sorted(self.__canceladas)]
+
+    def fechas(self, desde=None, hasta=None):
+        """
+        Recorre las fechas de las ocurrencias vigentes en orden cronológico.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+
+        Yields:
+            datetime: Fecha y hora de cada ocurrencia no cancelada
+        """
+        for indice in self._indices(desde, hasta):
+            yield self.__inicio + self.__intervalo * indice
+
+    def turnos(self, desde=None, hasta=None):
+        """
+        Recorre las ocurrencias vigentes como turnos, en orden cronológico.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+
+        Yields:
+            Turno: Cada ocurrencia no cancelada
+        """
+        for indice in self._indices(desde, hasta):
+            yield self._turno(indice)
+
+    def obtener_turno(self, fecha_hora: datetime):
+        """
+        Devuelve la ocurrencia de una fecha y hora.
+
+        Args:
+            fecha_hora (datetime): Fecha y hora de la ocurrencia
+
+        Returns:
+            Turno | None: La ocurrencia, o None si no hay una vigente en esa fecha y hora
+        """
+        indice = self._indice_de(fecha_hora)
+        return None if indice is None else self._turno(indice)
+
+    def cancelar(self, fecha_hora: datetime):
+        """
+        Cancela una ocurrencia de la serie.
+
+        Args:
+            fecha_hora (datetime): Fecha y hora de la ocurrencia
+
+        Returns:
+            Turno | None: La ocurrencia cancelada, o None si no había una vigente
+        """
+        indice = self._indice_de(fecha_hora)
+        if indice is None:
+            return None
+
+        turno = self._turno(indice)
+        self.__canceladas.add(indice)
+        self.__texto = None  # Cambió la cantidad de ocurrencias vigentes
+        return turno
+
+    def tiene_superposicion(self, fecha_hora: datetime, duracion: timedelta) -> bool:
+        """
+        Verifica si alguna ocurrencia vigente se superpone con un horario.
+
+        Args:
+            fecha_hora (datetime): Inicio del horario a verificar
+            duracion (timedelta): Duración de cada turno
+
+        Returns:
+            bool: True si hay una ocurrencia que comienza a menos de `duracion` del horario
+        """
+        for fecha in self.fechas(fecha_hora - duracion, fecha_hora + duracion):
+            if fecha > fecha_hora - duracion:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        """
+        Devuelve la cantidad de ocurrencias vigentes.
+
+        Returns:
+            int: Ocurrencias no canceladas
+        """
+        return self.__cantidad - len(self.__canceladas)
+
+    def __str__(self) -> str:
+        """
+        Devuelve una representación legible de la serie.
+
+        Returns:
+            str: Información de la serie y de sus ocurrencias vigentes
+        """
+        if self.__texto is not None:
+            return self.__texto
+
+        dias = self.__intervalo.days
+        if self.__intervalo == timedelta(days=dias) and dias % 7 == 0:
+            repeticion = "cada semana" if dias == 7 else f"cada {dias // 7} semanas"
+        else:
+            repeticion = f"cada {self.__intervalo}"
+
+        self.__texto = (f"Serie: {self.__paciente.obtener_nombre()} (DNI: {self.__paciente.obtener_dni()}) "
+                        f"con Dr./Dra. {self.__medico.obtener_nombre()} (Mat: {self.__medico.obtener_matricula()}) "
+                        f"- {self.__especialidad} - {repeticion} desde {self.__inicio.strftime('%d/%m/%Y %H:%M')} "
+                        f"hasta {self.obtener_fin().strftime('%d/%m/%Y')} ({len(self)} de {self.__cantidad} turnos)")
+        return self.__texto
+
+    def _indices(self, desde=None, hasta=None):
+        """
+        Recorre los índices de las ocurrencias vigentes de un rango.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+
+        Yields:
+            int: Índice de cada ocurrencia no cancelada del rango
+        """
+        primero = 0 if desde is None else self._primer_indice_desde(desde)
+        ultimo = self.__cantidad if hasta is None else min(self.__cantidad, self._primer_indice_desde(hasta))
+        for indice in range(primero, ultimo):
+            if indice not in self.__canceladas:
+                yield indice
+
+    def _primer_indice_desde(self, fecha_hora):
+        """
+        Calcula el primer índice cuya ocurrencia no es anterior a una fecha.
+
+        Args:
+            fecha_hora (datetime): Fecha y hora de referencia
+
+        Returns:
+            int: Índice (puede superar la cantidad de ocurrencias)
+        """
+        return max(0, -((self.__inicio - fecha_hora) // self.__intervalo))
+
+    def _indice_de(self, fecha_hora):
+        """
+        Calcula el índice de la ocurrencia vigente de una fecha y hora.
+
+        Args:
+            fecha_hora (datetime): Fecha y hora de la ocurrencia
+
+        Returns:
+            int | None: Índice, o None si no hay una ocurrencia vigente en esa fecha y hora
+        """
+        if fecha_hora < self.__inicio:
+            return None
+        indice, resto = divmod(fecha_hora - self.__inicio, self.__intervalo)
+        if resto or indice >= self.__cantidad or indice in self.__canceladas:
+            return None
+        return indice
+
+    def _turno(self, indice):
+        """
+        Crea el turno de la ocurrencia de un índice.
+
+        Args:
+            indice (int): Índice de una ocurrencia vigente
+
+        Returns:
+            Turno: La ocurrencia
+        """
+        return Turno.restaurar(self.__paciente, self.__medico,
+                               self.__inicio + self.__intervalo * indice, self.__especialidad)
@@ -20,6 +20,7 @@ class Turno:
         __medico (Medico): Médico asignado al turno
         __fecha_hora (datetime): Fecha y hora del turno
         __especialidad (str): Especialidad médica del turno
+        __texto (str): Representación ya formateada, o None hasta el primer str()
     """
     
     def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str):
@@ -57,6 +58,32 @@ class Turno:
         self.__medico = medico
         self.__fecha_hora = fecha_hora
         self.__especialidad = especialidad.strip()
+        self.__texto = None
+    
+    @classmethod
+    def restaurar(cls, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str) -> "Turno":
+        """
+        Reconstruye un turno ya agendado, aunque su fecha haya pasado.
+        
+        Los datos no se vuelven a validar: deben provenir de un turno que ya
+        pasó las validaciones al agendarse.
+        
+        Args:
+            paciente (Paciente): Paciente que asiste al turno
+            medico (Medico): Médico asignado al turno
+            fecha_hora (datetime): Fecha y hora del turno
+            especialidad (str): Especialidad médica del turno
+            
+        Returns:
+            Turno: El turno reconstruido
+        """
+        turno = cls.__new__(cls)
+        turno.__paciente = paciente
+        turno.__medico = medico
+        turno.__fecha_hora = fecha_hora
+        turno.__especialidad = especialidad.strip()
+        turno.__texto = None
+        return turno
     
     def obtener_paciente(self) -> Paciente:
         """
@@ -101,11 +128,15 @@ class Turno:
         Returns:
             str: Información completa del turno
         """
+        if self.__texto is not None:
+            return self.__texto
+        
         fecha_str = self.__fecha_hora.strftime("%d/%m/%Y %H:%M")
         
-        return (f"Turno: {self.__paciente.obtener_nombre()} (DNI: {self.__paciente.obtener_dni()}) "
-                f"con Dr./Dra. {self.__medico.obtener_nombre()} (Mat: {self.__medico.obtener_matricula()}) "
-                f"- {self.__especialidad} - {fecha_str}")
+        self.__texto = (f"Turno: {self.__paciente.obtener_nombre()} (DNI: {self.__paciente.obtener_dni()}) "
+                        f"con Dr./Dra. {self.__medico.obtener_nombre()} (Mat: {self.__medico.obtener_matricula()}) "
+                        f"- {self.__especialidad} - {fecha_str}")
+        return self.__texto
     
     def __eq__(self, other) -> bool:
         """
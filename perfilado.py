@@ -0,0 +1,123 @@
+"""
+Perfilado de sesiones del sistema de gestión de clínica.
+
+Envuelve una sesión (interactiva o por lotes) con cProfile y/o tracemalloc
+y, al terminar, escribe un reporte de las funciones más costosas y de los
+lugares del modelo que más memoria reservan.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+
+# Cantidad de entradas de cada tabla de los reportes
+LIMITE_REPORTE = 30
+
+DIRECTORIO_MODELO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modelo")
+
+
+@contextmanager
+def sesion_perfilada(ruta_cpu=None, ruta_memoria=None, limite=LIMITE_REPORTE):
+    """
+    Perfila el bloque de código y escribe los reportes al salir, aunque el
+    bloque termine con una excepción.
+
+    Args:
+        ruta_cpu (str): Si se indica, archivo del reporte de cProfile
+        ruta_memoria (str): Si se indica, archivo del reporte de tracemalloc
+        limite (int): Cantidad de entradas por tabla
+    """
+    perfil = cProfile.Profile() if ruta_cpu else None
+
+    if ruta_memoria:
+        tracemalloc.start()
+    if perfil is not None:
+        perfil.enable()
+
+    try:
+        yield
+    finally:
+        if perfil is not None:
+            perfil.disable()
+            _escribir(ruta_cpu, reporte_cpu(perfil, limite))
+        if ruta_memoria:
+            foto = tracemalloc.take_snapshot()
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            _escribir(ruta_memoria, reporte_memoria(foto, pico, limite))
+
+
+def reporte_cpu(perfil, limite=LIMITE_REPORTE):
+    """
+    Arma el reporte de las funciones más costosas.
+
+    Args:
+        perfil (cProfile.Profile): Perfil ya detenido
+        limite (int): Cantidad de funciones por tabla
+
+    Returns:
+        str: Funciones ordenadas por tiempo acumulado y por tiempo propio
+    """
+    salida = io.StringIO()
+    estadisticas = pstats.Stats(perfil, stream=salida)
+
+    salida.write("=== Funciones por tiempo acumulado ===\n")
+    estadisticas.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limite)
+    salida.write("\n=== Funciones por tiempo propio ===\n")
+    estadisticas.sort_stats(pstats.SortKey.TIME).print_stats(limite)
+
+    return salida.getvalue()
+
+
+def reporte_memoria(foto, pico, limite=LIMITE_REPORTE):
+    """
+    Arma el reporte de memoria agrupado por módulo del modelo.
+
+    Args:
+        foto (tracemalloc.Snapshot): Foto tomada al final de la sesión
+        pico (int): Memoria pico rastreada, en bytes
+        limite (int): Cantidad de lugares de reserva a mostrar
+
+    Returns:
+        str: Memoria en uso por módulo del modelo y lugares que más reservan
+    """
+    del_modelo = foto.filter_traces([tracemalloc.Filter(True, os.path.join(DIRECTORIO_MODELO, "*"))])
+    total = sum(estadistica.size for estadistica in foto.statistics("filename"))
+
+    lineas = [
+        "=== Memoria ===",
+        f"En uso al final: {total / 2**20:.2f} MB - pico: {pico / 2**20:.2f} MB",
+        "",
+        "=== Memoria en uso por módulo del modelo ===",
+    ]
+    for estadistica in del_modelo.statistics("filename"):
+        modulo = os.path.relpath(estadistica.traceback[0].filename, os.path.dirname(DIRECTORIO_MODELO))
+        lineas.append(f"{estadistica.size / 1024:12.1f} KiB  {estadistica.count:10d} bloques  {modulo}")
+
+    lineas += ["", f"=== {limite} lugares del modelo que más memoria reservan ==="]
+    for estadistica in del_modelo.statistics("lineno")[:limite]:
+        marco = estadistica.traceback[0]
+        modulo = os.path.relpath(marco.filename, os.path.dirname(DIRECTORIO_MODELO))
+        lineas.append(f"{estadistica.size / 1024:12.1f} KiB  {estadistica.count:10d} bloques  {modulo}:{marco.lineno}")
+
+    lineas += ["", f"=== {limite} lugares que más memoria reservan (todos los módulos) ==="]
+    for estadistica in foto.statistics("lineno")[:limite]:
+        marco = estadistica.traceback[0]
+        lineas.append(f"{estadistica.size / 1024:12.1f} KiB  {estadistica.count:10d} bloques  {marco.filename}:{marco.lineno}")
+
+    return "\n".join(lineas) + "\n"
+
+
+def _escribir(ruta, texto):
+    """
+    Escribe un reporte en un archivo.
+
+    Args:
+        ruta (str): Ruta del archivo
+        texto (str): Contenido del reporte
+    """
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(texto)
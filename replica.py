@@ -0,0 +1,804 @@
+"""
+Réplica de solo lectura de la clínica en memoria compartida.
+
+El proceso principal publica periódicamente una instantánea consistente de
+los pacientes y los turnos en un segmento de multiprocessing.shared_memory.
+Los procesos de reportes se conectan al segmento por su nombre y lo consultan
+directamente, sin serializar objetos ni frenar las escrituras del principal.
+
+El segmento tiene dos copias (ranuras) de los datos. El publicador escribe
+siempre en la ranura que los lectores no están usando y después anuncia la
+nueva generación; un lector verifica al terminar cada consulta que el
+publicador no haya empezado a reescribir su ranura y, si ocurrió, la repite.
+Cada ranura se actualiza en forma incremental: los pacientes solo se agregan
+y de los turnos se reescribe únicamente la parte que cambió desde la última
+vez que se escribió esa ranura.
+
+Formato de una ranura:
+    - Pacientes: registros de 8 bytes (posición y largo de su texto en el blob)
+    - Orden por DNI: posiciones de los pacientes ordenadas por DNI (4 bytes cada una)
+    - Blob: "dni\\x1fnombre\\x1ffecha_nacimiento" de cada paciente, en UTF-8
+    - Turnos: registros de 20 bytes (segundos, paciente, médico, especialidad)
+      ordenados por fecha y hora
+    - Catálogo: JSON con las matrículas, nombres de médicos y especialidades
+"""
+
+import json
+import struct
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from multiprocessing import resource_tracker, shared_memory
+from modelo.eventos import Evento
+
+# Identificación y versión del formato
+MAGIA = b"CLRP"
+VERSION = 1
+
+# Encabezado: magia, versión, generación en escritura, generación publicada,
+# capacidad de pacientes, de turnos, del blob y del catálogo
+ENCABEZADO = struct.Struct("<4sIQQQQQQ")
+TAMANIO_ENCABEZADO = 64
+
+# Encabezado de cada ranura: pacientes, turnos, bytes del blob y del catálogo
+ENCABEZADO_RANURA = struct.Struct("<QQQQ")
+REGISTRO_PACIENTE = struct.Struct("<II")
+POSICION = struct.Struct("<I")
+REGISTRO_TURNO = struct.Struct("<qIII")
+
+# Separador de los campos de un paciente en el blob
+SEPARADOR = "\x1f"
+
+# Capacidad por defecto del blob por paciente y del catálogo
+BYTES_POR_PACIENTE = 96
+BYTES_CATALOGO = 1 << 20
+
+# Las fechas se guardan como segundos desde esta fecha (sin zona horaria)
+EPOCA = datetime(1970, 1, 1)
+
+# Reintentos de una consulta que se cruzó con una publicación
+MAXIMO_REINTENTOS = 1000
+ESPERA_REINTENTO = 0.001
+
+# Eventos de la clínica que cambian los datos replicados
+EVENTOS_REPLICADOS = (Evento.PACIENTE_AGREGADO, Evento.TURNO_AGENDADO, Evento.TURNO_CANCELADO,
+                      Evento.SERIE_AGENDADA)
+
+
+def _segundos(fecha_hora):
+    """
+    Convierte una fecha y hora en segundos desde EPOCA.
+
+    Args:
+        fecha_hora (datetime): Fecha y hora
+
+    Returns:
+        int: Segundos desde EPOCA
+    """
+    return (fecha_hora - EPOCA) // timedelta(seconds=1)
+
+
+class _Disposicion:
+    """
+    Posición de cada región del segmento, calculada a partir de las capacidades.
+
+    Atributos:
+        max_pacientes (int): Capacidad de pacientes
+        max_turnos (int): Capacidad de turnos
+        bytes_blob (int): Capacidad del blob de pacientes
+        bytes_catalogo (int): Capacidad del catálogo
+        pacientes (int): Desplazamiento de los registros de pacientes dentro de una ranura
+        orden_dni (int): Desplazamiento del orden por DNI
+        blob (int): Desplazamiento del blob
+        turnos (int): Desplazamiento de los turnos
+        catalogo (int): Desplazamiento del catálogo
+        tamanio_ranura (int): Tamaño de una ranura
+        tamanio (int): Tamaño total del segmento
+    """
+
+    def __init__(self, max_pacientes, max_turnos, bytes_blob, bytes_catalogo):
+        self.max_pacientes = max_pacientes
+        self.max_turnos = max_turnos
+        self.bytes_blob = bytes_blob
+        self.bytes_catalogo = bytes_catalogo
+        self.pacientes = ENCABEZADO_RANURA.size
+        self.orden_dni = self.pacientes + REGISTRO_PACIENTE.size * max_pacientes
+        self.blob = self.orden_dni + POSICION.size * max_pacientes
+        self.turnos = self.blob + bytes_blob
+        self.catalogo = self.turnos + REGISTRO_TURNO.size * max_turnos
+        self.tamanio_ranura = self.catalogo + bytes_catalogo
+        self.tamanio = TAMANIO_ENCABEZADO + 2 * self.tamanio_ranura
+
+    def inicio_ranura(self, ranura):
+        """
+        Devuelve el desplazamiento de una ranura en el segmento.
+
+        Args:
+            ranura (int): 0 o 1
+
+        Returns:
+            int: Desplazamiento en bytes
+        """
+        return TAMANIO_ENCABEZADO + ranura * self.tamanio_ranura
+
+
+class PublicadorReplica:
+    """
+    Mantiene una réplica de los pacientes y turnos de una clínica en memoria
+    compartida.
+
+    Los cambios llegan por el feed de la clínica y se acumulan; publicar()
+    los aplica y escribe una nueva generación. Se puede llamar a mano o
+    dejar que un hilo lo haga cada cierto intervalo con iniciar().
+
+    Atributos:
+        __memoria (shared_memory.SharedMemory): Segmento compartido
+        __disposicion (_Disposicion): Posiciones de las regiones
+        __suscripcion (Suscripcion): Suscripción al feed de la clínica
+        __pendientes (list[Evento]): Eventos recibidos y todavía no aplicados
+        __candado (threading.Lock): Protege los eventos pendientes
+        __publicacion (threading.Lock): Serializa las publicaciones (a mano y del hilo)
+        __indice_paciente (dict[str, int]): DNI -> posición del paciente
+        __registros_pacientes (bytearray): Registros de pacientes codificados
+        __blob (bytearray): Textos de los pacientes
+        __dnis (list[str]): DNIs ordenados
+        __orden_dni (list[int]): Posiciones de los pacientes en el orden de __dnis
+        __claves (list[tuple[int, int]]): (segundos, médico) de cada turno, ordenadas
+        __turnos (bytearray): Registros de turnos en el orden de __claves
+        __medicos (dict[str, int]): Matrícula -> número en el catálogo
+        __nombres_medicos (list[str]): Nombre de cada médico del catálogo
+        __especialidades (dict[str, int]): Especialidad -> número en el catálogo
+        __validos (list[list[int]]): Por ranura, pacientes y prefijo de turnos ya escritos
+        __generacion (int): Última generación publicada
+        __hilo (threading.Thread): Hilo de publicación periódica, o None
+        __detener (threading.Event): Pide al hilo que termine
+        __error (ValueError): Error que detuvo al hilo de publicación, o None
+    """
+
+    def __init__(self, clinica, nombre=None, max_pacientes=100_000, max_turnos=1_000_000,
+                 bytes_blob=None, bytes_catalogo=BYTES_CATALOGO):
+        """
+        Crea el segmento compartido y publica la primera generación.
+
+        La clínica no debe modificarse desde otro hilo mientras se crea el
+        publicador.
+
+        Args:
+            clinica (Clinica): Clínica a replicar
+            nombre (str): Nombre del segmento (None genera uno)
+            max_pacientes (int): Capacidad de pacientes
+            max_turnos (int): Capacidad de turnos
+            bytes_blob (int): Capacidad de los textos de pacientes
+                (por defecto, BYTES_POR_PACIENTE por paciente)
+            bytes_catalogo (int): Capacidad del catálogo de médicos y especialidades
+
+        Raises:
+            ValueError: Si la clínica no entra en la capacidad indicada
+        """
+        if bytes_blob is None:
+            bytes_blob = BYTES_POR_PACIENTE * max_pacientes
+        self.__disposicion = _Disposicion(max_pacientes, max_turnos, bytes_blob, bytes_catalogo)
+        self.__memoria = shared_memory.SharedMemory(name=nombre, create=True, size=self.__disposicion.tamanio)
+
+        self.__pendientes = []
+        self.__candado = threading.Lock()
+        self.__publicacion = threading.Lock()
+        self.__indice_paciente = {}
+        self.__registros_pacientes = bytearray()
+        self.__blob = bytearray()
+        self.__dnis = []
+        self.__orden_dni = []
+        self.__claves = []
+        self.__turnos = bytearray()
+        self.__medicos = {}
+        self.__nombres_medicos = []
+        self.__especialidades = {}
+        self.__validos = [[0, 0], [0, 0]]
+        self.__generacion = 0
+        self.__hilo = None
+        self.__detener = threading.Event()
+        self.__error = None
+
+        disposicion = self.__disposicion
+        ENCABEZADO.pack_into(self.__memoria.buf, 0, MAGIA, VERSION, 0, 0, disposicion.max_pacientes,
+                             disposicion.max_turnos, disposicion.bytes_blob, disposicion.bytes_catalogo)
+
+        # Suscribirse antes de leer el estado: aplicar dos veces un cambio no tiene efecto
+        self.__suscripcion = clinica.suscribir_cambios(self.__recibir)
+        for paciente in clinica.obtener_pacientes():
+            self.__agregar_paciente(paciente)
+        for turno in sorted(clinica.obtener_turnos(), key=lambda t: t.obtener_fecha_hora()):
+            self.__agregar_turno(turno)
+        self.publicar()
+
+    def obtener_nombre(self):
+        """
+        Devuelve el nombre del segmento, para conectar los lectores.
+
+        Returns:
+            str: Nombre del segmento compartido
+        """
+        return self.__memoria.name
+
+    def obtener_generacion(self):
+        """
+        Devuelve la última generación publicada.
+
+        Returns:
+            int: Número de generación (la primera es 1)
+        """
+        return self.__generacion
+
+    def publicar(self):
+        """
+        Aplica los cambios pendientes y publica una nueva generación.
+
+        Solo se escribe en la ranura que no están leyendo los lectores, y de
+        ella solo lo que cambió desde la última vez que se escribió. Las
+        llamadas a mano y las del hilo de iniciar() no se superponen.
+
+        Returns:
+            int: Bytes copiados a la memoria compartida
+
+        Raises:
+            ValueError: Si los datos no entran en la capacidad del segmento
+        """
+        with self.__publicacion:
+            return self.__publicar()
+
+    def obtener_error(self):
+        """
+        Devuelve el error que detuvo la publicación periódica.
+
+        Returns:
+            ValueError: Error de capacidad del hilo de iniciar(), o None
+        """
+        return self.__error
+
+    def __publicar(self):
+        """
+        Aplica los cambios pendientes y escribe la nueva generación; se llama
+        con __publicacion tomado.
+
+        Returns:
+            int: Bytes copiados a la memoria compartida
+
+        Raises:
+            ValueError: Si los datos no entran en la capacidad del segmento
+        """
+        with self.__candado:
+            pendientes, self.__pendientes = self.__pendientes, []
+        for evento in pendientes:
+            self.__aplicar(evento)
+
+        catalogo = json.dumps({
+            "medicos": list(self.__medicos),
+            "nombres_medicos": self.__nombres_medicos,
+            "especialidades": list(self.__especialidades),
+        }, ensure_ascii=False).encode("utf-8")
+        self.__verificar_capacidad(len(catalogo))
+
+        generacion = self.__generacion + 1
+        ranura = generacion % 2
+        buf = self.__memoria.buf
+        disposicion = self.__disposicion
+        inicio = disposicion.inicio_ranura(ranura)
+        pacientes_escritos, turnos_validos = self.__validos[ranura]
+
+        # Avisar a los lectores de la ranura que se va a reescribir
+        struct.pack_into("<Q", buf, 8, generacion)
+        copiados = 0
+
+        cantidad_pacientes = len(self.__orden_dni)
+        if cantidad_pacientes > pacientes_escritos:
+            desde = REGISTRO_PACIENTE.size * pacientes_escritos
+            datos = self.__registros_pacientes[desde:]
+            buf[inicio + disposicion.pacientes + desde:inicio + disposicion.pacientes + desde + len(datos)] = datos
+            copiados += len(datos)
+
+            desde_blob = REGISTRO_PACIENTE.unpack_from(self.__registros_pacientes, desde)[0]
+            datos = self.__blob[desde_blob:]
+            buf[inicio + disposicion.blob + desde_blob:inicio + disposicion.blob + len(self.__blob)] = datos
+            copiados += len(datos)
+
+            datos = struct.pack(f"<{cantidad_pacientes}I", *self.__orden_dni)
+            buf[inicio + disposicion.orden_dni:inicio + disposicion.orden_dni + len(datos)] = datos
+            copiados += len(datos)
+
+        desde = REGISTRO_TURNO.size * turnos_validos
+        datos = self.__turnos[desde:]
+        buf[inicio + disposicion.turnos + desde:inicio + disposicion.turnos + len(self.__turnos)] = datos
+        copiados += len(datos)
+
+        buf[inicio + disposicion.catalogo:inicio + disposicion.catalogo + len(catalogo)] = catalogo
+        copiados += len(catalogo)
+
+        ENCABEZADO_RANURA.pack_into(buf, inicio, cantidad_pacientes, len(self.__claves),
+                                    len(self.__blob), len(catalogo))
+        self.__validos[ranura] = [cantidad_pacientes, len(self.__claves)]
+
+        # Anunciar la nueva generación
+        struct.pack_into("<Q", buf, 16, generacion)
+        self.__generacion = generacion
+        return copiados
+
+    def iniciar(self, intervalo=1.0):
+        """
+        Publica una nueva generación cada `intervalo` segundos en un hilo,
+        solo si hubo cambios.
+
+        Si los datos dejan de entrar en el segmento, el hilo termina y el
+        error queda disponible en obtener_error().
+
+        Args:
+            intervalo (float): Segundos entre publicaciones
+        """
+        if self.__hilo is not None and self.__hilo.is_alive():
+            return
+        self.__detener.clear()
+        self.__error = None
+
+        def publicar_periodicamente():
+            while not self.__detener.wait(intervalo):
+                with self.__candado:
+                    hay_cambios = bool(self.__pendientes)
+                if hay_cambios:
+                    try:
+                        self.publicar()
+                    except ValueError as e:
+                        self.__error = e
+                        return
+
+        self.__hilo = threading.Thread(target=publicar_periodicamente, daemon=True)
+        self.__hilo.start()
+
+    def detener(self):
+        """
+        Detiene la publicación periódica.
+        """
+        if self.__hilo is not None:
+            self.__detener.set()
+            self.__hilo.join()
+            self.__hilo = None
+
+    def cerrar(self):
+        """
+        Detiene la publicación, deja de seguir a la clínica y elimina el segmento.
+        """
+        self.detener()
+        self.__suscripcion.cancelar()
+        self.__memoria.close()
+        # Un lector que comparte el resource_tracker con este proceso pudo haber
+        # quitado el registro del segmento; se repone para que unlink lo encuentre
+        resource_tracker.register(self.__memoria._name, "shared_memory")
+        self.__memoria.unlink()
+
+    def __recibir(self, evento):
+        """
+        Anota un evento de la clínica para aplicarlo en la próxima publicación.
+
+        Solo se anotan los eventos que cambian pacientes o turnos.
+        HISTORIAS_ARCHIVADAS no se anota: archivar solo comprime el texto de
+        las historias clínicas y los turnos archivados siguen en la clínica,
+        así que la réplica debe seguir mostrándolos.
+
+        Args:
+            evento (Evento): Evento recibido
+        """
+        if evento.obtener_tipo() in EVENTOS_REPLICADOS:
+            with self.__candado:
+                self.__pendientes.append(evento)
+
+    def __aplicar(self, evento):
+        """
+        Aplica un evento a los datos codificados.
+
+        Args:
+            evento (Evento): Evento a aplicar
+        """
+        tipo = evento.obtener_tipo()
+        if tipo == Evento.PACIENTE_AGREGADO:
+            self.__agregar_paciente(evento.obtener("paciente"))
+        elif tipo == Evento.TURNO_AGENDADO:
+            self.__agregar_turno(evento.obtener("turno"))
+        elif tipo == Evento.SERIE_AGENDADA:
+            for turno in evento.obtener("serie").turnos():
+                self.__agregar_turno(turno)
+        elif tipo == Evento.TURNO_CANCELADO:
+            self.__quitar_turno(evento.obtener("turno"))
+
+    def __agregar_paciente(self, paciente):
+        """
+        Codifica un paciente nuevo.
+
+        Args:
+            paciente (Paciente): Paciente agregado
+        """
+        dni = paciente.obtener_dni()
+        if dni in self.__indice_paciente:
+            return
+
+        texto = SEPARADOR.join((dni, paciente.obtener_nombre(), paciente.obtener_fecha_nacimiento())).encode("utf-8")
+        indice = len(self.__indice_paciente)
+        self.__indice_paciente[dni] = indice
+        self.__registros_pacientes += REGISTRO_PACIENTE.pack(len(self.__blob), len(texto))
+        self.__blob += texto
+
+        posicion = bisect_left(self.__dnis, dni)
+        self.__dnis.insert(posicion, dni)
+        self.__orden_dni.insert(posicion, indice)
+
+    def __agregar_turno(self, turno):
+        """
+        Codifica un turno en su posición cronológica.
+
+        Args:
+            turno (Turno): Turno agendado
+        """
+        medico = turno.obtener_medico()
+        matricula = medico.obtener_matricula()
+        if matricula not in self.__medicos:
+            self.__medicos[matricula] = len(self.__medicos)
+            self.__nombres_medicos.append(medico.obtener_nombre())
+        especialidad = turno.obtener_especialidad()
+        if especialidad not in self.__especialidades:
+            self.__especialidades[especialidad] = len(self.__especialidades)
+
+        clave = (_segundos(turno.obtener_fecha_hora()), self.__medicos[matricula])
+        posicion = bisect_left(self.__claves, clave)
+        if posicion < len(self.__claves) and self.__claves[posicion] == clave:
+            return
+
+        paciente = self.__indice_paciente[turno.obtener_paciente().obtener_dni()]
+        registro = REGISTRO_TURNO.pack(clave[0], paciente, clave[1], self.__especialidades[especialidad])
+        self.__claves.insert(posicion, clave)
+        desde = REGISTRO_TURNO.size * posicion
+        self.__turnos[desde:desde] = registro
+        self.__invalidar_turnos(posicion)
+
+    def __quitar_turno(self, turno):
+        """
+        Quita un turno cancelado.
+
+        Args:
+            turno (Turno): Turno cancelado
+        """
+        medico = self.__medicos.get(turno.obtener_medico().obtener_matricula())
+        clave = (_segundos(turno.obtener_fecha_hora()), medico)
+        posicion = bisect_left(self.__claves, clave) if medico is not None else len(self.__claves)
+        if posicion == len(self.__claves) or self.__claves[posicion] != clave:
+            return
+
+        del self.__claves[posicion]
+        desde = REGISTRO_TURNO.size * posicion
+        del self.__turnos[desde:desde + REGISTRO_TURNO.size]
+        self.__invalidar_turnos(posicion)
+
+    def __invalidar_turnos(self, posicion):
+        """
+        Marca que los turnos desde una posición cambiaron en ambas ranuras.
+
+        Args:
+            posicion (int): Primera posición modificada
+        """
+        for validos in self.__validos:
+            validos[1] = min(validos[1], posicion)
+
+    def __verificar_capacidad(self, bytes_catalogo):
+        """
+        Verifica que los datos entren en el segmento.
+
+        Args:
+            bytes_catalogo (int): Tamaño del catálogo codificado
+
+        Raises:
+            ValueError: Si alguna región no alcanza
+        """
+        disposicion = self.__disposicion
+        if (len(self.__orden_dni) > disposicion.max_pacientes or len(self.__claves) > disposicion.max_turnos
+                or len(self.__blob) > disposicion.bytes_blob or bytes_catalogo > disposicion.bytes_catalogo):
+            raise ValueError("La réplica no tiene capacidad para los datos de la clínica")
+
+
+class VistaReplica:
+    """
+    Acceso a una generación de la réplica, para usar dentro de LectorReplica.consultar.
+
+    Lee directamente de la memoria compartida: solo se decodifican los
+    registros que se consultan.
+
+    Atributos:
+        __buf (memoryview): Memoria del segmento
+        __disposicion (_Disposicion): Posiciones de las regiones
+        __inicio (int): Desplazamiento de la ranura
+        __pacientes (int): Cantidad de pacientes
+        __turnos (int): Cantidad de turnos
+        __catalogo (dict): Médicos y especialidades
+    """
+
+    def __init__(self, buf, disposicion, ranura, catalogos):
+        """
+        Inicializa la vista de una ranura.
+
+        Args:
+            buf (memoryview): Memoria del segmento
+            disposicion (_Disposicion): Posiciones de las regiones
+            ranura (int): Ranura a leer
+            catalogos (dict[tuple[int, int], dict]): Catálogos ya decodificados, por
+                (ranura, tamaño); se actualiza
+        """
+        self.__buf = buf
+        self.__disposicion = disposicion
+        self.__inicio = disposicion.inicio_ranura(ranura)
+        self.__pacientes, self.__turnos, _, bytes_catalogo = ENCABEZADO_RANURA.unpack_from(buf, self.__inicio)
+
+        inicio_catalogo = self.__inicio + disposicion.catalogo
+        datos = bytes(buf[inicio_catalogo:inicio_catalogo + bytes_catalogo])
+        catalogo = catalogos.get(ranura)
+        if catalogo is None or catalogo[0] != datos:
+            catalogo = (datos, json.loads(datos.decode("utf-8")))
+            catalogos[ranura] = catalogo
+        self.__catalogo = catalogo[1]
+
+    def cantidad_pacientes(self):
+        """
+        Devuelve la cantidad de pacientes.
+
+        Returns:
+            int: Pacientes de la réplica
+        """
+        return self.__pacientes
+
+    def cantidad_turnos(self):
+        """
+        Devuelve la cantidad de turnos.
+
+        Returns:
+            int: Turnos de la réplica
+        """
+        return self.__turnos
+
+    def obtener_paciente(self, dni):
+        """
+        Busca un paciente por DNI con búsqueda binaria.
+
+        Args:
+            dni (str): DNI del paciente
+
+        Returns:
+            tuple[str, str, str] | None: DNI, nombre y fecha de nacimiento, o None si no está
+        """
+        inicio = self.__inicio + self.__disposicion.orden_dni
+        bajo, alto = 0, self.__pacientes
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            actual = self.__paciente(POSICION.unpack_from(self.__buf, inicio + POSICION.size * medio)[0])
+            if actual[0] < dni:
+                bajo = medio + 1
+            else:
+                alto = medio
+        if bajo < self.__pacientes:
+            actual = self.__paciente(POSICION.unpack_from(self.__buf, inicio + POSICION.size * bajo)[0])
+            if actual[0] == dni:
+                return actual
+        return None
+
+    def turnos_entre(self, desde=None, hasta=None):
+        """
+        Devuelve los turnos de un rango de fechas en orden cronológico.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+
+        Returns:
+            list[tuple[datetime, str, str, str]]: Fecha y hora, DNI, matrícula y especialidad
+        """
+        medicos = self.__catalogo["medicos"]
+        especialidades = self.__catalogo["especialidades"]
+        turnos = []
+        for segundos, paciente, medico, especialidad in self.__registros(desde, hasta):
+            turnos.append((EPOCA + timedelta(seconds=segundos), self.__paciente(paciente)[0],
+                           medicos[medico], especialidades[especialidad]))
+        return turnos
+
+    def contar_turnos(self, desde=None, hasta=None, por="especialidad"):
+        """
+        Cuenta los turnos de un rango de fechas agrupados por especialidad o médico.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+            por (str): "especialidad" o "medico"
+
+        Returns:
+            dict[str, int]: Especialidad o matrícula -> cantidad de turnos
+
+        Raises:
+            ValueError: Si el agrupamiento no es válido
+        """
+        if por not in ("especialidad", "medico"):
+            raise ValueError("Solo se puede agrupar por 'especialidad' o por 'medico'")
+        nombres = self.__catalogo["especialidades" if por == "especialidad" else "medicos"]
+        campo = 3 if por == "especialidad" else 2
+
+        cantidades = [0] * len(nombres)
+        for registro in self.__registros(desde, hasta):
+            cantidades[registro[campo]] += 1
+        return {nombre: cantidad for nombre, cantidad in zip(nombres, cantidades) if cantidad}
+
+    def __paciente(self, indice):
+        """
+        Decodifica un paciente por su posición.
+
+        Args:
+            indice (int): Posición del paciente
+
+        Returns:
+            tuple[str, str, str]: DNI, nombre y fecha de nacimiento
+        """
+        inicio = self.__inicio + self.__disposicion.pacientes + REGISTRO_PACIENTE.size * indice
+        desplazamiento, largo = REGISTRO_PACIENTE.unpack_from(self.__buf, inicio)
+        inicio = self.__inicio + self.__disposicion.blob + desplazamiento
+        return tuple(str(self.__buf[inicio:inicio + largo], "utf-8").split(SEPARADOR))
+
+    def __registros(self, desde, hasta):
+        """
+        Recorre los registros de turnos de un rango sin copiarlos.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+
+        Returns:
+            iterator[tuple[int, int, int, int]]: Segundos, paciente, médico y especialidad
+        """
+        primero = 0 if desde is None else self.__buscar(_segundos(desde))
+        ultimo = self.__turnos if hasta is None else self.__buscar(_segundos(hasta))
+        inicio = self.__inicio + self.__disposicion.turnos
+        return REGISTRO_TURNO.iter_unpack(
+            self.__buf[inicio + REGISTRO_TURNO.size * primero:inicio + REGISTRO_TURNO.size * max(primero, ultimo)]
+        )
+
+    def __buscar(self, segundos):
+        """
+        Busca la posición del primer turno que no es anterior a un momento.
+
+        Args:
+            segundos (int): Momento en segundos desde EPOCA
+
+        Returns:
+            int: Posición del turno
+        """
+        inicio = self.__inicio + self.__disposicion.turnos
+        bajo, alto = 0, self.__turnos
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if struct.unpack_from("<q", self.__buf, inicio + REGISTRO_TURNO.size * medio)[0] < segundos:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+
+
+class LectorReplica:
+    """
+    Conexión de un proceso de reportes a la réplica publicada por PublicadorReplica.
+
+    Atributos:
+        __memoria (shared_memory.SharedMemory): Segmento compartido
+        __disposicion (_Disposicion): Posiciones de las regiones
+        __catalogos (dict): Catálogos decodificados por ranura
+    """
+
+    def __init__(self, nombre):
+        """
+        Se conecta a un segmento existente.
+
+        Args:
+            nombre (str): Nombre del segmento (PublicadorReplica.obtener_nombre())
+
+        Raises:
+            FileNotFoundError: Si el segmento no existe
+            ValueError: Si el segmento no es una réplica de la clínica
+        """
+        self.__memoria = shared_memory.SharedMemory(name=nombre)
+        # El segmento pertenece al publicador: el lector no debe eliminarlo al terminar
+        resource_tracker.unregister(self.__memoria._name, "shared_memory")
+
+        magia, version, _, _, *capacidades = ENCABEZADO.unpack_from(self.__memoria.buf, 0)
+        if magia != MAGIA or version != VERSION:
+            self.__memoria.close()
+            raise ValueError(f"El segmento {nombre} no es una réplica de la clínica")
+        self.__disposicion = _Disposicion(*capacidades)
+        self.__catalogos = {}
+
+    def obtener_generacion(self):
+        """
+        Devuelve la última generación publicada.
+
+        Returns:
+            int: Número de generación
+        """
+        return struct.unpack_from("<Q", self.__memoria.buf, 16)[0]
+
+    def consultar(self, funcion):
+        """
+        Ejecuta una consulta sobre una generación consistente de la réplica.
+
+        Si durante la consulta el publicador empezó a reescribir la ranura
+        leída, la consulta se repite sobre la generación más reciente. Por
+        eso `funcion` debe devolver datos ya leídos, no la vista.
+
+        Args:
+            funcion (callable): Recibe una VistaReplica y devuelve el resultado
+
+        Returns:
+            El resultado de `funcion`
+
+        Raises:
+            RuntimeError: Si no se logra una lectura consistente tras MAXIMO_REINTENTOS
+        """
+        buf = self.__memoria.buf
+        for _ in range(MAXIMO_REINTENTOS):
+            generacion = struct.unpack_from("<Q", buf, 16)[0]
+            try:
+                resultado = funcion(VistaReplica(buf, self.__disposicion, generacion % 2, self.__catalogos))
+                error = None
+            except Exception as e:
+                resultado, error = None, e
+
+            # La ranura leída se reescribe recién al preparar la generación + 2
+            if struct.unpack_from("<Q", buf, 8)[0] < generacion + 2:
+                if error is not None:
+                    raise error
+                return resultado
+            time.sleep(ESPERA_REINTENTO)
+
+        raise RuntimeError("No se pudo leer una generación consistente de la réplica")
+
+    def obtener_paciente(self, dni):
+        """
+        Busca un paciente por DNI.
+
+        Args:
+            dni (str): DNI del paciente
+
+        Returns:
+            tuple[str, str, str] | None: DNI, nombre y fecha de nacimiento, o None si no está
+        """
+        return self.consultar(lambda vista: vista.obtener_paciente(dni))
+
+    def turnos_entre(self, desde=None, hasta=None):
+        """
+        Devuelve los turnos de un rango de fechas en orden cronológico.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+
+        Returns:
+            list[tuple[datetime, str, str, str]]: Fecha y hora, DNI, matrícula y especialidad
+        """
+        return self.consultar(lambda vista: vista.turnos_entre(desde, hasta))
+
+    def contar_turnos(self, desde=None, hasta=None, por="especialidad"):
+        """
+        Cuenta los turnos de un rango de fechas agrupados por especialidad o médico.
+
+        Args:
+            desde (datetime): Fecha y hora inicial, incluida (None: sin límite)
+            hasta (datetime): Fecha y hora final, excluida (None: sin límite)
+            por (str): "especialidad" o "medico"
+
+        Returns:
+            dict[str, int]: Especialidad o matrícula -> cantidad de turnos
+        """
+        return self.consultar(lambda vista: vista.contar_turnos(desde, hasta, por))
+
+    def cerrar(self):
+        """
+        Se desconecta del segmento sin eliminarlo.
+        """
+        self.__memoria.close()
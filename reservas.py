@@ -0,0 +1,288 @@
+"""
+Canal de reservas en línea para la clínica.
+
+Las reservas llegan en ráfagas desde muchos hilos. En lugar de que cada una
+tome el candado de la clínica y escriba el diario por su cuenta, se encolan
+en una cola acotada y un único hilo consumidor las agrupa en lotes: cada
+lote se valida y se agenda con una sola toma del candado, y los turnos
+agendados se escriben en el diario con una sola escritura y un solo
+vaciado a disco. El resultado de cada reserva se entrega en un Future.
+
+Si la cola se llena, solicitar() bloquea al productor hasta que haya lugar
+(o hasta su timeout), de modo que una ráfaga no puede acumular memoria sin
+límite.
+"""
+
+import json
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+# Capacidad de la cola de reservas pendientes
+TAMANIO_COLA = 10_000
+
+# Cantidad máxima de reservas por lote
+TAMANIO_LOTE = 256
+
+# Segundos que el consumidor espera más reservas para completar un lote
+ESPERA_LOTE = 0.002
+
+
+class CanalReservas:
+    """
+    Cola acotada de reservas de turnos que se agendan por lotes.
+
+    Atributos:
+        __clinica (Clinica): Clínica donde se agendan los turnos
+        __pendientes (deque): Reservas encoladas (dni, matrícula, especialidad, fecha y hora, Future)
+        __capacidad (int): Cantidad máxima de reservas encoladas
+        __hay_lugar (threading.Condition): Avisa a los productores que se liberó lugar en la cola
+        __hay_reservas (threading.Condition): Avisa al consumidor que hay reservas o que se cerró
+            el canal; comparte el candado de la cola con __hay_lugar
+        __candado (threading.Lock): Serializa las modificaciones de la clínica
+        __tamanio_lote (int): Cantidad máxima de reservas por lote
+        __espera_lote (float): Segundos de espera para completar un lote
+        __diario (file): Diario de turnos agendados (binario, sin búfer), o None
+        __sincronizar (bool): Forzar la escritura del diario a disco en cada lote
+        __cerrado (bool): True si ya no se aceptan reservas
+        __lotes (int): Lotes procesados
+        __procesadas (int): Reservas procesadas
+        __mayor_lote (int): Tamaño del lote más grande
+        __hilo (threading.Thread): Hilo consumidor
+    """
+
+    def __init__(self, clinica, diario=None, tamanio_cola=TAMANIO_COLA, tamanio_lote=TAMANIO_LOTE,
+                 espera_lote=ESPERA_LOTE, sincronizar=True, candado=None):
+        """
+        Inicializa el canal y arranca el hilo consumidor.
+
+        Args:
+            clinica (Clinica): Clínica donde se agendan los turnos
+            diario (str): Ruta del diario de turnos agendados (None: sin diario)
+            tamanio_cola (int): Capacidad de la cola de reservas pendientes
+            tamanio_lote (int): Cantidad máxima de reservas por lote
+            espera_lote (float): Segundos que se esperan más reservas para completar un lote
+            sincronizar (bool): Forzar la escritura del diario a disco (fsync) en cada lote
+            candado (threading.Lock): Candado compartido con otros hilos que
+                modifican la clínica (None: uno propio)
+
+        Raises:
+            ValueError: Si la capacidad de la cola o el tamaño del lote no son positivos
+        """
+        if tamanio_cola < 1 or tamanio_lote < 1:
+            raise ValueError("La capacidad de la cola y el tamaño del lote deben ser positivos")
+
+        self.__clinica = clinica
+        self.__pendientes = deque()
+        self.__capacidad = tamanio_cola
+        cola = threading.Lock()
+        self.__hay_lugar = threading.Condition(cola)
+        self.__hay_reservas = threading.Condition(cola)
+        self.__candado = candado if candado is not None else threading.Lock()
+        self.__tamanio_lote = tamanio_lote
+        self.__espera_lote = espera_lote
+        # Sin búfer: las líneas de un lote fallido no quedan pendientes para el próximo
+        self.__diario = open(diario, "ab", buffering=0) if diario is not None else None
+        self.__sincronizar = sincronizar
+        self.__cerrado = False
+        self.__lotes = 0
+        self.__procesadas = 0
+        self.__mayor_lote = 0
+        self.__hilo = threading.Thread(target=self.__consumir, daemon=True)
+        self.__hilo.start()
+
+    def obtener_candado(self):
+        """
+        Devuelve el candado que protege a la clínica, para que otros hilos
+        que la modifican lo tomen.
+
+        Returns:
+            threading.Lock: Candado de la clínica
+        """
+        return self.__candado
+
+    def solicitar(self, dni, matricula, especialidad, fecha_hora, timeout=None):
+        """
+        Encola una reserva.
+
+        Si la cola está llena, espera a que haya lugar.
+
+        Args:
+            dni (str): DNI del paciente
+            matricula (str): Matrícula del médico
+            especialidad (str): Especialidad solicitada
+            fecha_hora (datetime): Fecha y hora del turno
+            timeout (float): Segundos máximos de espera por lugar en la cola (None: sin límite)
+
+        Returns:
+            Future: Se resuelve con el Turno agendado, con la excepción de
+                Clinica.agendar_turno si la reserva no es válida, o con el
+                OSError del diario si no se pudo registrar (el turno se cancela)
+
+        Raises:
+            RuntimeError: Si el canal está cerrado
+            queue.Full: Si la cola siguió llena durante todo el timeout
+        """
+        futuro = Future()
+        with self.__hay_lugar:
+            if not self.__hay_lugar.wait_for(lambda: self.__cerrado or len(self.__pendientes) < self.__capacidad,
+                                             timeout):
+                raise queue.Full
+            if self.__cerrado:
+                raise RuntimeError("El canal de reservas está cerrado")
+            self.__pendientes.append((dni, matricula, especialidad, fecha_hora, futuro))
+            # Solo se despierta al consumidor si estaba esperando reservas o un lote completo
+            if len(self.__pendientes) in (1, self.__tamanio_lote):
+                self.__hay_reservas.notify()
+        return futuro
+
+    def obtener_estadisticas(self):
+        """
+        Devuelve la cantidad de lotes y reservas procesados.
+
+        Returns:
+            dict: 'lotes', 'reservas' y 'mayor_lote'
+        """
+        return {"lotes": self.__lotes, "reservas": self.__procesadas, "mayor_lote": self.__mayor_lote}
+
+    def cerrar(self):
+        """
+        Deja de aceptar reservas, espera a que se procesen las pendientes y
+        cierra el diario.
+        """
+        with self.__hay_reservas:
+            if self.__cerrado:
+                return
+            self.__cerrado = True
+            self.__hay_reservas.notify()
+            self.__hay_lugar.notify_all()
+        self.__hilo.join()
+        if self.__diario is not None:
+            self.__diario.close()
+
+    def __consumir(self):
+        """
+        Toma reservas de la cola en lotes y los procesa hasta que se cierra
+        el canal y no quedan reservas.
+        """
+        while True:
+            with self.__hay_reservas:
+                self.__hay_reservas.wait_for(lambda: self.__cerrado or self.__pendientes)
+                if not self.__pendientes:
+                    return
+                # Con un lote incompleto se espera un poco a que lleguen más reservas
+                self.__hay_reservas.wait_for(
+                    lambda: self.__cerrado or len(self.__pendientes) >= self.__tamanio_lote, self.__espera_lote)
+                cantidad = min(len(self.__pendientes), self.__tamanio_lote)
+                lote = [self.__pendientes.popleft() for _ in range(cantidad)]
+                self.__hay_lugar.notify(cantidad)
+            self.__procesar(lote)
+
+    def __procesar(self, lote):
+        """
+        Agenda un lote de reservas con una sola toma del candado y escribe
+        los turnos agendados en el diario con un solo vaciado.
+
+        Los Future se resuelven después de escribir el diario: un turno
+        entregado ya está registrado. Si el diario no se puede escribir, los
+        turnos del lote se cancelan antes de entregar el error. Cualquier
+        otro error se entrega en los Future del lote que sigan sin resolver,
+        de modo que ninguna reserva queda esperando para siempre.
+
+        Args:
+            lote (list[tuple]): Reservas (dni, matrícula, especialidad, fecha y hora, Future)
+        """
+        resultados = []
+        try:
+            with self.__candado:
+                for dni, matricula, especialidad, fecha_hora, futuro in lote:
+                    if not futuro.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        turno = self.__clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
+                        resultados.append((futuro, turno, None))
+                    except Exception as e:
+                        resultados.append((futuro, None, e))
+
+                agendados = [turno for _, turno, _ in resultados if turno is not None]
+                try:
+                    self.__escribir_diario(agendados)
+                except OSError as e:
+                    # Sin registro en el diario, los turnos no pueden quedar agendados
+                    self.__deshacer(agendados)
+                    resultados = [(futuro, None, error or e) for futuro, _, error in resultados]
+        except Exception as e:
+            for *_, futuro in lote:
+                if not futuro.done() and (futuro.running() or futuro.set_running_or_notify_cancel()):
+                    futuro.set_exception(e)
+            resultados = []
+
+        self.__lotes += 1
+        self.__procesadas += len(lote)
+        self.__mayor_lote = max(self.__mayor_lote, len(lote))
+        for futuro, turno, error in resultados:
+            if error is not None:
+                futuro.set_exception(error)
+            else:
+                futuro.set_result(turno)
+
+    def __deshacer(self, turnos):
+        """
+        Quita de la clínica los turnos agendados de un lote, del último al
+        primero, sin asignar los horarios a la lista de espera.
+
+        Args:
+            turnos (list[Turno]): Turnos agendados en el lote
+        """
+        for turno in reversed(turnos):
+            self.__clinica.deshacer_turno(turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora())
+
+    def __escribir_diario(self, turnos):
+        """
+        Agrega los turnos agendados al diario.
+
+        Si la escritura falla, se intenta recortar el diario a su tamaño
+        anterior para no dejar registrado un lote a medias.
+
+        Args:
+            turnos (list[Turno]): Turnos agendados en el lote
+
+        Raises:
+            OSError: Si no se pudo escribir o sincronizar el diario
+        """
+        if self.__diario is None or not turnos:
+            return
+        datos = memoryview("".join(json.dumps(registro_diario(turno), ensure_ascii=False) + "\n"
+                                   for turno in turnos).encode("utf-8"))
+        inicio = os.fstat(self.__diario.fileno()).st_size
+        try:
+            while datos:
+                datos = datos[self.__diario.write(datos):]
+            if self.__sincronizar:
+                os.fsync(self.__diario.fileno())
+        except OSError:
+            try:
+                self.__diario.truncate(inicio)
+            except OSError:
+                pass
+            raise
+
+
+def registro_diario(turno):
+    """
+    Arma la línea del diario de un turno agendado.
+
+    Args:
+        turno (Turno): Turno agendado
+
+    Returns:
+        dict: DNI, matrícula, especialidad y fecha y hora del turno
+    """
+    return {
+        "dni": turno.obtener_paciente().obtener_dni(),
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "especialidad": turno.obtener_especialidad(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+    }
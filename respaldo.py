@@ -0,0 +1,520 @@
+"""
+Respaldos incrementales de la clínica.
+
+Un respaldo completo guarda todos los pacientes, médicos, turnos, series y
+recetas, y las fechas de corte con las que se archivaron las historias
+clínicas. Los siguientes respaldos son diferenciales: guardan solo los
+cambios publicados en el feed de la clínica desde el respaldo anterior, de
+modo que su costo depende de la actividad del período y no del tamaño de la
+clínica. Cada tanto se vuelve a hacer un respaldo completo para que la
+restauración no tenga que aplicar una cadena de diferenciales muy larga.
+
+Cada respaldo es un archivo JSON Lines comprimido con gzip, con un número
+creciente en el nombre. La primera línea es un encabezado con el número del
+respaldo completo en el que se basa y el rango de secuencias del feed que
+cubre; restaurar() toma el último completo y le aplica sus diferenciales en
+orden, verificando que no falte ninguno.
+"""
+
+import gzip
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from modelo.clinica import Clinica
+from modelo.eventos import Evento
+from modelo.excepciones import EventosNoDisponiblesException
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.turno import Turno
+from modelo.serie_turnos import SerieTurnos
+from modelo.receta import Receta
+
+# Cantidad de respaldos diferenciales entre dos completos
+DIFERENCIALES_POR_COMPLETO = 30
+
+# Nivel de compresión de gzip (1 es el más rápido, 9 el más compacto)
+NIVEL_COMPRESION = 6
+
+COMPLETO = "completo"
+DIFERENCIAL = "diferencial"
+PATRON_ARCHIVO = re.compile(r"^(\d{8})-(completo|diferencial)\.jsonl\.gz$")
+
+
+def _registro_medico(medico):
+    """
+    Arma el registro de un médico con sus especialidades.
+
+    Args:
+        medico (Medico): Médico
+
+    Returns:
+        dict: Registro del médico
+    """
+    return {
+        "tipo": "medico",
+        "matricula": medico.obtener_matricula(),
+        "nombre": medico.obtener_nombre(),
+        "especialidades": [[especialidad.obtener_especialidad(), especialidad.obtener_dias()]
+                           for especialidad in medico.obtener_especialidades()],
+    }
+
+
+def _registro_paciente(paciente):
+    """
+    Arma el registro de un paciente.
+
+    Args:
+        paciente (Paciente): Paciente
+
+    Returns:
+        dict: Registro del paciente
+    """
+    return {
+        "tipo": "paciente",
+        "dni": paciente.obtener_dni(),
+        "nombre": paciente.obtener_nombre(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento(),
+    }
+
+
+def _registro_turno(turno, tipo="turno"):
+    """
+    Arma el registro de un turno agendado o cancelado.
+
+    Args:
+        turno (Turno): Turno
+        tipo (str): "turno" o "cancelacion"
+
+    Returns:
+        dict: Registro del turno
+    """
+    registro = {
+        "tipo": tipo,
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+    }
+    if tipo == "turno":
+        registro["dni"] = turno.obtener_paciente().obtener_dni()
+        registro["especialidad"] = turno.obtener_especialidad()
+    return registro
+
+
+def _registro_serie(serie, canceladas):
+    """
+    Arma el registro de una serie.
+
+    Args:
+        serie (SerieTurnos): Serie
+        canceladas (list[datetime]): Ocurrencias canceladas a guardar
+
+    Returns:
+        dict: Registro de la serie
+    """
+    return {
+        "tipo": "serie",
+        "dni": serie.obtener_paciente().obtener_dni(),
+        "matricula": serie.obtener_medico().obtener_matricula(),
+        "especialidad": serie.obtener_especialidad(),
+        "inicio": serie.obtener_fecha_hora().isoformat(),
+        "intervalo": serie.obtener_intervalo().total_seconds(),
+        "cantidad": serie.obtener_cantidad(),
+        "canceladas": [fecha_hora.isoformat() for fecha_hora in canceladas],
+    }
+
+
+def _registro_receta(receta):
+    """
+    Arma el registro de una receta.
+
+    Args:
+        receta (Receta): Receta
+
+    Returns:
+        dict: Registro de la receta
+    """
+    return {
+        "tipo": "receta",
+        "dni": receta.obtener_paciente().obtener_dni(),
+        "matricula": receta.obtener_medico().obtener_matricula(),
+        "medicamentos": receta.obtener_medicamentos(),
+        "fecha": receta.obtener_fecha().isoformat(),
+    }
+
+
+def _registro_archivo(antes_de):
+    """
+    Arma el registro de un archivo de las historias clínicas.
+
+    Args:
+        antes_de (datetime): Fecha de corte del archivo
+
+    Returns:
+        dict: Registro del archivo
+    """
+    return {"tipo": "archivo", "antes_de": antes_de.isoformat()}
+
+
+def registros_clinica(clinica):
+    """
+    Recorre el estado completo de una clínica como registros.
+
+    Args:
+        clinica (Clinica): Clínica a respaldar
+
+    Yields:
+        dict: Registros de médicos, pacientes, turnos, series, recetas y
+            fechas de corte del archivo, en el orden en que deben restaurarse
+    """
+    medicos = clinica.obtener_medicos()
+    for medico in medicos:
+        yield _registro_medico(medico)
+    for paciente in clinica.obtener_pacientes():
+        yield _registro_paciente(paciente)
+
+    # Los turnos y las series se guardan en el orden en que se agendaron, que
+    # es el orden de las historias clínicas
+    series = {}
+    for serie in clinica.obtener_series():
+        matricula = serie.obtener_medico().obtener_matricula()
+        series.update(((matricula, fecha_hora), serie) for fecha_hora in serie.fechas())
+    guardadas = set()
+    for turno in clinica.obtener_turnos():
+        serie = series.get((turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora()))
+        if serie is None:
+            yield _registro_turno(turno)
+        elif id(serie) not in guardadas:
+            guardadas.add(id(serie))
+            yield _registro_serie(serie, serie.obtener_canceladas())
+
+    recetas = clinica.obtener_indice_recetas()
+    todas = [receta for medico in medicos for receta in recetas.obtener_por_medico(medico.obtener_matricula())]
+    for receta in sorted(todas, key=lambda receta: receta.obtener_fecha()):
+        yield _registro_receta(receta)
+
+    # Las entradas archivadas siguen en la clínica; basta con volver a archivar
+    for antes_de in clinica.obtener_cortes_archivo():
+        yield _registro_archivo(antes_de)
+
+
+def registros_evento(evento):
+    """
+    Convierte un evento del feed en los registros que lo reproducen.
+
+    Las series se guardan sin cancelaciones: cada cancelación posterior
+    tiene su propio evento. Los eventos de la lista de espera no se
+    respaldan; una promoción se reproduce con el turno que agendó. Un
+    archivo de historias se reproduce volviendo a archivar con la misma
+    fecha de corte.
+
+    Args:
+        evento (Evento): Evento de la clínica
+
+    Returns:
+        list[dict]: Registros (vacía si el evento no se respalda)
+    """
+    tipo = evento.obtener_tipo()
+    if tipo == Evento.PACIENTE_AGREGADO:
+        return [_registro_paciente(evento.obtener("paciente"))]
+    if tipo == Evento.MEDICO_AGREGADO:
+        return [_registro_medico(evento.obtener("medico"))]
+    if tipo == Evento.ESPECIALIDAD_AGREGADA:
+        especialidad = evento.obtener("especialidad")
+        return [{
+            "tipo": "especialidad",
+            "matricula": evento.obtener("medico").obtener_matricula(),
+            "especialidad": especialidad.obtener_especialidad(),
+            "dias": especialidad.obtener_dias(),
+        }]
+    if tipo == Evento.TURNO_AGENDADO:
+        return [_registro_turno(evento.obtener("turno"))]
+    if tipo == Evento.TURNO_CANCELADO:
+        return [_registro_turno(evento.obtener("turno"), "cancelacion")]
+    if tipo == Evento.SERIE_AGENDADA:
+        return [_registro_serie(evento.obtener("serie"), [])]
+    if tipo == Evento.RECETA_EMITIDA:
+        return [_registro_receta(evento.obtener("receta"))]
+    if tipo == Evento.HISTORIAS_ARCHIVADAS:
+        return [_registro_archivo(evento.obtener("antes_de"))]
+    return []
+
+
+def listar_respaldos(directorio):
+    """
+    Lista los archivos de respaldo de un directorio.
+
+    Args:
+        directorio (str): Directorio de los respaldos
+
+    Returns:
+        list[tuple[int, str, str]]: Número, clase ("completo" o "diferencial") y
+            ruta de cada respaldo, ordenados por número
+    """
+    if not os.path.isdir(directorio):
+        return []
+    respaldos = []
+    for nombre in os.listdir(directorio):
+        coincidencia = PATRON_ARCHIVO.match(nombre)
+        if coincidencia:
+            respaldos.append((int(coincidencia.group(1)), coincidencia.group(2), os.path.join(directorio, nombre)))
+    return sorted(respaldos)
+
+
+def _leer(ruta):
+    """
+    Lee un archivo de respaldo.
+
+    Args:
+        ruta (str): Ruta del archivo
+
+    Returns:
+        tuple[dict, list[dict]]: Encabezado y registros
+    """
+    with gzip.open(ruta, "rt", encoding="utf-8") as archivo:
+        encabezado = json.loads(archivo.readline())
+        return encabezado, [json.loads(linea) for linea in archivo]
+
+
+class RespaldoIncremental:
+    """
+    Escribe respaldos completos y diferenciales de una clínica en un directorio.
+
+    Los cambios se toman de una suscripción sin límite al feed de la clínica.
+    Al crear el respaldo en una sesión nueva no se conoce la secuencia del
+    último respaldo escrito, así que el primero de la sesión es completo.
+    respaldar() debe llamarse desde el hilo que modifica la clínica.
+
+    Atributos:
+        __clinica (Clinica): Clínica respaldada
+        __directorio (str): Directorio de los respaldos
+        __diferenciales_por_completo (int): Diferenciales entre dos completos
+        __suscripcion (Suscripcion): Cambios pendientes de respaldar
+        __numero (int): Número del último respaldo del directorio
+        __base (int): Número del último completo de la sesión, o None
+        __diferenciales (int): Diferenciales escritos desde ese completo
+        __secuencia (int): Secuencia del feed cubierta por el último respaldo
+    """
+
+    def __init__(self, clinica, directorio, diferenciales_por_completo=DIFERENCIALES_POR_COMPLETO):
+        """
+        Inicializa el respaldo.
+
+        Args:
+            clinica (Clinica): Clínica a respaldar
+            directorio (str): Directorio de los respaldos (se crea si no existe)
+            diferenciales_por_completo (int): Diferenciales entre dos completos
+
+        Raises:
+            ValueError: Si la cantidad de diferenciales es negativa
+        """
+        if diferenciales_por_completo < 0:
+            raise ValueError("La cantidad de diferenciales entre completos no puede ser negativa")
+
+        os.makedirs(directorio, exist_ok=True)
+        self.__clinica = clinica
+        self.__directorio = directorio
+        self.__diferenciales_por_completo = diferenciales_por_completo
+        self.__suscripcion = clinica.suscribir_cambios()
+        respaldos = listar_respaldos(directorio)
+        self.__numero = respaldos[-1][0] if respaldos else 0
+        self.__base = None
+        self.__diferenciales = 0
+        self.__secuencia = 0
+
+    def respaldar(self, completo=False):
+        """
+        Escribe un respaldo diferencial con los cambios desde el anterior, o
+        uno completo si corresponde.
+
+        Args:
+            completo (bool): Forzar un respaldo completo
+
+        Returns:
+            str | None: Ruta del archivo escrito, o None si no hubo cambios
+        """
+        try:
+            eventos = self.__suscripcion.obtener_eventos()
+        except EventosNoDisponiblesException:
+            completo = True
+
+        if completo or self.__base is None or self.__diferenciales >= self.__diferenciales_por_completo:
+            return self.__respaldar_completo()
+
+        if not eventos:
+            return None
+
+        registros = [registro for evento in eventos for registro in registros_evento(evento)]
+        hasta = eventos[-1].obtener_secuencia()
+        ruta = self.__escribir(DIFERENCIAL, self.__secuencia, hasta, registros)
+        self.__diferenciales += 1
+        self.__secuencia = hasta
+        return ruta
+
+    def cerrar(self):
+        """
+        Deja de seguir los cambios de la clínica.
+        """
+        self.__suscripcion.cancelar()
+
+    def __respaldar_completo(self):
+        """
+        Escribe un respaldo completo.
+
+        Returns:
+            str: Ruta del archivo escrito
+        """
+        # Los eventos ya publicados quedan incluidos en el estado completo
+        self.__suscripcion.obtener_eventos()
+        secuencia = self.__clinica.obtener_ultima_secuencia()
+        ruta = self.__escribir(COMPLETO, 0, secuencia, registros_clinica(self.__clinica))
+        self.__base = self.__numero
+        self.__diferenciales = 0
+        self.__secuencia = secuencia
+        return ruta
+
+    def __escribir(self, clase, desde, hasta, registros):
+        """
+        Escribe un archivo de respaldo de forma atómica.
+
+        Args:
+            clase (str): "completo" o "diferencial"
+            desde (int): Secuencia cubierta por el respaldo anterior
+            hasta (int): Última secuencia cubierta por este respaldo
+            registros (iterable[dict]): Registros a guardar
+
+        Returns:
+            str: Ruta del archivo escrito
+        """
+        numero = self.__numero + 1
+        encabezado = {
+            "clase": clase,
+            "numero": numero,
+            "base": numero if clase == COMPLETO else self.__base,
+            "desde": desde,
+            "hasta": hasta,
+            "fecha": datetime.now().isoformat(),
+        }
+        ruta = os.path.join(self.__directorio, f"{numero:08d}-{clase}.jsonl.gz")
+        temporal = ruta + ".tmp"
+        with gzip.open(temporal, "wt", encoding="utf-8", compresslevel=NIVEL_COMPRESION) as archivo:
+            archivo.write(json.dumps(encabezado, ensure_ascii=False) + "\n")
+            for registro in registros:
+                archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        os.replace(temporal, ruta)
+        self.__numero = numero
+        return ruta
+
+
+class _Restauracion:
+    """
+    Aplica registros de respaldo a una clínica nueva.
+
+    Atributos:
+        __clinica (Clinica): Clínica restaurada
+        __pacientes (dict[str, Paciente]): DNI -> Paciente
+        __medicos (dict[str, Medico]): Matrícula -> Medico
+    """
+
+    def __init__(self):
+        """
+        Inicializa una restauración sobre una clínica vacía.
+        """
+        self.__clinica = Clinica()
+        self.__pacientes = {}
+        self.__medicos = {}
+
+    def obtener_clinica(self):
+        """
+        Devuelve la clínica restaurada.
+
+        Returns:
+            Clinica: Clínica con los registros aplicados
+        """
+        return self.__clinica
+
+    def aplicar(self, registro):
+        """
+        Aplica un registro.
+
+        Args:
+            registro (dict): Registro de un respaldo
+
+        Raises:
+            ValueError: Si el tipo de registro no es válido
+        """
+        tipo = registro["tipo"]
+        if tipo == "paciente":
+            paciente = Paciente(registro["nombre"], registro["dni"], registro["fecha_nacimiento"])
+            self.__clinica.agregar_paciente(paciente)
+            self.__pacientes[registro["dni"]] = paciente
+        elif tipo == "medico":
+            medico = Medico(registro["nombre"], registro["matricula"])
+            for nombre, dias in registro["especialidades"]:
+                medico.agregar_especialidad(Especialidad(nombre, dias))
+            self.__clinica.agregar_medico(medico)
+            self.__medicos[registro["matricula"]] = medico
+        elif tipo == "especialidad":
+            # El registro del médico pudo haberse escrito ya con esta especialidad
+            if not self.__medicos[registro["matricula"]].tiene_especialidad(registro["especialidad"]):
+                self.__clinica.agregar_especialidad_a_medico(
+                    registro["matricula"], Especialidad(registro["especialidad"], registro["dias"]))
+        elif tipo == "turno":
+            self.__clinica.restaurar_turno(Turno.restaurar(
+                self.__pacientes[registro["dni"]], self.__medicos[registro["matricula"]],
+                datetime.fromisoformat(registro["fecha_hora"]), registro["especialidad"]))
+        elif tipo == "cancelacion":
+            self.__clinica.restaurar_cancelacion(registro["matricula"], datetime.fromisoformat(registro["fecha_hora"]))
+        elif tipo == "serie":
+            self.__clinica.restaurar_serie(SerieTurnos.restaurar(
+                self.__pacientes[registro["dni"]], self.__medicos[registro["matricula"]],
+                registro["especialidad"], datetime.fromisoformat(registro["inicio"]),
+                timedelta(seconds=registro["intervalo"]), registro["cantidad"],
+                [datetime.fromisoformat(fecha_hora) for fecha_hora in registro["canceladas"]]))
+        elif tipo == "receta":
+            self.__clinica.restaurar_receta(Receta.restaurar(
+                self.__pacientes[registro["dni"]], self.__medicos[registro["matricula"]],
+                registro["medicamentos"], datetime.fromisoformat(registro["fecha"])))
+        elif tipo == "archivo":
+            self.__clinica.archivar_historias(datetime.fromisoformat(registro["antes_de"]))
+        else:
+            raise ValueError(f"Tipo de registro de respaldo desconocido: {tipo}")
+
+
+def restaurar(directorio, hasta=None):
+    """
+    Reconstruye una clínica a partir del último respaldo completo de un
+    directorio y de los diferenciales que le siguen.
+
+    Args:
+        directorio (str): Directorio de los respaldos
+        hasta (int): Si se indica, se restaura hasta ese número de respaldo inclusive
+
+    Returns:
+        Clinica: La clínica restaurada
+
+    Raises:
+        FileNotFoundError: Si no hay un respaldo completo
+        ValueError: Si falta un respaldo diferencial de la cadena
+    """
+    respaldos = [r for r in listar_respaldos(directorio) if hasta is None or r[0] <= hasta]
+    completos = [i for i, (_, clase, _) in enumerate(respaldos) if clase == COMPLETO]
+    if not completos:
+        raise FileNotFoundError(f"No hay respaldos completos en {directorio}")
+
+    restauracion = _Restauracion()
+    base = None
+    secuencia = None
+    for numero, clase, ruta in respaldos[completos[-1]:]:
+        encabezado, registros = _leer(ruta)
+        if base is None:
+            base = numero
+        elif encabezado["base"] != base:
+            continue
+        elif encabezado["desde"] != secuencia:
+            raise ValueError(f"Falta un respaldo diferencial antes del número {numero}")
+
+        for registro in registros:
+            restauracion.aplicar(registro)
+        secuencia = encabezado["hasta"]
+    return restauracion.obtener_clinica()
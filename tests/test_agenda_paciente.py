@@ -0,0 +1,38 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.agenda_paciente import AgendaPaciente
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.turno import Turno
+
+class TestAgendaPaciente(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Carla Ríos", "44556677", "12/12/1975")
+        self.medico = Medico("Dr. Paz", "P010")
+        self.base = (datetime.now() + timedelta(days=2)).replace(hour=10, minute=0, second=0, microsecond=0)
+        self.agenda = AgendaPaciente()
+        self.tarde = Turno(self.paciente, self.medico, self.base + timedelta(hours=5), "Clínica")
+        self.temprano = Turno(self.paciente, self.medico, self.base, "Clínica")
+        self.agenda.agregar(self.tarde)
+        self.agenda.agregar(self.temprano)
+
+    def test_proximo_en_orden_cronologico(self):
+        self.assertIs(self.agenda.obtener_proximo(), self.temprano)
+        self.assertEqual(self.agenda.obtener_proximos(), [self.temprano, self.tarde])
+
+    def test_superposicion(self):
+        duracion = timedelta(minutes=30)
+        self.assertTrue(self.agenda.tiene_superposicion(self.base + timedelta(minutes=15), duracion))
+        self.assertFalse(self.agenda.tiene_superposicion(self.base + timedelta(minutes=30), duracion))
+        self.assertFalse(self.agenda.tiene_superposicion(self.base - timedelta(minutes=30), duracion))
+
+    def test_descarta_turnos_pasados(self):
+        ahora = self.base + timedelta(hours=1)
+        self.assertIs(self.agenda.obtener_proximo(ahora), self.tarde)
+        self.assertEqual(len(self.agenda), 1)
+
+    def test_quitar(self):
+        self.agenda.quitar(self.temprano)
+        self.assertIs(self.agenda.obtener_proximo(), self.tarde)
+        self.agenda.quitar(self.temprano)
+        self.assertEqual(len(self.agenda), 1)
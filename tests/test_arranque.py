@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestArranque(unittest.TestCase):
+    """Verifica que el arranque no cargue subsistemas que todavía no se usan."""
+
+    def __modulos_cargados(self, codigo):
+        proceso = subprocess.run(
+            [sys.executable, "-c", codigo + "\nimport sys\nprint(' '.join(sys.modules))"],
+            cwd=RAIZ, capture_output=True, text=True, check=True,
+        )
+        return set(proceso.stdout.split())
+
+    def test_main_no_importa_el_modelo(self):
+        modulos = self.__modulos_cargados("import main")
+        self.assertNotIn("cli", modulos)
+        self.assertNotIn("lote", modulos)
+        self.assertNotIn("modelo.clinica", modulos)
+        self.assertNotIn("argparse", modulos)
+
+    def test_cli_crea_la_clinica_al_usarla(self):
+        modulos = self.__modulos_cargados("from cli import CLI\nCLI()")
+        self.assertNotIn("modelo.clinica", modulos)
+        modulos = self.__modulos_cargados("from cli import CLI\nCLI().clinica")
+        self.assertIn("modelo.clinica", modulos)
+
+    def test_lote_no_importa_multiprocessing(self):
+        modulos = self.__modulos_cargados("import lote")
+        self.assertNotIn("duplicados", modulos)
+        self.assertNotIn("multiprocessing", modulos)
+        self.assertNotIn("concurrent.futures.process", modulos)
+
+    def test_script_corto_no_importa_multiprocessing(self):
+        modulos = self.__modulos_cargados(
+            "import io, sys\nsys.stdin = io.StringIO('ver_pacientes\\n')\n"
+            "import main\nmain.main(['--script', '-'])"
+        )
+        self.assertIn("lote", modulos)
+        self.assertNotIn("multiprocessing", modulos)
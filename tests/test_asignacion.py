@@ -0,0 +1,126 @@
+import io
+import time
+import unittest
+from datetime import datetime, timedelta
+from modelo.asignacion import AsignadorTurnos, SolicitudAsignacion
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.excepciones import PacienteNoEncontradoException
+from lote import EjecutorLote
+
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+MEDIA_HORA = timedelta(minutes=30)
+
+def nunca_ocupado(dni, fecha_hora):
+    return False
+
+class TestAsignadorTurnos(unittest.TestCase):
+    def setUp(self):
+        self.nueve = datetime(2099, 1, 5, 9, 0)
+        self.diez = datetime(2099, 1, 5, 10, 0)
+
+    def __resolver(self, solicitudes, horarios):
+        return AsignadorTurnos(solicitudes, horarios, nunca_ocupado, MEDIA_HORA).resolver()
+
+    def test_camino_de_aumento(self):
+        # La primera toma las 9 y tiene que correrse a las 10 para que entre la segunda
+        solicitudes = [
+            SolicitudAsignacion("1", "Clínica", self.nueve, self.diez + MEDIA_HORA, prioridad=5),
+            SolicitudAsignacion("2", "Clínica", self.nueve, self.diez),
+        ]
+        horarios = {"clínica": [(self.nueve, "M1"), (self.diez, "M1")]}
+        self.assertEqual(self.__resolver(solicitudes, horarios), [("M1", self.diez), ("M1", self.nueve)])
+
+    def test_prioridad_cuando_no_alcanzan_los_horarios(self):
+        solicitudes = [
+            SolicitudAsignacion("1", "Clínica", self.nueve, self.diez),
+            SolicitudAsignacion("2", "Clínica", self.nueve, self.diez, prioridad=2),
+        ]
+        horarios = {"clínica": [(self.nueve, "M1")]}
+        self.assertEqual(self.__resolver(solicitudes, horarios), [None, ("M1", self.nueve)])
+
+    def test_horario_compartido_entre_especialidades(self):
+        solicitudes = [
+            SolicitudAsignacion("1", "Clínica", self.nueve, self.diez),
+            SolicitudAsignacion("2", "Cardiología", self.nueve, self.diez),
+        ]
+        horarios = {"clínica": [(self.nueve, "M1")], "cardiología": [(self.nueve, "M1")]}
+        self.assertEqual(self.__resolver(solicitudes, horarios).count(None), 1)
+
+    def test_paciente_sin_turnos_superpuestos(self):
+        solicitudes = [
+            SolicitudAsignacion("1", "Clínica", self.nueve, self.diez),
+            SolicitudAsignacion("1", "Cardiología", self.nueve, self.diez),
+        ]
+        horarios = {"clínica": [(self.nueve, "M1")], "cardiología": [(self.nueve, "M2")]}
+        self.assertEqual(self.__resolver(solicitudes, horarios), [("M1", self.nueve), None])
+
+    def test_solicitud_invalida(self):
+        with self.assertRaises(ValueError):
+            SolicitudAsignacion("1", "Clínica", self.diez, self.nueve)
+        with self.assertRaises(ValueError):
+            SolicitudAsignacion("1", "Clínica", self.nueve, self.diez, prioridad=-1)
+
+    def test_lote_grande_en_segundos(self):
+        # 20 médicos x 20 horarios x 5 días = 2000 horarios para 3000 solicitudes
+        inicio = datetime(2099, 1, 5, 8, 0)
+        horarios = {"clínica": sorted(
+            (inicio + timedelta(days=dia) + MEDIA_HORA * bloque, f"M{medico}")
+            for dia in range(5) for bloque in range(20) for medico in range(20)
+        )}
+        solicitudes = [
+            SolicitudAsignacion(str(i), "Clínica", inicio + timedelta(days=i % 5), inicio + timedelta(days=5), i % 3)
+            for i in range(3000)
+        ]
+        comienzo = time.perf_counter()
+        asignados = self.__resolver(solicitudes, horarios)
+        self.assertLess(time.perf_counter() - comienzo, 10)
+        self.assertEqual(len(asignados) - asignados.count(None), 2000)
+        self.assertEqual(len({horario for horario in asignados if horario}), 2000)
+
+class TestAsignarSolicitudes(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica()
+        for dni in ("1", "2", "3"):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {dni}", dni, "01/01/1990"))
+        medico = Medico("Dra. Gómez", "M1")
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS))
+        self.clinica.agregar_medico(medico)
+        self.dia = (datetime.now() + timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def test_asigna_y_registra_los_turnos(self):
+        # Solo quedan dos horarios libres ese día
+        for bloque in range(18):
+            fecha = self.dia.replace(hour=8) + MEDIA_HORA * bloque
+            self.clinica.agendar_turno("1" if bloque % 2 else "2", "M1", "Clínica", fecha)
+        solicitudes = [SolicitudAsignacion(dni, "Clínica", self.dia, self.dia + timedelta(days=1))
+                       for dni in ("1", "2", "3")]
+        asignados, sin_turno = self.clinica.asignar_solicitudes(solicitudes)
+        self.assertEqual(len(asignados), 2)
+        self.assertEqual(len(sin_turno), 1)
+        for solicitud, turno in asignados:
+            self.assertEqual(turno.obtener_paciente().obtener_dni(), solicitud.obtener_dni())
+            self.assertIn(turno, self.clinica.obtener_proximos_turnos(solicitud.obtener_dni()))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 20)
+
+    def test_no_agenda_nada_si_falta_un_paciente(self):
+        solicitudes = [SolicitudAsignacion(dni, "Clínica", self.dia, self.dia + timedelta(days=1))
+                       for dni in ("1", "99")]
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.asignar_solicitudes(solicitudes)
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+
+    def test_comando_lote(self):
+        salida = io.StringIO()
+        ejecutor = EjecutorLote(salida, self.clinica)
+        fecha = self.dia.strftime("%d/%m/%Y")
+        ejecutor.ejecutar([f"solicitar_turno 1 Clínica {fecha} {fecha} 2",
+                           f"solicitar_turno 2 Clínica {fecha} {fecha}",
+                           "asignar_solicitudes"])
+        self.assertEqual(salida.getvalue().count("Asignado: "), 2)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
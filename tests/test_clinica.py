@@ -6,6 +6,8 @@ from modelo.medico import Medico
 from modelo.especialidad import Especialidad
 from modelo.excepciones import *
 from modelo.turno import Turno
+from modelo.serie_turnos import SerieTurnos
+from modelo.receta import Receta
 
 class TestClinica(unittest.TestCase):
     def setUp(self):
@@ -34,16 +36,221 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(TurnoOcupadoException):
             self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha)
 
+    def test_paciente_con_turno_superpuesto(self):
+        otro = Medico("Dra. Sosa", "M222")
+        otro.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(otro)
+        fecha = self.__proximo_dia_semana("lunes", hora=10)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha)
+        with self.assertRaises(PacienteOcupadoException):
+            self.clinica.agendar_turno("12345678", "M222", "Pediatría", fecha + timedelta(minutes=15))
+        self.clinica.agendar_turno("12345678", "M222", "Pediatría", fecha + timedelta(hours=1))
+
+    def test_proximo_turno(self):
+        lunes = self.__proximo_dia_semana("lunes", hora=10)
+        martes = self.__proximo_dia_semana("martes", hora=10)
+        tardio = self.clinica.agendar_turno("12345678", "M111", "Clínica", max(lunes, martes))
+        proximo = self.clinica.agendar_turno("12345678", "M111", "Clínica", min(lunes, martes))
+        self.assertIs(self.clinica.obtener_proximo_turno("12345678"), proximo)
+        self.assertEqual(self.clinica.obtener_proximos_turnos("12345678"), [proximo, tardio])
+
+    def test_cancelar_turno(self):
+        fecha = self.__proximo_dia_semana("martes", hora=11)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha)
+        self.clinica.cancelar_turno("M111", fecha)
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual(self.clinica.obtener_historia_clinica("12345678").obtener_turnos(), [])
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_cancelar_turno_inexistente(self):
+        fecha = self.__proximo_dia_semana("martes", hora=11)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno("M111", fecha)
+
+    def test_estadisticas_de_ocupacion(self):
+        fecha = self.__proximo_dia_semana("lunes", hora=10)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha.replace(hour=12))
+        self.clinica.cancelar_turno("M111", fecha)
+        estadisticas = self.clinica.obtener_estadisticas()
+        self.assertEqual(estadisticas.ocupacion(matricula="M111", dia_semana="lunes"), 1)
+        self.assertTrue(self.clinica.verificar_estadisticas())
+
+    def test_turnos_entre_fechas(self):
+        otro = Medico("Dra. Sosa", "M222")
+        otro.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(otro)
+        self.clinica.agregar_paciente(Paciente("Ana Gil", "87654321", "02/02/2002"))
+        lunes = self.__proximo_dia_semana("lunes", hora=8)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", lunes + timedelta(hours=3))
+        self.clinica.agendar_turno("87654321", "M222", "Pediatría", lunes + timedelta(hours=1))
+        self.clinica.agendar_turno("87654321", "M111", "Clínica", lunes + timedelta(hours=5))
+        manana = self.clinica.obtener_turnos_entre(lunes, lunes + timedelta(hours=4))
+        self.assertEqual([t.obtener_fecha_hora().hour for t in manana], [9, 11])
+        self.assertEqual(len(self.clinica.obtener_turnos_entre(lunes, matricula="M111")), 2)
+        self.assertEqual(len(self.clinica.obtener_turnos_entre(especialidad="pediatría")), 1)
+        self.assertEqual(self.clinica.obtener_turnos_entre(matricula="M111", especialidad="Pediatría"), [])
+        self.clinica.cancelar_turno("M222", lunes + timedelta(hours=1))
+        self.assertEqual(self.clinica.obtener_turnos_entre(especialidad="Pediatría"), [])
+
+    def test_agendar_serie_semanal(self):
+        inicio = self.__proximo_dia_semana("martes", hora=9)
+        serie = self.clinica.agendar_serie("12345678", "M111", "Clínica", inicio, "semanal", 26)
+        self.assertEqual(len(serie), 26)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 26)
+        self.assertEqual(self.clinica.obtener_proximo_turno("12345678").obtener_fecha_hora(), inicio)
+        self.assertEqual(len(self.clinica.obtener_turnos_entre(inicio, inicio + timedelta(weeks=4))), 4)
+        self.assertEqual(self.clinica.obtener_estadisticas().ocupacion(matricula="M111"), 26)
+        self.assertTrue(self.clinica.verificar_estadisticas())
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "M111", "Clínica", inicio + timedelta(weeks=3))
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 1)
+
+    def test_agendar_serie_con_conflicto_no_agenda_nada(self):
+        inicio = self.__proximo_dia_semana("lunes", hora=9)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", inicio + timedelta(weeks=5))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_serie("12345678", "M111", "Clínica", inicio, "semanal", 10)
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_serie("12345678", "M111", "Clínica", inicio, timedelta(days=1), 7)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_cancelar_ocurrencia_de_serie(self):
+        inicio = self.__proximo_dia_semana("miércoles", hora=9)
+        serie = self.clinica.agendar_serie("12345678", "M111", "Clínica", inicio, "quincenal", 2)
+        cancelado = self.clinica.cancelar_turno("M111", inicio)
+        self.assertEqual(cancelado.obtener_fecha_hora(), inicio)
+        self.assertEqual(len(serie), 1)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", inicio)
+        self.clinica.cancelar_turno("M111", inicio + timedelta(weeks=2))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 1)
+        self.assertTrue(self.clinica.verificar_estadisticas())
+
+    def test_lista_espera_promueve_al_cancelar(self):
+        for dni, nombre in (("22222222", "Ana Díaz"), ("33333333", "Luis Gómez")):
+            self.clinica.agregar_paciente(Paciente(nombre, dni, "01/01/1990"))
+        fecha = self.__proximo_dia_semana("jueves", hora=10)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha)
+        normal = self.clinica.agendar_o_esperar("22222222", "M111", "Clínica", fecha)
+        urgente = self.clinica.agendar_o_esperar("33333333", "M111", "Clínica", fecha, urgencia=2)
+        self.assertEqual(self.clinica.obtener_lista_espera("M111", "Clínica"), [urgente, normal])
+
+        promociones = []
+        self.clinica.suscribir_promociones(lambda solicitud, turno: promociones.append((solicitud, turno)))
+        self.clinica.cancelar_turno("M111", fecha)
+        self.assertEqual(len(promociones), 1)
+        self.assertIs(promociones[0][0], urgente)
+        self.assertEqual(promociones[0][1].obtener_paciente().obtener_dni(), "33333333")
+        self.assertEqual(self.clinica.obtener_lista_espera("M111", "Clínica"), [normal])
+
+    def test_lista_espera_salta_paciente_ocupado(self):
+        otro = Medico("Dra. Sosa", "M222")
+        otro.agregar_especialidad(Especialidad("Pediatría", ["viernes"]))
+        self.clinica.agregar_medico(otro)
+        for dni, nombre in (("22222222", "Ana Díaz"), ("33333333", "Luis Gómez")):
+            self.clinica.agregar_paciente(Paciente(nombre, dni, "01/01/1990"))
+        fecha = self.__proximo_dia_semana("viernes", hora=10)
+        self.clinica.agendar_turno("22222222", "M111", "Clínica", fecha)
+        ocupado = self.clinica.agendar_o_esperar("12345678", "M111", "Clínica", fecha, urgencia=1)
+        self.clinica.agendar_turno("12345678", "M222", "Pediatría", fecha)
+        esperando = self.clinica.agendar_o_esperar("33333333", "M111", "Clínica", fecha)
+
+        turno = self.clinica.cancelar_turno("M111", fecha)
+        self.assertEqual(turno.obtener_paciente().obtener_dni(), "22222222")
+        self.assertEqual(self.clinica.obtener_proximo_turno("33333333").obtener_fecha_hora(), fecha)
+        self.assertEqual(self.clinica.obtener_lista_espera("M111", "Clínica"), [ocupado])
+        self.assertFalse(esperando.esta_activa())
+        self.assertTrue(self.clinica.retirar_de_espera(ocupado))
+        self.assertEqual(self.clinica.obtener_lista_espera("M111", "Clínica"), [])
+
     def test_emitir_receta_exitosa(self):
         medicamentos = ["Ibuprofeno"]
         self.clinica.emitir_receta("12345678", "M111", medicamentos)
         historia = self.clinica.obtener_historia_clinica("12345678")
         self.assertEqual(len(historia.obtener_recetas()), 1)
 
+    def test_emitir_receta_indexada(self):
+        receta = self.clinica.emitir_receta("12345678", "M111", ["Ibuprofeno"])
+        indice = self.clinica.obtener_indice_recetas()
+        self.assertEqual(indice.obtener_por_medico("M111"), [receta])
+        self.assertEqual(indice.medicamentos_mas_recetados(1), [("Ibuprofeno", 1)])
+
     def test_emitir_receta_sin_medicamentos(self):
         with self.assertRaises(RecetaInvalidaException):
             self.clinica.emitir_receta("12345678", "M111", [])
 
+    def test_archivar_historias_solo_el_pasado(self):
+        fecha = self.__proximo_dia_semana("lunes", hora=10)
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", fecha)
+        self.clinica.emitir_receta("12345678", "M111", ["Ibuprofeno"])
+        with self.assertRaises(ValueError):
+            self.clinica.archivar_historias(fecha)
+        self.assertEqual(self.clinica.archivar_historias(datetime.now()), 1)  # solo la receta
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertIn("Ibuprofeno", str(historia))
+        self.assertEqual(historia.obtener_cantidad_archivada(), 1)
+
+    def test_archivar_historias_conserva_la_clinica(self):
+        pasado = datetime(2020, 3, 2, 10, 0)
+        futuro = self.__proximo_dia_semana("lunes", hora=10)
+        self.clinica.restaurar_turno(Turno.restaurar(self.paciente, self.medico, pasado, "Clínica"))
+        self.clinica.restaurar_serie(SerieTurnos.restaurar(
+            self.paciente, self.medico, "Clínica", pasado.replace(hour=11), timedelta(weeks=1), 3))
+        self.clinica.restaurar_receta(Receta.restaurar(self.paciente, self.medico, ["Ibuprofeno"], pasado))
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", futuro)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        antes = str(historia)
+        total = self.clinica.obtener_estadisticas().total()
+
+        self.assertEqual(self.clinica.archivar_historias(datetime.now()), 3)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 5)
+        self.assertEqual(len(self.clinica.obtener_turnos_entre(matricula="M111", hasta=futuro)), 4)
+        self.assertEqual(len(self.clinica.obtener_series()), 1)
+        self.assertEqual(len(self.clinica.obtener_indice_recetas()), 1)
+        self.assertEqual(self.clinica.obtener_indice_recetas().medicamentos_mas_recetados(), [("Ibuprofeno", 1)])
+        self.assertEqual(self.clinica.obtener_estadisticas().total(), total)
+        self.assertTrue(self.clinica.verificar_estadisticas())
+
+        self.assertEqual(str(historia), antes)
+        self.assertTrue(all(isinstance(turno, (Turno, SerieTurnos)) for turno in historia.obtener_turnos()))
+        self.assertEqual([turno.obtener_fecha_hora() for turno in historia.obtener_turnos()], [futuro])
+        self.assertEqual(len(historia.obtener_turnos_archivados()), 2)
+        self.assertEqual(historia.obtener_recetas(), [])
+        self.assertEqual(len(historia.obtener_recetas_archivadas()), 1)
+
+    def test_turnos_entre_solo_con_series_del_rango(self):
+        pasada = datetime(2020, 3, 2, 11, 0)
+        self.clinica.restaurar_serie(SerieTurnos.restaurar(
+            self.paciente, self.medico, "Clínica", pasada, timedelta(weeks=1), 3))
+        lunes = self.__proximo_dia_semana("lunes", hora=9)
+        self.clinica.agendar_serie("12345678", "M111", "Clínica", lunes, "semanal", 2)
+        ahora = datetime.now()
+
+        self.assertEqual([t.obtener_fecha_hora() for t in self.clinica.obtener_turnos_entre(desde=ahora)],
+                         [lunes, lunes + timedelta(weeks=1)])
+        self.assertEqual(len(self.clinica.obtener_turnos_entre(desde=datetime(2020, 3, 5), hasta=ahora,
+                                                               especialidad="Clínica")), 2)
+        self.assertEqual(len(self.clinica.obtener_turnos_entre(desde=datetime(2020, 3, 5), matricula="M111")), 4)
+
+        for fecha in (lunes, lunes + timedelta(weeks=1)):
+            self.clinica.cancelar_turno("M111", fecha)
+        self.assertEqual(self.clinica.obtener_turnos_entre(desde=ahora), [])
+        self.assertEqual(len(self.clinica.obtener_series()), 1)
+
+    def test_no_se_cancelan_turnos_pasados(self):
+        fecha = datetime(2020, 3, 2, 10, 0)
+        self.clinica.restaurar_turno(Turno.restaurar(self.paciente, self.medico, fecha, "Clínica"))
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.cancelar_turno("M111", fecha)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+        self.clinica.archivar_historias(datetime.now())
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.cancelar_turno("M111", fecha)
+        self.assertIn("2020", str(self.clinica.obtener_historia_clinica("12345678")))
+
     def __proximo_dia_semana(self, dia_nombre: str, hora: int = 9) -> datetime:
         dias = {
             "lunes": 0, "martes": 1, "miércoles": 2,
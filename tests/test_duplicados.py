@@ -0,0 +1,87 @@
+import io
+import unittest
+from unittest import mock
+import duplicados
+from duplicados import buscar_duplicados, codigo_fonetico, claves_bloque, comparar
+from lote import EjecutorLote
+from modelo.paciente import Paciente
+
+class TestDuplicados(unittest.TestCase):
+    def setUp(self):
+        self.pacientes = [
+            Paciente("Juan Pérez", "12345678", "01/01/1990"),
+            Paciente("Juan Perez", "12345679", "01/01/1990"),       # DNI mal tipeado
+            Paciente("José Pérez", "30111222", "01/01/1990"),       # otra persona
+            Paciente("Valeria Hernández", "22333444", "15/03/1985"),
+            Paciente("Balería Ernández", "40555666", "15/03/1985"), # nombre mal tipeado
+            Paciente("Sofía Gómez", "28999000", "07/07/1970"),
+        ]
+
+    def test_codigo_fonetico(self):
+        self.assertEqual(codigo_fonetico("Hernández"), codigo_fonetico("Ernandes"))
+        self.assertEqual(codigo_fonetico("Valeria"), codigo_fonetico("Balería"))
+        self.assertEqual(codigo_fonetico("Quiroga"), codigo_fonetico("Kiroga"))
+        self.assertEqual(codigo_fonetico("Jiménez"), codigo_fonetico("Gimenez"))
+        self.assertNotEqual(codigo_fonetico("Pérez"), codigo_fonetico("Gómez"))
+
+    def test_claves_ignoran_orden_del_nombre(self):
+        claves_a = claves_bloque(("1", "Juan Pérez", "01/01/1990"))
+        claves_b = claves_bloque(("2", "Pérez Juan", "01/01/1990"))
+        self.assertEqual(claves_a, claves_b)
+
+    def test_comparar(self):
+        puntaje, motivos = comparar(("12345678", "Juan Pérez", "01/01/1990"),
+                                    ("12345687", "Juan Perez", "01/01/1990"))
+        self.assertAlmostEqual(puntaje, 1.0)
+        self.assertIn("DNI casi igual", motivos)
+        puntaje, _ = comparar(("12345678", "Juan Pérez", "01/01/1990"),
+                              ("30111222", "José Pérez", "01/01/1990"))
+        self.assertLess(puntaje, duplicados.UMBRAL_DUPLICADO)
+        self.assertIsNone(comparar(("12345678", "Juan Pérez", "01/01/1990"),
+                                   ("30111222", "Juan Pérez", "02/02/1990"), duplicados.UMBRAL_DUPLICADO))
+
+    def test_encuentra_duplicados(self):
+        candidatos = buscar_duplicados(self.pacientes, procesos=1)
+        pares = {tuple(p.obtener_dni() for p in c.obtener_pacientes()) for c in candidatos}
+        self.assertEqual(pares, {("12345678", "12345679"), ("22333444", "40555666")})
+        self.assertGreaterEqual(candidatos[0].obtener_puntaje(), candidatos[1].obtener_puntaje())
+        self.assertIn("misma fecha de nacimiento", str(candidatos[0]))
+
+    def test_solo_compara_dentro_de_los_bloques(self):
+        with mock.patch("duplicados.comparar", wraps=comparar) as comparar_espia:
+            buscar_duplicados(self.pacientes, procesos=1)
+        # Sofía Gómez no comparte bloque con nadie y nunca se compara
+        for llamada in comparar_espia.call_args_list:
+            self.assertNotIn("28999000", (llamada.args[0][0], llamada.args[1][0]))
+
+    def test_bloques_grandes_usan_ventana(self):
+        pacientes = [Paciente(f"Ana Pérez {i:04d}", str(10_000_000 + i * 7), "01/01/1990") for i in range(60)]
+        with mock.patch.object(duplicados, "MAXIMO_BLOQUE", 10), \
+             mock.patch.object(duplicados, "VENTANA_BLOQUE", 2):
+            self.assertEqual(duplicados._comparaciones([None] * 60), 120)
+            candidatos = buscar_duplicados(pacientes, procesos=1)
+        self.assertTrue(candidatos)
+
+    def test_resultado_en_paralelo_igual_al_secuencial(self):
+        pacientes = self.pacientes + [
+            Paciente(f"Paciente {nombre}", str(50_000_000 + i), "10/10/2000")
+            for i, nombre in enumerate(["Ruiz", "Ruis", "Díaz", "Dias", "Sosa"])
+        ]
+        secuencial = buscar_duplicados(pacientes, procesos=1)
+        with mock.patch.object(duplicados, "COMPARACIONES_PARALELO", 0), \
+             mock.patch.object(duplicados, "COMPARACIONES_POR_LOTE", 1):
+            paralelo = buscar_duplicados(pacientes, procesos=2)
+        self.assertEqual([str(c) for c in paralelo], [str(c) for c in secuencial])
+
+    def test_comando_lote(self):
+        salida = io.StringIO()
+        ejecutor = EjecutorLote(salida)
+        for paciente in self.pacientes:
+            ejecutor.clinica.agregar_paciente(paciente)
+        ejecutor.ejecutar(["buscar_duplicados --procesos 1 --formato tsv"])
+        lineas = salida.getvalue().splitlines()
+        self.assertEqual(lineas[0].split("\t")[:2], ["dni_a", "nombre_a"])
+        self.assertEqual(len(lineas), 4)  # encabezado, dos pares y resumen
+
+if __name__ == '__main__':
+    unittest.main()
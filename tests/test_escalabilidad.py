@@ -0,0 +1,203 @@
+import gc
+import time
+import unittest
+from datetime import datetime, timedelta
+from benchmarks.bench_clinica import Escenario
+from modelo.clinica import Clinica
+from modelo.historia_clinica import HistoriaClinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.turno import Turno
+
+# Tamaños comparados: el grande es 32 veces el chico
+TAMANIO_CHICO = 1_000
+TAMANIO_GRANDE = 32_000
+FACTOR = TAMANIO_GRANDE // TAMANIO_CHICO
+
+# Se toma la mejor de varias repeticiones para descartar el ruido de la máquina
+REPETICIONES = 5
+
+# Cantidad de operaciones medidas en cada repetición
+OPERACIONES = 500
+
+# Crecimiento máximo tolerado del costo por operación entre ambos tamaños. Una
+# operación O(1) u O(log n) queda muy por debajo; una O(n) crece ~32 veces.
+CRECIMIENTO_POR_OPERACION = 6
+
+# Crecimiento máximo tolerado del costo total de procesar n elementos. Una
+# operación lineal crece ~32 veces; una cuadrática, ~1000.
+CRECIMIENTO_TOTAL = FACTOR * 6
+
+
+def medir_una_vez(operacion):
+    """
+    Mide una ejecución de una operación con el recolector de basura desactivado.
+
+    Args:
+        operacion (callable): Operación a medir
+
+    Returns:
+        float: Tiempo en segundos
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        inicio = time.perf_counter()
+        operacion()
+        return max(time.perf_counter() - inicio, 1e-9)
+    finally:
+        gc.enable()
+
+
+def mejor_tiempo(operacion):
+    """
+    Devuelve el menor tiempo de REPETICIONES ejecuciones de una operación.
+
+    Args:
+        operacion (callable): Operación a medir
+
+    Returns:
+        float: Mejor tiempo en segundos
+    """
+    return min(medir_una_vez(operacion) for _ in range(REPETICIONES))
+
+
+class EscenarioCargado:
+    """
+    Clínica con `tamanio` pacientes y turnos ya cargados, más un médico y
+    pacientes extra cuyos turnos se agendan y cancelan en las mediciones.
+    """
+
+    def __init__(self, tamanio):
+        escenario = Escenario(tamanio)
+        self.clinica = Clinica()
+        for paciente in escenario.pacientes:
+            self.clinica.agregar_paciente(paciente)
+        for medico in escenario.medicos:
+            self.clinica.agregar_medico(medico)
+        for args in escenario.turnos:
+            self.clinica.agendar_turno(*args)
+        self.turnos = escenario.turnos
+
+        medico = Medico("Médico Extra", "MEXTRA")
+        medico.agregar_especialidad(Especialidad("Clínica", Especialidad.DIAS_VALIDOS))
+        self.clinica.agregar_medico(medico)
+
+        inicio = (datetime.now() + timedelta(days=1)).replace(hour=8, minute=15, second=0, microsecond=0)
+        self.extra = []
+        for i in range(OPERACIONES):
+            dni = str(90_000_000 + i)
+            self.clinica.agregar_paciente(Paciente(f"Extra {i}", dni, "01/01/1980"))
+            self.extra.append((dni, "MEXTRA", "Clínica", inicio + timedelta(minutes=30 * i)))
+
+
+class TestEscalabilidad(unittest.TestCase):
+    """
+    Compara el costo de las operaciones principales entre una clínica de 1.000
+    y otra de 32.000 registros, para detectar complejidades cuadráticas.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.chico = EscenarioCargado(TAMANIO_CHICO)
+        cls.grande = EscenarioCargado(TAMANIO_GRANDE)
+
+    def assertCrecimiento(self, chico, grande, maximo, operacion):
+        crecimiento = grande / chico
+        self.assertLess(
+            crecimiento, maximo,
+            f"{operacion}: el costo creció x{crecimiento:.1f} al pasar de "
+            f"{TAMANIO_CHICO} a {TAMANIO_GRANDE} registros (máximo x{maximo})",
+        )
+
+    def __agendar_y_cancelar(self, escenario):
+        clinica = escenario.clinica
+
+        def agendar():
+            for args in escenario.extra:
+                clinica.agendar_turno(*args)
+
+        def cancelar():
+            for _, matricula, _, fecha_hora in escenario.extra:
+                clinica.cancelar_turno(matricula, fecha_hora)
+
+        tiempos = {"agendar": float("inf"), "cancelar": float("inf")}
+        for _ in range(REPETICIONES):
+            tiempos["agendar"] = min(tiempos["agendar"], medir_una_vez(agendar))
+            tiempos["cancelar"] = min(tiempos["cancelar"], medir_una_vez(cancelar))
+        return tiempos
+
+    def test_agendar_y_cancelar_turno(self):
+        chico = self.__agendar_y_cancelar(self.chico)
+        grande = self.__agendar_y_cancelar(self.grande)
+        self.assertCrecimiento(chico["agendar"], grande["agendar"], CRECIMIENTO_POR_OPERACION, "agendar_turno")
+        self.assertCrecimiento(chico["cancelar"], grande["cancelar"], CRECIMIENTO_POR_OPERACION, "cancelar_turno")
+
+    def test_validar_turno_no_duplicado(self):
+        def medir(escenario):
+            libres = [(matricula, fecha_hora + timedelta(minutes=15))
+                      for _, matricula, _, fecha_hora in escenario.turnos[-OPERACIONES:]]
+            validar = escenario.clinica.validar_turno_no_duplicado
+            return mejor_tiempo(lambda: [validar(*args) for args in libres])
+
+        self.assertCrecimiento(medir(self.chico), medir(self.grande), CRECIMIENTO_POR_OPERACION,
+                               "validar_turno_no_duplicado")
+
+    def test_historia_clinica_y_busqueda(self):
+        def medir(escenario):
+            clinica = escenario.clinica
+            dnis = [dni for dni, _, _, _ in escenario.turnos[-OPERACIONES:]]
+            historia = mejor_tiempo(lambda: [str(clinica.obtener_historia_clinica(dni)) for dni in dnis])
+            busqueda = mejor_tiempo(lambda: [clinica.buscar_pacientes(str(i)) for i in range(OPERACIONES)])
+            return historia, busqueda
+
+        historia_chico, busqueda_chico = medir(self.chico)
+        historia_grande, busqueda_grande = medir(self.grande)
+        self.assertCrecimiento(historia_chico, historia_grande, CRECIMIENTO_POR_OPERACION, "obtener_historia_clinica")
+        self.assertCrecimiento(busqueda_chico, busqueda_grande, CRECIMIENTO_POR_OPERACION, "buscar_pacientes")
+
+
+class TestEscalabilidadHistoriaClinica(unittest.TestCase):
+    """
+    Compara el costo de armar y mostrar una historia clínica con 1.000 y con
+    32.000 turnos del mismo paciente: debe crecer en forma lineal.
+    """
+
+    @staticmethod
+    def __turnos(cantidad):
+        paciente = Paciente("Paciente Crónico", "12345678", "01/01/1950")
+        medico = Medico("Dr. House", "M001")
+        medico.agregar_especialidad(Especialidad("Clínica", Especialidad.DIAS_VALIDOS))
+        inicio = (datetime.now() + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
+        return paciente, [Turno(paciente, medico, inicio + timedelta(minutes=30 * i), "Clínica")
+                          for i in range(cantidad)]
+
+    def __medir(self, cantidad):
+        paciente, turnos = self.__turnos(cantidad)
+
+        def agregar():
+            historia = HistoriaClinica(paciente)
+            for turno in turnos:
+                historia.agregar_turno(turno)
+            return historia
+
+        historia = agregar()
+        return mejor_tiempo(agregar), mejor_tiempo(lambda: str(historia))
+
+    def test_crece_linealmente(self):
+        agregar_chico, texto_chico = self.__medir(TAMANIO_CHICO)
+        agregar_grande, texto_grande = self.__medir(TAMANIO_GRANDE)
+
+        for chico, grande, operacion in ((agregar_chico, agregar_grande, "agregar_turno"),
+                                         (texto_chico, texto_grande, "str(HistoriaClinica)")):
+            crecimiento = grande / chico
+            self.assertLess(
+                crecimiento, CRECIMIENTO_TOTAL,
+                f"{operacion}: el costo creció x{crecimiento:.1f} para {FACTOR} veces más turnos "
+                f"(máximo x{CRECIMIENTO_TOTAL})",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,3 +18,9 @@ class TestEspecialidad(unittest.TestCase):
     def test_tipo_vacio(self):
         with self.assertRaises(DatosInvalidosException):
             Especialidad("", ["lunes"])
+
+    def test_representacion_cacheada(self):
+        esp = Especialidad("Dermatología", ["lunes", "miércoles"])
+        texto = str(esp)
+        self.assertEqual(texto, "Dermatología (Días: Lunes, Miércoles)")
+        self.assertIs(str(esp), texto)
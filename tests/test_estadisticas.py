@@ -0,0 +1,38 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.estadisticas import EstadisticasOcupacion
+from modelo.especialidad import Especialidad
+
+class TestEstadisticasOcupacion(unittest.TestCase):
+    def setUp(self):
+        self.estadisticas = EstadisticasOcupacion()
+        self.fecha = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+        self.dia = Especialidad.DIAS_VALIDOS[self.fecha.weekday()]
+        self.estadisticas.registrar("M111", "Clínica", self.fecha)
+        self.estadisticas.registrar("M111", "Clínica", self.fecha.replace(hour=11))
+        self.estadisticas.registrar("M222", "Pediatría", self.fecha)
+
+    def test_ocupacion_por_medico_y_especialidad(self):
+        self.assertEqual(self.estadisticas.ocupacion(matricula="M111"), 2)
+        self.assertEqual(self.estadisticas.ocupacion(especialidad="pediatría"), 1)
+        self.assertEqual(self.estadisticas.ocupacion(matricula="M111", especialidad="Pediatría"), 0)
+        self.assertEqual(self.estadisticas.total(), 3)
+
+    def test_ocupacion_por_periodo(self):
+        self.assertEqual(self.estadisticas.ocupacion(fecha=self.fecha.date()), 3)
+        self.assertEqual(self.estadisticas.ocupacion(dia_semana=self.dia), 3)
+        self.assertEqual(self.estadisticas.ocupacion(matricula="M111", hora=11), 1)
+
+    def test_quitar(self):
+        self.estadisticas.quitar("M222", "Pediatría", self.fecha)
+        self.assertEqual(self.estadisticas.ocupacion(hora=10), 1)
+        self.assertEqual(self.estadisticas.ocupacion(especialidad="Pediatría"), 0)
+
+    def test_varios_periodos(self):
+        with self.assertRaises(ValueError):
+            self.estadisticas.ocupacion(fecha=self.fecha.date(), hora=10)
+
+    def test_utilizacion(self):
+        self.assertEqual(self.estadisticas.utilizacion("M111", self.fecha.date(), 4), 0.5)
+        with self.assertRaises(ValueError):
+            self.estadisticas.utilizacion("M111", self.fecha.date(), 0)
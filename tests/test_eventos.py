@@ -0,0 +1,109 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.eventos import Evento, FeedCambios
+from modelo.excepciones import EventosNoDisponiblesException
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+
+class TestFeedCambios(unittest.TestCase):
+    def setUp(self):
+        self.feed = FeedCambios(retencion=5)
+
+    def test_secuencias_y_oyente(self):
+        recibidos = []
+        self.feed.suscribir(recibidos.append)
+        for i in range(3):
+            self.feed.publicar(Evento.PACIENTE_AGREGADO, paciente=i)
+        self.assertEqual([e.obtener_secuencia() for e in recibidos], [1, 2, 3])
+        self.assertEqual(recibidos[1].obtener("paciente"), 1)
+        self.assertEqual(self.feed.obtener_ultima_secuencia(), 3)
+
+    def test_oyente_con_error_no_interrumpe(self):
+        def fallar(evento):
+            raise RuntimeError("consumidor roto")
+        suscripcion = self.feed.suscribir(fallar)
+        self.feed.publicar(Evento.MEDICO_AGREGADO)
+        self.assertIsInstance(suscripcion.obtener_error(), RuntimeError)
+        self.assertEqual(suscripcion.obtener_ultima_secuencia(), 1)
+
+    def test_publicar_desde_un_oyente_respeta_el_orden(self):
+        def reaccionar(evento):
+            if evento.obtener_secuencia() == 1:
+                self.feed.publicar(Evento.TURNO_AGENDADO, turno=0)
+        primera = self.feed.suscribir(reaccionar)
+        recibidos = []
+        segunda = self.feed.suscribir(recibidos.append)
+        cola = self.feed.suscribir(tamanio_cola=5)
+
+        evento = self.feed.publicar(Evento.TURNO_CANCELADO, turno=0)
+        self.assertEqual(evento.obtener_secuencia(), 1)
+        self.assertEqual([e.obtener_secuencia() for e in recibidos], [1, 2])
+        self.assertEqual([e.obtener_secuencia() for e in cola.obtener_eventos()], [1, 2])
+        for suscripcion in (primera, segunda, cola):
+            self.assertEqual(suscripcion.obtener_ultima_secuencia(), 2)
+
+    def test_cola_acotada_se_pone_al_dia(self):
+        suscripcion = self.feed.suscribir(tamanio_cola=2)
+        for i in range(4):
+            self.feed.publicar(Evento.TURNO_AGENDADO, turno=i)
+        self.assertTrue(suscripcion.esta_atrasada())
+        eventos = suscripcion.obtener_eventos()
+        self.assertEqual([e.obtener_secuencia() for e in eventos], [1, 2, 3, 4])
+        self.assertFalse(suscripcion.esta_atrasada())
+        self.feed.publicar(Evento.TURNO_CANCELADO, turno=0)
+        self.assertEqual(suscripcion.obtener(timeout=0).obtener_secuencia(), 5)
+        self.assertIsNone(suscripcion.obtener(timeout=0))
+
+    def test_obtener_avisa_que_la_cola_se_desbordo(self):
+        suscripcion = self.feed.suscribir(tamanio_cola=2)
+        for i in range(4):
+            self.feed.publicar(Evento.TURNO_AGENDADO, turno=i)
+        self.assertEqual([suscripcion.obtener().obtener_secuencia() for _ in range(2)], [1, 2])
+        with self.assertRaises(EventosNoDisponiblesException) as contexto:
+            suscripcion.obtener()
+        self.assertEqual(contexto.exception.secuencia, 2)
+        self.assertEqual([e.obtener_secuencia() for e in self.feed.eventos_desde(contexto.exception.secuencia)],
+                         [3, 4])
+        self.assertTrue(suscripcion.esta_atrasada())
+        self.assertEqual([e.obtener_secuencia() for e in suscripcion.obtener_eventos()], [3, 4])
+        self.assertIsNone(suscripcion.obtener(timeout=0))
+
+    def test_reanudar_desde_secuencia(self):
+        for i in range(7):
+            self.feed.publicar(Evento.RECETA_EMITIDA, receta=i)
+        self.assertEqual([e.obtener_secuencia() for e in self.feed.eventos_desde(4)], [5, 6, 7])
+        recibidos = []
+        suscripcion = self.feed.suscribir(recibidos.append, desde=5)
+        self.assertEqual([e.obtener_secuencia() for e in recibidos], [6, 7])
+        suscripcion.cancelar()
+        self.feed.publicar(Evento.RECETA_EMITIDA, receta=7)
+        self.assertEqual(len(recibidos), 2)
+        with self.assertRaises(EventosNoDisponiblesException):
+            self.feed.eventos_desde(1)
+        self.assertEqual(self.feed.eventos_desde(8), [])
+
+class TestClinicaEventos(unittest.TestCase):
+    def test_cada_modificacion_publica_un_evento(self):
+        clinica = Clinica()
+        suscripcion = clinica.suscribir_cambios(tamanio_cola=100)
+        clinica.agregar_paciente(Paciente("Ana Díaz", "1", "01/01/1990"))
+        clinica.agregar_medico(Medico("Dr. Paz", "M1"))
+        clinica.agregar_especialidad_a_medico("M1", Especialidad("Clínica", Especialidad.DIAS_VALIDOS))
+        fecha = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+        turno = clinica.agendar_turno("1", "M1", "Clínica", fecha)
+        clinica.emitir_receta("1", "M1", ["Ibuprofeno"])
+        clinica.cancelar_turno("M1", fecha)
+
+        eventos = suscripcion.obtener_eventos()
+        self.assertEqual([e.obtener_tipo() for e in eventos], [
+            Evento.PACIENTE_AGREGADO, Evento.MEDICO_AGREGADO, Evento.ESPECIALIDAD_AGREGADA,
+            Evento.TURNO_AGENDADO, Evento.RECETA_EMITIDA, Evento.TURNO_CANCELADO,
+        ])
+        self.assertIs(eventos[3].obtener("turno"), turno)
+        self.assertEqual(clinica.obtener_ultima_secuencia(), 6)
+        self.assertEqual(len(clinica.obtener_cambios_desde(4)), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from federacion import Federacion, SedeSimulada
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.excepciones import PacienteNoEncontradoException
+
+class TestFederacion(unittest.TestCase):
+    def setUp(self):
+        self.lunes = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.lunes += timedelta(days=7 - self.lunes.weekday())
+        self.norte = self.__clinica("N1", ["lunes"])
+        self.sur = self.__clinica("S1", ["martes"])
+        self.federacion = Federacion({"norte": self.norte, "sur": SedeSimulada(self.sur, latencia=0.05)})
+
+    def __clinica(self, matricula, dias):
+        clinica = Clinica()
+        medico = Medico(f"Dr. {matricula}", matricula)
+        medico.agregar_especialidad(Especialidad("Cardiología", dias))
+        clinica.agregar_medico(medico)
+        return clinica
+
+    def test_turnos_libres_de_una_clinica(self):
+        libres = list(self.norte.obtener_turnos_libres("Cardiología", self.lunes, self.lunes + timedelta(days=1)))
+        self.assertEqual(len(libres), 20)
+        self.assertEqual(libres[0], (self.lunes.replace(hour=8), "N1"))
+        self.assertEqual(libres[-1][0], self.lunes.replace(hour=17, minute=30))
+
+    def test_primeros_turnos_en_orden_entre_sedes(self):
+        self.norte.agregar_paciente(Paciente("Ana Díaz", "1", "01/01/1990"))
+        self.norte.agendar_turno("1", "N1", "Cardiología", self.lunes.replace(hour=8))
+        turnos = self.federacion.primeros_turnos("Cardiología", 3, self.lunes, self.lunes + timedelta(weeks=1))
+        self.assertEqual(turnos, [
+            (self.lunes.replace(hour=8, minute=30), "norte", "N1"),
+            (self.lunes.replace(hour=9), "norte", "N1"),
+            (self.lunes.replace(hour=9, minute=30), "norte", "N1"),
+        ])
+        todos = list(self.federacion.turnos_libres("Cardiología", self.lunes, self.lunes + timedelta(days=2)))
+        self.assertEqual(len(todos), 39)
+        self.assertEqual(todos[-1], (self.lunes + timedelta(days=1, hours=17, minutes=30), "sur", "S1"))
+        self.assertEqual(todos, sorted(todos))
+
+    def test_sede_lenta_no_demora_las_demas(self):
+        lenta = SedeSimulada(self.__clinica("L1", ["lunes"]), latencia=2.0)
+        federacion = Federacion({"norte": self.norte, "lenta": lenta}, tiempo_maximo=0.2)
+        inicio = time.perf_counter()
+        turnos = federacion.primeros_turnos("Cardiología", 1, self.lunes, self.lunes + timedelta(days=1))
+        self.assertLess(time.perf_counter() - inicio, 1.0)
+        self.assertEqual(turnos, [(self.lunes.replace(hour=8), "norte", "N1")])
+        self.assertIsInstance(federacion.obtener_errores()["lenta"], TimeoutError)
+
+    def test_sede_colgada_se_omite(self):
+        colgada = threading.Event()
+
+        class SedeColgada:
+            def obtener_turnos_libres(self, especialidad, desde=None, hasta=None):
+                colgada.wait()
+                return iter(())
+
+            def validar_existencia_paciente(self, dni):
+                colgada.wait()
+
+        self.norte.agregar_paciente(Paciente("Ana Díaz", "1", "01/01/1990"))
+        federacion = Federacion({"colgada": SedeColgada(), "norte": self.norte}, tiempo_maximo=0.2)
+        try:
+            todos = list(federacion.turnos_libres("Cardiología", self.lunes, self.lunes + timedelta(days=1)))
+            self.assertEqual(len(todos), 20)
+            self.assertEqual(federacion.sede_de_paciente("1"), "norte")
+            with self.assertRaises(PacienteNoEncontradoException):
+                federacion.sede_de_paciente("99")
+            self.assertIsInstance(federacion.obtener_errores()["colgada"], TimeoutError)
+        finally:
+            colgada.set()
+
+    def test_directorio_de_pacientes(self):
+        self.sur.agregar_paciente(Paciente("Luis Gómez", "2", "01/01/1990"))
+        self.assertEqual(self.federacion.sede_de_paciente("2"), "sur")
+        self.sur.agregar_paciente(Paciente("Eva Ruiz", "3", "01/01/1990"))
+        inicio = time.perf_counter()
+        self.assertEqual(self.federacion.sede_de_paciente("2"), "sur")
+        self.assertLess(time.perf_counter() - inicio, 0.05)
+        self.federacion.registrar_paciente("norte", Paciente("Sol Paz", "4", "01/01/1990"))
+        self.assertEqual(self.federacion.sede_de_paciente("4"), "norte")
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.federacion.sede_de_paciente("99")
+
+    def test_sede_con_error_se_omite(self):
+        class SedeCaida:
+            def obtener_turnos_libres(self, especialidad, desde=None, hasta=None):
+                raise ConnectionError("sin conexión")
+
+            def validar_existencia_paciente(self, dni):
+                raise ConnectionError("sin conexión")
+
+        federacion = Federacion({"caida": SedeCaida(), "norte": self.norte})
+        turnos = federacion.primeros_turnos("Cardiología", 2, self.lunes, self.lunes + timedelta(days=1))
+        self.assertEqual(len(turnos), 2)
+        self.assertIsInstance(federacion.obtener_errores()["caida"], ConnectionError)
+
+        self.norte.agregar_paciente(Paciente("Ana Díaz", "1", "01/01/1990"))
+        self.assertEqual(federacion.sede_de_paciente("1"), "norte")
+        with self.assertRaises(PacienteNoEncontradoException):
+            federacion.sede_de_paciente("99")
+        self.assertIsInstance(federacion.obtener_errores()["caida"], ConnectionError)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from benchmarks.generador import GeneradorDatos, poblar_clinica, escribir_archivos
+from modelo.clinica import Clinica
+
+class TestGeneradorDatos(unittest.TestCase):
+    def setUp(self):
+        self.generador = GeneradorDatos(semilla=7, cantidad_medicos=12)
+
+    def test_es_deterministico(self):
+        otro = GeneradorDatos(semilla=7, cantidad_medicos=12, inicio=self.generador.inicio)
+        self.assertEqual(self.generador.medicos(), otro.medicos())
+        self.assertEqual(list(self.generador.pacientes(50)), list(otro.pacientes(50)))
+        self.assertEqual(list(self.generador.turnos(200, 50)), list(otro.turnos(200, 50)))
+
+    def test_respeta_restricciones_del_modelo(self):
+        for _, _, fecha in self.generador.pacientes(500):
+            self.assertLessEqual(int(fecha[-4:]), 2024)
+
+        turnos = list(self.generador.turnos(1000, 100))
+        self.assertEqual(len(turnos), 1000)
+        self.assertTrue(all(t[3] > datetime.now() for t in turnos))
+        self.assertEqual(len({(t[1], t[3]) for t in turnos}), 1000)
+
+    def test_turnos_con_recetas(self):
+        pares = list(self.generador.turnos_con_recetas(300, 50))
+        self.assertEqual([turno for turno, _ in pares], list(self.generador.turnos(300, 50)))
+        recetas = [receta for _, receta in pares if receta is not None]
+        self.assertTrue(0 < len(recetas) < 300)
+        self.assertTrue(all(receta[3] == turno[3] for turno, receta in pares if receta is not None))
+
+    def test_poblar_clinica(self):
+        clinica = Clinica()
+        resumen = poblar_clinica(clinica, self.generador, 100, 500)
+        self.assertEqual(resumen["rechazados"], 0)
+        self.assertEqual(len(clinica.obtener_turnos()), 500)
+        self.assertEqual(len(clinica.obtener_indice_recetas()), resumen["recetas"])
+
+    def test_escribir_archivos(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            conteos = escribir_archivos(directorio, self.generador, 20, 100)
+            with open(os.path.join(directorio, "turnos.csv"), encoding="utf-8") as archivo:
+                self.assertEqual(sum(1 for _ in archivo), conteos["turnos"] + 1)
@@ -1,9 +1,13 @@
+import io
 import unittest
+from unittest import mock
 from modelo.historia_clinica import HistoriaClinica
 from modelo.paciente import Paciente
 from modelo.receta import Receta
 from modelo.turno import Turno
+from modelo.serie_turnos import SerieTurnos
 from modelo.medico import Medico
+from modelo.archivo_historia import SegmentoArchivado, EntradaArchivada
 from datetime import datetime, timedelta
 
 class TestHistoriaClinica(unittest.TestCase):
@@ -21,3 +25,81 @@ class TestHistoriaClinica(unittest.TestCase):
     def test_agregar_y_obtener_receta(self):
         self.historia.agregar_receta(self.receta)
         self.assertEqual(len(self.historia.obtener_recetas()), 1)
+
+    def test_str_con_turnos_y_recetas(self):
+        self.historia.agregar_turno(self.turno)
+        self.historia.agregar_receta(self.receta)
+        texto = str(self.historia)
+        self.assertIn("--- TURNOS (1) ---", texto)
+        self.assertIn("1. " + str(self.turno), texto)
+        self.assertIn("1. " + str(self.receta), texto)
+
+    def test_escribir_en_flujo(self):
+        self.historia.agregar_turno(self.turno)
+        destino = io.StringIO()
+        self.historia.escribir(destino)
+        self.assertEqual(destino.getvalue(), str(self.historia))
+
+    def test_filtro_por_fecha(self):
+        self.historia.agregar_turno(self.turno)
+        self.historia.agregar_receta(self.receta)
+        texto = "".join(self.historia.iterar_lineas(desde=datetime.now() + timedelta(hours=1)))
+        self.assertIn("--- TURNOS (1) ---", texto)
+        self.assertIn("No hay recetas registradas.", texto)
+
+    def test_filtro_por_fecha_con_series(self):
+        inicio = datetime(2020, 3, 2, 10, 0)
+        self.historia.agregar_turno(SerieTurnos.restaurar(
+            self.paciente, self.medico, "Clínica", inicio, timedelta(weeks=1), 3))
+
+        def series_por_filtro():
+            filtros = [(datetime(2020, 3, 10), None), (datetime(2020, 3, 5), datetime(2020, 3, 6)),
+                       (datetime(2020, 3, 17), None), (None, datetime(2020, 3, 1))]
+            return ["".join(self.historia.iterar_lineas(desde, hasta)).count("1. Serie") for desde, hasta in filtros]
+
+        self.assertEqual(series_por_filtro(), [1, 1, 0, 0])
+        self.assertEqual(self.historia.archivar(datetime(2021, 1, 1)), 1)
+        self.assertEqual(series_por_filtro(), [1, 1, 0, 0])
+
+    def test_paginacion(self):
+        for dias in range(2, 7):
+            turno = Turno(self.paciente, self.medico, datetime.now() + timedelta(days=dias), "Clínica")
+            self.historia.agregar_turno(turno)
+        lineas = list(self.historia.iterar_lineas(pagina=2, por_pagina=2))
+        self.assertIn("\n--- TURNOS (5) - página 2 de 3 ---\n", lineas)
+        self.assertTrue(any(linea.startswith("3. ") for linea in lineas))
+        self.assertFalse(any(linea.startswith("1. ") for linea in lineas))
+
+    def test_archivar_conserva_la_historia(self):
+        for dias in range(1, 7):
+            turno = Turno(self.paciente, self.medico, datetime.now() + timedelta(days=dias), "Clínica")
+            self.historia.agregar_turno(turno)
+        self.historia.agregar_receta(self.receta)
+        antes = str(self.historia)
+        self.assertEqual(self.historia.archivar(datetime.now() + timedelta(days=3, hours=1)), 4)
+        self.assertEqual(self.historia.obtener_cantidad_archivada(), 4)
+        self.assertEqual(str(self.historia), antes)
+        self.assertEqual(len(self.historia.obtener_turnos()), 3)
+        self.assertIsInstance(self.historia.obtener_turnos_archivados()[0], EntradaArchivada)
+        self.assertEqual(len(self.historia.obtener_turnos_archivados()), 3)
+        self.assertEqual(len(self.historia.obtener_recetas_archivadas()), 1)
+
+    def test_archivado_se_descomprime_solo_si_se_pide(self):
+        for dias in range(1, 7):
+            turno = Turno(self.paciente, self.medico, datetime.now() + timedelta(days=dias), "Clínica")
+            self.historia.agregar_turno(turno)
+        pagina_2 = list(self.historia.iterar_lineas(pagina=2, por_pagina=2))
+        self.historia.archivar(datetime.now() + timedelta(days=3, hours=1))
+        with mock.patch.object(SegmentoArchivado, "entradas", autospec=True,
+                               side_effect=SegmentoArchivado.entradas) as entradas:
+            list(self.historia.iterar_lineas(pagina=3, por_pagina=2))
+            self.assertFalse(entradas.called)
+            # La página 2 tiene un turno archivado y uno en memoria
+            self.assertEqual(list(self.historia.iterar_lineas(pagina=2, por_pagina=2)), pagina_2)
+            self.assertTrue(entradas.called)
+        texto = "".join(self.historia.iterar_lineas(hasta=datetime.now() + timedelta(days=1, hours=1)))
+        self.assertIn("--- TURNOS (1) ---", texto)
+
+    def test_pagina_invalida(self):
+        with self.assertRaises(ValueError):
+            list(self.historia.iterar_lineas(pagina=0))
@@ -0,0 +1,47 @@
+import unittest
+from modelo.indice_pacientes import IndicePacientes, normalizar_texto
+from modelo.paciente import Paciente
+from modelo.clinica import Clinica
+
+class TestIndicePacientes(unittest.TestCase):
+    def setUp(self):
+        self.indice = IndicePacientes()
+        self.juan = Paciente("Juan Pérez", "11111111", "01/01/1980")
+        self.julia = Paciente("Julia Gómez", "22222222", "02/02/1985")
+        self.ramon = Paciente("Ramón Jurado", "33333333", "03/03/1990")
+        for paciente in (self.juan, self.julia, self.ramon):
+            self.indice.agregar(paciente)
+
+    def test_normalizar_texto(self):
+        self.assertEqual(normalizar_texto("  José   MARÍA "), "jose maria")
+
+    def test_buscar_por_prefijo(self):
+        resultado = self.indice.buscar("ju")
+        self.assertEqual(resultado[:2], [self.juan, self.julia])
+        self.assertIn(self.ramon, resultado)
+
+    def test_buscar_sin_tildes(self):
+        self.assertEqual(self.indice.buscar("perez"), [self.juan])
+        self.assertEqual(self.indice.buscar("RAMON"), [self.ramon])
+
+    def test_buscar_varias_palabras(self):
+        self.assertEqual(self.indice.buscar("jul gom"), [self.julia])
+
+    def test_buscar_subcadena(self):
+        self.assertEqual(self.indice.buscar("ome"), [self.julia])
+
+    def test_buscar_respeta_limite(self):
+        self.assertEqual(len(self.indice.buscar("ju", limite=1)), 1)
+
+    def test_buscar_sin_resultados(self):
+        self.assertEqual(self.indice.buscar("xyz"), [])
+        self.assertEqual(self.indice.buscar(""), [])
+
+    def test_limite_invalido(self):
+        with self.assertRaises(ValueError):
+            self.indice.buscar("ju", limite=0)
+
+    def test_clinica_buscar_pacientes(self):
+        clinica = Clinica()
+        clinica.agregar_paciente(self.julia)
+        self.assertEqual(clinica.buscar_pacientes("Gómez"), [self.julia])
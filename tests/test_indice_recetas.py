@@ -0,0 +1,50 @@
+import unittest
+from datetime import datetime
+from modelo.indice_recetas import IndiceRecetas
+from modelo.receta import Receta
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+
+class TestIndiceRecetas(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Mario Ruiz", "11223344", "10/10/1985")
+        self.suarez = Medico("Dra. Suárez", "S777")
+        self.molina = Medico("Dr. Molina", "M111")
+        self.indice = IndiceRecetas()
+        self.recetas = [
+            Receta(self.paciente, self.suarez, ["Paracetamol", "Amoxicilina"]),
+            Receta(self.paciente, self.suarez, ["paracetamol"]),
+            Receta(self.paciente, self.molina, ["Ibuprofeno", "Paracetamol", "PARACETAMOL"]),
+        ]
+        for receta in self.recetas:
+            self.indice.agregar(receta)
+
+    def test_por_medico(self):
+        self.assertEqual(self.indice.obtener_por_medico("S777"), self.recetas[:2])
+        self.assertEqual(self.indice.cantidad_por_medico("M111"), 1)
+        self.assertEqual(self.indice.cantidad_por_medico("X000"), 0)
+
+    def test_por_medicamento(self):
+        self.assertEqual(len(self.indice.obtener_por_medicamento("PARACETAMOL")), 3)
+        self.assertEqual(self.indice.obtener_por_medicamento("Aspirina"), [])
+
+    def test_mas_recetados(self):
+        self.assertEqual(self.indice.medicamentos_mas_recetados(1), [("Paracetamol", 3)])
+        hoy = datetime.now()
+        ranking = self.indice.medicamentos_mas_recetados(3, anio=hoy.year, mes=hoy.month)
+        self.assertEqual(ranking[0], ("Paracetamol", 3))
+        self.assertEqual(len(ranking), 3)
+
+    def test_mes_sin_recetas(self):
+        self.assertEqual(self.indice.medicamentos_mas_recetados(anio=1999, mes=1), [])
+        self.assertEqual(self.indice.obtener_por_mes(1999, 1), [])
+
+    def test_mes_incompleto(self):
+        with self.assertRaises(ValueError):
+            self.indice.medicamentos_mas_recetados(anio=2025)
+
+    def test_getters_de_receta(self):
+        receta = self.recetas[0]
+        self.assertEqual(receta.obtener_paciente(), self.paciente)
+        self.assertEqual(receta.obtener_medico(), self.suarez)
+        self.assertEqual(receta.obtener_medicamentos(), ["Paracetamol", "Amoxicilina"])
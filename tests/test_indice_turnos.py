@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.indice_turnos import IndiceTurnos
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.turno import Turno
+
+class TestIndiceTurnos(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Laura González", "55443322", "20/06/1992")
+        self.medico = Medico("Dr. Bravo", "B001")
+        self.base = (datetime.now() + timedelta(days=1)).replace(minute=0, second=0, microsecond=0)
+        self.indice = IndiceTurnos()
+
+    def __turno(self, horas):
+        return Turno(self.paciente, self.medico, self.base + timedelta(hours=horas), "Clínica")
+
+    def test_entre_devuelve_rango_ordenado(self):
+        turnos = [self.__turno(h) for h in (5, 1, 3, 2, 4)]
+        for turno in turnos:
+            self.indice.agregar(turno)
+        resultado = list(self.indice.entre(self.base + timedelta(hours=2), self.base + timedelta(hours=4)))
+        self.assertEqual([t.obtener_fecha_hora().hour for t in resultado],
+                         [(self.base + timedelta(hours=h)).hour for h in (2, 3)])
+        self.assertEqual(len(list(self.indice.entre())), 5)
+
+    def test_muchos_turnos_en_varios_bloques(self):
+        turnos = [self.__turno(h) for h in range(3000, 0, -1)]
+        for turno in turnos:
+            self.indice.agregar(turno)
+        fechas = [t.obtener_fecha_hora() for t in self.indice.entre()]
+        self.assertEqual(fechas, sorted(fechas))
+        self.assertEqual(len(list(self.indice.entre(self.base + timedelta(hours=1001),
+                                                    self.base + timedelta(hours=1101)))), 100)
+
+    def test_quitar(self):
+        primero, segundo = self.__turno(1), self.__turno(1)
+        self.indice.agregar(primero)
+        self.indice.agregar(segundo)
+        self.assertTrue(self.indice.quitar(primero))
+        self.assertFalse(self.indice.quitar(primero))
+        self.assertEqual(list(self.indice.entre()), [segundo])
+        self.assertEqual(len(self.indice), 1)
+
+    def test_indice_vacio(self):
+        self.assertEqual(list(self.indice.entre(self.base)), [])
+        self.assertFalse(self.indice.quitar(self.__turno(1)))
@@ -0,0 +1,61 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.lista_espera import ListaEspera, SolicitudEspera
+
+class TestListaEspera(unittest.TestCase):
+    def setUp(self):
+        self.lista = ListaEspera()
+        self.fecha = datetime(2099, 1, 5, 9, 0)
+        self.ahora = datetime(2098, 1, 1)
+
+    def __solicitud(self, dni, urgencia=0, minutos=0, especialidad="Clínica"):
+        return SolicitudEspera(dni, "M111", especialidad, self.fecha, urgencia,
+                               self.ahora + timedelta(minutes=minutos))
+
+    def test_orden_por_urgencia_y_llegada(self):
+        for solicitud in (self.__solicitud("1", 0, 0), self.__solicitud("2", 3, 5),
+                          self.__solicitud("3", 3, 1), self.__solicitud("4", 0, 2)):
+            self.lista.agregar(solicitud)
+        self.assertEqual([s.obtener_dni() for s in self.lista.obtener_solicitudes("M111", "clínica")],
+                         ["3", "2", "1", "4"])
+        self.assertEqual(self.lista.siguiente("M111", "CLÍNICA").obtener_dni(), "3")
+        self.assertEqual(len(self.lista), 3)
+
+    def test_retirar_y_devolver(self):
+        primera, segunda = self.__solicitud("1", 1), self.__solicitud("2")
+        self.lista.agregar(primera)
+        self.lista.agregar(segunda)
+        self.assertTrue(self.lista.retirar(primera))
+        self.assertFalse(self.lista.retirar(primera))
+        self.assertIs(self.lista.siguiente("M111", "Clínica"), segunda)
+        self.assertFalse(segunda.esta_activa())
+        self.lista.agregar(segunda)
+        self.assertIs(self.lista.siguiente("M111", "Clínica"), segunda)
+        self.assertIsNone(self.lista.siguiente("M111", "Clínica"))
+        self.assertEqual(len(self.lista), 0)
+
+    def test_retirar_y_volver_a_anotar_no_duplica(self):
+        primera, segunda = self.__solicitud("1", 1), self.__solicitud("2")
+        self.lista.agregar(primera)
+        self.lista.agregar(segunda)
+        self.lista.retirar(primera)
+        self.lista.agregar(primera)
+        self.lista.agregar(primera)
+        self.assertEqual(self.lista.obtener_solicitudes("M111", "Clínica"), [primera, segunda])
+        self.assertEqual(len(self.lista), 2)
+        self.assertIs(self.lista.siguiente("M111", "Clínica"), primera)
+        self.assertIs(self.lista.siguiente("M111", "Clínica"), segunda)
+        self.assertIsNone(self.lista.siguiente("M111", "Clínica"))
+        self.assertEqual(len(self.lista), 0)
+
+    def test_separa_por_especialidad(self):
+        self.lista.agregar(self.__solicitud("1", especialidad="Pediatría"))
+        self.assertIsNone(self.lista.siguiente("M111", "Clínica"))
+        self.assertIsNone(self.lista.siguiente("M222", "Pediatría"))
+
+    def test_urgencia_invalida(self):
+        with self.assertRaises(ValueError):
+            SolicitudEspera("1", "M111", "Clínica", self.fecha, -1)
+
+if __name__ == "__main__":
+    unittest.main()
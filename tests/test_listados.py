@@ -0,0 +1,53 @@
+import io
+import json
+import unittest
+from datetime import datetime, timedelta
+from listados import escribir_listado, fila_paciente, fila_turno, seleccionar_turnos
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+
+class TestListados(unittest.TestCase):
+    def setUp(self):
+        self.pacientes = [Paciente(f"Paciente {i}", f"1000000{i}", "01/01/1990") for i in range(5)]
+        self.destino = io.StringIO()
+
+    def test_texto_numerado(self):
+        escritas = escribir_listado(self.destino, self.pacientes, fila_paciente)
+        self.assertEqual(escritas, 5)
+        self.assertTrue(self.destino.getvalue().startswith(f"1. {self.pacientes[0]}\n"))
+
+    def test_paginacion(self):
+        escribir_listado(self.destino, self.pacientes, fila_paciente, pagina=2, por_pagina=2)
+        lineas = self.destino.getvalue().splitlines()
+        self.assertEqual(lineas, [f"3. {self.pacientes[2]}", f"4. {self.pacientes[3]}"])
+
+    def test_tsv_con_encabezado(self):
+        escribir_listado(self.destino, self.pacientes[:2], fila_paciente, formato="tsv")
+        lineas = self.destino.getvalue().splitlines()
+        self.assertEqual(lineas[0], "dni\tnombre\tfecha_nacimiento")
+        self.assertEqual(lineas[1], "10000000\tPaciente 0\t01/01/1990")
+        self.assertEqual(len(lineas), 3)
+
+    def test_jsonl(self):
+        escribir_listado(self.destino, self.pacientes[:1], fila_paciente, formato="jsonl")
+        self.assertEqual(json.loads(self.destino.getvalue())["dni"], "10000000")
+
+    def test_formato_invalido(self):
+        with self.assertRaises(ValueError):
+            escribir_listado(self.destino, self.pacientes, fila_paciente, formato="xml")
+
+    def test_seleccionar_turnos_con_filtros(self):
+        clinica = Clinica()
+        medico = Medico("Dr. García", "M111")
+        medico.agregar_especialidad(Especialidad("Clínica", Especialidad.DIAS_VALIDOS))
+        clinica.agregar_medico(medico)
+        clinica.agregar_paciente(self.pacientes[0])
+        base = (datetime.now() + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+        tarde = clinica.agendar_turno("10000000", "M111", "Clínica", base + timedelta(days=1))
+        temprano = clinica.agendar_turno("10000000", "M111", "Clínica", base)
+        self.assertEqual(seleccionar_turnos(clinica), [tarde, temprano])
+        self.assertEqual(seleccionar_turnos(clinica, matricula="M111"), [temprano, tarde])
+        self.assertEqual(seleccionar_turnos(clinica, desde=base + timedelta(hours=1)), [tarde])
+        self.assertEqual(fila_turno(temprano)["matricula"], "M111")
@@ -0,0 +1,60 @@
+import io
+import unittest
+from lote import EjecutorLote
+
+class TestEjecutorLote(unittest.TestCase):
+    def setUp(self):
+        self.salida = io.StringIO()
+        self.ejecutor = EjecutorLote(self.salida)
+        self.carga = [
+            'agregar_paciente "Juan Pérez" 12345678 01/01/1990',
+            'agregar_medico "Dra. Gómez" M111',
+            "agregar_especialidad M111 Pediatría lunes,martes,miércoles,jueves,viernes,sábado,domingo",
+            "agendar_turno 12345678 M111 Pediatría 15/06/2099 10:00",
+        ]
+
+    def test_ejecuta_comandos(self):
+        resumen = self.ejecutor.ejecutar(self.carga + ["emitir_receta 12345678 M111 Ibuprofeno Paracetamol"])
+        self.assertEqual(resumen["exitosos"], 5)
+        self.assertEqual(resumen["fallidos"], 0)
+        self.assertEqual(len(self.ejecutor.clinica.obtener_turnos()), 1)
+        self.assertIn("Resumen: 5 comandos", self.salida.getvalue())
+
+    def test_ignora_comentarios_y_lineas_vacias(self):
+        resumen = self.ejecutor.ejecutar(["# comentario", "", "   "])
+        self.assertEqual(resumen["exitosos"] + resumen["fallidos"], 0)
+
+    def test_informa_errores_y_continua(self):
+        resumen = self.ejecutor.ejecutar(self.carga + [
+            "agendar_turno 12345678 M111 Pediatría 15/06/2099 10:00",
+            "agendar_turno 12345678",
+            "comando_inexistente",
+            "cancelar_turno M111 15/06/2099 10:00",
+        ])
+        self.assertEqual(resumen["fallidos"], 3)
+        self.assertEqual(resumen["exitosos"], 5)
+        salida = self.salida.getvalue()
+        self.assertIn("Línea 5: TurnoOcupadoException", salida)
+        self.assertIn("Línea 6: ValueError: Uso: agendar_turno DNI MATRICULA", salida)
+        self.assertIn("Línea 7: ValueError: Comando desconocido", salida)
+        self.assertEqual(self.ejecutor.clinica.obtener_turnos(), [])
+
+    def test_consultas_escriben_en_la_salida(self):
+        self.ejecutor.ejecutar(self.carga + ["buscar_pacientes perez", "ver_turnos"])
+        salida = self.salida.getvalue()
+        self.assertIn("Paciente: Juan Pérez (DNI: 12345678)", salida)
+        self.assertIn("15/06/2099 10:00", salida)
+
+    def test_listado_con_filtros_y_formato(self):
+        self.ejecutor.ejecutar(self.carga + [
+            "agendar_turno 12345678 M111 Pediatría 16/06/2099 10:00",
+            "ver_turnos --desde 16/06/2099 --medico M111 --formato tsv",
+        ])
+        lineas = self.salida.getvalue().splitlines()
+        self.assertTrue(lineas[0].startswith("fecha_hora\tdni"))
+        self.assertTrue(lineas[1].startswith("16/06/2099 10:00\t12345678"))
+        self.assertTrue(lineas[2].startswith("Resumen"))
+
+    def test_listado_con_opcion_invalida(self):
+        resumen = self.ejecutor.ejecutar(["ver_pacientes --formato xml"])
+        self.assertEqual(resumen["fallidos"], 1)
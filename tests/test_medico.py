@@ -25,3 +25,15 @@ class TestMedico(unittest.TestCase):
         medico.agregar_especialidad(esp1)
         with self.assertRaises(EspecialidadDuplicadaException):
             medico.agregar_especialidad(esp2)
+
+    def test_representacion_se_actualiza_al_agregar_especialidad(self):
+        medico = Medico("Dra. Yang", "M456")
+        texto = str(medico)
+        self.assertEqual(texto, "Dr./Dra. Dra. Yang (Matrícula: M456)\nEspecialidades: Ninguna registrada")
+        self.assertIs(str(medico), texto)
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        actualizado = str(medico)
+        self.assertNotEqual(actualizado, texto)
+        self.assertEqual(actualizado, "Dr./Dra. Dra. Yang (Matrícula: M456)\nEspecialidades:\n"
+                                      "  - Cardiología (Días: Lunes)")
+        self.assertIs(str(medico), actualizado)
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from modelo.metricas import Metricas
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.excepciones import TurnoOcupadoException
+
+class TestMetricas(unittest.TestCase):
+    def test_registrar_e_histograma(self):
+        metricas = Metricas(limites=(0.001, 0.01))
+        metricas.registrar("op", 0.0005)
+        metricas.registrar("op", 0.005, "ValueError")
+        metricas.registrar("op", 2.0)
+        resumen = metricas.obtener_resumen()["op"]
+        self.assertEqual(resumen["llamadas"], 3)
+        self.assertEqual(resumen["errores"], {"ValueError": 1})
+        self.assertEqual(list(resumen["latencia_segundos"]["intervalos"].values()), [1, 2, 3])
+
+    def test_prometheus(self):
+        metricas = Metricas(limites=(0.001,))
+        metricas.registrar("agendar_turno", 0.0001, "TurnoOcupadoException")
+        texto = metricas.a_prometheus({"turnos": 5})
+        self.assertIn('clinica_operaciones_total{operacion="agendar_turno"} 1', texto)
+        self.assertIn('excepcion="TurnoOcupadoException"} 1', texto)
+        self.assertIn('clinica_latencia_segundos_bucket{operacion="agendar_turno",le="+Inf"} 1', texto)
+        self.assertIn('clinica_registros{coleccion="turnos"} 5', texto)
+
+
+class TestMetricasClinica(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica()
+        medico = Medico("Dr. García", "M111")
+        medico.agregar_especialidad(Especialidad("Clínica", Especialidad.DIAS_VALIDOS))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "01/01/2000"))
+        self.fecha = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    def test_deshabilitadas_por_defecto(self):
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", self.fecha)
+        foto = self.clinica.metricas()
+        self.assertFalse(foto["habilitadas"])
+        self.assertEqual(foto["operaciones"], {})
+        self.assertEqual(foto["tamanios"]["turnos"], 1)
+
+    def test_cuenta_llamadas_y_excepciones(self):
+        self.clinica.habilitar_metricas()
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", self.fecha)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "M111", "Clínica", self.fecha)
+        operacion = self.clinica.metricas()["operaciones"]["agendar_turno"]
+        self.assertEqual(operacion["llamadas"], 2)
+        self.assertEqual(operacion["errores"], {"TurnoOcupadoException": 1})
+
+    def test_deshabilitar(self):
+        self.clinica.habilitar_metricas()
+        self.clinica.deshabilitar_metricas()
+        self.assertNotIn("agendar_turno", vars(self.clinica))
+        self.clinica.agendar_turno("12345678", "M111", "Clínica", self.fecha)
+        self.assertEqual(self.clinica.metricas()["operaciones"], {})
+
+    def test_exportar(self):
+        self.clinica.habilitar_metricas()
+        self.clinica.obtener_historia_clinica("12345678")
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.prom")
+            self.clinica.exportar_metricas(ruta)
+            with open(ruta, encoding="utf-8") as archivo:
+                self.assertIn('operacion="obtener_historia_clinica"', archivo.read())
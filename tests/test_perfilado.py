@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from perfilado import sesion_perfilada
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+
+class TestPerfilado(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta_cpu = os.path.join(self.directorio.name, "cpu.txt")
+        self.ruta_memoria = os.path.join(self.directorio.name, "memoria.txt")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def __cargar(self):
+        clinica = Clinica()
+        for i in range(200):
+            clinica.agregar_paciente(Paciente(f"Paciente {i}", str(30_000_000 + i), "01/01/1990"))
+        return clinica
+
+    def test_reportes_de_cpu_y_memoria(self):
+        with sesion_perfilada(self.ruta_cpu, self.ruta_memoria):
+            clinica = self.__cargar()
+
+        with open(self.ruta_cpu, encoding="utf-8") as archivo:
+            cpu = archivo.read()
+        self.assertIn("Funciones por tiempo acumulado", cpu)
+        self.assertIn("agregar_paciente", cpu)
+
+        with open(self.ruta_memoria, encoding="utf-8") as archivo:
+            memoria = archivo.read()
+        self.assertIn("Memoria en uso por módulo del modelo", memoria)
+        self.assertIn(os.path.join("modelo", "indice_pacientes.py"), memoria)
+        self.assertEqual(len(clinica.obtener_pacientes()), 200)
+
+    def test_escribe_reporte_aunque_falle_la_sesion(self):
+        with self.assertRaises(RuntimeError):
+            with sesion_perfilada(self.ruta_cpu):
+                raise RuntimeError("fallo")
+        self.assertTrue(os.path.exists(self.ruta_cpu))
+        self.assertFalse(os.path.exists(self.ruta_memoria))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,3 +14,13 @@ class TestReceta(unittest.TestCase):
         receta = Receta(self.paciente, self.medico, self.medicamentos)
         self.assertIn("Paracetamol", str(receta))
         self.assertIn("S777", str(receta))
+
+    def test_representacion_cacheada(self):
+        fecha = datetime(2020, 3, 2, 9, 15)
+        receta = Receta.restaurar(self.paciente, self.medico, self.medicamentos, fecha)
+        texto = str(receta)
+        self.assertEqual(texto, "Receta - Paciente: 11223344, Médico: S777, "
+                                "Medicamentos: Paracetamol, Amoxicilina, Fecha: 02/03/2020 09:15")
+        self.assertIs(str(receta), texto)
+        self.medicamentos.append("Ibuprofeno")
+        self.assertEqual(str(receta), texto)
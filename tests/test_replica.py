@@ -0,0 +1,153 @@
+import multiprocessing
+import time
+import unittest
+from datetime import datetime, timedelta
+from replica import PublicadorReplica, LectorReplica
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.turno import Turno
+from modelo.serie_turnos import SerieTurnos
+
+
+def _contar_en_otro_proceso(nombre, cola):
+    lector = LectorReplica(nombre)
+    try:
+        cola.put((lector.obtener_generacion(), lector.contar_turnos(), lector.obtener_paciente("2")))
+    finally:
+        lector.cerrar()
+
+
+class TestReplica(unittest.TestCase):
+    def setUp(self):
+        self.lunes = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.lunes += timedelta(days=7 - self.lunes.weekday())
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Ana Díaz", "2", "01/01/1990"))
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "1", "02/02/1985"))
+        medico = Medico("Dr. García", "M1")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        medico = Medico("Dra. Sosa", "M2")
+        medico.agregar_especialidad(Especialidad("Clínica", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("1", "M1", "Cardiología", self.lunes.replace(hour=10))
+        self.clinica.agendar_turno("2", "M2", "Clínica", self.lunes.replace(hour=9))
+
+        self.publicador = PublicadorReplica(self.clinica, max_pacientes=100, max_turnos=100)
+        self.lector = LectorReplica(self.publicador.obtener_nombre())
+
+    def tearDown(self):
+        self.lector.cerrar()
+        self.publicador.cerrar()
+
+    def test_instantanea_inicial(self):
+        self.assertEqual(self.lector.obtener_generacion(), 1)
+        self.assertEqual(self.lector.obtener_paciente("1"), ("1", "Juan Pérez", "02/02/1985"))
+        self.assertIsNone(self.lector.obtener_paciente("3"))
+        self.assertEqual(self.lector.turnos_entre(), [
+            (self.lunes.replace(hour=9), "2", "M2", "Clínica"),
+            (self.lunes.replace(hour=10), "1", "M1", "Cardiología"),
+        ])
+
+    def test_los_cambios_se_ven_al_publicar(self):
+        self.clinica.agregar_paciente(Paciente("Eva Ruiz", "0", "03/03/2000"))
+        self.clinica.agendar_turno("0", "M1", "Cardiología", self.lunes.replace(hour=8))
+        self.clinica.cancelar_turno("M1", self.lunes.replace(hour=10))
+        self.assertIsNone(self.lector.obtener_paciente("0"))
+
+        self.publicador.publicar()
+        self.assertEqual(self.lector.obtener_generacion(), 2)
+        self.assertEqual(self.lector.obtener_paciente("0"), ("0", "Eva Ruiz", "03/03/2000"))
+        self.assertEqual([turno[1] for turno in self.lector.turnos_entre()], ["0", "2"])
+
+    def test_series_y_rango_de_fechas(self):
+        self.clinica.agendar_serie("1", "M1", "Cardiología", self.lunes.replace(hour=11), "semanal", 4)
+        self.publicador.publicar()
+        desde = self.lunes + timedelta(days=1)
+        turnos = self.lector.turnos_entre(desde, desde + timedelta(weeks=2))
+        self.assertEqual([turno[0] for turno in turnos],
+                         [self.lunes.replace(hour=11) + timedelta(weeks=1), self.lunes.replace(hour=11) + timedelta(weeks=2)])
+        self.assertEqual(self.lector.contar_turnos(), {"Cardiología": 5, "Clínica": 1})
+        self.assertEqual(self.lector.contar_turnos(hasta=desde, por="medico"), {"M1": 2, "M2": 1})
+
+    def test_historias_archivadas_siguen_en_la_replica(self):
+        paciente = self.clinica.obtener_pacientes()[0]
+        medico = self.clinica.obtener_medico_por_matricula("M1")
+        pasado = datetime(2020, 3, 2, 10, 0)
+        self.clinica.restaurar_turno(Turno.restaurar(paciente, medico, pasado, "Cardiología"))
+        self.clinica.restaurar_serie(SerieTurnos.restaurar(
+            paciente, medico, "Cardiología", pasado.replace(hour=11), timedelta(weeks=1), 3))
+        self.publicador.publicar()
+
+        self.assertEqual(self.clinica.archivar_historias(datetime.now()), 2)
+        self.publicador.publicar()
+        self.assertEqual(self.lector.turnos_entre(), sorted(
+            (turno.obtener_fecha_hora(), turno.obtener_paciente().obtener_dni(),
+             turno.obtener_medico().obtener_matricula(), turno.obtener_especialidad())
+            for turno in self.clinica.obtener_turnos()))
+        self.assertEqual(self.lector.consultar(lambda vista: vista.cantidad_turnos()), 6)
+
+    def test_publicacion_incremental(self):
+        for semana in range(1, 6):
+            self.clinica.agendar_turno("1", "M1", "Cardiología", self.lunes.replace(hour=8) + timedelta(weeks=semana))
+        self.publicador.publicar()
+        self.publicador.publicar()
+
+        # Un turno al final solo copia su registro en cada ranura, no la tabla entera
+        self.clinica.agendar_turno("2", "M1", "Cardiología", self.lunes.replace(hour=8) + timedelta(weeks=10))
+        copiados = self.publicador.publicar()
+        self.assertLess(copiados, 2 * 20 + 200)
+        self.assertEqual(self.lector.consultar(lambda vista: vista.cantidad_turnos()), 8)
+
+    def test_lectura_desde_otro_proceso(self):
+        contexto = multiprocessing.get_context("spawn")
+        cola = contexto.Queue()
+        proceso = contexto.Process(target=_contar_en_otro_proceso, args=(self.publicador.obtener_nombre(), cola))
+        proceso.start()
+        resultado = cola.get(timeout=30)
+        proceso.join(timeout=30)
+        self.assertEqual(resultado, (1, {"Cardiología": 1, "Clínica": 1}, ("2", "Ana Díaz", "01/01/1990")))
+
+    def test_capacidad_insuficiente(self):
+        publicador = PublicadorReplica(self.clinica, max_pacientes=2, max_turnos=2)
+        try:
+            self.clinica.agregar_paciente(Paciente("Eva Ruiz", "0", "03/03/2000"))
+            with self.assertRaises(ValueError):
+                publicador.publicar()
+        finally:
+            publicador.cerrar()
+
+    def test_publicar_a_mano_con_el_hilo_activo(self):
+        self.publicador.iniciar(intervalo=0.0005)
+        try:
+            for semana in range(1, 41):
+                self.clinica.agendar_turno("1", "M1", "Cardiología", self.lunes.replace(hour=8) + timedelta(weeks=semana))
+                self.publicador.publicar()
+        finally:
+            self.publicador.detener()
+        self.publicador.publicar()
+        self.assertEqual(self.lector.obtener_generacion(), self.publicador.obtener_generacion())
+        self.assertEqual([turno[0] for turno in self.lector.turnos_entre()],
+                         sorted(turno.obtener_fecha_hora() for turno in self.clinica.obtener_turnos()))
+
+    def test_error_de_capacidad_en_el_hilo(self):
+        publicador = PublicadorReplica(self.clinica, max_pacientes=2, max_turnos=2)
+        try:
+            publicador.iniciar(intervalo=0.001)
+            self.clinica.agregar_paciente(Paciente("Eva Ruiz", "0", "03/03/2000"))
+            limite = time.monotonic() + 5
+            while publicador.obtener_error() is None and time.monotonic() < limite:
+                time.sleep(0.001)
+            self.assertIsInstance(publicador.obtener_error(), ValueError)
+        finally:
+            publicador.cerrar()
+
+    def test_agrupamiento_invalido(self):
+        with self.assertRaises(ValueError):
+            self.lector.contar_turnos(por="paciente")
+
+
+if __name__ == '__main__':
+    unittest.main()
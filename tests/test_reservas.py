@@ -0,0 +1,138 @@
+import json
+import os
+import queue
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from reservas import CanalReservas
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.excepciones import TurnoOcupadoException, PacienteNoEncontradoException
+
+
+class TestReservas(unittest.TestCase):
+    def setUp(self):
+        self.temporal = tempfile.TemporaryDirectory()
+        self.diario = os.path.join(self.temporal.name, "diario.jsonl")
+        self.lunes = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.lunes += timedelta(days=7 - self.lunes.weekday())
+        self.clinica = Clinica()
+        for dni in ("1", "2", "3"):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {dni}", dni, "01/01/1990"))
+        medico = Medico("Dr. García", "M1")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+
+    def tearDown(self):
+        self.temporal.cleanup()
+
+    def __lineas_diario(self):
+        with open(self.diario, encoding="utf-8") as archivo:
+            return [json.loads(linea) for linea in archivo]
+
+    def test_resultados_y_errores_por_future(self):
+        canal = CanalReservas(self.clinica, self.diario, sincronizar=False)
+        try:
+            ok = canal.solicitar("1", "M1", "Cardiología", self.lunes.replace(hour=9))
+            ocupado = canal.solicitar("2", "M1", "Cardiología", self.lunes.replace(hour=9))
+            sin_paciente = canal.solicitar("9", "M1", "Cardiología", self.lunes.replace(hour=10))
+            self.assertEqual(ok.result(timeout=5).obtener_paciente().obtener_dni(), "1")
+            self.assertIsInstance(ocupado.exception(timeout=5), TurnoOcupadoException)
+            self.assertIsInstance(sin_paciente.exception(timeout=5), PacienteNoEncontradoException)
+        finally:
+            canal.cerrar()
+
+        self.assertEqual(self.__lineas_diario(), [{
+            "dni": "1", "matricula": "M1", "especialidad": "Cardiología",
+            "fecha_hora": self.lunes.replace(hour=9).isoformat(),
+        }])
+
+    def test_rafaga_en_lotes(self):
+        canal = CanalReservas(self.clinica, self.diario, tamanio_lote=4, sincronizar=False)
+        try:
+            # Con el candado tomado, las reservas se acumulan en la cola
+            with canal.obtener_candado():
+                futuros = [canal.solicitar(str(1 + i % 3), "M1", "Cardiología",
+                                           self.lunes.replace(hour=8) + timedelta(minutes=30 * i))
+                           for i in range(9)]
+            turnos = [futuro.result(timeout=5) for futuro in futuros]
+        finally:
+            canal.cerrar()
+
+        self.assertEqual(len(self.clinica.obtener_turnos()), 9)
+        self.assertEqual([t.obtener_fecha_hora().isoformat() for t in turnos],
+                         [linea["fecha_hora"] for linea in self.__lineas_diario()])
+        estadisticas = canal.obtener_estadisticas()
+        self.assertEqual(estadisticas["reservas"], 9)
+        self.assertLessEqual(estadisticas["lotes"], 4)
+        self.assertEqual(estadisticas["mayor_lote"], 4)
+
+    def test_contrapresion_con_cola_llena(self):
+        canal = CanalReservas(self.clinica, tamanio_cola=2, tamanio_lote=1)
+        try:
+            with canal.obtener_candado():
+                # El consumidor retira una reserva y espera el candado; las otras dos llenan la cola
+                for dni, hora in (("1", 8), ("2", 9), ("3", 10)):
+                    canal.solicitar(dni, "M1", "Cardiología", self.lunes.replace(hour=hora), timeout=1)
+                with self.assertRaises(queue.Full):
+                    canal.solicitar("1", "M1", "Cardiología", self.lunes.replace(hour=11), timeout=0.05)
+        finally:
+            canal.cerrar()
+        self.assertEqual(len(self.clinica.obtener_turnos()), 3)
+
+    @unittest.skipUnless(os.path.exists("/dev/full"), "requiere /dev/full")
+    def test_error_del_diario_deshace_el_lote(self):
+        canal = CanalReservas(self.clinica, "/dev/full", sincronizar=False)
+        try:
+            with canal.obtener_candado():
+                futuros = [canal.solicitar(dni, "M1", "Cardiología", self.lunes.replace(hour=hora))
+                           for dni, hora in (("1", 8), ("2", 9))]
+            for futuro in futuros:
+                self.assertIsInstance(futuro.exception(timeout=5), OSError)
+        finally:
+            canal.cerrar()
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+
+    @unittest.skipUnless(os.path.exists("/dev/full"), "requiere /dev/full")
+    def test_deshacer_el_lote_no_promueve_la_espera(self):
+        ocupado = self.clinica.agendar_turno("2", "M1", "Cardiología", self.lunes.replace(hour=12))
+        solicitud = self.clinica.agendar_o_esperar("3", "M1", "Cardiología", self.lunes.replace(hour=12))
+        canal = CanalReservas(self.clinica, "/dev/full", sincronizar=False)
+        try:
+            futuro = canal.solicitar("1", "M1", "Cardiología", self.lunes.replace(hour=8))
+            self.assertIsInstance(futuro.exception(timeout=5), OSError)
+        finally:
+            canal.cerrar()
+        self.assertEqual(self.clinica.obtener_turnos(), [ocupado])
+        self.assertEqual(self.clinica.obtener_lista_espera("M1", "Cardiología"), [solicitud])
+
+    def test_error_inesperado_resuelve_todo_el_lote(self):
+        class ClinicaRota:
+            def agendar_turno(self, *args):
+                # registro_diario no puede leer este "turno"
+                return object()
+
+        canal = CanalReservas(ClinicaRota(), self.diario, sincronizar=False)
+        try:
+            with canal.obtener_candado():
+                futuros = [canal.solicitar("1", "M1", "Cardiología", self.lunes.replace(hour=hora))
+                           for hora in (8, 9, 10)]
+            for futuro in futuros:
+                self.assertIsInstance(futuro.exception(timeout=5), AttributeError)
+            # El consumidor sigue atendiendo reservas
+            siguiente = canal.solicitar("1", "M1", "Cardiología", self.lunes.replace(hour=11))
+            self.assertIsInstance(siguiente.exception(timeout=5), AttributeError)
+        finally:
+            canal.cerrar()
+
+    def test_cerrado_no_acepta_reservas(self):
+        canal = CanalReservas(self.clinica)
+        canal.cerrar()
+        with self.assertRaises(RuntimeError):
+            canal.solicitar("1", "M1", "Cardiología", self.lunes.replace(hour=8))
+
+
+if __name__ == '__main__':
+    unittest.main()
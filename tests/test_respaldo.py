@@ -0,0 +1,159 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from respaldo import RespaldoIncremental, restaurar, listar_respaldos
+from modelo.clinica import Clinica
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.especialidad import Especialidad
+from modelo.turno import Turno
+from modelo.receta import Receta
+
+
+class TestRespaldo(unittest.TestCase):
+    def setUp(self):
+        self.temporal = tempfile.TemporaryDirectory()
+        self.directorio = os.path.join(self.temporal.name, "respaldos")
+        self.lunes = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.lunes += timedelta(days=7 - self.lunes.weekday())
+
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Ana Díaz", "1", "01/01/1990"))
+        medico = Medico("Dr. García", "M1")
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("1", "M1", "Cardiología", self.lunes.replace(hour=9))
+        self.clinica.agendar_serie("1", "M1", "Cardiología", self.lunes.replace(hour=11), "semanal", 3)
+        self.clinica.cancelar_turno("M1", self.lunes.replace(hour=11) + timedelta(weeks=1))
+        self.clinica.emitir_receta("1", "M1", ["Aspirina"])
+        self.respaldo = RespaldoIncremental(self.clinica, self.directorio, diferenciales_por_completo=2)
+
+    def tearDown(self):
+        self.respaldo.cerrar()
+        self.temporal.cleanup()
+
+    def assertMismaClinica(self, restaurada):
+        self.assertEqual([str(p) for p in restaurada.obtener_pacientes()],
+                         [str(p) for p in self.clinica.obtener_pacientes()])
+        self.assertEqual([str(m) for m in restaurada.obtener_medicos()],
+                         [str(m) for m in self.clinica.obtener_medicos()])
+        self.assertEqual(sorted(str(t) for t in restaurada.obtener_turnos()),
+                         sorted(str(t) for t in self.clinica.obtener_turnos()))
+        for paciente in self.clinica.obtener_pacientes():
+            dni = paciente.obtener_dni()
+            self.assertEqual(str(restaurada.obtener_historia_clinica(dni)),
+                             str(self.clinica.obtener_historia_clinica(dni)))
+            self.assertEqual(restaurada.obtener_historia_clinica(dni).obtener_cantidad_archivada(),
+                             self.clinica.obtener_historia_clinica(dni).obtener_cantidad_archivada())
+
+    def __registros(self, ruta):
+        with gzip.open(ruta, "rt", encoding="utf-8") as archivo:
+            return [json.loads(linea) for linea in archivo][1:]
+
+    def test_primer_respaldo_completo(self):
+        ruta = self.respaldo.respaldar()
+        self.assertTrue(ruta.endswith("00000001-completo.jsonl.gz"))
+        self.assertMismaClinica(restaurar(self.directorio))
+
+    def test_diferencial_solo_con_los_cambios(self):
+        self.respaldo.respaldar()
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "2", "02/02/1985"))
+        self.clinica.agendar_turno("2", "M1", "Cardiología", self.lunes.replace(hour=10))
+        self.clinica.agregar_especialidad_a_medico("M1", Especialidad("Clínica", ["martes"]))
+
+        ruta = self.respaldo.respaldar()
+        self.assertTrue(ruta.endswith("00000002-diferencial.jsonl.gz"))
+        self.assertEqual([registro["tipo"] for registro in self.__registros(ruta)],
+                         ["paciente", "turno", "especialidad"])
+        self.assertMismaClinica(restaurar(self.directorio))
+
+    def test_sin_cambios_no_escribe(self):
+        self.respaldo.respaldar()
+        self.assertIsNone(self.respaldo.respaldar())
+        self.assertEqual(len(listar_respaldos(self.directorio)), 1)
+
+    def test_cancelaciones_y_series_en_diferenciales(self):
+        self.respaldo.respaldar()
+        self.clinica.cancelar_turno("M1", self.lunes.replace(hour=9))
+        self.clinica.agendar_serie("1", "M1", "Cardiología", self.lunes.replace(hour=14), "quincenal", 4)
+        self.clinica.cancelar_turno("M1", self.lunes.replace(hour=14) + timedelta(weeks=2))
+        self.clinica.emitir_receta("1", "M1", ["Ibuprofeno"])
+        self.respaldo.respaldar()
+        self.assertMismaClinica(restaurar(self.directorio))
+
+    def __agregar_pasado(self):
+        paciente = self.clinica.obtener_pacientes()[0]
+        medico = self.clinica.obtener_medico_por_matricula("M1")
+        for dia in (2, 9):
+            fecha = datetime(2020, 3, dia, 10)
+            self.clinica.restaurar_turno(Turno.restaurar(paciente, medico, fecha, "Cardiología"))
+            self.clinica.restaurar_receta(Receta.restaurar(paciente, medico, ["Enalapril"], fecha))
+
+    def test_completo_con_historias_archivadas(self):
+        self.__agregar_pasado()
+        self.assertEqual(self.clinica.archivar_historias(datetime(2020, 3, 5)), 2)
+        self.assertEqual(self.clinica.archivar_historias(datetime(2020, 3, 10)), 2)
+        ruta = self.respaldo.respaldar()
+        self.assertEqual([registro["antes_de"] for registro in self.__registros(ruta) if registro["tipo"] == "archivo"],
+                         ["2020-03-05T00:00:00", "2020-03-10T00:00:00"])
+        self.assertEqual(len([registro for registro in self.__registros(ruta) if registro["tipo"] == "receta"]), 3)
+        self.assertMismaClinica(restaurar(self.directorio))
+
+    def test_archivo_en_diferenciales(self):
+        self.respaldo.respaldar()
+        self.__agregar_pasado()
+        self.respaldo.respaldar()
+        self.clinica.archivar_historias(datetime.now())
+        ruta = self.respaldo.respaldar()
+        self.assertEqual([registro["tipo"] for registro in self.__registros(ruta)], ["archivo"])
+        restaurada = restaurar(self.directorio)
+        self.assertMismaClinica(restaurada)
+        self.assertEqual(len(restaurada.obtener_indice_recetas()), 3)
+
+    def test_completo_periodico(self):
+        self.respaldo.respaldar()
+        for hora in (8, 10, 12):
+            self.clinica.agendar_turno("1", "M1", "Cardiología", self.lunes.replace(hour=hora))
+            self.respaldo.respaldar()
+        self.assertEqual([clase for _, clase, _ in listar_respaldos(self.directorio)],
+                         ["completo", "diferencial", "diferencial", "completo"])
+        self.assertMismaClinica(restaurar(self.directorio))
+
+    def test_restaurar_hasta_un_numero(self):
+        self.respaldo.respaldar()
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "2", "02/02/1985"))
+        self.respaldo.respaldar()
+        self.assertEqual(len(restaurar(self.directorio, hasta=1).obtener_pacientes()), 1)
+        self.assertEqual(len(restaurar(self.directorio).obtener_pacientes()), 2)
+
+    def test_falta_un_diferencial(self):
+        self.respaldo.respaldar()
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "2", "02/02/1985"))
+        faltante = self.respaldo.respaldar()
+        self.clinica.agregar_paciente(Paciente("Eva Ruiz", "3", "03/03/2000"))
+        self.respaldo.respaldar()
+        os.remove(faltante)
+        with self.assertRaises(ValueError):
+            restaurar(self.directorio)
+
+    def test_sin_completo(self):
+        with self.assertRaises(FileNotFoundError):
+            restaurar(self.directorio)
+
+    def test_nueva_sesion_continua_la_numeracion(self):
+        self.respaldo.respaldar()
+        restaurada = restaurar(self.directorio)
+        respaldo = RespaldoIncremental(restaurada, self.directorio)
+        try:
+            ruta = respaldo.respaldar()
+        finally:
+            respaldo.cerrar()
+        self.assertTrue(ruta.endswith("00000002-completo.jsonl.gz"))
+        self.assertMismaClinica(restaurar(self.directorio))
+
+
+if __name__ == '__main__':
+    unittest.main()
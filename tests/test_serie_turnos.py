@@ -0,0 +1,61 @@
+import unittest
+from datetime import datetime, timedelta
+from modelo.serie_turnos import SerieTurnos
+from modelo.paciente import Paciente
+from modelo.medico import Medico
+from modelo.excepciones import DatosInvalidosException
+
+class TestSerieTurnos(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Ana Díaz", "11111111", "01/01/1950")
+        self.medico = Medico("Dr. García", "M111")
+        self.inicio = (datetime.now() + timedelta(days=1)).replace(hour=9, minute=0, second=0, microsecond=0)
+        self.serie = SerieTurnos(self.paciente, self.medico, "Clínica", self.inicio, "semanal", 26)
+
+    def test_expande_sin_crear_turnos_de_antemano(self):
+        fechas = list(self.serie.fechas())
+        self.assertEqual(len(fechas), 26)
+        self.assertEqual(fechas[1] - fechas[0], timedelta(weeks=1))
+        self.assertEqual(self.serie.obtener_fin(), self.inicio + timedelta(weeks=25))
+
+    def test_rango_y_ocurrencia(self):
+        desde = self.inicio + timedelta(days=10)
+        turnos = list(self.serie.turnos(desde, desde + timedelta(weeks=2)))
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos],
+                         [self.inicio + timedelta(weeks=2), self.inicio + timedelta(weeks=3)])
+        self.assertEqual(self.serie.obtener_turno(self.inicio + timedelta(weeks=2)), turnos[0])
+        self.assertIsNone(self.serie.obtener_turno(self.inicio + timedelta(days=1)))
+        self.assertIsNone(self.serie.obtener_turno(self.inicio + timedelta(weeks=26)))
+
+    def test_cancelar_y_superposicion(self):
+        fecha = self.inicio + timedelta(weeks=1)
+        self.assertTrue(self.serie.tiene_superposicion(fecha + timedelta(minutes=15), timedelta(minutes=30)))
+        self.assertFalse(self.serie.tiene_superposicion(fecha + timedelta(minutes=30), timedelta(minutes=30)))
+        self.assertEqual(self.serie.cancelar(fecha).obtener_fecha_hora(), fecha)
+        self.assertIsNone(self.serie.cancelar(fecha))
+        self.assertFalse(self.serie.tiene_superposicion(fecha, timedelta(minutes=30)))
+        self.assertEqual(len(self.serie), 25)
+        self.assertIn("(25 de 26 turnos)", str(self.serie))
+        self.assertIs(str(self.serie), str(self.serie))
+        self.serie.cancelar(fecha + timedelta(weeks=1))
+        self.assertIn("(24 de 26 turnos)", str(self.serie))
+
+    def test_datos_invalidos(self):
+        with self.assertRaises(DatosInvalidosException):
+            SerieTurnos(self.paciente, self.medico, "Clínica", self.inicio, "mensual", 3)
+        with self.assertRaises(DatosInvalidosException):
+            SerieTurnos(self.paciente, self.medico, "Clínica", self.inicio, timedelta(hours=1), 3)
+        with self.assertRaises(DatosInvalidosException):
+            SerieTurnos(self.paciente, self.medico, "Clínica", self.inicio, "semanal", 0)
+
+    def test_restaurar_serie_pasada_con_cancelaciones(self):
+        inicio = self.inicio - timedelta(weeks=4)
+        cancelada = inicio + timedelta(weeks=1)
+        serie = SerieTurnos.restaurar(self.paciente, self.medico, "Clínica", inicio, timedelta(weeks=1), 6, [cancelada])
+        self.assertEqual(len(serie), 5)
+        self.assertEqual(serie.obtener_cantidad(), 6)
+        self.assertEqual(serie.obtener_canceladas(), [cancelada])
+        self.assertIsNone(serie.obtener_turno(cancelada))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,4 +22,11 @@ class TestTurno(unittest.TestCase):
         with self.assertRaises(DatosInvalidosException):
             Turno(self.paciente, self.medico, fecha_pasada, "Pediatría")
 
-                  
+    def test_representacion_cacheada(self):
+        fecha = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=30, second=0, microsecond=0)
+        turno = Turno(self.paciente, self.medico, fecha, "Pediatría")
+        texto = str(turno)
+        self.assertEqual(texto, f"Turno: Ana Torres (DNI: 99887766) con Dr./Dra. Dr. Luna (Mat: L001) "
+                                f"- Pediatría - {fecha.strftime('%d/%m/%Y')} 10:30")
+        self.assertIs(str(turno), texto)
+        self.assertEqual(str(Turno.restaurar(self.paciente, self.medico, fecha, "Pediatría")), texto)